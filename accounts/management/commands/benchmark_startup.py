@@ -0,0 +1,39 @@
+"""
+Django management command to benchmark worker startup.
+Usage: python manage.py benchmark_startup [--runs 5] [--target web --target celery] [--output startup.json]
+
+Starts the web and Celery worker processes in fresh interpreters and prints,
+or writes, the median startup time and RSS of each as JSON, with and without
+the report export backends (openpyxl, reportlab) imported at startup.
+"""
+
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from eduTrack.startup_benchmark import STARTUP_TARGETS, startup_benchmark_run, startup_benchmark_savings
+
+
+class Command(BaseCommand):
+    help = 'Measure startup time and resident memory of the web and Celery worker processes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=5, help='Processes started per target (default: 5)')
+        parser.add_argument('--target', action='append', choices=sorted(STARTUP_TARGETS), help='Process to start (default: all)')
+        parser.add_argument('--output', help='Write the JSON report to this file instead of stdout')
+
+    def handle(self, *args, **options):
+        try:
+            report = startup_benchmark_run(targets=options['target'], runs=options['runs'])
+        except (ValueError, RuntimeError) as exc:
+            raise CommandError(str(exc))
+
+        output = json.dumps(report, indent=2, sort_keys=True) + '\n'
+        if options['output']:
+            Path(options['output']).write_text(output)
+        else:
+            self.stdout.write(output, ending='')
+
+        for line in startup_benchmark_savings(report):
+            self.stdout.write(self.style.SUCCESS(line))
@@ -0,0 +1,73 @@
+"""
+Django management command to check every API endpoint against its query budget.
+Usage: python manage.py check_query_budgets [--update] [--report path.json]
+
+Runs in a throwaway test database: seeds the benchmark dataset, requests
+every GET endpoint as every role, prints budget violations and the changes
+since the previous report, and writes the new report. The run uses a
+process-local cache and no read replicas, so it neither clears nor fills
+the cache the live workers share and never reads from a real replica.
+"""
+
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings, setup_test_environment, teardown_test_environment
+
+from eduTrack.query_budget import (
+    BUDGET_FILE,
+    query_budget_build,
+    query_budget_check,
+    query_budget_diff,
+    query_budget_load,
+    query_budget_measure,
+    query_budget_seed,
+)
+
+# Only "default" is switched to the test database; replicas would still
+# point at the real ones, and CACHES at the cache the live workers share.
+ISOLATED_RUN_SETTINGS = {
+    'CACHES': {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    'DATABASE_REPLICAS': [],
+}
+
+
+class Command(BaseCommand):
+    help = 'Measure query counts and latency of every GET endpoint and compare with the stored budgets'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--update', action='store_true', help=f'Rewrite {BUDGET_FILE.name} from this run')
+        parser.add_argument('--report', help='Report file (default: QUERY_BUDGET_REPORT_PATH)')
+
+    def handle(self, *args, **options):
+        report_path = Path(options['report'] or settings.QUERY_BUDGET_REPORT_PATH)
+        previous = json.loads(report_path.read_text()) if report_path.exists() else {}
+
+        setup_test_environment()
+        database_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            with override_settings(**ISOLATED_RUN_SETTINGS):
+                results = query_budget_measure(query_budget_seed())
+        finally:
+            connection.creation.destroy_test_db(database_name, verbosity=0)
+            teardown_test_environment()
+
+        for line in query_budget_diff(previous, results):
+            self.stdout.write(line)
+        report_path.write_text(json.dumps(results, indent=2, sort_keys=True) + '\n')
+
+        if options['update']:
+            BUDGET_FILE.write_text(json.dumps(query_budget_build(results), indent=2, sort_keys=True) + '\n')
+            self.stdout.write(self.style.SUCCESS(f'Recorded budgets for {len(results)} endpoint/role pairs'))
+            return
+
+        violations = query_budget_check(results, query_budget_load())
+        for line in violations:
+            self.stdout.write(self.style.ERROR(line))
+        if violations:
+            raise CommandError(f'{len(violations)} budget violations in {len(results)} endpoint/role pairs')
+        self.stdout.write(self.style.SUCCESS(f'{len(results)} endpoint/role pairs within budget'))
@@ -0,0 +1,25 @@
+"""
+Django management command to generate the OpenAPI schema served at /api/schema/.
+Usage: python manage.py generate_openapi_schema [--output-dir DIR]
+
+Writes the YAML and JSON schema of the current API version to
+OPENAPI_SCHEMA_DIR (or --output-dir); run it on every deploy, after the code
+is in place.
+"""
+
+from django.core.management.base import BaseCommand
+
+from eduTrack.openapi import openapi_schema_generate
+
+
+class Command(BaseCommand):
+    help = 'Generate the OpenAPI schema files served at /api/schema/'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output-dir', help='Write the schema files to this directory instead of OPENAPI_SCHEMA_DIR')
+
+    def handle(self, *args, **options):
+        for path, etag in openapi_schema_generate(options['output_dir']).values():
+            self.stdout.write(self.style.SUCCESS(
+                f"Wrote {path} ({path.stat().st_size // 1024} KB, ETag {etag})"
+            ))
@@ -0,0 +1,64 @@
+"""
+Django management command to load-test the hottest API endpoints.
+Usage: python manage.py load_test [--duration 30] [--requests N] [--clients N] [--seed 42]
+           [--password PASSWORD] [--output run.json] [--baseline previous.json]
+
+Replays the weighted workload in eduTrack.load_test against the configured
+database (seed it first with `seed_data --scale N`) and prints, or writes,
+p50/p95/p99 latency, throughput and error rate per endpoint as JSON.
+"""
+
+import json
+import os
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from eduTrack.bulk_seed import DEFAULT_PASSWORD
+from eduTrack.load_test import load_test_diff, load_test_run
+
+
+class Command(BaseCommand):
+    help = 'Replay a weighted request mix against the hot endpoints and report latency percentiles per endpoint'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--duration', type=float, help='Seconds each client sends requests (default: 30)')
+        parser.add_argument('--requests', type=int, help='Requests per client')
+        parser.add_argument('--clients', type=int, default=os.cpu_count() or 1, help='Concurrent client processes')
+        parser.add_argument('--seed', type=int, default=42, help='Seed for the request sequence')
+        parser.add_argument('--password', default=DEFAULT_PASSWORD, help='Password of the seeded users')
+        parser.add_argument('--output', help='Write the JSON report to this file instead of stdout')
+        parser.add_argument('--baseline', help='Report of an earlier run to compare with')
+
+    def handle(self, *args, **options):
+        duration = options['duration']
+        if duration is None and options['requests'] is None:
+            duration = 30
+        try:
+            report = load_test_run(
+                duration=duration,
+                requests=options['requests'],
+                clients=options['clients'],
+                seed=options['seed'],
+                password=options['password'],
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        output = json.dumps(report, indent=2, sort_keys=True) + '\n'
+        if options['output']:
+            Path(options['output']).write_text(output)
+        else:
+            self.stdout.write(output, ending='')
+
+        if options['baseline']:
+            for line in load_test_diff(json.loads(Path(options['baseline']).read_text()), report):
+                self.stdout.write(line)
+
+        total = report['total']
+        if not total:
+            raise CommandError('No requests were sent')
+        self.stdout.write(self.style.SUCCESS(
+            f"{total['requests']} requests in {report['meta']['measured_s']}s: "
+            f"{total['throughput_rps']} req/s, p95 {total['p95_ms']} ms, {total['error_rate']:.1%} errors"
+        ))
@@ -0,0 +1,78 @@
+# Generated by Django 5.2.8 on 2026-10-18 21:44
+
+import re
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+KEY_MAX_LENGTH = 255
+WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def user_search_keys_for(*, full_name, email, role):
+    """
+    Frozen copy of accounts.services.user_search_services.user_search_keys_for
+    as of this migration, so later changes to it do not change history.
+    """
+    keys = set()
+    full_name = " ".join((full_name or "").lower().split())
+    if full_name:
+        keys.add(full_name)
+        keys.update(WORD_RE.findall(full_name))
+
+    email = (email or "").strip().lower()
+    if email:
+        local_part = email.split("@", 1)[0]
+        keys.update({email, local_part})
+        keys.update(WORD_RE.findall(local_part))
+
+    if role:
+        keys.add(role.lower())
+
+    return {key[:KEY_MAX_LENGTH] for key in keys if key}
+
+
+def backfill_user_search_keys(apps, schema_editor):
+    CustomUser = apps.get_model("accounts", "CustomUser")
+    UserSearchKey = apps.get_model("accounts", "UserSearchKey")
+
+    keys = []
+    for user_id, full_name, email, role in (
+        CustomUser.objects.values_list("id", "full_name", "email", "role").iterator(chunk_size=BATCH_SIZE)
+    ):
+        keys.extend(
+            UserSearchKey(user_id=user_id, key=key)
+            for key in user_search_keys_for(full_name=full_name, email=email, role=role)
+        )
+        if len(keys) >= BATCH_SIZE:
+            UserSearchKey.objects.bulk_create(keys, ignore_conflicts=True)
+            keys = []
+
+    UserSearchKey.objects.bulk_create(keys, ignore_conflicts=True)
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_case_sensitive_email_mysql'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserSearchKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(help_text='Lower-cased search key', max_length=255)),
+                ('user', models.ForeignKey(help_text='User this key resolves to', on_delete=django.db.models.deletion.CASCADE, related_name='search_keys', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'User Search Key',
+                'verbose_name_plural': 'User Search Keys',
+                'db_table': 'user_search_keys',
+                'indexes': [models.Index(fields=['key', 'user'], name='idx_user_search_key')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'key'), name='unique_user_search_key')],
+            },
+        ),
+        migrations.RunPython(backfill_user_search_keys, migrations.RunPython.noop),
+    ]
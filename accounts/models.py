@@ -191,6 +191,36 @@ class CustomUser(AbstractBaseUser, PermissionsMixin, SoftDeleteModel):
         return f"{self.email} ({self.get_role_display()})"
 
 
+class UserSearchKey(models.Model):
+    """
+    Normalised, lower-cased search keys for a user (name tokens, full
+    name, email and its local part, role) so prefix lookups are index
+    range scans instead of LIKE scans over `users`.
+    Schema: User_search_keys table
+    """
+    user = models.ForeignKey(
+        CustomUser,
+        on_delete=models.CASCADE,
+        related_name="search_keys",
+        help_text="User this key resolves to"
+    )
+    key = models.CharField(max_length=255, help_text="Lower-cased search key")
+
+    class Meta:
+        db_table = "user_search_keys"
+        verbose_name = "User Search Key"
+        verbose_name_plural = "User Search Keys"
+        constraints = [
+            models.UniqueConstraint(fields=["user", "key"], name="unique_user_search_key"),
+        ]
+        indexes = [
+            models.Index(fields=["key", "user"], name="idx_user_search_key"),
+        ]
+
+    def __str__(self):
+        return f"{self.key} -> {self.user_id}"
+
+
 class SystemConfiguration(SoftDeleteModel):
     """
     System-wide or school-specific configuration settings.
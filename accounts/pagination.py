@@ -3,9 +3,37 @@ Pagination utilities for the EduTraker API.
 
 Provides a reusable pagination mixin for APIView classes and standard pagination class.
 """
+from collections.abc import Mapping
+
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework.exceptions import ValidationError
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
+SPARSE_FIELDSET_PARAMETERS = [
+    OpenApiParameter(name='fields', type=str, description='Comma-separated fields to return'),
+    OpenApiParameter(name='exclude', type=str, description='Comma-separated fields to leave out'),
+]
+
+
+def _field_list(value) -> list[str]:
+    return [name.strip() for name in (value or '').split(',') if name.strip()]
+
+
+def _serialized_fields(data):
+    """
+    The field names rows of data can have: the readable fields of the
+    serializer that produced it (serializer.data keeps a reference), else
+    the keys of the rows themselves; None if data is not a list of mappings.
+    """
+    serializer = getattr(data, 'serializer', None)
+    child = getattr(serializer, 'child', None)
+    if child is not None and hasattr(child, 'fields'):
+        return [name for name, field in child.fields.items() if not field.write_only]
+    if data and isinstance(data[0], Mapping):
+        return list(dict.fromkeys(name for row in data for name in row))
+    return None
+
 
 class StandardPagination(PageNumberPagination):
     """Standard pagination class with 10 items per page."""
@@ -28,8 +56,20 @@ class PaginatedAPIMixin:
                     return self.get_paginated_response(serializer.data)
                 serializer = MySerializer(queryset, many=True)
                 return Response(serializer.data)
+
+    Sparse fieldsets: ?fields=a,b and ?exclude=c trim every paginated
+    response. Views listing through a ProjectionSerializer also push the
+    selection into the query:
+
+        fields = self.get_sparse_fields(MyListSerializer.field_paths())
+        page = self.paginate_queryset(MyListSerializer.project(queryset, fields=fields))
+        return self.get_paginated_response(MyListSerializer(page, many=True, fields=fields).data)
+
+    Listing only reads, so GET requests may read from a database replica
+    (eduTrack.db_router).
     """
     pagination_class = StandardPagination
+    read_replica_methods = ('GET', 'HEAD')
     
     @property
     def paginator(self):
@@ -47,7 +87,37 @@ class PaginatedAPIMixin:
             return None
         return self.paginator.paginate_queryset(queryset, self.request, view=self)
     
+    def get_sparse_fields(self, available):
+        """
+        Return the names in available selected by ?fields= / ?exclude=, in
+        their original order, or None when neither parameter is given.
+
+        Raises:
+            ValidationError: If either parameter names an unknown field
+        """
+        fields = _field_list(self.request.query_params.get('fields'))
+        exclude = _field_list(self.request.query_params.get('exclude'))
+        if not fields and not exclude:
+            return None
+
+        available = list(available)
+        unknown = sorted(set(fields + exclude) - set(available))
+        if unknown:
+            raise ValidationError({'fields': f"Unknown field(s): {', '.join(unknown)}."})
+
+        self._sparse_fields = [
+            name for name in available if (not fields or name in fields) and name not in exclude
+        ]
+        return self._sparse_fields
+
     def get_paginated_response(self, data):
         """Return a paginated response for the given data."""
         assert self.paginator is not None
+        if not hasattr(self, '_sparse_fields'):
+            # The view did not select fields itself: trim the serialized rows
+            available = _serialized_fields(data)
+            if available is not None:
+                fields = self.get_sparse_fields(available)
+                if fields is not None:
+                    data = [{name: row[name] for name in fields if name in row} for row in data]
         return self.paginator.get_paginated_response(data)
@@ -0,0 +1,77 @@
+"""
+Projection serializers for high-volume list endpoints.
+
+A ModelSerializer with dotted sources ('student.user.full_name') needs a
+model instance per row plus one per select_related join. A projection
+serializer declares the same output fields, but project() turns them into
+a .values() query selecting exactly those columns, and the serializer
+renders the resulting dicts directly - no model instances on list paths.
+"""
+from django.db.models import QuerySet
+from rest_framework import serializers
+
+
+class ProjectionSerializer(serializers.Serializer):
+    """
+    Read-only serializer over .values() rows.
+
+    Usage:
+        class MarkListSerializer(ProjectionSerializer):
+            id = serializers.IntegerField()
+            student_name = serializers.CharField(source='student.user.full_name')
+
+        rows = MarkListSerializer.project(mark_list(...))
+        MarkListSerializer(rows, many=True).data
+
+    Each field reads the column named by its source (dotted or ORM path,
+    defaulting to the field name). SerializerMethodFields receive the whole
+    row; the extra columns they need are declared in `annotations` as
+    {method field name: {alias: expression}}.
+
+    Passing fields= to both project() and the serializer limits the query
+    and the output to those fields (sparse fieldsets).
+    """
+    annotations: dict = {}
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def field_paths(cls) -> dict:
+        """Field name -> ORM path read from the row (None for method fields)."""
+        if '_field_paths' not in cls.__dict__:
+            cls._field_paths = {
+                name: None if isinstance(field, serializers.SerializerMethodField)
+                else (field.source or name).replace('.', '__')
+                for name, field in cls._declared_fields.items()
+                if not field.write_only
+            }
+        return cls._field_paths
+
+    @classmethod
+    def project(cls, queryset: QuerySet, fields=None) -> QuerySet:
+        """Restrict queryset to the columns behind fields (default: all), as dicts."""
+        selected = [name for name in cls.field_paths() if fields is None or name in fields]
+        columns = [cls.field_paths()[name] for name in selected if cls.field_paths()[name]]
+        annotations = {}
+        for name in selected:
+            annotations.update(cls.annotations.get(name, {}))
+        if annotations:
+            queryset = queryset.annotate(**annotations)
+        # .values() with no arguments would select every column
+        return queryset.values(*columns, *annotations) if columns or annotations else queryset.values('pk')
+
+    def to_representation(self, row):
+        paths = self.field_paths()
+        ret = {}
+        for field in self._readable_fields:
+            path = paths[field.field_name]
+            if path is None:
+                ret[field.field_name] = field.to_representation(row)
+                continue
+            value = row[path]
+            ret[field.field_name] = None if value is None else field.to_representation(value)
+        return ret
@@ -1,9 +1,125 @@
-from typing import Optional, Any
+import json
+import logging
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+
+from django.conf import settings
+from django.core.cache import cache
 from django.db.models import Q
 from accounts.models import SystemConfiguration
+from eduTrack.metrics import cache_lookup
 from workstream.models import WorkStream
 from school.models import School
 
+logger = logging.getLogger(__name__)
+
+SYSTEM_CONFIG_CACHE_VERSION_KEY = "system_config:version"
+
+_TRUE_VALUES = {"1", "true", "yes", "on"}
+_FALSE_VALUES = {"0", "false", "no", "off", ""}
+
+
+def config_get_map(
+    *,
+    school: Optional[School] = None,
+    work_stream: Optional[WorkStream] = None
+) -> Dict[str, str]:
+    """
+    Return the effective {config_key: config_value} map for a scope.
+
+    Global, workstream and school rows are read in one query and merged
+    with cascading priority (school > workstream > global). The workstream
+    defaults to the school's own. Maps are cached per (school, workstream)
+    until any SystemConfiguration changes; without a shared cache
+    (SYSTEM_CONFIG_CACHE_ENABLED off) they are read on every call, since a
+    per-process cache would miss invalidations from other workers.
+    """
+    school_id = school.pk if school else None
+    work_stream_id = work_stream.pk if work_stream else (school.work_stream_id if school else None)
+    if not settings.SYSTEM_CONFIG_CACHE_ENABLED:
+        return _config_load_map(school_id=school_id, work_stream_id=work_stream_id)
+
+    version = cache.get_or_set(SYSTEM_CONFIG_CACHE_VERSION_KEY, 0, None)
+    cache_key = f"system_config:{version}:{school_id or '-'}:{work_stream_id or '-'}"
+    config_map = cache.get(cache_key)
+    cache_lookup("system_config", hit=config_map is not None)
+    if config_map is not None:
+        return config_map
+
+    config_map = _config_load_map(school_id=school_id, work_stream_id=work_stream_id)
+    cache.set(cache_key, config_map, settings.SYSTEM_CONFIG_CACHE_TIMEOUT)
+    return config_map
+
+
+def _config_load_map(*, school_id: Optional[int], work_stream_id: Optional[int]) -> Dict[str, str]:
+    scope = Q(school__isnull=True, work_stream__isnull=True)
+    if work_stream_id:
+        scope |= Q(work_stream_id=work_stream_id, school__isnull=True)
+    if school_id:
+        scope |= Q(school_id=school_id)
+
+    rows = SystemConfiguration.objects.filter(scope, is_active=True).values_list(
+        "school_id", "work_stream_id", "config_key", "config_value"
+    )
+    # Apply lowest priority first so more specific rows overwrite it
+    ranked = sorted(rows, key=lambda row: 2 if row[0] else (1 if row[1] else 0))
+    return {config_key: config_value for _, _, config_key, config_value in ranked}
+
+
+def _parse_config_value(raw: str, value_type: Callable) -> Any:
+    if value_type is bool:
+        normalized = raw.strip().lower()
+        if normalized in _TRUE_VALUES:
+            return True
+        if normalized in _FALSE_VALUES:
+            return False
+        raise ValueError(f"not a boolean: {raw!r}")
+    if value_type in (dict, list):
+        value = json.loads(raw)
+        if not isinstance(value, value_type):
+            raise ValueError(f"not a JSON {value_type.__name__}: {raw!r}")
+        return value
+    if value_type in (int, float):
+        return value_type(raw.strip())
+    return value_type(raw)
+
+
+def config_get_many(
+    keys: Union[Iterable[str], Dict[str, Callable]],
+    *,
+    school: Optional[School] = None,
+    work_stream: Optional[WorkStream] = None,
+    defaults: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Read several configuration values at once from the cached effective map.
+
+    Args:
+        keys: Config keys, or {key: type} where type is str, int, float,
+            bool, dict or list (JSON) to parse the stored text
+        defaults: Values for keys that are missing or fail to parse
+            (otherwise None)
+
+    Returns:
+        {key: parsed value} for every requested key
+    """
+    types = keys if isinstance(keys, dict) else dict.fromkeys(keys, str)
+    defaults = defaults or {}
+    config_map = config_get_map(school=school, work_stream=work_stream)
+
+    values = {}
+    for key, value_type in types.items():
+        raw = config_map.get(key)
+        if raw is None:
+            values[key] = defaults.get(key)
+            continue
+        try:
+            values[key] = _parse_config_value(raw, value_type)
+        except (TypeError, ValueError) as exc:
+            logger.warning(f"Invalid value for configuration '{key}': {exc}")
+            values[key] = defaults.get(key)
+    return values
+
+
 def config_get_value(
     config_key: str, 
     *, 
@@ -18,40 +134,4 @@ def config_get_value(
     
     Returns the config_value of the highest priority match, or None if not found.
     """
-    # 1. Check School Specific
-    if school:
-        school_config = SystemConfiguration.objects.filter(
-            school=school, 
-            config_key=config_key,
-            is_active=True
-        ).first()
-        if school_config:
-            return school_config.config_value
-        
-        # If no school config, fallback to school's workstream if not provided
-        if not work_stream:
-            work_stream = school.work_stream
-
-    # 2. Check Workstream Specific
-    if work_stream:
-        ws_config = SystemConfiguration.objects.filter(
-            work_stream=work_stream, 
-            config_key=config_key,
-            school__isnull=True,
-            is_active=True
-        ).first()
-        if ws_config:
-            return ws_config.config_value
-
-    # 3. Check Global Specific
-    global_config = SystemConfiguration.objects.filter(
-        school__isnull=True, 
-        work_stream__isnull=True, 
-        config_key=config_key,
-        is_active=True
-    ).first()
-    
-    if global_config:
-        return global_config.config_value
-
-    return None
+    return config_get_map(school=school, work_stream=work_stream).get(config_key)
@@ -0,0 +1,52 @@
+"""
+Filter builder for list selectors.
+
+Filtering a list on a multi-valued relation (enrollments, guardian links)
+with a JOIN duplicates parent rows, which then needs DISTINCT: the
+database sorts and de-duplicates whole wide rows before it can paginate.
+These helpers express the same filters as correlated EXISTS subqueries,
+so the outer query keeps one row per object and can stream pages straight
+off its ordering index.
+"""
+from typing import NamedTuple
+
+from django.db.models import Exists, OuterRef, QuerySet
+
+
+class RelationFilter(NamedTuple):
+    """
+    How one filter key maps onto a related table.
+
+    related: Queryset over the related model (its manager decides whether
+        inactive rows count)
+    link: Field on the related model pointing back at the filtered model
+    lookup: Field on the related model compared with the filter value
+    outer: Field on the filtered model that link refers to
+    """
+    related: QuerySet
+    link: str
+    lookup: str
+    outer: str = "pk"
+
+
+def relation_exists(related: QuerySet, *, link: str, outer: str = "pk", **conditions) -> Exists:
+    """Exists(...) matching rows of related whose link points at the outer row."""
+    return Exists(related.filter(**{link: OuterRef(outer)}, **conditions))
+
+
+def apply_relation_filters(qs: QuerySet, *, filters: dict, spec: dict[str, RelationFilter]) -> QuerySet:
+    """
+    Apply each key of filters that spec knows as an EXISTS subquery.
+
+    Every key gets its own subquery, which matches chained
+    .filter(relation__field=value) calls: the conditions may be met by
+    different related rows.
+    """
+    for key, relation in spec.items():
+        value = filters.get(key)
+        if not value:
+            continue
+        qs = qs.filter(relation_exists(
+            relation.related, link=relation.link, outer=relation.outer, **{relation.lookup: value}
+        ))
+    return qs
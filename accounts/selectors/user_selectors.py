@@ -1,10 +1,18 @@
-from django.db.models import QuerySet, Q
-from accounts.models import CustomUser, Role
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import QuerySet
+from accounts.models import CustomUser, Role, UserSearchKey
 from django.shortcuts import get_object_or_404
 from accounts.policies.user_policies import can_access_user
 from rest_framework.exceptions import ValidationError, PermissionDenied as DRFPermissionDenied
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from django.db.models.functions import Lower
+from eduTrack.metrics import cache_lookup
+
+USER_SEARCH_CACHE_VERSION_KEY = "user_search:version"
+AUTH_USER_PROFILE_RELATIONS = ("teacher_profile", "student_profile", "guardian_profile", "secretary_profile")
 
 
 def user_list(*, filters: dict, user: CustomUser) -> QuerySet[CustomUser]:
@@ -34,17 +42,53 @@ def user_list(*, filters: dict, user: CustomUser) -> QuerySet[CustomUser]:
          qs = qs.filter(is_active=is_active_val)
 
     if search := filters.get("search"):
-        qs = qs.annotate(
-            low_full_name=Lower('full_name'),
-            low_email=Lower('email')
-        ).filter(
-            Q(low_full_name__icontains=search.lower()) | 
-            Q(low_email__icontains=search.lower())
-        )
+        qs = qs.filter(id__in=user_search_prefix_ids(term=search))
 
     return qs
 
 
+def user_search_prefix_ids(*, term: str) -> QuerySet:
+    """
+    Subquery of ids of users with a search key starting with term
+    (name word, full name, email, email local part or role).
+    """
+    term = " ".join((term or "").lower().split())
+    # Keys are stored lower-cased, so a case-insensitive LIKE 'term%' is an
+    # exact prefix match and stays an index range scan on MySQL.
+    return UserSearchKey.objects.filter(key__istartswith=term).values("user_id")
+
+
+def user_search_cached_ids(*, scope_key: str, term: str, queryset: QuerySet, limit: int) -> List[int]:
+    """
+    Ids of the first `limit` users in `queryset` matching a search prefix,
+    cached per (scope, prefix) so repeated keystrokes from users with the
+    same visibility scope reuse one lookup.
+
+    The caller must pass a scope_key that fully determines `queryset`.
+    Without a shared cache (USER_SEARCH_CACHE_ENABLED off) every call runs
+    the lookup, since a per-process cache would miss invalidations from
+    other workers.
+    """
+    term = " ".join((term or "").lower().split())
+    if not settings.USER_SEARCH_CACHE_ENABLED:
+        return list(
+            queryset.filter(id__in=user_search_prefix_ids(term=term)).values_list("id", flat=True)[:limit]
+        )
+
+    version = cache.get_or_set(USER_SEARCH_CACHE_VERSION_KEY, 0, None)
+    digest = hashlib.sha1(f"{scope_key}:{term}".encode()).hexdigest()
+    cache_key = f"user_search:{version}:{digest}"
+
+    ids = cache.get(cache_key)
+    cache_lookup("user_search", hit=ids is not None)
+    if ids is None:
+        ids = list(
+            queryset.filter(id__in=user_search_prefix_ids(term=term)).values_list("id", flat=True)[:limit]
+        )
+        cache.set(cache_key, ids, settings.USER_SEARCH_CACHE_TIMEOUT)
+    return ids
+
+
 def user_get(*, user_id: int, actor: CustomUser) -> CustomUser:
     """
     Get a single user by ID with permission check.
@@ -60,6 +104,50 @@ def user_get(*, user_id: int, actor: CustomUser) -> CustomUser:
     return user
 
 
+def auth_user_cache_version_key(user_id: int) -> str:
+    return f"auth_user:version:{user_id}"
+
+
+def user_get_for_auth(*, user_id: int) -> Optional[CustomUser]:
+    """
+    Load an active user for request authentication, with school, work
+    stream and role profile joined, from a short-lived cache.
+
+    Entries are keyed by user id and a per-user version stamp; every
+    CustomUser save or delete rotates the stamp on commit (accounts.signals)
+    and retires them. queryset.update() sends no signal and is visible
+    after at most AUTH_USER_CACHE_TIMEOUT seconds. Without a shared cache
+    (AUTH_USER_CACHE_ENABLED off) the user is loaded on every request,
+    since a per-process cache would miss invalidations from other workers.
+
+    Returns None if no active user has this id.
+    """
+    if not settings.AUTH_USER_CACHE_ENABLED:
+        return (
+            CustomUser.objects.select_related("school", "work_stream", *AUTH_USER_PROFILE_RELATIONS)
+            .filter(id=user_id)
+            .first()
+        )
+
+    # Read the stamp before the row so a load racing an invalidation is
+    # stored under the retired stamp and never served.
+    version = cache.get_or_set(auth_user_cache_version_key(user_id), 0, None)
+    cache_key = f"auth_user:{user_id}:{version}"
+
+    user = cache.get(cache_key)
+    cache_lookup("auth_user", hit=user is not None)
+    if user is None:
+        user = (
+            CustomUser.objects.select_related("school", "work_stream", *AUTH_USER_PROFILE_RELATIONS)
+            .filter(id=user_id)
+            .first()
+        )
+        if user is None:
+            return None
+        cache.set(cache_key, user, settings.AUTH_USER_CACHE_TIMEOUT)
+    return user
+
+
 def user_get_by_email(*, email: str) -> Optional[CustomUser]:
     """
     Get user by email address.
@@ -75,6 +163,42 @@ def user_get_by_email(*, email: str) -> Optional[CustomUser]:
         return None
 
 
+def user_resolve_emails(*, emails: List[str]) -> Tuple[List[CustomUser], List[str]]:
+    """
+    Resolve email addresses to active users case-insensitively in one query.
+    An exact-case match wins when several accounts differ only by case;
+    otherwise a single case-insensitive match is used.
+
+    Returns:
+        (resolved users without duplicates, emails that matched no single user)
+    """
+    requested = [(email or "").strip() for email in emails]
+    lowered = {email.lower() for email in requested if email}
+    if not lowered:
+        return [], [email for email in requested if not email]
+
+    candidates: Dict[str, List[CustomUser]] = {}
+    for candidate in CustomUser.objects.annotate(email_lower=Lower("email")).filter(email_lower__in=lowered):
+        candidates.setdefault(candidate.email_lower, []).append(candidate)
+
+    users, seen_ids, unresolved = [], set(), []
+    for email in requested:
+        matches = candidates.get(email.lower(), [])
+        exact = [match for match in matches if match.email == email]
+        if exact:
+            match = exact[0]
+        elif len(matches) == 1:
+            match = matches[0]
+        else:
+            unresolved.append(email)
+            continue
+        if match.id not in seen_ids:
+            seen_ids.add(match.id)
+            users.append(match)
+
+    return users, unresolved
+
+
 def user_get_profile(*, user_id: int, actor: CustomUser) -> Dict[str, Any]:
     """
     Get user with their role-specific profile.
@@ -4,6 +4,7 @@ from rest_framework_simplejwt.tokens import RefreshToken
 from accounts.models import CustomUser, Role
 from student.services.student_services import student_create
 from workstream.models import WorkStream
+from workstream.services.workstream_capacity_services import workstream_lock
 from accounts.selectors.auth_selectors import authenticate_user
 from accounts.selectors.user_selectors import user_get_by_email
 from typing import Dict
@@ -112,33 +113,32 @@ def workstream_register_user(
     if user_get_by_email(email=normalized_email):
         raise ValidationError("A user with this email already exists.")
     
-    # Validate workstream exists and is active
+    # Create user with STUDENT role. Hashing the password is slow, so it
+    # happens before the workstream row is locked.
+    user = CustomUser(
+        email=normalized_email,
+        full_name=full_name,
+        role=Role.STUDENT,
+        work_stream_id=workstream_id,
+    )
+    user.set_password(password)
+    user.full_clean(exclude=["work_stream"])
+
+    # Validate workstream exists and is active; the row stays locked until
+    # the user is saved so concurrent registrations cannot both take the
+    # last seat.
     try:
-        workstream = WorkStream.objects.get(id=workstream_id, is_active=True)
+        workstream = workstream_lock(work_stream_id=workstream_id)
     except WorkStream.DoesNotExist:
         raise ValidationError("Workstream not found.")
-    
-    # Check workstream capacity
-    current_users_count = CustomUser.objects.filter(
-        work_stream=workstream,
-        is_active=True
-    ).count()
 
-    if current_users_count >= workstream.capacity:
+    # Check workstream capacity (the counter moves when the user is saved)
+    if workstream.active_user_count >= workstream.capacity:
         raise ValidationError(
             "This workstream has reached the maximum number of users."
         )
-    
-    # Create user with STUDENT role and assign to workstream
-    user = CustomUser(
-        email=normalized_email,
-        full_name=full_name,
-        role=Role.STUDENT,
-        work_stream=workstream,
-    )
-    
-    user.set_password(password)
-    user.full_clean()
+
+    user.work_stream = workstream
     user.save()
     
     return user
@@ -193,6 +193,7 @@ def request_password_reset(*, email: str) -> Dict:
     from django.utils.http import urlsafe_base64_encode
     from django.utils.encoding import force_bytes
     from accounts.services.email_service import send_password_reset_email
+    from accounts.tasks import send_password_reset_email_async
 
     normalized_email = (email or "").strip()
     user = user_get_by_email(email=normalized_email)
@@ -208,8 +209,13 @@ def request_password_reset(*, email: str) -> Dict:
     uid = urlsafe_base64_encode(force_bytes(user.pk))
     token = default_token_generator.make_token(user)
 
-    # Send the password reset email
-    email_sent = send_password_reset_email(user=user, uid=uid, token=token)
+    # Queue the password reset email so SMTP latency stays off the request
+    try:
+        send_password_reset_email_async.delay(user_id=user.id, uid=uid, token=token)
+        email_sent = True
+    except Exception:
+        # Celery/broker not available: fall back to sending inline.
+        email_sent = send_password_reset_email(user=user, uid=uid, token=token)
 
     response = {
         'message': 'If this email exists, a password reset link has been sent.',
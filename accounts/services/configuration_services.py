@@ -0,0 +1,22 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+from accounts.selectors.configuration_selectors import SYSTEM_CONFIG_CACHE_VERSION_KEY
+
+
+def _rotate_config_cache_version() -> None:
+    cache.set(SYSTEM_CONFIG_CACHE_VERSION_KEY, time.time_ns(), None)
+
+
+def config_cache_invalidate() -> None:
+    """
+    Retire every cached effective configuration map.
+
+    Rotates now, so the writer's own transaction reads fresh values, and
+    again on commit, so a map cached by a concurrent reader from
+    pre-commit data is not served afterwards.
+    """
+    _rotate_config_cache_version()
+    transaction.on_commit(_rotate_config_cache_version)
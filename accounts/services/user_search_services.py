@@ -0,0 +1,99 @@
+"""
+Maintenance of the UserSearchKey prefix index.
+
+Keys are lower-cased so lookups are plain prefix range scans on
+user_search_keys(key). Every sync also rotates the cache version used by
+the prefix result cache in accounts.selectors.user_selectors.
+"""
+import re
+import time
+from typing import Iterable, Set
+
+from django.core.cache import cache
+from django.db import transaction
+
+from accounts.models import CustomUser, UserSearchKey
+from accounts.selectors.user_selectors import USER_SEARCH_CACHE_VERSION_KEY
+
+KEY_MAX_LENGTH = 255
+WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def user_search_cache_invalidate() -> None:
+    """Retire every cached prefix result by rotating the cache version."""
+    cache.set(USER_SEARCH_CACHE_VERSION_KEY, time.time_ns(), None)
+
+
+def user_search_keys_for(*, full_name: str, email: str, role: str) -> Set[str]:
+    """
+    Search keys for a user: the whole name, each name word, the email, its
+    local part and the words in it, and the role.
+    """
+    keys = set()
+    full_name = " ".join((full_name or "").lower().split())
+    if full_name:
+        keys.add(full_name)
+        keys.update(WORD_RE.findall(full_name))
+
+    email = (email or "").strip().lower()
+    if email:
+        local_part = email.split("@", 1)[0]
+        keys.update({email, local_part})
+        keys.update(WORD_RE.findall(local_part))
+
+    if role:
+        keys.add(role.lower())
+
+    return {key[:KEY_MAX_LENGTH] for key in keys if key}
+
+
+@transaction.atomic
+def user_search_keys_sync(*, user: CustomUser) -> None:
+    """Replace a user's search keys with ones derived from current field values."""
+    keys = user_search_keys_for(full_name=user.full_name, email=user.email, role=user.role)
+    existing = set(UserSearchKey.objects.filter(user=user).values_list("key", flat=True))
+
+    if existing - keys:
+        UserSearchKey.objects.filter(user=user, key__in=existing - keys).delete()
+    if keys - existing:
+        UserSearchKey.objects.bulk_create(
+            [UserSearchKey(user=user, key=key) for key in keys - existing],
+            ignore_conflicts=True,
+        )
+    transaction.on_commit(user_search_cache_invalidate)
+
+
+def user_search_keys_rebuild(*, user_ids: Iterable[int] = None, batch_size: int = 500) -> int:
+    """
+    Recompute search keys for the given users (default: everyone) in
+    primary-key batches. Use after bulk_create() or queryset.update() on
+    users, which do not send post_save.
+
+    Returns:
+        Number of users processed
+    """
+    queryset = CustomUser.all_objects.only("id", "full_name", "email", "role").order_by("id")
+    if user_ids is not None:
+        queryset = queryset.filter(id__in=list(user_ids))
+
+    processed = 0
+    last_id = 0
+    while True:
+        batch = list(queryset.filter(id__gt=last_id)[:batch_size])
+        if not batch:
+            break
+        with transaction.atomic():
+            UserSearchKey.objects.filter(user_id__in=[user.id for user in batch]).delete()
+            UserSearchKey.objects.bulk_create(
+                [
+                    UserSearchKey(user_id=user.id, key=key)
+                    for user in batch
+                    for key in user_search_keys_for(full_name=user.full_name, email=user.email, role=user.role)
+                ],
+                batch_size=1000,
+            )
+        processed += len(batch)
+        last_id = batch[-1].id
+
+    user_search_cache_invalidate()
+    return processed
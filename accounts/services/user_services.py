@@ -1,5 +1,9 @@
+import time
+
+from django.core.cache import cache
 from django.db import transaction
 from accounts.models import CustomUser, Role
+from accounts.selectors.user_selectors import auth_user_cache_version_key
 from accounts.policies.user_policies import ROLE_CREATION_MATRIX
 from rest_framework.exceptions import ValidationError, PermissionDenied as DRFPermissionDenied
 from typing import Optional
@@ -8,6 +12,19 @@ from reports.utils import log_activity
 from django.core.exceptions import ValidationError as DjangoValidationError
 
 
+def user_auth_cache_invalidate(*, user_id: int) -> None:
+    """
+    Retire the cached authentication copy of a user once the current
+    transaction commits, so the next request reloads it.
+
+    Called from the CustomUser post_save/post_delete receiver in
+    accounts.signals; call it directly after queryset.update() on users.
+    """
+    transaction.on_commit(
+        lambda: cache.set(auth_user_cache_version_key(user_id), time.time_ns(), None)
+    )
+
+
 @transaction.atomic
 def user_create(
     *,
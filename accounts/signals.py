@@ -0,0 +1,41 @@
+"""
+Keep the UserSearchKey prefix index and the prefix result cache in sync
+with user saves, retire a user's cached authentication copy whenever the
+user is saved or deleted, and retire cached configuration maps when a
+SystemConfiguration changes.
+
+bulk_create()/queryset.update() on users do not send post_save; call
+accounts.services.user_search_services.user_search_keys_rebuild() and
+accounts.services.user_services.user_auth_cache_invalidate() after them.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accounts.models import CustomUser, SystemConfiguration
+from accounts.services.configuration_services import config_cache_invalidate
+from accounts.services.user_search_services import user_search_cache_invalidate, user_search_keys_sync
+from accounts.services.user_services import user_auth_cache_invalidate
+
+SEARCH_KEY_FIELDS = {"full_name", "email", "role"}
+SEARCH_SCOPE_FIELDS = {"is_active", "school", "work_stream"}
+
+
+@receiver(post_save, sender=CustomUser)
+def sync_user_search_keys(sender, instance, created, update_fields=None, **kwargs):
+    if update_fields is None or SEARCH_KEY_FIELDS & set(update_fields):
+        user_search_keys_sync(user=instance)
+    elif SEARCH_SCOPE_FIELDS & set(update_fields):
+        transaction.on_commit(user_search_cache_invalidate)
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_auth_user_cache(sender, instance, **kwargs):
+    user_auth_cache_invalidate(user_id=instance.pk)
+
+
+@receiver(post_save, sender=SystemConfiguration)
+@receiver(post_delete, sender=SystemConfiguration)
+def invalidate_configuration_cache(sender, instance, **kwargs):
+    config_cache_invalidate()
@@ -0,0 +1,27 @@
+from celery import shared_task
+import logging
+
+from accounts.models import CustomUser
+from accounts.services.email_service import send_password_reset_email
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def send_password_reset_email_async(self, user_id, uid, token):
+    """
+    Send the password reset email outside the request/response cycle.
+
+    Args:
+        user_id: ID of the user requesting the reset
+        uid: URL-safe base64 encoded user ID
+        token: Password reset token
+    """
+    try:
+        user = CustomUser.objects.get(id=user_id)
+    except CustomUser.DoesNotExist:
+        logger.error(f"User with ID {user_id} not found for password reset email")
+        return
+
+    if not send_password_reset_email(user=user, uid=uid, token=token):
+        raise self.retry()
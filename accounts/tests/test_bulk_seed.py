@@ -0,0 +1,92 @@
+from django.db import transaction
+from django.db.models import F
+from django.test import TestCase
+
+from accounts.models import CustomUser, UserSearchKey
+from eduTrack.bulk_seed import SUBJECTS, BulkSeedLayout, bulk_seed
+from guardian.models import GuardianStudentLink
+from school.models import Grade, School
+from student.models import Student, StudentEnrollment
+from teacher.models import Attendance, Mark
+from workstream.models import WorkStream
+
+LAYOUT = BulkSeedLayout(
+    schools_per_scale=2,
+    schools_per_workstream=3,
+    grades=2,
+    classrooms_per_grade=2,
+    students_per_classroom=3,
+    teachers=3,
+    secretaries=1,
+    assignments_per_allocation=2,
+    attendance_days=2,
+)
+
+
+class BulkSeedTests(TestCase):
+    """Tests for the seed_data --scale benchmark generator."""
+
+    def setUp(self):
+        self.grade_ids = [
+            Grade.objects.create(name=f"Grade {level}", numeric_level=level, min_age=5, max_age=6).id
+            for level in (1, 2)
+        ]
+
+    def seed(self, **kwargs):
+        return bulk_seed(scale=2, grade_ids=self.grade_ids, layout=LAYOUT, batch_size=7, **kwargs)
+
+    def snapshot(self):
+        return (
+            list(CustomUser.objects.order_by("id").values_list("full_name", "role")),
+            list(Mark.objects.order_by("id").values_list("score", "letter_grade")),
+            list(Attendance.objects.order_by("id").values_list("status", "date")),
+        )
+
+    def test_writes_layout_row_counts(self):
+        """Test every school gets exactly the rows its reserved key blocks allow for."""
+        totals = self.seed()
+
+        self.assertEqual(totals["Schools"], 4)
+        self.assertEqual(totals["Workstreams"], 2)
+        self.assertEqual(Student.objects.count(), 4 * LAYOUT.students)
+        self.assertEqual(Mark.objects.count(), 4 * LAYOUT.students * len(SUBJECTS) * LAYOUT.assignments_per_allocation)
+        self.assertEqual(Attendance.objects.count(), 4 * LAYOUT.students * len(SUBJECTS) * LAYOUT.attendance_days)
+        self.assertEqual(GuardianStudentLink.objects.count(), 4 * LAYOUT.students)
+        self.assertEqual(totals["Marks"], Mark.objects.count())
+
+    def test_rows_are_consistent(self):
+        """Test marks belong to enrolled students and every school has its manager."""
+        self.seed()
+
+        enrolled = Mark.objects.filter(
+            student__enrollments__class_room=F("assignment__course_allocation__class_room")
+        )
+        self.assertEqual(enrolled.count(), Mark.objects.count())
+        self.assertFalse(School.objects.filter(manager__isnull=True).exists())
+        self.assertEqual(StudentEnrollment.objects.values("student").distinct().count(), Student.objects.count())
+
+    def test_maintains_signal_driven_data(self):
+        """Test search keys and workstream counters are rebuilt after the bulk inserts."""
+        self.seed()
+
+        self.assertEqual(
+            UserSearchKey.objects.values("user").distinct().count(), CustomUser.objects.count()
+        )
+        for workstream in WorkStream.objects.all():
+            self.assertEqual(workstream.active_school_count, workstream.schools.count())
+            self.assertEqual(workstream.active_user_count, workstream.users.count())
+
+    def test_same_seed_gives_same_data(self):
+        """Test the dataset depends only on the seed."""
+        with transaction.atomic():
+            self.seed(seed=7)
+            first = self.snapshot()
+            transaction.set_rollback(True)
+        with transaction.atomic():
+            self.seed(seed=7)
+            second = self.snapshot()
+            transaction.set_rollback(True)
+        self.seed(seed=8)
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first[1], self.snapshot()[1])
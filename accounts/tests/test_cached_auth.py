@@ -0,0 +1,93 @@
+"""
+Cached JWT Authentication Tests
+
+Tests that authenticated requests resolve the user from cache and that
+every user save, including role-specific deactivations, invalidates it.
+"""
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.services.user_services import user_activate, user_deactivate, user_update
+from school.models import School
+from teacher.models import Teacher
+from teacher.services.teacher_services import teacher_deactivate
+from workstream.models import WorkStream
+
+User = get_user_model()
+
+
+@override_settings(AUTH_USER_CACHE_ENABLED=True)
+class CachedJWTAuthenticationTests(APITestCase):
+    """Test the cached JWT authentication class."""
+
+    def setUp(self):
+        cache.clear()
+        self.workstream = WorkStream.objects.create(workstream_name="Test WS", capacity=50)
+        self.school = School.objects.create(school_name="Test School", work_stream=self.workstream)
+        self.user = User.objects.create_user(
+            email='secretary@test.com', full_name='Sam Office', role='secretary', school=self.school
+        )
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.url = reverse('notifications:notification-list')
+
+    def test_user_is_loaded_once(self):
+        """Test repeated requests authenticate without querying users, school or profile."""
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+
+        # Only the view's own notification COUNT(*) remains
+        with self.assertNumQueries(1):
+            user = self.client.get(self.url).wsgi_request.user
+            self.assertEqual(user.school.school_name, "Test School")
+            self.assertEqual(user.school.work_stream_id, self.workstream.id)
+            self.assertFalse(hasattr(user, 'teacher_profile'))
+
+    def test_user_services_invalidate_cached_user(self):
+        """Test deactivate, activate and update take effect on the next request."""
+        self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            user_deactivate(user=self.user)
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            user_activate(user=User.all_objects.get(pk=self.user.pk))
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            user_update(user=User.objects.get(pk=self.user.pk), data={'full_name': 'Samantha Office'})
+        response = self.client.get(self.url)
+        self.assertEqual(response.wsgi_request.user.full_name, 'Samantha Office')
+
+    def test_teacher_deactivate_invalidates_cached_user(self):
+        """Test a role service that saves the user directly also revokes access."""
+        teacher_user = User.objects.create_user(
+            email='teacher@test.com', full_name='Tess Teacher', role='teacher', school=self.school
+        )
+        teacher = Teacher.objects.create(user=teacher_user, hire_date="2025-01-01")
+        manager = User.objects.create_user(
+            email='manager@test.com', full_name='Max Manager', role='manager_school', school=self.school
+        )
+        token = RefreshToken.for_user(teacher_user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            teacher_deactivate(teacher=teacher, actor=manager)
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(AUTH_USER_CACHE_ENABLED=False)
+    def test_without_shared_cache_user_is_loaded_per_request(self):
+        """Test a process-local cache is not used, so every request sees a deactivation."""
+        self.client.get(self.url)
+
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
+
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
@@ -2,10 +2,14 @@ from rest_framework.test import APITestCase
 from accounts.models import SystemConfiguration, CustomUser, Role
 from workstream.models import WorkStream
 from school.models import School
-from accounts.selectors.configuration_selectors import config_get_value
+from django.core.cache import cache
+from django.test import override_settings
+from accounts.selectors.configuration_selectors import config_get_value, config_get_many
 
+@override_settings(SYSTEM_CONFIG_CACHE_ENABLED=True)
 class CascadingConfigTests(APITestCase):
     def setUp(self):
+        cache.clear()
         self.ws = WorkStream.objects.create(workstream_name="WS1", capacity=10)
         self.school = School.objects.create(school_name="Sch1", work_stream=self.ws)
         
@@ -26,3 +30,43 @@ class CascadingConfigTests(APITestCase):
         
         # Global should still be GLOBAL if requested without context
         self.assertEqual(config_get_value("GRADING"), "GLOBAL")
+
+    def test_get_many_reads_effective_map_once(self):
+        SystemConfiguration.objects.create(config_key="MAX_CLASS_SIZE", config_value="30")
+        SystemConfiguration.objects.create(config_key="LATE_SUBMISSIONS", config_value="no")
+        SystemConfiguration.objects.create(config_key="LATE_SUBMISSIONS", config_value="yes", work_stream=self.ws)
+        SystemConfiguration.objects.create(config_key="TERMS", config_value='["T1", "T2"]', school=self.school)
+        SystemConfiguration.objects.create(config_key="PASS_MARK", config_value="fifty", school=self.school)
+        keys = {"MAX_CLASS_SIZE": int, "LATE_SUBMISSIONS": bool, "TERMS": list, "PASS_MARK": float, "MISSING": str}
+
+        with self.assertNumQueries(1):
+            values = config_get_many(keys, school=self.school, defaults={"PASS_MARK": 50.0})
+        with self.assertNumQueries(0):
+            self.assertEqual(config_get_many(keys, school=self.school, defaults={"PASS_MARK": 50.0}), values)
+
+        self.assertEqual(values, {
+            "MAX_CLASS_SIZE": 30,
+            "LATE_SUBMISSIONS": True,
+            "TERMS": ["T1", "T2"],
+            "PASS_MARK": 50.0,
+            "MISSING": None,
+        })
+
+    def test_cached_map_invalidated_on_save_and_delete(self):
+        config = SystemConfiguration.objects.create(config_key="GRADING", config_value="GLOBAL")
+        self.assertEqual(config_get_value("GRADING", school=self.school), "GLOBAL")
+
+        config.config_value = "LETTER"
+        config.save()
+        self.assertEqual(config_get_value("GRADING", school=self.school), "LETTER")
+
+        config.delete()
+        self.assertIsNone(config_get_value("GRADING", school=self.school))
+
+    @override_settings(SYSTEM_CONFIG_CACHE_ENABLED=False)
+    def test_map_read_every_call_without_shared_cache(self):
+        SystemConfiguration.objects.create(config_key="GRADING", config_value="GLOBAL")
+
+        for _ in range(2):
+            with self.assertNumQueries(1):
+                self.assertEqual(config_get_value("GRADING", school=self.school), "GLOBAL")
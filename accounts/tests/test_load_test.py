@@ -0,0 +1,57 @@
+from django.test import TestCase
+
+from eduTrack.bulk_seed import BulkSeedLayout, bulk_seed
+from eduTrack.load_test import WORKLOAD, load_test_diff, load_test_run, load_test_summarize
+from school.models import Grade
+
+LAYOUT = BulkSeedLayout(
+    schools_per_scale=1,
+    grades=1,
+    classrooms_per_grade=1,
+    students_per_classroom=4,
+    teachers=2,
+    secretaries=1,
+    assignments_per_allocation=1,
+    attendance_days=2,
+)
+
+
+class LoadTestTests(TestCase):
+    """Tests for the load_test harness."""
+
+    def test_run_reports_every_endpoint_without_errors(self):
+        """Test a short run against a seeded database exercises the whole workload."""
+        grade = Grade.objects.create(name="Grade 1", numeric_level=1, min_age=6, max_age=7)
+        bulk_seed(scale=1, grade_ids=[grade.id], layout=LAYOUT)
+
+        report = load_test_run(duration=None, requests=60, clients=1)
+
+        self.assertEqual(report["total"]["requests"], 60)
+        self.assertEqual(report["total"]["errors"], 0, report["endpoints"])
+        self.assertLessEqual(set(report["endpoints"]), {scenario.name for scenario in WORKLOAD})
+        self.assertEqual(report["meta"]["clients"], 1)
+        self.assertLessEqual(report["meta"]["measured_s"], report["meta"]["elapsed_s"])
+
+    def test_summarize_percentiles_and_errors(self):
+        """Test nearest-rank percentiles and error rates per endpoint."""
+        samples = [("GET /a [student]", float(ms), 200) for ms in range(1, 101)]
+        samples += [("GET /b [teacher]", 5.0, 500), ("GET /b [teacher]", 7.0, 200)]
+
+        summary = load_test_summarize(samples, elapsed=2.0)
+
+        a = summary["endpoints"]["GET /a [student]"]
+        self.assertEqual((a["p50_ms"], a["p95_ms"], a["p99_ms"]), (50.0, 95.0, 99.0))
+        self.assertEqual(a["throughput_rps"], 50.0)
+        self.assertEqual(summary["endpoints"]["GET /b [teacher]"]["error_rate"], 0.5)
+        self.assertEqual(summary["total"]["requests"], 102)
+
+    def test_diff_lists_changed_and_new_endpoints(self):
+        """Test comparing two reports."""
+        before = load_test_summarize([("GET /a [student]", 10.0, 200)], elapsed=1.0)
+        after = load_test_summarize([("GET /a [student]", 20.0, 200), ("GET /b [teacher]", 5.0, 200)], elapsed=1.0)
+
+        lines = load_test_diff(before, after)
+
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith("~ GET /a [student]: p95 10.0 -> 20.0 ms"))
+        self.assertTrue(lines[1].startswith("+ GET /b [teacher]"))
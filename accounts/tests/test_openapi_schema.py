@@ -0,0 +1,82 @@
+import tempfile
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from eduTrack.openapi import openapi_schema_generate
+
+
+class OpenApiSchemaTests(TestCase):
+    """Tests for the pre-generated schema served at /api/schema/."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings_override = override_settings(OPENAPI_SCHEMA_DIR=directory.name, DEBUG=False)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.url = reverse("schema")
+
+    def test_serves_generated_schema_with_etag(self):
+        """Test the generated YAML is served by default with caching headers and revalidates to 304."""
+        path, etag = openapi_schema_generate()["yaml"]
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/vnd.oai.openapi")
+        self.assertEqual(response["ETag"], etag)
+        self.assertIn("no-cache", response["Cache-Control"])
+        self.assertIn("Accept", response["Vary"])
+        self.assertEqual(response.content, path.read_bytes())
+        self.assertTrue(response.content.startswith(b"openapi:"))
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_json_by_format_or_accept(self):
+        """Test ?format=json and a JSON Accept header both get the JSON file."""
+        path, etag = openapi_schema_generate()["json"]
+
+        by_format = self.client.get(self.url, {"format": "json"})
+        by_accept = self.client.get(self.url, HTTP_ACCEPT="application/json")
+
+        self.assertEqual(by_format["Content-Type"], "application/vnd.oai.openapi+json")
+        self.assertEqual(by_accept["Content-Type"], "application/json")
+        for response in (by_format, by_accept):
+            self.assertEqual(response["ETag"], etag)
+            self.assertEqual(response.content, path.read_bytes())
+
+    def test_lang_served_from_file(self):
+        """Test ?lang= does not trigger per-request generation outside DEBUG."""
+        path, etag = openapi_schema_generate()["yaml"]
+
+        response = self.client.get(self.url, {"lang": "de"})
+
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, path.read_bytes())
+
+    def test_unknown_format_not_found(self):
+        """Test ?format= outside yaml and json is a 404."""
+        openapi_schema_generate()
+
+        response = self.client.get(self.url, {"format": "xml"})
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_missing_schema_unavailable(self):
+        """Test the schema is not generated per request outside DEBUG."""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 503)
+
+    def test_debug_generates_schema_live(self):
+        """Test DEBUG generates the schema per request even when the files exist."""
+        openapi_schema_generate()
+
+        with override_settings(DEBUG=True):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response)
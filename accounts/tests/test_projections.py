@@ -0,0 +1,138 @@
+from datetime import date
+from decimal import Decimal
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from accounts.models import CustomUser
+from school.models import AcademicYear, ClassRoom, Course, Grade, School
+from student.models import Student, StudentEnrollment
+from student.views.student_views import StudentListSerializer, StudentOutputSerializer
+from teacher.models import Assignment, Attendance, CourseAllocation, Mark, Teacher
+from teacher.views.attendance_views import AttendanceListSerializer, AttendanceOutputSerializer
+from teacher.views.mark_views import MarkListSerializer, MarkOutputSerializer
+from teacher.views.teacher_views import TeacherListSerializer, TeacherOutputSerializer
+from workstream.models import WorkStream
+
+
+class ProjectionSerializerTests(APITestCase):
+    """
+    Tests that projection list serializers keep the model serializers' output.
+    """
+    def setUp(self):
+        self.workstream = WorkStream.objects.create(workstream_name="Proj", capacity=5)
+        self.school = School.objects.create(school_name="Proj High", work_stream=self.workstream)
+        year = AcademicYear.objects.create(
+            academic_year_code="2027/2026", school=self.school,
+            start_date=date(2026, 9, 1), end_date=date(2027, 6, 30)
+        )
+        grade = Grade.objects.create(name="Grade 7", numeric_level=7, min_age=12, max_age=13)
+        classroom = ClassRoom.objects.create(classroom_name="7A", school=self.school, academic_year=year, grade=grade)
+        self.manager = CustomUser.objects.create_user(
+            email="manager@school.com", password="password123", full_name="Manager",
+            role="manager_school", school=self.school
+        )
+        teacher_user = CustomUser.objects.create_user(
+            email="teacher@school.com", password="password123", full_name="Teacher", role="teacher", school=self.school
+        )
+        self.teacher = Teacher.objects.create(
+            user=teacher_user, hire_date=date(2020, 1, 1), employment_status="full_time", specialization="Math"
+        )
+        course = Course.objects.create(course_code="MATH7", school=self.school, grade=grade, name="Math")
+        allocation = CourseAllocation.objects.create(
+            course=course, class_room=classroom, teacher=self.teacher, academic_year=year
+        )
+        assignment = Assignment.objects.create(
+            assignment_code="HW1", course_allocation=allocation, created_by=self.teacher,
+            title="Homework 1", full_mark=Decimal("100.00")
+        )
+        self.students = []
+        for i in range(2):
+            user = CustomUser.objects.create_user(
+                email=f"s{i}@school.com", password="password123", full_name=f"Student {i}",
+                role="student", school=self.school
+            )
+            student = Student.objects.create(
+                user=user, grade=grade, date_of_birth=date(2014, 1, 1), admission_date=date(2026, 9, 1)
+            )
+            self.students.append(student)
+            Mark.objects.create(
+                student=student, assignment=assignment, score=Decimal("91.50"),
+                graded_by=self.teacher, graded_at=timezone.now()
+            )
+            Attendance.objects.create(
+                student=student, course_allocation=allocation, date=date(2026, 10, 1),
+                status="present", recorded_by=self.teacher
+            )
+        # Only the first student has a current grade
+        StudentEnrollment.objects.create(student=self.students[0], class_room=classroom, academic_year=year)
+
+    def _assert_same(self, projection, model_serializer, queryset):
+        expected = model_serializer(list(queryset), many=True).data
+        with self.assertNumQueries(1):
+            actual = projection(projection.project(queryset), many=True).data
+        self.assertEqual([dict(row) for row in actual], [dict(row) for row in expected])
+
+    def test_projections_match_model_serializers(self):
+        """Test each list projection renders what its ModelSerializer renders, in one query."""
+        self._assert_same(StudentListSerializer, StudentOutputSerializer, Student.objects.order_by("pk"))
+        self._assert_same(TeacherListSerializer, TeacherOutputSerializer, Teacher.objects.order_by("pk"))
+        self._assert_same(MarkListSerializer, MarkOutputSerializer, Mark.objects.order_by("pk"))
+        self._assert_same(AttendanceListSerializer, AttendanceOutputSerializer, Attendance.objects.order_by("pk"))
+
+    def test_list_endpoint_serves_rows(self):
+        """Test the paginated list endpoint returns projected rows."""
+        self.client.force_authenticate(user=self.manager)
+
+        response = self.client.get(reverse("teacher:mark-list"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(response.data["results"][0]["score"], "91.50")
+        self.assertEqual(response.data["results"][0]["graded_by_name"], "Teacher")
+
+    def test_sparse_fieldset_prunes_query_and_output(self):
+        """Test ?fields= selects only the requested columns and keys."""
+        self.client.force_authenticate(user=self.manager)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("student:student-list"), {"fields": "user_id,full_name"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data["results"][0]), {"user_id", "full_name"})
+        listing = queries.captured_queries[-1]["sql"]
+        self.assertNotIn("medical_notes", listing)
+        self.assertNotIn("enrollments", listing)
+
+    def test_exclude_and_unknown_fields(self):
+        """Test ?exclude= drops fields and unknown names are rejected."""
+        self.client.force_authenticate(user=self.manager)
+
+        response = self.client.get(reverse("teacher:attendance-list"), {"exclude": "note,student_name"})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("note", response.data["results"][0])
+        self.assertIn("course_name", response.data["results"][0])
+
+        response = self.client.get(reverse("teacher:mark-list"), {"fields": "score,grade"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_sparse_fieldset_trims_other_list_apis(self):
+        """Test list APIs on ModelSerializers have their rows trimmed too."""
+        self.client.force_authenticate(user=self.manager)
+
+        response = self.client.get(reverse("school:grade-list"), {"fields": "id,name"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data["results"][0]), {"id", "name"})
+
+    def test_unknown_fields_rejected_on_empty_page(self):
+        """Test ModelSerializer lists check field names against the serializer, not the rows."""
+        self.client.force_authenticate(user=self.manager)
+
+        response = self.client.get(reverse("school:grade-list"), {"name": "No such grade", "fields": "id,nope"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("nope", str(response.data["fields"]))
@@ -0,0 +1,28 @@
+from django.test import TransactionTestCase
+
+from eduTrack.query_budget import query_budget_check, query_budget_load, query_budget_measure, query_budget_seed
+
+
+class QueryBudgetTests(TransactionTestCase):
+    """
+    Tests every GET endpoint, as every role, against eduTrack/query_budgets.json.
+
+    Runs outside a test transaction so savepoints do not count as queries,
+    matching the check_query_budgets command that records the budgets.
+    """
+    def test_endpoints_stay_within_budget(self):
+        """Test no endpoint exceeds its recorded query count or latency budget."""
+        results = query_budget_measure(query_budget_seed())
+
+        violations = query_budget_check(results, query_budget_load())
+
+        self.assertEqual(violations, [], "\n".join(violations))
+
+    def test_status_change_is_a_violation(self):
+        """Test an endpoint answering a different status fails even with fewer queries."""
+        budgets = {"teacher GET /api/x/": {"status": 200, "queries": 5, "ms": 250}}
+        results = {"teacher GET /api/x/": {"status": 403, "queries": 1, "ms": 1.0}}
+
+        violations = query_budget_check(results, budgets)
+
+        self.assertEqual(violations, ["teacher GET /api/x/: status 403, budget 200"])
@@ -0,0 +1,49 @@
+import json
+
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from accounts.models import CustomUser
+from school.models import Grade
+
+
+@override_settings(REQUEST_METRICS_SAMPLE_RATE=1.0, REQUEST_METRICS_SERVER_TIMING=True)
+class QueryMetricsMiddlewareTests(APITestCase):
+    """
+    Tests for per-request SQL instrumentation.
+    """
+    def setUp(self):
+        self.admin = CustomUser.objects.create_user(
+            email="admin@example.com", password="password123", full_name="Admin", role="admin"
+        )
+        Grade.objects.create(name="Grade 1", numeric_level=1, min_age=6, max_age=7)
+        self.client.force_authenticate(user=self.admin)
+
+    def test_server_timing_and_log_line(self):
+        """Test sampled requests carry Server-Timing and log their query stats."""
+        with self.assertLogs("eduTrack.request_metrics", level="INFO") as logs:
+            response = self.client.get(reverse("school:grade-list"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(response["Server-Timing"], r'db;dur=[\d.]+;desc="\d+ queries"')
+        payload = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(payload["status"], 200)
+        self.assertEqual(payload["route"], "api/grades/")
+        self.assertGreater(payload["queries"], 0)
+
+    @override_settings(REQUEST_METRICS_DUPLICATE_THRESHOLD=1, REQUEST_METRICS_SLOW_MS=0)
+    def test_repeated_statements_log_a_warning(self):
+        """Test slow or repetitive requests are logged at WARNING with the statements."""
+        with self.assertLogs("eduTrack.request_metrics", level="WARNING") as logs:
+            self.client.get(reverse("school:grade-list"))
+
+        payload = json.loads(logs.records[-1].getMessage())
+        self.assertIn("repeated", payload)
+
+    @override_settings(REQUEST_METRICS_SAMPLE_RATE=0.0)
+    def test_unsampled_requests_are_not_instrumented(self):
+        """Test requests outside the sample get no header."""
+        response = self.client.get(reverse("school:grade-list"))
+
+        self.assertNotIn("Server-Timing", response)
@@ -0,0 +1,16 @@
+from django.test import SimpleTestCase
+
+from accounts.management.commands.seed_data import Command
+
+
+class SeedDataTests(SimpleTestCase):
+    """Tests for the default (non --scale) seed_data mode."""
+
+    def test_repeated_names_get_numbered_emails(self):
+        """Test a local part the seeded Faker repeats is numbered instead of reused."""
+        command = Command()
+        command.used_emails = {"john.smith@edutracker.com"}
+
+        self.assertEqual(command.unique_email("john.smith"), "john.smith.2@edutracker.com")
+        self.assertEqual(command.unique_email("john.smith"), "john.smith.3@edutracker.com")
+        self.assertEqual(command.unique_email("jane.doe"), "jane.doe@edutracker.com")
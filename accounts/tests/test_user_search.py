@@ -0,0 +1,107 @@
+"""
+User Prefix Search Tests
+
+Tests for the UserSearchKey index behind user_list search and the
+messaging recipient picker, and for its prefix result cache.
+"""
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import UserSearchKey
+from accounts.services.user_search_services import user_search_keys_rebuild
+from school.models import School
+from workstream.models import WorkStream
+
+User = get_user_model()
+
+
+class UserSearchKeyTests(APITestCase):
+    """Test search keys are maintained and used for prefix search."""
+
+    def setUp(self):
+        cache.clear()
+        self.workstream = WorkStream.objects.create(workstream_name="Test WS", capacity=50)
+        self.school = School.objects.create(school_name="Test School", work_stream=self.workstream)
+        self.admin = User.objects.create_user(email='admin@test.com', full_name='Admin User', role='admin')
+        self.teacher = User.objects.create_user(
+            email='mary.jones@test.com', full_name='Mary Ann Jones', role='teacher', school=self.school
+        )
+        self.secretary = User.objects.create_user(
+            email='office@test.com', full_name='Sam Office', role='secretary', school=self.school
+        )
+
+    def _keys(self, user):
+        return set(UserSearchKey.objects.filter(user=user).values_list('key', flat=True))
+
+    def test_keys_follow_user_saves(self):
+        """Test keys are derived on create and replaced when the name changes."""
+        self.assertEqual(
+            self._keys(self.teacher),
+            {'mary ann jones', 'mary', 'ann', 'jones', 'mary.jones@test.com', 'mary.jones', 'teacher'}
+        )
+
+        self.teacher.full_name = 'Mary Smith'
+        self.teacher.save(update_fields=['full_name'])
+
+        keys = self._keys(self.teacher)
+        self.assertIn('smith', keys)
+        self.assertNotIn('ann', keys)
+        self.assertNotIn('mary ann jones', keys)
+
+    def test_user_list_search_matches_word_prefixes(self):
+        """Test user list search matches any name word, email or local-part prefix."""
+        self.client.force_authenticate(user=self.admin)
+        url = reverse('user-list')
+
+        for term in ['jon', 'ANN', 'mary ann', 'mary.j']:
+            response = self.client.get(url, {'search': term})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            emails = {row['email'] for row in response.data['results']}
+            self.assertEqual(emails, {'mary.jones@test.com'}, term)
+
+    @override_settings(USER_SEARCH_CACHE_ENABLED=True)
+    def test_recipient_search_is_cached_until_a_user_changes(self):
+        """Test repeated prefixes are served from cache and user saves invalidate it."""
+        self.client.force_authenticate(user=self.secretary)
+        url = reverse('user_messages:user-search')
+
+        response = self.client.get(url, {'search': 'ma'})
+        self.assertEqual([row['email'] for row in response.data['results']], ['mary.jones@test.com'])
+
+        with self.assertNumQueries(1):
+            self.client.get(url, {'search': 'ma'})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.create_user(
+                email='mark@test.com', full_name='Mark Twain', role='teacher', school=self.school
+            )
+        response = self.client.get(url, {'search': 'ma'})
+        self.assertEqual(
+            [row['email'] for row in response.data['results']], ['mark@test.com', 'mary.jones@test.com']
+        )
+
+    @override_settings(USER_SEARCH_CACHE_ENABLED=False)
+    def test_without_shared_cache_recipient_search_is_not_cached(self):
+        """Test a process-local cache is not used, so changes made elsewhere are seen at once."""
+        self.client.force_authenticate(user=self.secretary)
+        url = reverse('user_messages:user-search')
+        self.client.get(url, {'search': 'ma'})
+
+        # Rotates no cache version, as a save handled by another worker would not here
+        UserSearchKey.objects.filter(user=self.teacher).delete()
+
+        response = self.client.get(url, {'search': 'ma'})
+        self.assertEqual(response.data['results'], [])
+
+    def test_rebuild_restores_keys_after_bulk_writes(self):
+        """Test rebuilding recomputes keys for users changed without post_save."""
+        User.objects.filter(pk=self.secretary.pk).update(full_name='Pat Office')
+
+        user_search_keys_rebuild(user_ids=[self.secretary.pk])
+
+        self.assertIn('pat', self._keys(self.secretary))
+        self.assertNotIn('sam', self._keys(self.secretary))
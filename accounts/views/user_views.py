@@ -22,7 +22,7 @@ from accounts.permissions import (IsAdminOrManager,
     IsStaffUser,
     IsAdminOrManagerOrSecretary,
 )
-from accounts.pagination import PaginatedAPIMixin
+from accounts.pagination import PaginatedAPIMixin, SPARSE_FIELDSET_PARAMETERS
 from django.core.exceptions import PermissionDenied
 from reports.utils import log_activity
 
@@ -63,6 +63,7 @@ class UserListApi(PaginatedAPIMixin, APIView):
             OpenApiParameter(name='role', type=str, description='Filter by role'),
             OpenApiParameter(name='search', type=str, description='Search by name or email'),
             OpenApiParameter(name='page', type=int, description='Page number'),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={
             200: UserOutputSerializer(many=True),
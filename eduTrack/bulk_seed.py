@@ -0,0 +1,468 @@
+"""
+Scaled benchmark dataset for `seed_data --scale N`.
+
+Every school has the same shape (BulkSeedLayout), so the number of rows
+each school writes to each table is known up front. The parent process
+reserves one contiguous primary-key block per school and table, after
+which schools are independent: a process pool writes them concurrently
+with chunked bulk_create(), objects carry their precomputed ids (MySQL
+does not return keys from bulk inserts) and nothing is read back.
+
+Values come from a random.Random and a Faker instance seeded with
+(seed, school number), so a given seed, scale and layout produce the same
+rows whichever worker handles a school. Dates are relative to the day the
+seed runs.
+
+The default layout gives each scale unit 2 schools, 2,000 students,
+100,000 marks and 400,000 attendance rows: --scale 100 is about 200k
+students and 50M marks/attendance rows.
+"""
+import logging
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from typing import NamedTuple
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import connection, connections, transaction
+from django.db.models import Max
+from faker import Faker
+
+from accounts.models import CustomUser, Role
+from accounts.services.user_search_services import user_search_keys_rebuild
+from eduTrack.process_pool import process_pool_worker_init
+from guardian.models import Guardian, GuardianStudentLink
+from school.models import AcademicYear, ClassRoom, Course, School
+from school.services.academic_year_services import _build_academic_year_code
+from secretary.models import Secretary
+from student.models import Student, StudentEnrollment
+from teacher.models import Assignment, Attendance, CourseAllocation, Mark, Teacher
+from workstream.models import WorkStream
+from workstream.services.workstream_capacity_services import workstream_counters_reconcile
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PASSWORD = "Password123!"
+
+SUBJECTS = ("Mathematics", "Science", "English", "History", "Art")
+ASSIGNMENT_TYPES = ("homework", "quiz", "assignment", "project", "midterm", "final")
+ATTENDANCE_STATUSES = ("present", "absent", "late", "excused")
+ATTENDANCE_WEIGHTS = (85, 8, 5, 2)
+
+
+class BulkSeedLayout(NamedTuple):
+    """Shape of every seeded school."""
+    schools_per_scale: int = 2
+    schools_per_workstream: int = 10
+    grades: int = 10
+    classrooms_per_grade: int = 4
+    students_per_classroom: int = 25
+    teachers: int = 40
+    secretaries: int = 2
+    assignments_per_allocation: int = 10
+    attendance_days: int = 40
+
+    @property
+    def students(self) -> int:
+        return self.grades * self.classrooms_per_grade * self.students_per_classroom
+
+    @property
+    def guardians(self) -> int:
+        # One guardian per pair of siblings
+        return math.ceil(self.students / 2)
+
+    def rows_per_school(self) -> dict:
+        """Rows each school writes, keyed by model (primary-key block sizes)."""
+        classrooms = self.grades * self.classrooms_per_grade
+        allocations = classrooms * len(SUBJECTS)
+        return {
+            CustomUser: 1 + self.teachers + self.secretaries + self.students + self.guardians,
+            AcademicYear: 1,
+            Course: self.grades * len(SUBJECTS),
+            ClassRoom: classrooms,
+            CourseAllocation: allocations,
+            StudentEnrollment: self.students,
+            GuardianStudentLink: self.students,
+            Assignment: allocations * self.assignments_per_allocation,
+            Mark: self.students * len(SUBJECTS) * self.assignments_per_allocation,
+            Attendance: self.students * len(SUBJECTS) * self.attendance_days,
+        }
+
+
+class _Ids:
+    """Hands out one school's reserved primary keys, table by table."""
+
+    def __init__(self, *, bases: dict, index: int, layout: BulkSeedLayout):
+        self._last = {
+            label: bases[label] + index * rows
+            for label, rows in ((model._meta.label, rows) for model, rows in layout.rows_per_school().items())
+        }
+
+    def next(self, model) -> int:
+        label = model._meta.label
+        self._last[label] += 1
+        return self._last[label]
+
+
+class _Writer:
+    """Buffers new objects per model and writes them in bulk_create() chunks."""
+
+    def __init__(self, batch_size: int):
+        self.batch_size = batch_size
+        self.buffers = {}
+        self.counts = {}
+
+    def add(self, obj):
+        model = type(obj)
+        buffer = self.buffers.setdefault(model, [])
+        buffer.append(obj)
+        if len(buffer) >= self.batch_size:
+            self.flush(model)
+
+    def flush(self, model=None):
+        for current in [model] if model else list(self.buffers):
+            buffer = self.buffers.get(current)
+            if buffer:
+                current.objects.bulk_create(buffer, batch_size=self.batch_size)
+                label = current._meta.verbose_name_plural.title()
+                self.counts[label] = self.counts.get(label, 0) + len(buffer)
+                buffer.clear()
+
+
+def _weekdays_before(day: date, count: int) -> list[date]:
+    days = []
+    while len(days) < count:
+        day -= timedelta(days=1)
+        if day.weekday() < 5:
+            days.append(day)
+    return days
+
+
+def _letter_grade(percentage: Decimal) -> str:
+    for threshold, letter in ((90, "A"), (80, "B"), (70, "C"), (60, "D")):
+        if percentage >= threshold:
+            return letter
+    return "F"
+
+
+def _bulk_seed_school(task: dict) -> dict:
+    """Write one school's people, classes, marks and attendance. Runs in a worker."""
+    layout = BulkSeedLayout(**task["layout"])
+    number = task["index"] + 1
+    school_id = task["school_id"]
+    workstream_id = task["workstream_id"]
+    rng = random.Random(f"{task['seed']}:{number}")
+    fake = Faker()
+    fake.seed_instance(task["seed"] * 1_000_003 + number)
+    ids = _Ids(bases=task["bases"], index=task["index"], layout=layout)
+    writer = _Writer(task["batch_size"])
+    today = date.fromisoformat(task["today"])
+    grade_ids = task["grade_ids"]
+
+    def user(role: str, key: str, full_name: str) -> CustomUser:
+        account = CustomUser(
+            id=ids.next(CustomUser),
+            email=f"bench.s{school_id}.{key}@edutracker.com",
+            full_name=full_name,
+            role=role,
+            school_id=school_id,
+            work_stream_id=workstream_id,
+            password=task["password"],
+        )
+        writer.add(account)
+        return account
+
+    with transaction.atomic():
+        manager = user(Role.MANAGER_SCHOOL, "manager", fake.name())
+        teachers = []
+        for n in range(layout.teachers):
+            account = user(Role.TEACHER, f"t{n}", fake.name())
+            teachers.append(Teacher(
+                user=account,
+                specialization=SUBJECTS[n % len(SUBJECTS)],
+                hire_date=today - timedelta(days=rng.randint(180, 7300)),
+                employment_status=rng.choice(("full_time", "full_time", "full_time", "part_time", "contract")),
+                years_of_experience=rng.randint(1, 20),
+            ))
+        secretaries = [
+            Secretary(
+                user=user(Role.SECRETARY, f"sec{n}", fake.name()),
+                department=("Registrar", "Administration")[n % 2],
+                hire_date=today - timedelta(days=rng.randint(180, 3650)),
+            )
+            for n in range(layout.secretaries)
+        ]
+        student_accounts = [
+            user(Role.STUDENT, f"st{n}", f"{fake.first_name()} {fake.last_name()}") for n in range(layout.students)
+        ]
+        guardian_accounts = [
+            user(Role.GUARDIAN, f"g{n}", fake.name()) for n in range(layout.guardians)
+        ]
+        writer.flush(CustomUser)
+        School.all_objects.filter(pk=school_id).update(manager_id=manager.id)
+
+        for profile in teachers + secretaries:
+            writer.add(profile)
+        for account in guardian_accounts:
+            writer.add(Guardian(user=account, phone_number=fake.numerify("05########")))
+
+        start = today - timedelta(days=180)
+        end = start + timedelta(days=364)
+        year = AcademicYear(
+            id=ids.next(AcademicYear),
+            academic_year_code=_build_academic_year_code(start_date=start, end_date=end),
+            school_id=school_id,
+            start_date=start,
+            end_date=end,
+        )
+        writer.add(year)
+        # Referenced rows go in first: MySQL checks foreign keys per statement.
+        writer.flush()
+
+        attendance_days = _weekdays_before(today, layout.attendance_days)
+        now = datetime.combine(today, time(9), tzinfo=dt_timezone.utc)
+        for g, grade_id in enumerate(grade_ids[:layout.grades]):
+            level = g + 1
+            courses = [
+                Course(
+                    id=ids.next(Course),
+                    course_code=f"{subject[:3].upper()}-{level:02d}",
+                    school_id=school_id,
+                    grade_id=grade_id,
+                    name=f"{subject} {level}",
+                )
+                for subject in SUBJECTS
+            ]
+            for course in courses:
+                writer.add(course)
+
+            for r in range(layout.classrooms_per_grade):
+                classroom = ClassRoom(
+                    id=ids.next(ClassRoom),
+                    classroom_name=f"{level}{chr(65 + r)}",
+                    school_id=school_id,
+                    academic_year_id=year.id,
+                    grade_id=grade_id,
+                    homeroom_teacher_id=rng.choice(teachers).user_id,
+                    capacity=layout.students_per_classroom + 5,
+                )
+                writer.add(classroom)
+                allocations = [
+                    CourseAllocation(
+                        id=ids.next(CourseAllocation),
+                        course_id=course.id,
+                        class_room_id=classroom.id,
+                        teacher_id=teachers[(g * len(SUBJECTS) + c + r) % len(teachers)].user_id,
+                        academic_year_id=year.id,
+                    )
+                    for c, course in enumerate(courses)
+                ]
+                for allocation in allocations:
+                    writer.add(allocation)
+
+                first = (g * layout.classrooms_per_grade + r) * layout.students_per_classroom
+                roster = list(range(first, first + layout.students_per_classroom))
+                for n in roster:
+                    writer.add(Student(
+                        user=student_accounts[n],
+                        student_id=f"B{school_id:05d}{n:05d}",
+                        date_of_birth=start - timedelta(days=365 * (level + 5) + rng.randint(0, 364)),
+                        gender=rng.choice(("male", "female")),
+                        grade_id=grade_id,
+                        grade_level=level,
+                        admission_date=start - timedelta(days=365 * rng.randint(0, level - 1)),
+                        current_gpa=Decimal(rng.randint(200, 400)) / 100,
+                    ))
+                assignments = []
+                for allocation in allocations:
+                    for a in range(layout.assignments_per_allocation):
+                        assignment_id = ids.next(Assignment)
+                        assignment_type = ASSIGNMENT_TYPES[a % len(ASSIGNMENT_TYPES)]
+                        due = now - timedelta(days=rng.randint(1, 150))
+                        assignment = Assignment(
+                            id=assignment_id,
+                            assignment_code=f"BENCH-{assignment_id}",
+                            course_allocation_id=allocation.id,
+                            created_by_id=allocation.teacher_id,
+                            title=f"{assignment_type.title()} {a + 1}",
+                            assignment_type=assignment_type,
+                            exam_type=assignment_type,
+                            full_mark=Decimal((10, 20, 50, 100)[rng.randrange(4)]),
+                            assigned_date=(due - timedelta(days=7)).date(),
+                            due_date=due,
+                            is_published=True,
+                        )
+                        writer.add(assignment)
+                        assignments.append(assignment)
+                writer.flush()
+
+                for n in roster:
+                    writer.add(StudentEnrollment(
+                        id=ids.next(StudentEnrollment),
+                        student_id=student_accounts[n].id,
+                        class_room_id=classroom.id,
+                        academic_year_id=year.id,
+                        status="active",
+                        enrollment_date=start,
+                    ))
+                    writer.add(GuardianStudentLink(
+                        id=ids.next(GuardianStudentLink),
+                        guardian_id=guardian_accounts[n // 2].id,
+                        student_id=student_accounts[n].id,
+                        relationship_type=rng.choice(("parent", "parent", "parent", "legal_guardian")),
+                        is_primary=True,
+                    ))
+                for assignment in assignments:
+                    for n in roster:
+                        percentage = Decimal(rng.randint(3500, 10000)) / 100
+                        writer.add(Mark(
+                            id=ids.next(Mark),
+                            student_id=student_accounts[n].id,
+                            assignment_id=assignment.id,
+                            score=(assignment.full_mark * percentage / 100).quantize(Decimal("0.01")),
+                            max_score=assignment.full_mark,
+                            percentage=percentage,
+                            letter_grade=_letter_grade(percentage),
+                            graded_by_id=assignment.created_by_id,
+                            graded_at=assignment.due_date + timedelta(days=rng.randint(1, 7)),
+                            is_final=True,
+                        ))
+                for allocation in allocations:
+                    for day in attendance_days:
+                        for n in roster:
+                            writer.add(Attendance(
+                                id=ids.next(Attendance),
+                                student_id=student_accounts[n].id,
+                                course_allocation_id=allocation.id,
+                                date=day,
+                                status=rng.choices(ATTENDANCE_STATUSES, weights=ATTENDANCE_WEIGHTS)[0],
+                                recorded_by_id=allocation.teacher_id,
+                            ))
+        writer.flush()
+
+    return writer.counts
+
+
+def _reserve_ids(layout: BulkSeedLayout) -> dict:
+    """Highest existing primary key per table; school i owns the block after base + i * rows."""
+    return {
+        model._meta.label: model.all_objects.aggregate(top=Max("pk"))["top"] or 0
+        for model in layout.rows_per_school()
+    }
+
+
+def bulk_seed(
+    *,
+    scale: int,
+    grade_ids: list[int],
+    seed: int = 42,
+    workers: int = None,
+    batch_size: int = None,
+    layout: BulkSeedLayout = None,
+    progress=None,
+) -> dict:
+    """
+    Seed scale * layout.schools_per_scale schools in parallel.
+
+    Args:
+        scale: Size multiplier
+        grade_ids: Grade ids in numeric_level order; the first layout.grades are used
+        seed: Random seed; the same seed gives the same dataset
+        workers: Processes writing schools (default: settings.SEED_WORKERS;
+            always 1 on SQLite, which has a single writer)
+        batch_size: Rows per INSERT (default: settings.SEED_BATCH_SIZE)
+        layout: School shape (default: BulkSeedLayout())
+        progress: Optional callable(school_number, total, counts) after each school
+
+    Returns:
+        {"Workstreams": n, "Schools": n, "Users": n, <table>: rows, ...}
+    """
+    layout = layout or BulkSeedLayout()
+    if len(grade_ids) < layout.grades:
+        raise ValueError(f"The layout needs {layout.grades} grades, got {len(grade_ids)}.")
+    workers = workers or settings.SEED_WORKERS
+    if connection.vendor == "sqlite":
+        workers = 1
+    batch_size = batch_size or settings.SEED_BATCH_SIZE
+    password = make_password(DEFAULT_PASSWORD)
+
+    school_count = scale * layout.schools_per_scale
+    schools = []
+    with transaction.atomic():
+        workstreams = []
+        for w in range(math.ceil(school_count / layout.schools_per_workstream)):
+            workstream = WorkStream.objects.create(
+                workstream_name=f"Benchmark Workstream {w + 1}",
+                capacity=layout.schools_per_workstream,
+                location=f"Benchmark Region {w + 1}",
+            )
+            manager = CustomUser.objects.create(
+                email=f"bench.ws{workstream.id}@edutracker.com",
+                full_name=f"Benchmark Workstream Manager {w + 1}",
+                role=Role.MANAGER_WORKSTREAM,
+                work_stream=workstream,
+                password=password,
+            )
+            WorkStream.objects.filter(pk=workstream.pk).update(manager=manager)
+            workstreams.append(workstream)
+        for i in range(school_count):
+            workstream = workstreams[i // layout.schools_per_workstream]
+            schools.append(School.objects.create(
+                school_name=f"Benchmark School {i + 1}",
+                work_stream=workstream,
+                capacity=layout.students + 100,
+                location=f"Benchmark Region {i // layout.schools_per_workstream + 1}",
+            ))
+        bases = _reserve_ids(layout)
+
+    tasks = [
+        {
+            "index": i,
+            "school_id": school.id,
+            "workstream_id": school.work_stream_id,
+            "grade_ids": list(grade_ids),
+            "seed": seed,
+            "bases": bases,
+            "password": password,
+            "today": date.today().isoformat(),
+            "batch_size": batch_size,
+            "layout": layout._asdict(),
+        }
+        for i, school in enumerate(schools)
+    ]
+
+    totals = {"Workstreams": len(workstreams), "Schools": len(schools), "Users": len(workstreams)}
+
+    def collect(counts):
+        for label, rows in counts.items():
+            totals[label] = totals.get(label, 0) + rows
+        if progress:
+            progress(collect.done + 1, len(tasks), counts)
+        collect.done += 1
+    collect.done = 0
+
+    if workers <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            collect(_bulk_seed_school(task))
+    else:
+        # Workers must open their own connections, not share the parent's.
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks)), initializer=process_pool_worker_init) as pool:
+            for future in as_completed([pool.submit(_bulk_seed_school, task) for task in tasks]):
+                collect(future.result())
+
+    # Explicit ids leave PostgreSQL sequences behind (no-op elsewhere).
+    with connection.cursor() as cursor:
+        for sql in connection.ops.sequence_reset_sql(no_style(), list(layout.rows_per_school())):
+            cursor.execute(sql)
+
+    # bulk_create() bypasses the signals maintaining these.
+    user_search_keys_rebuild()
+    workstream_counters_reconcile()
+
+    logger.info(f"Bulk seed (scale {scale}, seed {seed}) wrote {totals}")
+    return totals
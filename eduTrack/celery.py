@@ -1,5 +1,10 @@
 import os
+import time
+
 from celery import Celery
+from celery.signals import task_postrun, task_prerun
+
+from eduTrack.metrics import CELERY_TASK_SECONDS, CELERY_TASKS, metrics_flush
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'eduTrack.settings')
@@ -15,6 +20,24 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 # Load task modules from all registered Django apps.
 app.autodiscover_tasks()
 
+# Task counts and run times for /api/metrics/; each worker process flushes
+# them to METRICS_DIR after every task.
+_task_started = {}
+
+
+@task_prerun.connect
+def _task_prerun(task_id=None, **kwargs):
+    _task_started[task_id] = time.perf_counter()
+
+
+@task_postrun.connect
+def _task_postrun(task_id=None, task=None, state=None, **kwargs):
+    started = _task_started.pop(task_id, None)
+    CELERY_TASKS.inc(task=task.name, state=state or "UNKNOWN")
+    if started is not None:
+        CELERY_TASK_SECONDS.observe(time.perf_counter() - started, task=task.name)
+    metrics_flush(force=True)
+
 
 @app.task(bind=True, ignore_result=True)
 def debug_task(self):
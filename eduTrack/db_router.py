@@ -0,0 +1,180 @@
+"""
+Read-replica routing.
+
+DATABASES may declare read replicas of the primary ("replica",
+"replica_2", ... listed in DATABASE_REPLICAS). ReplicaRoutingMiddleware
+marks a request as replica-eligible when its view only reads - every view
+in reports/views and the GET side of paginated list APIs - and
+ReplicaRouter then sends that request's reads to one replica:
+
+    request --> eligible view? --> user wrote recently? --> healthy replica?
+                    | no                | yes                    | none
+                    v                   v                        v
+                 primary             primary                  primary
+
+Writes always go to the primary. A request that writes reads from the
+primary for the rest of the request, and its user is pinned to the
+primary for REPLICA_STICKY_SECONDS so they read their own writes. The pin
+lives in the cache, which must be shared by every worker (settings refuse
+replicas without CACHE_REDIS_URL).
+A replica lagging more than REPLICA_MAX_LAG_SECONDS behind (or whose
+replication is stopped or unreachable) is skipped; each process checks
+lag at most every REPLICA_LAG_CHECK_INTERVAL seconds.
+
+Code outside a request (Celery tasks, commands) can opt in with:
+
+    with read_from_replica():
+        rows = list(heavy_report_queryset)
+"""
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+# Every method of a reporting view only reads (its activity-log writes still
+# go to the primary); elsewhere views opt in with read_replica_methods.
+REPLICA_VIEW_MODULES = ("reports.views.",)
+
+_routing = ContextVar("replica_routing", default=None)
+_health = {}  # alias -> (checked at, healthy)
+
+
+class ReplicaRouting:
+    """Replica chosen for the current request or block, and whether it wrote."""
+
+    def __init__(self):
+        self.alias = None
+        self.wrote = False
+
+    def use_replica(self) -> Optional[str]:
+        self.alias = replica_pick()
+        return self.alias
+
+
+def replica_lag(alias: str) -> Optional[float]:
+    """
+    Seconds the replica is behind its source, 0 if the server reports no
+    replication status, None if replication is stopped.
+    """
+    connection = connections[alias]
+    if connection.vendor != "mysql":
+        return 0.0
+    with connection.cursor() as cursor:
+        try:
+            cursor.execute("SHOW REPLICA STATUS")
+            column = "Seconds_Behind_Source"
+        except DatabaseError:
+            # MySQL before 8.0.22 and MariaDB
+            cursor.execute("SHOW SLAVE STATUS")
+            column = "Seconds_Behind_Master"
+        row = cursor.fetchone()
+        if row is None:
+            return 0.0
+        lag = dict(zip([col[0] for col in cursor.description], row)).get(column)
+    return None if lag is None else float(lag)
+
+
+def replica_healthy(alias: str) -> bool:
+    """Whether the replica is within REPLICA_MAX_LAG_SECONDS, re-checked every REPLICA_LAG_CHECK_INTERVAL."""
+    now = time.monotonic()
+    checked_at, healthy = _health.get(alias, (None, False))
+    if checked_at is not None and now - checked_at < settings.REPLICA_LAG_CHECK_INTERVAL:
+        return healthy
+
+    try:
+        lag = replica_lag(alias)
+    except Exception as exc:
+        logger.warning(f"Replica {alias} is unreachable, reading from the primary: {exc}")
+        lag = None
+    healthy = lag is not None and lag <= settings.REPLICA_MAX_LAG_SECONDS
+    if not healthy and lag is not None:
+        logger.warning(f"Replica {alias} is {lag:.0f}s behind, reading from the primary")
+    _health[alias] = (now, healthy)
+    return healthy
+
+
+def replica_pick() -> Optional[str]:
+    """A random healthy replica alias, or None to use the primary."""
+    healthy = [alias for alias in settings.DATABASE_REPLICAS if replica_healthy(alias)]
+    return random.choice(healthy) if healthy else None
+
+
+def replica_eligible(view_class, method: str) -> bool:
+    """Whether a request for this view and method only reads."""
+    if view_class is None:
+        return False
+    methods = getattr(view_class, "read_replica_methods", None)
+    if methods is None:
+        return view_class.__module__.startswith(REPLICA_VIEW_MODULES)
+    return method in methods
+
+
+def _pin_key(user_id) -> str:
+    return f"db_primary_pin:{user_id}"
+
+
+def primary_pin(user_id):
+    """Send the user's reads to the primary for REPLICA_STICKY_SECONDS."""
+    cache.set(_pin_key(user_id), True, settings.REPLICA_STICKY_SECONDS)
+
+
+def primary_pinned(user_id) -> bool:
+    return user_id is not None and bool(cache.get(_pin_key(user_id)))
+
+
+@contextmanager
+def replica_routing():
+    """Track the reads and writes of a block; its reads stay on the primary until use_replica()."""
+    routing = ReplicaRouting()
+    token = _routing.set(routing)
+    try:
+        yield routing
+    finally:
+        _routing.reset(token)
+
+
+@contextmanager
+def read_from_replica():
+    """
+    Send the block's reads to a healthy replica, if any. Yields the
+    replica alias, or None when reads stay on the primary.
+    """
+    with replica_routing() as routing:
+        yield routing.use_replica()
+
+
+class ReplicaRouter:
+    """Route reads of a replica-routed block to its replica until it writes; everything else to the primary."""
+
+    def db_for_read(self, model, **hints):
+        routing = _routing.get()
+        if routing is None:
+            return None
+        # After a write, even rows loaded from the replica read on from the primary.
+        return "default" if routing.wrote else routing.alias
+
+    def db_for_write(self, model, **hints):
+        routing = _routing.get()
+        if routing is not None:
+            routing.wrote = True
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {"default", *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive the schema through replication.
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
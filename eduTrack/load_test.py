@@ -0,0 +1,288 @@
+"""
+Load-test harness for the hottest API paths.
+
+Replays a weighted mix of authenticated requests (WORKLOAD) against the
+configured database - normally one filled by `seed_data --scale N` - and
+reports latency percentiles, throughput and error rate per endpoint:
+
+    python manage.py load_test --duration 60 --clients 8 --output run.json
+    python manage.py load_test --baseline run.json   # compare with a run
+
+Each client is a process driving the WSGI application in-process through
+django.test.Client, so requests go through the full middleware, auth and
+view stack without a network hop. Clients pick requests with a seeded
+random.Random, so two runs with the same seed send the same sequence.
+
+The workload writes (logins, attendance records): run it against a
+disposable database. SQLite serialises writers; measure on MySQL.
+"""
+import json
+import math
+import random
+import subprocess
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from typing import Callable, NamedTuple, Optional
+
+from django.conf import settings
+from django.db import connection, connections
+from django.test import Client
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import Role
+from eduTrack.bulk_seed import DEFAULT_PASSWORD
+from eduTrack.process_pool import process_pool_worker_init
+from guardian.models import GuardianStudentLink
+from student.models import StudentEnrollment
+from teacher.models import CourseAllocation
+
+
+class LoadTestScenario(NamedTuple):
+    """One weighted request of the workload."""
+    role: str
+    method: str
+    path: str  # formatted with the context values
+    weight: int
+    data: Optional[Callable] = None  # (values, rng) -> request body
+    authenticated: bool = True
+
+    @property
+    def name(self) -> str:
+        return f"{self.method} {self.path} [{self.role}]"
+
+
+def _login_body(values, rng):
+    return {"email": values["teacher_email"], "password": values["password"]}
+
+
+def _attendance_body(values, rng):
+    return {
+        "student_id": values["student_id"],
+        "course_allocation_id": values["allocation_id"],
+        "date": (timezone.localdate() - timedelta(days=rng.randint(0, 13))).isoformat(),
+        "status": rng.choices(("present", "absent", "late"), weights=(85, 10, 5))[0],
+    }
+
+
+WORKLOAD = (
+    LoadTestScenario(Role.TEACHER, "POST", "/api/workstream/{slug}/auth/login/", 5, _login_body, False),
+    LoadTestScenario(Role.MANAGER_SCHOOL, "GET", "/api/statistics/dashboard/", 10),
+    LoadTestScenario(Role.TEACHER, "GET", "/api/statistics/dashboard/", 10),
+    LoadTestScenario(Role.STUDENT, "GET", "/api/notifications/unread-count/", 20),
+    LoadTestScenario(Role.GUARDIAN, "GET", "/api/notifications/unread-count/", 10),
+    LoadTestScenario(Role.TEACHER, "GET", "/api/notifications/unread-count/", 10),
+    LoadTestScenario(Role.TEACHER, "GET", "/api/teacher/marks/", 10),
+    LoadTestScenario(Role.STUDENT, "GET", "/api/teacher/marks/", 10),
+    LoadTestScenario(Role.TEACHER, "POST", "/api/teacher/attendance/record/", 15, _attendance_body),
+)
+
+
+def load_test_context(*, password: str = DEFAULT_PASSWORD) -> dict:
+    """
+    Pick one user per role around the first active enrollment and issue
+    their access tokens.
+
+    Returns:
+        {"tokens": {role: access token}, "values": {path/body value: ...}}
+
+    Raises:
+        ValueError: If the database has no enrolled students to work with
+    """
+    enrollment = (
+        StudentEnrollment.objects.filter(status="active", class_room__school__manager__isnull=False)
+        .select_related("student__user", "class_room__school__manager", "class_room__school__work_stream")
+        .order_by("id")
+        .first()
+    )
+    allocation = enrollment and (
+        CourseAllocation.objects.filter(class_room_id=enrollment.class_room_id)
+        .select_related("teacher__user").order_by("id").first()
+    )
+    link = enrollment and (
+        GuardianStudentLink.objects.filter(student_id=enrollment.student_id)
+        .select_related("guardian__user").order_by("id").first()
+    )
+    if not (enrollment and allocation and link):
+        raise ValueError("No enrolled student with a course allocation and a guardian; seed the database first.")
+
+    school = enrollment.class_room.school
+    users = {
+        Role.MANAGER_SCHOOL: school.manager,
+        Role.TEACHER: allocation.teacher.user,
+        Role.STUDENT: enrollment.student.user,
+        Role.GUARDIAN: link.guardian.user,
+    }
+    return {
+        "tokens": {role: str(RefreshToken.for_user(user).access_token) for role, user in users.items()},
+        "values": {
+            "slug": school.work_stream.slug,
+            "teacher_email": users[Role.TEACHER].email,
+            "password": password,
+            "student_id": enrollment.student_id,
+            "allocation_id": allocation.id,
+        },
+    }
+
+
+def _load_test_client(task: dict) -> tuple[list[tuple[str, float, int]], float]:
+    """
+    Send requests until the deadline or request quota. Runs in a worker.
+
+    Returns the samples and the seconds spent sending them, which leaves
+    out process start-up and the warm-up requests.
+    """
+    rng = random.Random(f"{task['seed']}:{task['client']}")
+    tokens, values = task["context"]["tokens"], task["context"]["values"]
+    scenarios = [scenario for scenario in WORKLOAD if scenario.role in tokens]
+    weights = [scenario.weight for scenario in scenarios]
+    host = next((host for host in settings.ALLOWED_HOSTS if host and "*" not in host), "localhost").lstrip(".")
+    client = Client(HTTP_HOST=host, raise_request_exception=False)
+
+    def send(scenario):
+        extra = {"HTTP_AUTHORIZATION": f"Bearer {tokens[scenario.role]}"} if scenario.authenticated else {}
+        body = scenario.data(values, rng) if scenario.data else None
+        start = time.perf_counter()
+        response = client.generic(
+            scenario.method,
+            scenario.path.format(**values),
+            json.dumps(body) if body is not None else "",
+            content_type="application/json",
+            **extra,
+        )
+        return (time.perf_counter() - start) * 1000, response.status_code
+
+    # Warm caches and connections before measuring.
+    for scenario in scenarios:
+        send(scenario)
+
+    samples = []
+    start = time.perf_counter()
+    deadline = start + task["duration"] if task["duration"] else None
+    while (task["requests"] is None or len(samples) < task["requests"]) and (
+        deadline is None or time.perf_counter() < deadline
+    ):
+        scenario = rng.choices(scenarios, weights=weights)[0]
+        elapsed_ms, status = send(scenario)
+        samples.append((scenario.name, elapsed_ms, status))
+    return samples, time.perf_counter() - start
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    # Nearest rank
+    return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
+
+
+def _summary(timings: list[float], errors: int, elapsed: float) -> dict:
+    ordered = sorted(timings)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "error_rate": round(errors / len(ordered), 4),
+        "throughput_rps": round(len(ordered) / elapsed, 1),
+        "p50_ms": round(_percentile(ordered, 50), 1),
+        "p95_ms": round(_percentile(ordered, 95), 1),
+        "p99_ms": round(_percentile(ordered, 99), 1),
+        "mean_ms": round(sum(ordered) / len(ordered), 1),
+    }
+
+
+def load_test_summarize(samples: list[tuple[str, float, int]], elapsed: float) -> dict:
+    """Per-endpoint and overall statistics; responses of 400 and above are errors."""
+    timings, errors = defaultdict(list), defaultdict(int)
+    for name, elapsed_ms, status in samples:
+        timings[name].append(elapsed_ms)
+        errors[name] += status >= 400
+    endpoints = {name: _summary(timings[name], errors[name], elapsed) for name in sorted(timings)}
+    total = _summary([sample[1] for sample in samples], sum(errors.values()), elapsed) if samples else {}
+    return {"endpoints": endpoints, "total": total}
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=settings.BASE_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_test_run(
+    *,
+    duration: Optional[float] = 30,
+    requests: Optional[int] = None,
+    clients: int = 1,
+    seed: int = 42,
+    password: str = DEFAULT_PASSWORD,
+) -> dict:
+    """
+    Run the workload with `clients` concurrent client processes.
+
+    Args:
+        duration: Seconds each client keeps sending (None: until `requests`)
+        requests: Requests per client (None: until `duration`)
+        clients: Client processes; 1 runs in this process
+        seed: Seed for the request sequence
+        password: Password of the seeded users, for the login requests
+
+    Throughput is measured over the clients' sending windows (their mean
+    with several clients), not over start-up and warm-up, so runs with
+    different --clients values compare.
+
+    Returns:
+        {"meta": {...}, "endpoints": {name: stats}, "total": stats}
+    """
+    if duration is None and requests is None:
+        raise ValueError("Give a duration, a request count or both.")
+    context = load_test_context(password=password)
+    tasks = [
+        {"client": n, "seed": seed, "context": context, "duration": duration, "requests": requests}
+        for n in range(clients)
+    ]
+
+    started = timezone.now()
+    start = time.perf_counter()
+    if clients <= 1:
+        results = [_load_test_client(tasks[0])]
+    else:
+        # Clients must open their own connections, not share the parent's.
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=clients, initializer=process_pool_worker_init) as pool:
+            results = list(pool.map(_load_test_client, tasks))
+    elapsed = time.perf_counter() - start
+    samples = [sample for batch, _ in results for sample in batch]
+    measured = sum(window for _, window in results) / len(results)
+
+    return {
+        "meta": {
+            "commit": _commit(),
+            "started_at": started.isoformat(),
+            "elapsed_s": round(elapsed, 2),
+            "measured_s": round(measured, 2),
+            "clients": clients,
+            "seed": seed,
+            "database": connection.vendor,
+        },
+        **load_test_summarize(samples, measured),
+    }
+
+
+def load_test_diff(previous: dict, current: dict) -> list[str]:
+    """Per-endpoint p95 latency and throughput changes between two runs."""
+    lines = []
+    before_all, after_all = previous.get("endpoints", {}), current.get("endpoints", {})
+    for name in sorted(set(before_all) | set(after_all)):
+        before, after = before_all.get(name), after_all.get(name)
+        if before is None:
+            lines.append(f"+ {name}: p95 {after['p95_ms']} ms, {after['throughput_rps']} req/s")
+        elif after is None:
+            lines.append(f"- {name}")
+        else:
+            lines.append(
+                f"~ {name}: p95 {before['p95_ms']} -> {after['p95_ms']} ms, "
+                f"{before['throughput_rps']} -> {after['throughput_rps']} req/s, "
+                f"errors {before['error_rate']:.1%} -> {after['error_rate']:.1%}"
+            )
+    return lines
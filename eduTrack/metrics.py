@@ -0,0 +1,375 @@
+"""
+Application metrics in the Prometheus text format.
+
+Counters and histograms live in the memory of each process. Gunicorn
+workers and Celery worker processes each flush a JSON snapshot of their
+values to METRICS_DIR (at most every METRICS_FLUSH_INTERVAL seconds, after
+a request or task), and /api/metrics/ merges every snapshot in the
+directory, so a scrape sees the whole deployment whichever worker serves
+it. Without METRICS_DIR only the serving process is reported.
+
+Snapshot files are named after the host, PID and start time of their
+process, so a recycled PID (gunicorn max_requests, Celery
+max_tasks_per_child) never overwrites an exited process's totals. On each
+flush, the counters and histograms of exited processes on the same host
+are folded into that host's "exited" file and their snapshots removed (as
+prometheus_client's mark_process_dead does), so counters never go
+backwards and the directory does not grow. Clear the directory when the
+deployment starts.
+
+    REQUESTS = Counter("http_requests_total", "HTTP requests.", ["view", "status"])
+    REQUESTS.inc(view="api/teacher/marks/", status="200")
+
+    EXPORT_SECONDS = Histogram("export_duration_seconds", "Export time.", ["format"])
+    with EXPORT_SECONDS.time(format="pdf"):
+        ...
+
+Values that are cheap to read at scrape time (queue depths) are reported
+by collectors registered with register_collector().
+"""
+import fcntl
+import json
+import logging
+import math
+import os
+import re
+import socket
+import threading
+import time
+from contextlib import ContextDecorator
+from pathlib import Path
+
+import redis
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_registry = {}
+_collectors = []
+_lock = threading.Lock()
+_last_flush = 0.0
+# (pid, snapshot file name); recomputed in forked children.
+_process_file = (None, None)
+
+_SNAPSHOT_NAME = re.compile(r"^(?P<host>.+)-(?P<pid>\d+)-(?P<started>\d+)\.json$")
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames=()):
+        if name in _registry:
+            raise ValueError(f"Metric {name} is already registered.")
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        _registry[name] = self
+
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} takes labels {self.labelnames}, got {tuple(labels)}.")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def snapshot(self) -> dict:
+        with _lock:
+            return {
+                "type": self.type,
+                "help": self.documentation,
+                "labels": list(self.labelnames),
+                "samples": [[list(key), value] for key, value in self._snapshot_values()],
+            }
+
+    def _snapshot_values(self):
+        return [(key, value) for key, value in self._values.items()]
+
+
+class Counter(_Metric):
+    """Monotonic count per label set."""
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        if not settings.METRICS_ENABLED:
+            return
+        key = self._key(labels)
+        with _lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class _Timer(ContextDecorator):
+    def __init__(self, histogram, labels):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+        return False
+
+
+class Histogram(_Metric):
+    """Cumulative bucket counts, sum and count of observations per label set."""
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        if not settings.METRICS_ENABLED:
+            return
+        key = self._key(labels)
+        with _lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {"buckets": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state["buckets"][i] += 1
+            state["sum"] += value
+            state["count"] += 1
+
+    def time(self, **labels) -> _Timer:
+        """Context manager (or decorator) observing the seconds its block takes."""
+        return _Timer(self, labels)
+
+    def snapshot(self) -> dict:
+        data = super().snapshot()
+        data["buckets"] = list(self.buckets)
+        return data
+
+    def _snapshot_values(self):
+        return [(key, dict(value, buckets=list(value["buckets"]))) for key, value in self._values.items()]
+
+
+def register_collector(collector):
+    """
+    Register a callable run at scrape time in the serving process. It
+    returns {name: {"type", "help", "labels", "samples"}} like a snapshot.
+    """
+    _collectors.append(collector)
+    return collector
+
+
+def metrics_snapshot() -> dict:
+    """This process's metrics, as written to METRICS_DIR."""
+    return {name: metric.snapshot() for name, metric in _registry.items()}
+
+
+def _snapshot_file_name() -> str:
+    """host-pid-start.json for this process; a forked child gets its own."""
+    global _process_file
+    pid = os.getpid()
+    if _process_file[0] != pid:
+        _process_file = (pid, f"{socket.gethostname()}-{pid}-{time.time_ns()}.json")
+    return _process_file[1]
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _write_json(path: Path, data: dict):
+    partial = path.with_name(f".{path.name}.tmp")
+    partial.write_text(json.dumps(data))
+    os.replace(partial, path)
+
+
+def _reap_exited(path: Path):
+    """Fold the snapshots of exited processes on this host into its exited file."""
+    host = socket.gethostname()
+    exited = [
+        snapshot for snapshot in path.glob(f"{host}-*.json")
+        if (match := _SNAPSHOT_NAME.match(snapshot.name))
+        and match["host"] == host
+        and not _process_alive(int(match["pid"]))
+    ]
+    if not exited:
+        return
+
+    with open(path / f".{host}.lock", "w") as lock:
+        # One process at a time, so no snapshot is folded in twice.
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        totals_path = path / f"{host}-exited.json"
+        merged = {}
+        if totals_path.exists():
+            _merge(merged, json.loads(totals_path.read_text()))
+        folded = []
+        for snapshot in exited:
+            try:
+                _merge(merged, json.loads(snapshot.read_text()))
+            except FileNotFoundError:
+                continue  # Folded by another process
+            except ValueError as exc:
+                logger.warning(f"Dropping unreadable metrics file {snapshot}: {exc}")
+            folded.append(snapshot)
+        _write_json(totals_path, {
+            name: {**data, "samples": [[list(key), value] for key, value in data["samples"].items()]}
+            for name, data in merged.items()
+            if data["type"] in ("counter", "histogram")
+        })
+        for snapshot in folded:
+            snapshot.unlink(missing_ok=True)
+
+
+def metrics_flush(*, force: bool = False):
+    """
+    Write this process's snapshot to METRICS_DIR, at most every
+    METRICS_FLUSH_INTERVAL seconds, and fold in exited processes' snapshots.
+    """
+    global _last_flush
+    directory = settings.METRICS_DIR
+    if not (directory and settings.METRICS_ENABLED):
+        return
+    now = time.monotonic()
+    if not force and now - _last_flush < settings.METRICS_FLUSH_INTERVAL:
+        return
+    _last_flush = now
+    try:
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        _write_json(path / _snapshot_file_name(), metrics_snapshot())
+        _reap_exited(path)
+    except (OSError, ValueError) as exc:
+        logger.warning(f"Could not write metrics to {directory}: {exc}")
+
+
+def _merge(into: dict, snapshot: dict):
+    for name, data in snapshot.items():
+        merged = into.setdefault(name, {**data, "samples": {}})
+        for key, value in data["samples"]:
+            key = tuple(key)
+            if data["type"] == "histogram":
+                current = merged["samples"].get(key)
+                if current is None:
+                    merged["samples"][key] = {"buckets": list(value["buckets"]), "sum": value["sum"], "count": value["count"]}
+                elif len(current["buckets"]) == len(value["buckets"]):
+                    current["buckets"] = [a + b for a, b in zip(current["buckets"], value["buckets"])]
+                    current["sum"] += value["sum"]
+                    current["count"] += value["count"]
+            elif data["type"] == "counter":
+                merged["samples"][key] = merged["samples"].get(key, 0) + value
+            else:
+                merged["samples"][key] = value
+
+
+def metrics_collect() -> dict:
+    """Merged metrics of every process writing to METRICS_DIR (or just this one), plus collectors."""
+    merged = {}
+    directory = settings.METRICS_DIR
+    if directory and Path(directory).is_dir():
+        metrics_flush(force=True)
+        for path in sorted(Path(directory).glob("*.json")):
+            try:
+                _merge(merged, json.loads(path.read_text()))
+            except (OSError, ValueError) as exc:
+                logger.warning(f"Skipping unreadable metrics file {path}: {exc}")
+    else:
+        _merge(merged, metrics_snapshot())
+
+    for collector in _collectors:
+        try:
+            _merge(merged, collector())
+        except Exception as exc:
+            logger.warning(f"Metrics collector {getattr(collector, '__name__', collector)} failed: {exc}")
+    return merged
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=()) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in list(zip(names, values)) + list(extra)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value) -> str:
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        return repr(value)
+    return str(value)
+
+
+def metrics_render(merged: dict = None) -> str:
+    """Prometheus text exposition format (version 0.0.4)."""
+    merged = metrics_collect() if merged is None else merged
+    lines = []
+    for name in sorted(merged):
+        data = merged[name]
+        lines.append(f"# HELP {name} {data['help']}")
+        lines.append(f"# TYPE {name} {data['type']}")
+        for key in sorted(data["samples"]):
+            value = data["samples"][key]
+            if data["type"] != "histogram":
+                lines.append(f"{name}{_labels(data['labels'], key)} {_number(value)}")
+                continue
+            for bound, count in zip(data["buckets"], value["buckets"]):
+                lines.append(f"{name}_bucket{_labels(data['labels'], key, [('le', _number(float(bound)))])} {count}")
+            lines.append(f"{name}_bucket{_labels(data['labels'], key, [('le', '+Inf')])} {value['count']}")
+            lines.append(f"{name}_sum{_labels(data['labels'], key)} {_number(float(value['sum']))}")
+            lines.append(f"{name}_count{_labels(data['labels'], key)} {value['count']}")
+    return "\n".join(lines) + "\n"
+
+
+# =============================================================================
+# Application metrics
+# =============================================================================
+
+HTTP_REQUESTS = Counter(
+    "edutrack_http_requests_total", "HTTP requests by route, method and status.", ["view", "method", "status"]
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "edutrack_http_request_duration_seconds", "HTTP request latency by route.", ["view", "method"]
+)
+DB_QUERY_SECONDS = Histogram(
+    "edutrack_db_query_duration_seconds", "SQL time per request (sampled requests) by route.", ["view"]
+)
+DB_QUERIES = Histogram(
+    "edutrack_db_queries_per_request", "SQL statements per request (sampled requests) by route.", ["view"],
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+CACHE_REQUESTS = Counter(
+    "edutrack_cache_requests_total", "Application cache lookups by cache and result (hit/miss).", ["cache", "result"]
+)
+EXPORT_SECONDS = Histogram(
+    "edutrack_export_duration_seconds", "Report export generation time by format.", ["format"]
+)
+EXPORT_ROWS = Counter("edutrack_export_rows_total", "Rows written to report exports by format.", ["format"])
+CELERY_TASKS = Counter("edutrack_celery_tasks_total", "Celery tasks run, by task and final state.", ["task", "state"])
+CELERY_TASK_SECONDS = Histogram("edutrack_celery_task_duration_seconds", "Celery task run time by task.", ["task"])
+
+
+def cache_lookup(cache_name: str, hit: bool):
+    """Count one lookup of an application cache layer."""
+    CACHE_REQUESTS.inc(cache=cache_name, result="hit" if hit else "miss")
+
+
+@register_collector
+def celery_queue_depths() -> dict:
+    """Messages waiting in each METRICS_CELERY_QUEUES queue of a Redis broker."""
+    broker = settings.CELERY_BROKER_URL
+    if not broker.startswith(("redis://", "rediss://")) or not settings.METRICS_CELERY_QUEUES:
+        return {}
+    with redis.Redis.from_url(broker, socket_timeout=0.5, socket_connect_timeout=0.5) as client:
+        samples = [[[queue], client.llen(queue)] for queue in settings.METRICS_CELERY_QUEUES]
+    return {
+        "edutrack_celery_queue_length": {
+            "type": "gauge",
+            "help": "Messages waiting in the Celery broker queue.",
+            "labels": ["queue"],
+            "samples": samples,
+        }
+    }
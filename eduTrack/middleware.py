@@ -0,0 +1,192 @@
+"""
+Project-wide middleware.
+
+QueryMetricsMiddleware records, per request, how many SQL statements ran,
+how long they took and how many were repeats of an earlier statement (the
+signature of an N+1 loop). The numbers go out as a Server-Timing header,
+which browser dev tools display next to the request, and as one JSON log
+line on the "eduTrack.request_metrics" logger. Every request, sampled or
+not, also feeds the Prometheus counters in eduTrack.metrics.
+
+ReplicaRoutingMiddleware sends the reads of read-only views to a database
+replica (see eduTrack.db_router).
+"""
+import json
+import logging
+import random
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+from eduTrack.db_router import primary_pin, primary_pinned, replica_eligible, replica_routing
+
+from eduTrack.metrics import DB_QUERIES, DB_QUERY_SECONDS, HTTP_REQUEST_SECONDS, HTTP_REQUESTS, metrics_flush
+
+logger = logging.getLogger("eduTrack.request_metrics")
+
+
+class QueryRecorder:
+    """connection.execute_wrapper hook counting statements and their time."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.statements[sql] += 1
+
+    @property
+    def duplicates(self) -> int:
+        """Statements that repeated an earlier one with the same SQL text."""
+        return sum(times - 1 for times in self.statements.values())
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statements run at least threshold times, most frequent first."""
+        return [(sql, times) for sql, times in self.statements.most_common() if times >= threshold]
+
+
+class QueryMetricsMiddleware:
+    """
+    Instrument a sample of requests with per-request SQL metrics.
+
+    Settings:
+        REQUEST_METRICS_ENABLED: Master switch for the SQL metrics and log
+            lines (the Prometheus counters follow METRICS_ENABLED)
+        REQUEST_METRICS_SAMPLE_RATE: Fraction of requests instrumented (0-1;
+            default 1 in DEBUG, 0.01 otherwise)
+        REQUEST_METRICS_SLOW_MS: Requests at least this slow log a warning,
+            sampled or not
+        REQUEST_METRICS_DUPLICATE_THRESHOLD: A statement repeated this often
+            is reported as a likely N+1
+        REQUEST_METRICS_SERVER_TIMING: Add the Server-Timing header (default:
+            DEBUG only)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        if not settings.REQUEST_METRICS_ENABLED:
+            response = self.get_response(request)
+            self._observe(request, response, time.perf_counter() - start)
+            return response
+
+        if random.random() >= settings.REQUEST_METRICS_SAMPLE_RATE:
+            response = self.get_response(request)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._observe(request, response, elapsed_ms / 1000)
+            if elapsed_ms >= settings.REQUEST_METRICS_SLOW_MS:
+                self._log(request, response, {"duration_ms": round(elapsed_ms, 1), "sampled": False}, slow=True)
+            return response
+
+        recorder = QueryRecorder()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response = self.get_response(request)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        db_ms = recorder.duration * 1000
+        self._observe(request, response, elapsed_ms / 1000, recorder)
+
+        if settings.REQUEST_METRICS_SERVER_TIMING:
+            timing = (
+                f'total;dur={elapsed_ms:.1f}, '
+                f'db;dur={db_ms:.1f};desc="{recorder.count} queries", '
+                f'dupq;desc="{recorder.duplicates} duplicate queries"'
+            )
+            existing = response.get("Server-Timing")
+            response["Server-Timing"] = f"{existing}, {timing}" if existing else timing
+
+        repeated = recorder.repeated(settings.REQUEST_METRICS_DUPLICATE_THRESHOLD)
+        metrics = {
+            "duration_ms": round(elapsed_ms, 1),
+            "db_ms": round(db_ms, 1),
+            "queries": recorder.count,
+            "duplicate_queries": recorder.duplicates,
+            "sampled": True,
+        }
+        if repeated:
+            metrics["repeated"] = [{"sql": sql[:300], "times": times} for sql, times in repeated[:3]]
+        self._log(request, response, metrics, slow=elapsed_ms >= settings.REQUEST_METRICS_SLOW_MS or bool(repeated))
+        return response
+
+    def _observe(self, request, response, elapsed, recorder=None):
+        match = getattr(request, "resolver_match", None)
+        # The route pattern, not the path, keeps the label set bounded.
+        view = match.route if match else "unmatched"
+        HTTP_REQUESTS.inc(view=view, method=request.method, status=response.status_code)
+        HTTP_REQUEST_SECONDS.observe(elapsed, view=view, method=request.method)
+        if recorder is not None:
+            DB_QUERY_SECONDS.observe(recorder.duration, view=view)
+            DB_QUERIES.observe(recorder.count, view=view)
+        metrics_flush()
+
+    def _log(self, request, response, metrics, *, slow):
+        match = getattr(request, "resolver_match", None)
+        payload = {
+            "method": request.method,
+            "path": request.path,
+            "route": match.route if match else None,
+            "status": response.status_code,
+            **metrics,
+        }
+        logger.log(logging.WARNING if slow else logging.INFO, json.dumps(payload))
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Route the reads of replica-eligible views to a healthy replica, unless
+    the requesting user wrote within REPLICA_STICKY_SECONDS; pin users who
+    write. Does nothing unless DATABASE_REPLICAS is set.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.DATABASE_REPLICAS:
+            return self.get_response(request)
+
+        # The user is known here only from the token; DRF authenticates later.
+        request.replica_user_id = self._token_user_id(request)
+        with replica_routing() as routing:
+            request.replica_routing = routing
+            response = self.get_response(request)
+        if routing.wrote and request.replica_user_id is not None:
+            primary_pin(request.replica_user_id)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        routing = getattr(request, "replica_routing", None)
+        if routing is None:
+            return None
+        view_class = getattr(view_func, "view_class", None) or getattr(view_func, "cls", None)
+        if replica_eligible(view_class, request.method) and not primary_pinned(request.replica_user_id):
+            routing.use_replica()
+        return None
+
+    @staticmethod
+    def _token_user_id(request):
+        authentication = JWTAuthentication()
+        header = authentication.get_header(request)
+        try:
+            raw_token = authentication.get_raw_token(header) if header else None
+            if raw_token is None:
+                return None
+            return authentication.get_validated_token(raw_token).get(api_settings.USER_ID_CLAIM)
+        except AuthenticationFailed:
+            return None
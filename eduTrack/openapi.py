@@ -0,0 +1,140 @@
+"""
+Pre-generated OpenAPI schema.
+
+Generating the schema introspects every view and extend_schema decorator,
+which is far too slow to repeat each time the Swagger UI loads it. The
+schema is generated once at deploy time, as YAML and JSON files named after
+the API version,
+
+    python manage.py generate_openapi_schema
+
+and GET /api/schema/ serves those files with an ETag and Cache-Control:
+no-cache, so browsers keep their copy but revalidate it on every load; a
+304 costs nothing, and a deploy that changes the schema is picked up at
+once even though the URL does not change. As with drf-spectacular's
+SpectacularAPIView, the response is YAML unless ?format=json or the Accept
+header asks for JSON.
+
+DEBUG always generates the schema per request (SpectacularAPIView), so it
+never serves a stale file while the API changes under development. Other
+deployments only ever serve the files, in the default language: ?lang= is
+ignored there, since honouring it would mean introspecting the API per
+request again. Without the files they answer 503 until the command has run.
+"""
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.views.decorators.http import require_safe
+from drf_spectacular.renderers import OpenApiJsonRenderer, OpenApiYamlRenderer
+from drf_spectacular.settings import spectacular_settings
+from drf_spectacular.views import SpectacularAPIView
+
+# format -> renderer, in SpectacularAPIView's order: the first is the default.
+OPENAPI_RENDERERS = {"yaml": OpenApiYamlRenderer, "json": OpenApiJsonRenderer}
+
+# Accepted media types and the format served for each, also in
+# SpectacularAPIView's order, so */* picks YAML.
+OPENAPI_MEDIA_TYPES = {
+    "application/vnd.oai.openapi": "yaml",
+    "application/yaml": "yaml",
+    "application/vnd.oai.openapi+json": "json",
+    "application/json": "json",
+}
+
+# path -> (mtime_ns, content, etag), so a regenerated file is picked up
+# without restarting the workers.
+_schema_files = {}
+
+_live_schema_view = SpectacularAPIView.as_view()
+
+
+def openapi_schema_path(schema_format: str = "yaml") -> Path:
+    """The schema file of the current API version in the given format."""
+    return Path(settings.OPENAPI_SCHEMA_DIR) / f"schema-{spectacular_settings.VERSION}.{schema_format}"
+
+
+def openapi_schema_generate(directory: Optional[Path] = None) -> dict[str, tuple[Path, str]]:
+    """
+    Generate the schema in every format into directory (default:
+    OPENAPI_SCHEMA_DIR) and return {format: (path, ETag)}.
+    """
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    schema = generator.get_schema(request=None, public=True)
+
+    written = {}
+    for schema_format, renderer_class in OPENAPI_RENDERERS.items():
+        path = openapi_schema_path(schema_format)
+        if directory:
+            path = Path(directory) / path.name
+        content = renderer_class().render(schema, renderer_context={})
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(".tmp")
+        temporary.write_bytes(content)
+        temporary.replace(path)
+        written[schema_format] = (path, _etag(content))
+    return written
+
+
+def _etag(content: bytes) -> str:
+    return f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+
+
+def openapi_schema_file(schema_format: str = "yaml") -> Optional[tuple[bytes, str]]:
+    """The generated schema and its ETag, or None if it has not been generated."""
+    path = openapi_schema_path(schema_format)
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = _schema_files.get(path)
+    if cached is None or cached[0] != mtime:
+        content = path.read_bytes()
+        cached = (mtime, content, _etag(content))
+        _schema_files[path] = cached
+    return cached[1], cached[2]
+
+
+def _negotiate(request) -> tuple[str, str]:
+    """
+    The (format, content type) to answer with: ?format= wins, then the
+    Accept header, as DRF negotiates for SpectacularAPIView.
+
+    Raises:
+        Http404: If ?format= names an unknown format
+    """
+    requested = request.GET.get("format")
+    if requested:
+        if requested not in OPENAPI_RENDERERS:
+            raise Http404(f"Unknown schema format: {requested}")
+        return requested, OPENAPI_RENDERERS[requested].media_type
+
+    media_type = request.get_preferred_type(list(OPENAPI_MEDIA_TYPES)) or next(iter(OPENAPI_MEDIA_TYPES))
+    return OPENAPI_MEDIA_TYPES[media_type], media_type
+
+
+@require_safe
+def openapi_schema_view(request):
+    """Serve the generated schema in the negotiated format, revalidated by ETag."""
+    if settings.DEBUG:
+        return _live_schema_view(request)
+
+    schema_format, content_type = _negotiate(request)
+    schema = openapi_schema_file(schema_format)
+    if schema is None:
+        return HttpResponse(
+            "The API schema has not been generated. Run: python manage.py generate_openapi_schema",
+            content_type="text/plain",
+            status=503,
+        )
+
+    content, etag = schema
+    response = HttpResponse(content, content_type=content_type)
+    response["ETag"] = etag
+    patch_cache_control(response, public=True, no_cache=True)
+    patch_vary_headers(response, ["Accept"])
+    return get_conditional_response(request, etag=etag, response=response)
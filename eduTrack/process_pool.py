@@ -0,0 +1,13 @@
+"""
+Shared helpers for work fanned out to a ProcessPoolExecutor (bulk seeding,
+load-test clients, roster password hashing).
+"""
+import django
+from django.apps import apps
+
+
+def process_pool_worker_init():
+    """Pool initializer that makes Django usable in the worker process."""
+    # Forked workers inherit configured settings; spawned ones must set up.
+    if not apps.ready:
+        django.setup()
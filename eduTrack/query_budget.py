@@ -0,0 +1,359 @@
+"""
+Query-budget harness.
+
+Seeds a fixed, medium-size dataset, requests every GET endpoint under
+api/ as each role and records status, SQL query count and latency. The
+results are checked against eduTrack/query_budgets.json, which is kept in
+version control, so a change that adds queries to an endpoint (an N+1
+loop, a lost select_related) fails the budget test instead of reaching
+MySQL.
+
+    python manage.py check_query_budgets            # check, report, diff
+    python manage.py check_query_budgets --update   # accept current numbers
+
+Query counts are exact budgets: any increase fails, as does any change of
+response status (an endpoint that starts answering 403 or 500 usually runs
+fewer queries). Latency budgets are
+loose (QUERY_BUDGET_LATENCY_TOLERANCE times the recorded value) because
+timings depend on the machine.
+"""
+import json
+import math
+import re
+import time
+from contextlib import ExitStack
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLResolver, get_resolver
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import CustomUser, Role, SystemConfiguration
+from guardian.models import Guardian, GuardianStudentLink
+from manager.models import StaffEvaluation
+from notifications.models import Notification
+from school.models import AcademicYear, ClassRoom, Course, Grade, School
+from secretary.models import Secretary
+from student.models import Student, StudentEnrollment
+from teacher.models import Assignment, Attendance, CourseAllocation, Mark, Teacher
+from user_messages.services.message_services import message_send
+from workstream.models import WorkStream
+
+BUDGET_FILE = Path(__file__).resolve().parent / "query_budgets.json"
+
+# Documentation endpoints render the whole schema and are not budgeted;
+# the metrics scrape reads worker snapshot files and the broker, not SQL.
+EXCLUDED_ROUTES = {"api/schema/", "api/docs/", "api/redoc/", "api/metrics/"}
+
+ROLES = [
+    Role.ADMIN, Role.MANAGER_WORKSTREAM, Role.MANAGER_SCHOOL,
+    Role.SECRETARY, Role.TEACHER, Role.STUDENT, Role.GUARDIAN,
+]
+
+# Dataset size
+SCHOOLS = 2
+GRADES = 2
+CLASSROOMS_PER_GRADE = 2
+STUDENTS_PER_CLASSROOM = 10
+TEACHERS_PER_SCHOOL = 4
+ASSIGNMENTS_PER_ALLOCATION = 2
+ATTENDANCE_DAYS = 2
+
+# Routes whose <pk> is not self-describing
+PK_ROUTES = {
+    "api/system-config/": "system_config",
+    "api/user-messages/": "message",
+    "api/notifications/": "notification",
+}
+
+_PARAMETER = re.compile(r"<(?:(\w+):)?(\w+)>")
+
+
+def _user(email, full_name, role, **fields):
+    # Unusable passwords: requests are force-authenticated, and hashing
+    # would dominate seeding time.
+    return CustomUser.objects.create_user(email=email, password=None, full_name=full_name, role=role, **fields)
+
+
+def query_budget_seed() -> dict:
+    """
+    Create the benchmark dataset.
+
+    Returns:
+        {"users": {role: user}, "values": {url parameter: value}}
+    """
+    admin = _user("budget.admin@example.com", "Budget Admin", Role.ADMIN)
+    ws_manager = _user("budget.ws@example.com", "Budget WS Manager", Role.MANAGER_WORKSTREAM)
+    workstream = WorkStream.objects.create(workstream_name="Budget Workstream", capacity=10, manager=ws_manager)
+    ws_manager.work_stream = workstream
+    ws_manager.save(update_fields=["work_stream"])
+
+    grades = [
+        Grade.objects.create(name=f"Budget Grade {level}", numeric_level=level, min_age=5 + level, max_age=6 + level)
+        for level in range(1, GRADES + 1)
+    ]
+    today = timezone.localdate()
+
+    values = {"workstream_id": workstream.id, "slug": workstream.slug, "grade_id": grades[0].id}
+    users = {Role.ADMIN: admin, Role.MANAGER_WORKSTREAM: ws_manager}
+
+    for s in range(SCHOOLS):
+        school_manager = _user(f"budget.sm{s}@example.com", f"Budget Manager {s}", Role.MANAGER_SCHOOL)
+        school = School.objects.create(
+            school_name=f"Budget School {s}", work_stream=workstream, manager=school_manager, capacity=1000
+        )
+        school_manager.school = school
+        school_manager.work_stream = workstream
+        school_manager.save(update_fields=["school", "work_stream"])
+
+        year = AcademicYear.objects.create(
+            academic_year_code=f"{today.year + 1}/{today.year}", school=school,
+            start_date=date(today.year, 1, 1), end_date=date(today.year, 12, 31)
+        )
+        secretary_user = _user(f"budget.sec{s}@example.com", f"Budget Secretary {s}", Role.SECRETARY, school=school)
+        Secretary.objects.create(user=secretary_user, department="Office", hire_date=date(2020, 1, 1))
+        teachers = [
+            Teacher.objects.create(
+                user=_user(f"budget.t{s}.{t}@example.com", f"Budget Teacher {s}.{t}", Role.TEACHER, school=school),
+                hire_date=date(2020, 1, 1), employment_status="full_time", specialization="General"
+            )
+            for t in range(TEACHERS_PER_SCHOOL)
+        ]
+        evaluation = StaffEvaluation.objects.create(
+            reviewer=school_manager, reviewee=teachers[0].user, evaluation_date=today, rating_score=4
+        )
+
+        first_student = first_guardian = None
+        for g, grade in enumerate(grades):
+            courses = [
+                Course.objects.create(
+                    course_code=f"B{s}{g}{c}", school=school, grade=grade, name=f"Budget Course {s}.{g}.{c}"
+                )
+                for c in range(2)
+            ]
+            for r in range(CLASSROOMS_PER_GRADE):
+                classroom = ClassRoom.objects.create(
+                    classroom_name=f"{grade.numeric_level}{chr(65 + r)}", school=school,
+                    academic_year=year, grade=grade, homeroom_teacher=teachers[r % len(teachers)]
+                )
+                allocations = [
+                    CourseAllocation.objects.create(
+                        course=course, class_room=classroom, academic_year=year,
+                        teacher=teachers[(r + c) % len(teachers)]
+                    )
+                    for c, course in enumerate(courses)
+                ]
+                students = []
+                for n in range(STUDENTS_PER_CLASSROOM):
+                    student = Student.objects.create(
+                        user=_user(
+                            f"budget.s{s}.{g}.{r}.{n}@example.com", f"Budget Student {s}.{g}.{r}.{n}",
+                            Role.STUDENT, school=school
+                        ),
+                        grade=grade, date_of_birth=date(2015, 1, 1), admission_date=date(today.year, 1, 1)
+                    )
+                    enrollment = StudentEnrollment.objects.create(
+                        student=student, class_room=classroom, academic_year=year, status="active"
+                    )
+                    if n % 2 == 0:
+                        guardian = Guardian.objects.create(user=_user(
+                            f"budget.g{s}.{g}.{r}.{n}@example.com", f"Budget Guardian {s}.{g}.{r}.{n}",
+                            Role.GUARDIAN, school=school
+                        ))
+                    link = GuardianStudentLink.objects.create(
+                        guardian=guardian, student=student, relationship_type="parent", is_primary=n % 2 == 0
+                    )
+                    students.append(student)
+                    if first_student is None:
+                        first_student, first_guardian = student, guardian
+                        first_enrollment, first_link = enrollment, link
+
+                for allocation in allocations:
+                    for a in range(ASSIGNMENTS_PER_ALLOCATION):
+                        assignment = Assignment.objects.create(
+                            assignment_code=f"B-{allocation.id}-{a}", course_allocation=allocation,
+                            created_by=allocation.teacher, title=f"Budget Assignment {a}",
+                            full_mark=Decimal("100.00"), due_date=timezone.now() + timedelta(days=7)
+                        )
+                        Mark.objects.bulk_create([
+                            Mark(
+                                student=student, assignment=assignment, score=Decimal(60 + i % 40),
+                                graded_by=allocation.teacher, graded_at=timezone.now()
+                            )
+                            for i, student in enumerate(students)
+                        ])
+                    Attendance.objects.bulk_create([
+                        Attendance(
+                            student=student, course_allocation=allocation, date=today - timedelta(days=d),
+                            status="present" if i % 5 else "absent", recorded_by=allocation.teacher
+                        )
+                        for d in range(ATTENDANCE_DAYS)
+                        for i, student in enumerate(students)
+                    ])
+
+        if s == 0:
+            message = message_send(
+                sender=teachers[0].user, recipients=[first_student.user, first_guardian.user],
+                subject="Budget", body="Budget message"
+            )
+            config = SystemConfiguration.objects.create(school=school, config_key="budget", config_value="1")
+            notification = Notification.objects.create(
+                recipient=first_student.user, title="Budget", message="Budget notification",
+                notification_type="announcement"
+            )
+            users.update({
+                Role.MANAGER_SCHOOL: school_manager,
+                Role.SECRETARY: secretary_user,
+                Role.TEACHER: teachers[0].user,
+                Role.STUDENT: first_student.user,
+                Role.GUARDIAN: first_guardian.user,
+            })
+            values.update(
+                school_id=school.id, manager_id=school_manager.id, academic_year_id=year.id,
+                classroom_id=ClassRoom.objects.filter(school=school).order_by("id").first().id,
+                course_id=Course.objects.filter(school=school).order_by("id").first().id,
+                allocation_id=CourseAllocation.objects.filter(academic_year=year).order_by("id").first().id,
+                teacher_id=teachers[0].user_id, student_id=first_student.user_id,
+                user_id=first_student.user_id, guardian_id=first_guardian.user_id,
+                secretary_id=secretary_user.id, evaluation_id=evaluation.id,
+                assignment_id=Assignment.objects.order_by("id").first().id,
+                mark_id=Mark.objects.order_by("id").first().id,
+                attendance_id=Attendance.objects.order_by("id").first().id,
+                enrollment_id=first_enrollment.id, link_id=first_link.id,
+                thread_id=message.thread_id, message=message.id, notification=notification.id,
+                system_config=config.id,
+            )
+
+    return {"users": users, "values": values}
+
+
+def query_budget_endpoints() -> list[str]:
+    """Route patterns of every GET endpoint under api/, in URLconf order."""
+    routes = []
+
+    def walk(patterns, prefix):
+        for pattern in patterns:
+            if isinstance(pattern, URLResolver):
+                walk(pattern.url_patterns, prefix + str(pattern.pattern))
+                continue
+            route = prefix + str(pattern.pattern)
+            view = getattr(pattern.callback, "view_class", None) or getattr(pattern.callback, "cls", None)
+            if route.startswith("api/") and route not in EXCLUDED_ROUTES and view and hasattr(view, "get"):
+                routes.append(route)
+
+    walk(get_resolver().url_patterns, "")
+    return routes
+
+
+def _url(route: str, values: dict):
+    def value(match):
+        name = match.group(2)
+        if name == "pk":
+            name = next((key for prefix, key in PK_ROUTES.items() if route.startswith(prefix)), None)
+        if name not in values:
+            raise KeyError(match.group(2))
+        return str(values[name])
+
+    try:
+        return "/" + _PARAMETER.sub(value, route)
+    except KeyError:
+        return None
+
+
+def query_budget_measure(dataset: dict) -> dict:
+    """
+    Request every endpoint as every role.
+
+    Each request runs once to warm caches and is then measured, so counts
+    reflect steady state. Queries are counted on the primary and every
+    replica the router may read from. Endpoints whose URL parameters the dataset cannot
+    fill are skipped.
+
+    Returns:
+        {"<role> GET /<route>": {"status", "queries", "ms"}}
+    """
+    cache.clear()
+    client = APIClient()
+    client.raise_request_exception = False
+    results = {}
+    for route in query_budget_endpoints():
+        url = _url(route, dataset["values"])
+        if url is None:
+            continue
+        for role in ROLES:
+            client.force_authenticate(user=dataset["users"][role])
+            client.get(url)
+            with ExitStack() as stack:
+                captured = [
+                    stack.enter_context(CaptureQueriesContext(connections[alias]))
+                    for alias in ["default", *settings.DATABASE_REPLICAS]
+                ]
+                start = time.perf_counter()
+                response = client.get(url)
+                elapsed = (time.perf_counter() - start) * 1000
+            results[f"{role} GET /{route}"] = {
+                "status": response.status_code,
+                "queries": sum(len(queries) for queries in captured),
+                "ms": round(elapsed, 1),
+            }
+    client.force_authenticate(user=None)
+    return results
+
+
+def query_budget_load(path: Path = BUDGET_FILE) -> dict:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def query_budget_build(results: dict) -> dict:
+    """Budgets accepting results: exact query counts, latency with headroom."""
+    return {
+        key: {
+            "status": result["status"],
+            "queries": result["queries"],
+            "ms": max(settings.QUERY_BUDGET_MIN_MS, math.ceil(result["ms"])),
+        }
+        for key, result in sorted(results.items())
+    }
+
+
+def query_budget_check(results: dict, budgets: dict) -> list[str]:
+    """Violations of budgets by results, one line each."""
+    tolerance = settings.QUERY_BUDGET_LATENCY_TOLERANCE
+    violations = []
+    for key, result in sorted(results.items()):
+        budget = budgets.get(key)
+        if budget is None:
+            violations.append(f"{key}: no budget (run check_query_budgets --update)")
+            continue
+        if result["status"] != budget["status"]:
+            violations.append(f"{key}: status {result['status']}, budget {budget['status']}")
+        if result["queries"] > budget["queries"]:
+            violations.append(f"{key}: {result['queries']} queries, budget {budget['queries']}")
+        if result["ms"] > budget["ms"] * tolerance:
+            violations.append(f"{key}: {result['ms']} ms, budget {budget['ms']} ms (x{tolerance})")
+    return violations
+
+
+def query_budget_diff(previous: dict, current: dict) -> list[str]:
+    """Per-endpoint changes in status and query count between two runs."""
+    lines = []
+    for key in sorted(set(previous) | set(current)):
+        before, after = previous.get(key), current.get(key)
+        if before is None:
+            lines.append(f"+ {key}: {after['queries']} queries ({after['status']})")
+        elif after is None:
+            lines.append(f"- {key}")
+        elif (before["queries"], before["status"]) != (after["queries"], after["status"]):
+            lines.append(
+                f"~ {key}: {before['queries']} -> {after['queries']} queries, "
+                f"status {before['status']} -> {after['status']}"
+            )
+    return lines
@@ -14,6 +14,7 @@ from pathlib import Path
 from datetime import timedelta
 import os
 import sys
+from django.core.exceptions import ImproperlyConfigured
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -57,6 +58,7 @@ INSTALLED_APPS = [
     "notifications",
     "secretary",
     "reports",
+    "search",
     "drf_spectacular",
     "django_celery_results",
 ]
@@ -66,7 +68,7 @@ AUTH_USER_MODEL = "accounts.CustomUser"
 # REST Framework Configuration
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.CachedJWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": [
@@ -122,6 +124,8 @@ SIMPLE_JWT = {
 
 
 MIDDLEWARE = [
+    'eduTrack.middleware.QueryMetricsMiddleware',
+    'eduTrack.middleware.ReplicaRoutingMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
@@ -212,6 +216,27 @@ else:
         }
     }
 
+    # Read replicas (eduTrack/db_router.py): DB_REPLICA_HOSTS="host[:port],..."
+    # adds "replica", "replica_2", ... with the primary's credentials.
+    for index, replica in enumerate(h for h in os.environ.get('DB_REPLICA_HOSTS', '').split(',') if h):
+        replica_host, _, replica_port = replica.partition(':')
+        DATABASES['replica' if index == 0 else f'replica_{index + 1}'] = {
+            **DATABASES['default'],
+            'HOST': replica_host,
+            'PORT': replica_port or DB_PORT,
+            'TEST': {'MIRROR': 'default'},
+        }
+
+# Reporting views and list GETs read from a replica when one is configured
+# and less than REPLICA_MAX_LAG_SECONDS behind (checked every
+# REPLICA_LAG_CHECK_INTERVAL seconds per process); users who wrote read
+# from the primary for REPLICA_STICKY_SECONDS.
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias.startswith('replica')]
+DATABASE_ROUTERS = ['eduTrack.db_router.ReplicaRouter']
+REPLICA_MAX_LAG_SECONDS = float(os.environ.get('REPLICA_MAX_LAG_SECONDS', 5))
+REPLICA_LAG_CHECK_INTERVAL = float(os.environ.get('REPLICA_LAG_CHECK_INTERVAL', 5))
+REPLICA_STICKY_SECONDS = int(os.environ.get('REPLICA_STICKY_SECONDS', 15))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -260,6 +285,32 @@ STORAGES = {
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Cache: shared Redis cache when CACHE_REDIS_URL is set so invalidation is
+# seen by every worker; per-process memory otherwise (development/tests).
+CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL')
+if CACHE_REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_REDIS_URL,
+            'KEY_PREFIX': 'edutraker',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+# State every gunicorn worker must agree on (the cached authentication
+# user, read-your-writes replica pins) needs the shared cache.
+CACHE_SHARED = bool(CACHE_REDIS_URL)
+if DATABASE_REPLICAS and not CACHE_SHARED:
+    raise ImproperlyConfigured(
+        "DB_REPLICA_HOSTS requires CACHE_REDIS_URL: users are pinned to the primary after a write "
+        "through the cache, and a per-process cache would not pin them on the other workers."
+    )
+
 # Celery Configuration
 CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = 'django-db'
@@ -274,6 +325,121 @@ CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = (
 CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 30 * 60  # 30 minutes
 CELERY_TASK_SOFT_TIME_LIMIT = 20 * 60  # 20 minutes
+CELERY_BEAT_SCHEDULE = {
+    'deliver-notification-emails': {
+        'task': 'notifications.tasks.deliver_notification_emails',
+        'schedule': int(os.environ.get('NOTIFICATION_EMAIL_INTERVAL', 60)),
+    },
+    'purge-expired-notifications': {
+        'task': 'notifications.tasks.purge_expired_notifications',
+        'schedule': 24 * 60 * 60,
+    },
+}
+
+# Notification digesting: same-type notifications for a recipient inside one
+# window (seconds) are merged into a single row. Types not listed are never merged.
+NOTIFICATION_DIGEST_WINDOWS = {
+    'attendance_marked': int(os.environ.get('NOTIFICATION_DIGEST_ATTENDANCE_WINDOW', 24 * 60 * 60)),
+    'grade_posted': int(os.environ.get('NOTIFICATION_DIGEST_GRADE_WINDOW', 60 * 60)),
+}
+NOTIFICATION_DIGEST_MAX_ITEMS = int(os.environ.get('NOTIFICATION_DIGEST_MAX_ITEMS', 50))
+NOTIFICATION_BULK_BATCH_SIZE = int(os.environ.get('NOTIFICATION_BULK_BATCH_SIZE', 500))
+
+# Messages with more recipients than this are fanned out by a Celery task
+# instead of inside the request; receipts are inserted in chunks of this size.
+MESSAGE_ASYNC_RECIPIENT_THRESHOLD = int(os.environ.get('MESSAGE_ASYNC_RECIPIENT_THRESHOLD', 200))
+MESSAGE_BULK_BATCH_SIZE = int(os.environ.get('MESSAGE_BULK_BATCH_SIZE', 500))
+
+# Notification email delivery: messages per SMTP batch and batches per beat run.
+# A claimed notification is skipped by other runs for NOTIFICATION_EMAIL_CLAIM_TIMEOUT
+# seconds, which is also the delay before a temporarily refused message is
+# retried; after NOTIFICATION_EMAIL_MAX_ATTEMPTS attempts it is marked failed.
+# Digests are emailed once their window has closed.
+NOTIFICATION_EMAIL_BATCH_SIZE = int(os.environ.get('NOTIFICATION_EMAIL_BATCH_SIZE', 100))
+NOTIFICATION_EMAIL_MAX_BATCHES = int(os.environ.get('NOTIFICATION_EMAIL_MAX_BATCHES', 10))
+NOTIFICATION_EMAIL_CLAIM_TIMEOUT = int(os.environ.get('NOTIFICATION_EMAIL_CLAIM_TIMEOUT', 30 * 60))
+NOTIFICATION_EMAIL_MAX_ATTEMPTS = int(os.environ.get('NOTIFICATION_EMAIL_MAX_ATTEMPTS', 5))
+# Notification retention: read rows and dismissed (inactive) rows older than
+# these many days are hard-deleted in bounded batches by a periodic task.
+NOTIFICATION_RETENTION_READ_DAYS = int(os.environ.get('NOTIFICATION_RETENTION_READ_DAYS', 90))
+NOTIFICATION_RETENTION_INACTIVE_DAYS = int(os.environ.get('NOTIFICATION_RETENTION_INACTIVE_DAYS', 30))
+NOTIFICATION_RETENTION_BATCH_SIZE = int(os.environ.get('NOTIFICATION_RETENTION_BATCH_SIZE', 1000))
+NOTIFICATION_RETENTION_MAX_BATCHES = int(os.environ.get('NOTIFICATION_RETENTION_MAX_BATCHES', 100))
+
+# Seconds an authenticated user (with school, work stream and profile) is
+# served from cache; any save or delete of the user invalidates it.
+# Only with the shared cache: with per-process LocMem a deactivation would
+# not reach the other workers.
+AUTH_USER_CACHE_ENABLED = CACHE_SHARED
+AUTH_USER_CACHE_TIMEOUT = int(os.environ.get('AUTH_USER_CACHE_TIMEOUT', 60))
+
+# Seconds an effective SystemConfiguration map is cached per (school,
+# workstream); any configuration save/delete invalidates all maps. Only with
+# the shared cache, for the same reason as the authenticated-user cache.
+SYSTEM_CONFIG_CACHE_ENABLED = CACHE_SHARED
+SYSTEM_CONFIG_CACHE_TIMEOUT = int(os.environ.get('SYSTEM_CONFIG_CACHE_TIMEOUT', 300))
+
+# User prefix search: seconds a recipient-picker result list is reused for
+# the same prefix and visibility scope. Any user save invalidates all entries.
+# Only with the shared cache, for the same reason as the authenticated-user
+# cache.
+USER_SEARCH_CACHE_ENABLED = CACHE_SHARED
+USER_SEARCH_CACHE_TIMEOUT = int(os.environ.get('USER_SEARCH_CACHE_TIMEOUT', 30))
+
+# Roster import: rows written per transaction, processes used to hash
+# passwords, and the smallest batch worth starting a process pool for.
+# The API endpoint runs inside a gunicorn request (--timeout 120), so it
+# hashes with ROSTER_IMPORT_API_HASH_WORKERS processes and refuses rosters
+# above ROSTER_IMPORT_MAX_ROWS: at ~0.3s of PBKDF2 per password, 200 rows
+# on 2 processes take ~30s. Use the import_roster management command for
+# larger files.
+ROSTER_IMPORT_CHUNK_SIZE = int(os.environ.get('ROSTER_IMPORT_CHUNK_SIZE', 500))
+ROSTER_IMPORT_HASH_WORKERS = int(os.environ.get('ROSTER_IMPORT_HASH_WORKERS', os.cpu_count() or 1))
+ROSTER_IMPORT_PARALLEL_MIN_ROWS = int(os.environ.get('ROSTER_IMPORT_PARALLEL_MIN_ROWS', 50))
+ROSTER_IMPORT_MAX_ROWS = int(os.environ.get('ROSTER_IMPORT_MAX_ROWS', 200))
+ROSTER_IMPORT_API_HASH_WORKERS = int(os.environ.get('ROSTER_IMPORT_API_HASH_WORKERS', 2))
+
+# Request instrumentation (eduTrack.middleware.QueryMetricsMiddleware):
+# the sampled fraction of requests gets SQL count/time and duplicate
+# statements reported in a Server-Timing header and a JSON log line on
+# "eduTrack.request_metrics"; requests over REQUEST_METRICS_SLOW_MS, or
+# repeating one statement REQUEST_METRICS_DUPLICATE_THRESHOLD times, log
+# at WARNING. Outside DEBUG only 1% of requests are sampled and the header,
+# which exposes query counts and timings to any client, is off by default.
+REQUEST_METRICS_ENABLED = os.environ.get('REQUEST_METRICS_ENABLED', 'True') == 'True'
+REQUEST_METRICS_SAMPLE_RATE = float(os.environ.get('REQUEST_METRICS_SAMPLE_RATE', 1.0 if DEBUG else 0.01))
+REQUEST_METRICS_SLOW_MS = int(os.environ.get('REQUEST_METRICS_SLOW_MS', 1000))
+REQUEST_METRICS_DUPLICATE_THRESHOLD = int(os.environ.get('REQUEST_METRICS_DUPLICATE_THRESHOLD', 10))
+REQUEST_METRICS_SERVER_TIMING = os.environ.get('REQUEST_METRICS_SERVER_TIMING', str(DEBUG)) == 'True'
+
+# Query-budget harness (eduTrack/query_budget.py): latency budgets are
+# recorded with a floor of QUERY_BUDGET_MIN_MS and fail only beyond
+# QUERY_BUDGET_LATENCY_TOLERANCE times the budget; check_query_budgets
+# writes its report to QUERY_BUDGET_REPORT_PATH and diffs the previous one.
+QUERY_BUDGET_MIN_MS = int(os.environ.get('QUERY_BUDGET_MIN_MS', 250))
+QUERY_BUDGET_LATENCY_TOLERANCE = float(os.environ.get('QUERY_BUDGET_LATENCY_TOLERANCE', 4.0))
+QUERY_BUDGET_REPORT_PATH = os.environ.get('QUERY_BUDGET_REPORT_PATH', str(BASE_DIR / 'query_budget_report.json'))
+
+# Benchmark datasets (seed_data --scale): processes writing schools in
+# parallel (SQLite always uses one) and rows per bulk INSERT.
+SEED_WORKERS = int(os.environ.get('SEED_WORKERS', os.cpu_count() or 1))
+SEED_BATCH_SIZE = int(os.environ.get('SEED_BATCH_SIZE', 2000))
+
+# Prometheus metrics (eduTrack/metrics.py, GET /api/metrics/ for admins):
+# each gunicorn/Celery process writes its counters to METRICS_DIR at most
+# every METRICS_FLUSH_INTERVAL seconds and a scrape merges them (exited
+# processes' files are folded into one per host); unset, a scrape only sees
+# the worker serving it. METRICS_CELERY_QUEUES are the
+# broker queues whose length is reported.
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'True') == 'True'
+METRICS_DIR = os.environ.get('METRICS_DIR') or None
+METRICS_FLUSH_INTERVAL = float(os.environ.get('METRICS_FLUSH_INTERVAL', 1.0))
+METRICS_CELERY_QUEUES = [q for q in os.environ.get('METRICS_CELERY_QUEUES', 'celery').split(',') if q]
+
+# OpenAPI schema (eduTrack/openapi.py): generate_openapi_schema writes it to
+# OPENAPI_SCHEMA_DIR at deploy time and, outside DEBUG, /api/schema/ serves
+# the files with an ETag, revalidated by browsers on every load.
+OPENAPI_SCHEMA_DIR = os.environ.get('OPENAPI_SCHEMA_DIR', str(BASE_DIR / 'openapi'))
 
 # Email Configuration
 EMAIL_BACKEND = os.environ.get(
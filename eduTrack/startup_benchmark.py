@@ -0,0 +1,132 @@
+"""
+Startup benchmark for worker processes.
+
+Boots each kind of worker in a fresh interpreter, the way gunicorn and
+Celery do, and reports the wall time to get ready and the resident memory
+once ready:
+
+    python manage.py benchmark_startup --runs 5 --output startup.json
+
+The "web" process loads the WSGI application and the full URLconf, so every
+view module is imported; the "celery" process loads the Celery app and its
+task modules. Each is also measured with the report export backends
+imported up front (the "+exports" rows), which is what every worker paid
+before the backends were loaded on first use - the difference between the
+two rows is the cost a worker now only pays on its first export.
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+
+STARTUP_TARGETS = {
+    "web": (
+        "from eduTrack.wsgi import application\n"
+        "from django.urls import get_resolver\n"
+        "get_resolver().url_patterns\n"
+    ),
+    "celery": (
+        "import django\n"
+        "django.setup()\n"
+        "from eduTrack.celery import app\n"
+        "app.loader.import_default_modules()\n"
+    ),
+}
+
+# Modules whose presence in sys.modules tells whether exports were loaded.
+STARTUP_WATCHED_MODULES = ("openpyxl", "reportlab")
+
+# The child gets this process's command line, so settings that look at
+# sys.argv (the test database) resolve as they did here.
+_PRELUDE = (
+    "import os, sys, time\n"
+    "sys.argv = {argv!r}\n"
+    "os.environ.setdefault('DJANGO_SETTINGS_MODULE', {settings_module!r})\n"
+    "_t0 = time.perf_counter()\n"
+)
+
+_EAGER_EXPORTS = (
+    "from reports.services.export_service import EXPORT_BACKENDS, export_backend\n"
+    "for _format in EXPORT_BACKENDS:\n"
+    "    export_backend(_format)\n"
+)
+
+_REPORT = (
+    "import json, sys\n"
+    "_elapsed = time.perf_counter() - _t0\n"
+    "_rss_kb = 0\n"
+    "with open('/proc/self/status') as _status:\n"
+    "    for _line in _status:\n"
+    "        if _line.startswith('VmRSS:'):\n"
+    "            _rss_kb = int(_line.split()[1])\n"
+    "print(json.dumps({{'seconds': _elapsed, 'rss_kb': _rss_kb, 'modules': len(sys.modules),\n"
+    "                   'loaded': [m for m in {watched!r} if m in sys.modules]}}))\n"
+)
+
+
+def _startup_script(target: str, eager_exports: bool) -> str:
+    return (
+        _PRELUDE.format(argv=sys.argv, settings_module=settings.SETTINGS_MODULE)
+        + STARTUP_TARGETS[target]
+        + (_EAGER_EXPORTS if eager_exports else "")
+        + _REPORT.format(watched=STARTUP_WATCHED_MODULES)
+    )
+
+
+def _startup_sample(script: str) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True, text=True, cwd=settings.BASE_DIR, env=os.environ.copy(),
+    )
+    if completed.returncode:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "startup failed")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def startup_benchmark_run(*, targets=None, runs: int = 5) -> dict:
+    """
+    Start every target `runs` times, with and without the export backends,
+    and return the median startup time and RSS of each.
+
+    Raises:
+        ValueError: If a target is unknown or runs is not positive
+        RuntimeError: If a process fails to start
+    """
+    targets = list(targets or STARTUP_TARGETS)
+    unknown = sorted(set(targets) - set(STARTUP_TARGETS))
+    if unknown:
+        raise ValueError(f"Unknown startup targets: {', '.join(unknown)}")
+    if runs < 1:
+        raise ValueError("runs must be at least 1")
+
+    report = {"meta": {"runs": runs, "python": sys.version.split()[0]}, "targets": {}}
+    for target in targets:
+        for eager_exports in (False, True):
+            script = _startup_script(target, eager_exports)
+            samples = [_startup_sample(script) for _ in range(runs)]
+            name = f"{target}+exports" if eager_exports else target
+            report["targets"][name] = {
+                "startup_ms": round(statistics.median(s["seconds"] for s in samples) * 1000, 1),
+                "rss_mb": round(statistics.median(s["rss_kb"] for s in samples) / 1024, 1),
+                "modules": samples[-1]["modules"],
+                "loaded": samples[-1]["loaded"],
+            }
+    return report
+
+
+def startup_benchmark_savings(report: dict) -> list[str]:
+    """One line per target with what loading exports on first use saves at startup."""
+    lines = []
+    for name, lazy in report["targets"].items():
+        eager = report["targets"].get(f"{name}+exports")
+        if eager is None:
+            continue
+        lines.append(
+            f"{name}: {eager['startup_ms'] - lazy['startup_ms']:+.1f} ms, "
+            f"{eager['rss_mb'] - lazy['rss_mb']:+.1f} MB RSS, "
+            f"{eager['modules'] - lazy['modules']:+d} modules deferred to the first export"
+        )
+    return lines
@@ -16,7 +16,9 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
+from drf_spectacular.views import SpectacularSwaggerView, SpectacularRedocView
+
+from eduTrack.openapi import openapi_schema_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -24,7 +26,7 @@ urlpatterns = [
     # ============================================
     # API DOCUMENTATION (Swagger/OpenAPI)
     # ============================================
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
+    path('api/schema/', openapi_schema_view, name='schema'),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
     path('api/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
     
@@ -48,5 +50,6 @@ urlpatterns = [
     path('api/user-messages/', include('user_messages.urls')),
     path('api/notifications/', include('notifications.urls')),
     path('api/secretary/', include('secretary.urls')),
+    path('api/search/', include('search.urls')),
 ]
 
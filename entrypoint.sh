@@ -61,6 +61,15 @@ if [ $# -eq 0 ]; then
     echo "Collecting static files..."
     python manage.py collectstatic --noinput
 
+    echo "Generating OpenAPI schema..."
+    python manage.py generate_openapi_schema
+
+    if [ -n "$METRICS_DIR" ]; then
+      echo "Clearing metrics snapshots in $METRICS_DIR..."
+      mkdir -p "$METRICS_DIR"
+      rm -f "$METRICS_DIR"/*.json
+    fi
+
     echo "Starting Gunicorn..."
     exec gunicorn --reload --bind 0.0.0.0:8000 --workers 3 --timeout 120 eduTrack.wsgi:application
 else
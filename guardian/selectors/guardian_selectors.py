@@ -6,6 +6,11 @@ from django.core.exceptions import PermissionDenied
 from accounts.models import CustomUser, Role
 from guardian.models import Guardian, GuardianStudentLink
 from accounts.policies.guardian_policies import can_access_guardian, can_manage_guardians_in_school
+from accounts.selectors.relation_filters import RelationFilter, apply_relation_filters
+
+GUARDIAN_RELATION_FILTERS = {
+    "student_id": RelationFilter(GuardianStudentLink.objects.all(), "guardian_id", "student_id"),
+}
 
 def guardian_list(*, filters: dict, user: CustomUser, include_inactive: bool = False) -> QuerySet[Guardian]:
     """Return a QuerySet of Guardians filtered by user role and optional filters."""
@@ -30,6 +35,8 @@ def guardian_list(*, filters: dict, user: CustomUser, include_inactive: bool = F
     if school_id := filters.get("school_id"):
         qs = qs.filter(user__school_id=school_id)
 
+    qs = apply_relation_filters(qs, filters=filters, spec=GUARDIAN_RELATION_FILTERS)
+
     if search := filters.get("search"):
         qs = qs.filter(user__full_name__icontains=search)
 
@@ -13,6 +13,7 @@ User = get_user_model()
 class GuardianFilterSerializer(serializers.Serializer):
     """Filter serializer for guardian list endpoint."""
     school_id = serializers.IntegerField(required=False, help_text="Filter by school")
+    student_id = serializers.IntegerField(required=False, help_text="Guardians linked to this student")
     search = serializers.CharField(required=False, help_text="Search by name or email")
     include_inactive = serializers.BooleanField(default=False, help_text="Include deactivated records")
 
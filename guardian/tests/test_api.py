@@ -101,6 +101,16 @@ class GuardianApiTests(APITestCase):
         self.assertEqual(len(response.data['results']), 1)
         self.assertEqual(response.data['results'][0]['email'], self.guardian1_user.email)
 
+    def test_list_guardians_by_student(self):
+        """Test filtering guardians to those linked to a student."""
+        GuardianStudentLink.objects.create(guardian=self.guardian1, student=self.student1, relationship_type="parent")
+        GuardianStudentLink.objects.create(guardian=self.guardian2, student=self.student2, relationship_type="parent")
+
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(reverse('guardian:guardian-list'), {'student_id': self.student2_user.id})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([g['email'] for g in response.data['results']], [self.guardian2_user.email])
+
     def test_create_guardian_rbac(self):
         """Test creating a guardian."""
         url = reverse('guardian:guardian-create')
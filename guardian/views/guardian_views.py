@@ -8,7 +8,7 @@ from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExampl
 
 from rest_framework.permissions import IsAuthenticated
 from accounts.permissions import IsAdminOrManagerOrSecretary, IsStaffUser, IsTeacher, IsGuardian
-from accounts.pagination import PaginatedAPIMixin
+from accounts.pagination import PaginatedAPIMixin, SPARSE_FIELDSET_PARAMETERS
 from accounts.models import CustomUser, Role
 from guardian.models import Guardian, GuardianStudentLink
 from guardian.selectors.guardian_selectors import (
@@ -50,9 +50,11 @@ class GuardianListApi(PaginatedAPIMixin, APIView):
         summary="List guardians",
         parameters=[
             OpenApiParameter(name='school_id', type=int, description='Filter by school'),
+            OpenApiParameter(name='student_id', type=int, description='Guardians linked to this student'),
             OpenApiParameter(name='search', type=str, description='Search by name or email'),
             OpenApiParameter(name='include_inactive', type=bool, description='Include deactivated records'),
             OpenApiParameter(name='page', type=int, description='Page number'),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={200: GuardianOutputSerializer(many=True)},
     )
@@ -172,6 +174,7 @@ class GuardianStudentLinkApi(PaginatedAPIMixin, APIView):
         summary='List linked students',
         parameters=[
             OpenApiParameter(name='page', type=int, description='Page number'),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={200: GuardianStudentLinkOutputSerializer(many=True)}
     )
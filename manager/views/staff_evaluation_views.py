@@ -4,7 +4,7 @@ from rest_framework import serializers, status
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample, OpenApiResponse
 
 from accounts.permissions import IsAdminOrManager, IsStaffUser
-from accounts.pagination import PaginatedAPIMixin
+from accounts.pagination import PaginatedAPIMixin, SPARSE_FIELDSET_PARAMETERS
 from manager.models import StaffEvaluation
 from manager.selectors.staff_evaluation_selectors import staff_evaluation_list, staff_evaluation_get
 from manager.services.staff_evaluation_services import (
@@ -63,6 +63,7 @@ class StaffEvaluationListApi(PaginatedAPIMixin, APIView):
             OpenApiParameter(name='start_date', type=str, description='Filter by start date'),
             OpenApiParameter(name='end_date', type=str, description='Filter by end date'),
             OpenApiParameter(name='page', type=int, description='Page number'),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={200: StaffEvaluationOutputSerializer(many=True)},
         examples=[
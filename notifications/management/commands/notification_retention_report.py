@@ -0,0 +1,57 @@
+"""
+Django management command to report notifications table size and the rows
+the retention purge would reclaim.
+Usage: python manage.py notification_retention_report [--read-days N] [--inactive-days M] [--top K]
+"""
+
+from django.core.management.base import BaseCommand
+
+from notifications.selectors.notification_selectors import notification_retention_summary
+
+
+class Command(BaseCommand):
+    help = 'Report notifications table size and reclaimable rows per recipient'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--read-days',
+            type=int,
+            default=None,
+            help='Read notifications older than this are reclaimable (default: NOTIFICATION_RETENTION_READ_DAYS)',
+        )
+        parser.add_argument(
+            '--inactive-days',
+            type=int,
+            default=None,
+            help='Inactive notifications older than this are reclaimable (default: NOTIFICATION_RETENTION_INACTIVE_DAYS)',
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=20,
+            help='Number of recipients to list (default: 20)',
+        )
+
+    def handle(self, *args, **options):
+        summary = notification_retention_summary(
+            read_days=options['read_days'],
+            inactive_days=options['inactive_days'],
+            limit=options['top'],
+        )
+
+        self.stdout.write(self.style.SUCCESS('Notification table retention report'))
+        self.stdout.write(f"  Total rows:       {summary['total']}")
+        self.stdout.write(f"  Active rows:      {summary['active']}")
+        self.stdout.write(f"  Reclaimable rows: {summary['reclaimable']}")
+        if summary['size_bytes'] is not None:
+            self.stdout.write(f"  Table size:       {summary['size_bytes'] / (1024 * 1024):.1f} MiB")
+
+        if not summary['per_recipient']:
+            self.stdout.write('No reclaimable rows.')
+            return
+
+        self.stdout.write('')
+        self.stdout.write(f"{'Recipient':<40} {'Reclaimable':>12}")
+        for row in summary['per_recipient']:
+            email = row['recipient__email'] or f"(user #{row['recipient_id']})"
+            self.stdout.write(f"{email:<40} {row['reclaimable']:>12}")
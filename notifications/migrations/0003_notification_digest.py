@@ -0,0 +1,34 @@
+# Generated by Django 5.2.8 on 2026-10-18 21:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_ensure_notifications_table'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='digest_count',
+            field=models.PositiveIntegerField(default=1, help_text='Number of events merged into this notification'),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='digest_payload',
+            field=models.JSONField(blank=True, default=list, help_text='Per-event details of the merged notifications'),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='digest_window_start',
+            field=models.DateTimeField(blank=True, help_text='Start of the coalescing window this digest row covers', null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='notification',
+            constraint=models.UniqueConstraint(fields=('recipient', 'notification_type', 'digest_window_start'), name='unique_notification_digest_window'),
+        ),
+    ]
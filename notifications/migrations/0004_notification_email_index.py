@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-18 21:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0003_notification_digest'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['email_sent', 'id'], name='idx_notifications_email'),
+        ),
+    ]
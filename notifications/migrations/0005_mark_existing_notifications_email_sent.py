@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-19 09:12
+
+from django.db import migrations
+
+
+def mark_existing_notifications_sent(apps, schema_editor):
+    """
+    Nothing set email_sent before notification emails were delivered, so
+    every existing row would otherwise be emailed on the first run.
+    """
+    Notification = apps.get_model('notifications', 'Notification')
+    Notification.objects.filter(email_sent=False).update(email_sent=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0004_notification_email_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(mark_existing_notifications_sent, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-19 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0005_mark_existing_notifications_email_sent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='email_attempts',
+            field=models.PositiveSmallIntegerField(default=0, help_text='Email delivery attempts so far'),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='email_claimed_at',
+            field=models.DateTimeField(blank=True, help_text='When a delivery run last claimed this notification for email', null=True),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='email_failed',
+            field=models.BooleanField(default=False, help_text='Whether email delivery was given up'),
+        ),
+    ]
@@ -76,8 +76,31 @@ class Notification(SoftDeleteModel):
     
     # Delivery tracking
     email_sent = models.BooleanField(default=False, help_text="Whether email notification was sent")
+    email_failed = models.BooleanField(default=False, help_text="Whether email delivery was given up")
+    email_attempts = models.PositiveSmallIntegerField(default=0, help_text="Email delivery attempts so far")
+    email_claimed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When a delivery run last claimed this notification for email"
+    )
     push_sent = models.BooleanField(default=False, help_text="Whether push notification was sent")
     
+    # Digest coalescing (high-frequency events merged per recipient/type/window)
+    digest_window_start = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Start of the coalescing window this digest row covers"
+    )
+    digest_count = models.PositiveIntegerField(
+        default=1,
+        help_text="Number of events merged into this notification"
+    )
+    digest_payload = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="Per-event details of the merged notifications"
+    )
+    
     # Legacy scope fields (for backwards compatibility)
     scope_type = models.CharField(
         max_length=20,
@@ -103,6 +126,13 @@ class Notification(SoftDeleteModel):
             models.Index(fields=["recipient", "is_read", "created_at"], name="idx_notifications_recipient"),
             models.Index(fields=["scope_type", "scope_id"], name="idx_notifications_scope"),
             models.Index(fields=["created_at"], name="idx_notifications_created"),
+            models.Index(fields=["email_sent", "id"], name="idx_notifications_email"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["recipient", "notification_type", "digest_window_start"],
+                name="unique_notification_digest_window"
+            ),
         ]
     
     def __str__(self):
@@ -1,4 +1,6 @@
 from .notification_selectors import (
     notification_list,
     notification_get,
+    notification_expired_filter,
+    notification_retention_summary,
 )
@@ -4,7 +4,11 @@ Notification selectors for querying Notification models.
 All database queries are centralized here. Selectors apply filtering
 and use get_object_or_404 for single-object retrieval.
 """
-from django.db.models import QuerySet
+from datetime import timedelta
+from django.conf import settings
+from django.db import connection
+from django.db.models import Count, Q, QuerySet
+from django.utils import timezone
 from django.shortcuts import get_object_or_404
 from django.core.exceptions import PermissionDenied
 
@@ -87,3 +91,75 @@ def notification_unread_count(
         is_read=False,
         is_active=True
     ).count()
+
+
+def notification_expired_filter(
+    *,
+    read_days: int = None,
+    inactive_days: int = None
+) -> Q:
+    """
+    Build the filter matching notifications eligible for purging: read more
+    than `read_days` ago, or dismissed (inactive) more than `inactive_days` ago.
+    Defaults come from NOTIFICATION_RETENTION_* settings.
+    """
+    if read_days is None:
+        read_days = settings.NOTIFICATION_RETENTION_READ_DAYS
+    if inactive_days is None:
+        inactive_days = settings.NOTIFICATION_RETENTION_INACTIVE_DAYS
+
+    now = timezone.now()
+    read_cutoff = now - timedelta(days=read_days)
+    inactive_cutoff = now - timedelta(days=inactive_days)
+
+    expired_read = Q(is_read=True) & (
+        Q(read_at__lt=read_cutoff) | Q(read_at__isnull=True, updated_at__lt=read_cutoff)
+    )
+    expired_inactive = Q(is_active=False, updated_at__lt=inactive_cutoff)
+    return expired_read | expired_inactive
+
+
+def notification_retention_summary(
+    *,
+    read_days: int = None,
+    inactive_days: int = None,
+    limit: int = 20
+) -> dict:
+    """
+    Report the notifications table size and the rows a purge would reclaim.
+    
+    Returns:
+        Dict with total/active/reclaimable row counts, on-disk size in bytes
+        (MySQL only, otherwise None) and the top `limit` recipients by
+        reclaimable rows.
+    """
+    expired = notification_expired_filter(read_days=read_days, inactive_days=inactive_days)
+    rows = Notification.all_objects.aggregate(
+        total=Count('id'),
+        active=Count('id', filter=Q(is_active=True)),
+        reclaimable=Count('id', filter=expired),
+    )
+
+    per_recipient = list(
+        Notification.all_objects.filter(expired)
+        .values('recipient_id', 'recipient__email')
+        .annotate(reclaimable=Count('id'))
+        .order_by('-reclaimable')[:limit]
+    )
+
+    size_bytes = None
+    if connection.vendor == 'mysql':
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT data_length + index_length FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = %s",
+                [Notification._meta.db_table],
+            )
+            row = cursor.fetchone()
+            size_bytes = int(row[0]) if row and row[0] is not None else None
+
+    return {
+        **rows,
+        'size_bytes': size_bytes,
+        'per_recipient': per_recipient,
+    }
@@ -1,4 +1,12 @@
 from .notification_services import (
     notification_mark_read,
     notification_create,
+    notification_coalesce,
+    notification_bulk_create,
+)
+from .notification_email_services import (
+    notification_email_deliver_pending,
+)
+from .notification_retention_services import (
+    notification_purge_expired,
 )
@@ -0,0 +1,197 @@
+"""
+Notification email delivery services.
+
+Pending notifications for users who opted into email are collected in
+batches, rendered with one compiled template per notification type and
+sent over a single reused mail connection. Each batch is claimed with
+SELECT ... FOR UPDATE SKIP LOCKED and the claim is committed before any
+mail is sent, so overlapping runs never pick up the same rows and no row
+stays locked during SMTP round trips.
+
+A message the server refuses (for instance an invalid recipient) only
+affects its own row: a permanent refusal, or too many attempts, marks the
+row failed, and a temporary one leaves it claimed until
+NOTIFICATION_EMAIL_CLAIM_TIMEOUT passes. Only connection-level errors abort
+the run; the rows not yet sent are released for the next one.
+"""
+import logging
+import smtplib
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import F, Q
+from django.template.loader import select_template
+from django.utils import timezone
+from django.utils.html import strip_tags
+
+from notifications.models import Notification
+
+logger = logging.getLogger(__name__)
+
+# SMTP errors that say nothing about the message being sent: the run stops,
+# as it does for socket errors (every other OSError).
+_CONNECTION_ERRORS = (
+    smtplib.SMTPServerDisconnected,
+    smtplib.SMTPConnectError,
+    smtplib.SMTPHeloError,
+    smtplib.SMTPAuthenticationError,
+    smtplib.SMTPSenderRefused,
+    smtplib.SMTPNotSupportedError,
+)
+
+
+def _digest_window_closed(now) -> Q:
+    """Plain notifications, and digests that can no longer absorb events."""
+    closed = Q(digest_window_start__isnull=True) | ~Q(notification_type__in=list(settings.NOTIFICATION_DIGEST_WINDOWS))
+    for notification_type, window in settings.NOTIFICATION_DIGEST_WINDOWS.items():
+        closed |= Q(notification_type=notification_type, digest_window_start__lte=now - timedelta(seconds=window))
+    return closed
+
+
+def _pending_email_notifications(now):
+    """Unsent, unclaimed, active notifications whose recipient accepts email."""
+    claim_expired = now - timedelta(seconds=settings.NOTIFICATION_EMAIL_CLAIM_TIMEOUT)
+    return Notification.objects.filter(
+        Q(email_claimed_at__isnull=True) | Q(email_claimed_at__lt=claim_expired),
+        _digest_window_closed(now),
+        email_sent=False,
+        email_failed=False,
+        recipient__is_active=True,
+        recipient__email_notifications=True,
+    ).select_related('recipient', 'sender').order_by('id')
+
+
+def _claim_batch(batch_size: int) -> list:
+    """Claim up to batch_size pending notifications and commit the claim."""
+    now = timezone.now()
+    with transaction.atomic():
+        batch = list(
+            _pending_email_notifications(now).select_for_update(skip_locked=True, of=('self',))[:batch_size]
+        )
+        Notification.objects.filter(id__in=[notification.id for notification in batch]).update(
+            email_claimed_at=now, email_attempts=F('email_attempts') + 1
+        )
+    return batch
+
+
+def _is_permanent(exc: smtplib.SMTPException) -> bool:
+    """Whether the server refused the message for good (5xx replies)."""
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in exc.recipients.values())
+    return isinstance(exc, smtplib.SMTPResponseException) and exc.smtp_code >= 500
+
+
+def _build_message(*, notification: Notification, template, frontend_url: str) -> EmailMultiAlternatives:
+    recipient = notification.recipient
+    context = {
+        'user_name': recipient.full_name or recipient.email.split('@')[0],
+        'title': notification.title,
+        'message': notification.message,
+        'notification_type': notification.get_notification_type_display(),
+        'sender_name': notification.sender.full_name if notification.sender else '',
+        'digest_count': notification.digest_count,
+        'action_url': f"{frontend_url}{notification.action_url}" if notification.action_url else '',
+        'frontend_url': frontend_url,
+    }
+    html_content = template.render(context)
+
+    email = EmailMultiAlternatives(
+        subject=f"EduTraker: {notification.title}",
+        body=strip_tags(html_content),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[recipient.email],
+    )
+    email.attach_alternative(html_content, "text/html")
+    return email
+
+
+def notification_email_deliver_pending(
+    *,
+    batch_size: int = None,
+    max_batches: int = None
+) -> int:
+    """
+    Send email for pending notifications and mark them as sent.
+
+    Args:
+        batch_size: Notifications per claim/send round
+            (default: settings.NOTIFICATION_EMAIL_BATCH_SIZE)
+        max_batches: Upper bound on rounds per call
+            (default: settings.NOTIFICATION_EMAIL_MAX_BATCHES)
+
+    Returns:
+        Number of notifications delivered
+
+    Raises:
+        SMTPException, OSError: If the connection to the mail server fails;
+            the notifications delivered before the failure stay marked as
+            sent and the rest of the batch is released
+    """
+    batch_size = batch_size or settings.NOTIFICATION_EMAIL_BATCH_SIZE
+    max_batches = max_batches or settings.NOTIFICATION_EMAIL_MAX_BATCHES
+    max_attempts = settings.NOTIFICATION_EMAIL_MAX_ATTEMPTS
+    frontend_url = settings.FRONTEND_URL.rstrip('/')
+
+    templates = {}
+    delivered = 0
+    connection = get_connection(fail_silently=False)
+    connection.open()
+    try:
+        for _ in range(max_batches):
+            batch = _claim_batch(batch_size)
+            if not batch:
+                break
+
+            error = None
+            sent_ids, failed_ids, released_ids = [], [], []
+            for index, notification in enumerate(batch):
+                template = templates.get(notification.notification_type)
+                if template is None:
+                    template = select_template([
+                        f"emails/notifications/{notification.notification_type}.html",
+                        "emails/notifications/default.html",
+                    ])
+                    templates[notification.notification_type] = template
+                message = _build_message(
+                    notification=notification,
+                    template=template,
+                    frontend_url=frontend_url,
+                )
+                # The claim counted this attempt in the database only.
+                out_of_attempts = notification.email_attempts + 1 >= max_attempts
+                try:
+                    sent = connection.send_messages([message])
+                except (smtplib.SMTPException, OSError) as exc:
+                    # SMTPException is an OSError too.
+                    if isinstance(exc, _CONNECTION_ERRORS) or not isinstance(exc, smtplib.SMTPException):
+                        error = exc
+                        (failed_ids if out_of_attempts else released_ids).append(notification.id)
+                        released_ids.extend(pending.id for pending in batch[index + 1:])
+                        break
+                    logger.warning(f"Notification {notification.id} email refused: {exc}")
+                    sent = 0
+                    if _is_permanent(exc):
+                        out_of_attempts = True
+                if sent:
+                    sent_ids.append(notification.id)
+                elif out_of_attempts:
+                    failed_ids.append(notification.id)
+                # Otherwise the row stays claimed and is retried once the claim expires.
+
+            Notification.objects.filter(id__in=sent_ids).update(email_sent=True, email_claimed_at=None)
+            Notification.objects.filter(id__in=failed_ids).update(email_failed=True, email_claimed_at=None)
+            Notification.objects.filter(id__in=released_ids).update(email_claimed_at=None)
+            delivered += len(sent_ids)
+
+            if error is not None:
+                logger.info(f"Delivered {delivered} notification emails before the mail server failed")
+                raise error
+            if len(batch) < batch_size:
+                break
+    finally:
+        connection.close()
+
+    logger.info(f"Delivered {delivered} notification emails")
+    return delivered
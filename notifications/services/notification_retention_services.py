@@ -0,0 +1,62 @@
+"""
+Notification retention services.
+
+Read and dismissed notifications are never needed again once they age
+out, so they are hard-deleted in bounded batches. Each batch runs in its
+own short transaction to avoid holding long locks on the table.
+"""
+import logging
+
+from django.conf import settings
+from django.db import transaction
+
+from notifications.models import Notification
+from notifications.selectors.notification_selectors import notification_expired_filter
+
+logger = logging.getLogger(__name__)
+
+
+def notification_purge_expired(
+    *,
+    read_days: int = None,
+    inactive_days: int = None,
+    batch_size: int = None,
+    max_batches: int = None
+) -> int:
+    """
+    Hard-delete expired notifications in bounded batches.
+    
+    Args:
+        read_days: Purge read notifications read more than this many days ago
+        inactive_days: Purge inactive notifications older than this many days
+        batch_size: Rows deleted per transaction
+            (default: settings.NOTIFICATION_RETENTION_BATCH_SIZE)
+        max_batches: Upper bound on batches per call
+            (default: settings.NOTIFICATION_RETENTION_MAX_BATCHES)
+    
+    Returns:
+        Number of notifications deleted
+    """
+    batch_size = batch_size or settings.NOTIFICATION_RETENTION_BATCH_SIZE
+    max_batches = max_batches or settings.NOTIFICATION_RETENTION_MAX_BATCHES
+    expired = notification_expired_filter(read_days=read_days, inactive_days=inactive_days)
+
+    deleted = 0
+    for _ in range(max_batches):
+        ids = list(
+            Notification.all_objects.filter(expired)
+            .order_by('id')
+            .values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+
+        with transaction.atomic():
+            Notification.all_objects.filter(id__in=ids).delete()
+        deleted += len(ids)
+
+        if len(ids) < batch_size:
+            break
+
+    logger.info(f"Purged {deleted} expired notifications")
+    return deleted
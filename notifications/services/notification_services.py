@@ -4,9 +4,11 @@ Notification services for creating and mutating Notification models.
 All business logic, permission checks, and workflows are centralized here.
 Services use @transaction.atomic for data-modifying operations.
 """
-from django.db import transaction
+from datetime import datetime, timezone as dt_timezone
+from django.conf import settings
+from django.db import IntegrityError, transaction
 from django.utils import timezone
-from typing import Optional
+from typing import Callable, Iterable, Optional, Union
 
 from accounts.models import CustomUser
 from notifications.models import Notification
@@ -87,6 +89,156 @@ def notification_create(
     
     return notification
 
+@transaction.atomic
+def notification_bulk_create(
+    *,
+    recipients: Iterable[CustomUser],
+    title: str,
+    message: str,
+    notification_type: str = "system",
+    sender: Optional[CustomUser] = None,
+    action_url: Union[str, Callable[[CustomUser], str]] = "",
+    related_object_type: str = "",
+    related_object_id: Optional[int] = None,
+    batch_size: Optional[int] = None
+) -> int:
+    """
+    Create the same notification for many recipients with chunked bulk inserts.
+    
+    Unlike notification_create this skips per-row full_clean(); callers pass
+    values that are already validated.
+    
+    Args:
+        recipients: Users receiving the notification
+        action_url: A URL, or a callable returning the URL for a recipient
+        batch_size: Rows per INSERT (default: settings.NOTIFICATION_BULK_BATCH_SIZE)
+    
+    Returns:
+        Number of notifications created
+    """
+    batch_size = batch_size or settings.NOTIFICATION_BULK_BATCH_SIZE
+    notifications = [
+        Notification(
+            recipient=recipient,
+            sender=sender,
+            title=title,
+            message=message,
+            notification_type=notification_type,
+            action_url=action_url(recipient) if callable(action_url) else action_url,
+            related_object_type=related_object_type,
+            related_object_id=related_object_id,
+        )
+        for recipient in recipients
+    ]
+    Notification.objects.bulk_create(notifications, batch_size=batch_size)
+    return len(notifications)
+
+
+def _digest_window_start(notification_type: str, now: datetime) -> Optional[datetime]:
+    """
+    Return the start of the coalescing window containing `now` for the given
+    notification type, or None if the type is not configured for digesting.
+    Windows are aligned to the Unix epoch so every process agrees on them.
+    """
+    window = settings.NOTIFICATION_DIGEST_WINDOWS.get(notification_type)
+    if not window:
+        return None
+
+    epoch = int(now.timestamp())
+    return datetime.fromtimestamp(epoch - epoch % window, tz=dt_timezone.utc)
+
+
+@transaction.atomic
+def notification_coalesce(
+    *,
+    recipient: CustomUser,
+    title: str,
+    message: str,
+    notification_type: str,
+    sender: Optional[CustomUser] = None,
+    action_url: str = "",
+    related_object_type: str = "",
+    related_object_id: Optional[int] = None
+) -> Notification:
+    """
+    Create a notification, merging it into the recipient's digest row when
+    the type is listed in settings.NOTIFICATION_DIGEST_WINDOWS.
+    
+    The digest row is keyed by (recipient, notification_type, window start)
+    and carries a counter plus a bounded list of the merged events. A digest
+    that was already read or dismissed is reopened by the new event.
+    
+    Returns:
+        The created or updated Notification object
+    """
+    now = timezone.now()
+    window_start = _digest_window_start(notification_type, now)
+    if window_start is None:
+        return notification_create(
+            recipient=recipient,
+            sender=sender,
+            title=title,
+            message=message,
+            notification_type=notification_type,
+            action_url=action_url,
+            related_object_type=related_object_type,
+            related_object_id=related_object_id,
+        )
+    
+    item = {
+        "title": title,
+        "message": message,
+        "action_url": action_url,
+        "related_object_type": related_object_type,
+        "related_object_id": related_object_id,
+        "sender_id": sender.id if sender else None,
+        "created_at": now.isoformat(),
+    }
+    digest_lookup = Notification.all_objects.select_for_update().filter(
+        recipient=recipient,
+        notification_type=notification_type,
+        digest_window_start=window_start,
+    )
+    
+    digest = digest_lookup.first()
+    if digest is None:
+        try:
+            with transaction.atomic():
+                return Notification.objects.create(
+                    recipient=recipient,
+                    sender=sender,
+                    title=title,
+                    message=message,
+                    notification_type=notification_type,
+                    action_url=action_url,
+                    related_object_type=related_object_type,
+                    related_object_id=related_object_id,
+                    digest_window_start=window_start,
+                    digest_payload=[item],
+                )
+        except IntegrityError:
+            # Another request opened the digest for this window first.
+            digest = digest_lookup.get()
+    
+    max_items = settings.NOTIFICATION_DIGEST_MAX_ITEMS
+    digest.digest_count += 1
+    digest.digest_payload = (list(digest.digest_payload) + [item])[-max_items:]
+    digest.title = title
+    digest.message = f"{digest.digest_count} updates. Latest: {message}"
+    digest.sender = sender
+    digest.action_url = action_url
+    digest.related_object_type = related_object_type
+    digest.related_object_id = related_object_id
+    digest.is_read = False
+    digest.read_at = None
+    digest.is_active = True
+    digest.deactivated_at = None
+    digest.deactivated_by = None
+    digest.save()
+    
+    return digest
+
+
 @transaction.atomic
 def notification_mark_all_read(
     *,
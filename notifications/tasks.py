@@ -0,0 +1,38 @@
+from celery import shared_task
+import logging
+
+from notifications.services.notification_email_services import notification_email_deliver_pending
+from notifications.services.notification_retention_services import notification_purge_expired
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def deliver_notification_emails(self, batch_size=None):
+    """
+    Periodically send email for unsent notifications of opted-in users.
+
+    Args:
+        batch_size: Optional override for notifications per SMTP batch
+    """
+    try:
+        return notification_email_deliver_pending(batch_size=batch_size)
+    except Exception as e:
+        logger.error(f"Error delivering notification emails: {str(e)}")
+        raise self.retry(exc=e)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def purge_expired_notifications(self, read_days=None, inactive_days=None):
+    """
+    Periodically hard-delete read and dismissed notifications past retention.
+
+    Args:
+        read_days: Optional override for NOTIFICATION_RETENTION_READ_DAYS
+        inactive_days: Optional override for NOTIFICATION_RETENTION_INACTIVE_DAYS
+    """
+    try:
+        return notification_purge_expired(read_days=read_days, inactive_days=inactive_days)
+    except Exception as e:
+        logger.error(f"Error purging expired notifications: {str(e)}")
+        raise self.retry(exc=e)
@@ -0,0 +1,75 @@
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from notifications.models import Notification
+from notifications.services.notification_services import notification_coalesce
+
+User = get_user_model()
+
+
+@override_settings(
+    NOTIFICATION_DIGEST_WINDOWS={'attendance_marked': 24 * 60 * 60},
+    NOTIFICATION_DIGEST_MAX_ITEMS=3,
+)
+class NotificationDigestTests(APITestCase):
+    """
+    Tests for coalescing high-frequency notifications into digest rows.
+    """
+    def setUp(self):
+        self.student = User.objects.create_user(
+            email='student@example.com',
+            password='password123',
+            full_name='Student One',
+            role='student'
+        )
+
+    def _attendance(self, related_object_id):
+        return notification_coalesce(
+            recipient=self.student,
+            title="Attendance Marked",
+            message=f"Period {related_object_id} marked present.",
+            notification_type="attendance_marked",
+            related_object_type="Attendance",
+            related_object_id=related_object_id,
+        )
+
+    def test_same_window_events_share_one_row(self):
+        """Test repeated events in one window update a single digest row."""
+        for period in range(1, 8):
+            self._attendance(period)
+
+        self.assertEqual(Notification.objects.filter(recipient=self.student).count(), 1)
+        digest = Notification.objects.get(recipient=self.student)
+        self.assertEqual(digest.digest_count, 7)
+        self.assertEqual(digest.related_object_id, 7)
+        self.assertIn("7 updates", digest.message)
+        # Payload is bounded by NOTIFICATION_DIGEST_MAX_ITEMS, newest kept.
+        self.assertEqual([item['related_object_id'] for item in digest.digest_payload], [5, 6, 7])
+
+    def test_read_digest_is_reopened(self):
+        """Test a new event marks a read digest as unread again."""
+        digest = self._attendance(1)
+        digest.is_read = True
+        digest.save()
+
+        self._attendance(2)
+
+        digest.refresh_from_db()
+        self.assertFalse(digest.is_read)
+        self.assertIsNone(digest.read_at)
+        self.assertEqual(digest.digest_count, 2)
+
+    def test_unconfigured_type_is_not_merged(self):
+        """Test types without a digest window still create one row per event."""
+        for i in range(2):
+            notification_coalesce(
+                recipient=self.student,
+                title="Grade Posted",
+                message=f"Grade {i}",
+                notification_type="grade_posted",
+            )
+
+        rows = Notification.objects.filter(recipient=self.student, notification_type="grade_posted")
+        self.assertEqual(rows.count(), 2)
+        self.assertTrue(all(row.digest_window_start is None for row in rows))
@@ -0,0 +1,166 @@
+import smtplib
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from notifications.models import Notification
+from notifications.services.notification_email_services import notification_email_deliver_pending
+from notifications.services.notification_services import notification_coalesce
+
+User = get_user_model()
+
+
+class CountingEmailBackend(EmailBackend):
+    """Local SMTP stand-in that records how often a connection is opened."""
+    opened = 0
+    send_calls = 0
+    fail_on_call = None
+    failure = smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+
+    def open(self):
+        CountingEmailBackend.opened += 1
+        return super().open()
+
+    def send_messages(self, messages):
+        CountingEmailBackend.send_calls += 1
+        if CountingEmailBackend.send_calls == CountingEmailBackend.fail_on_call:
+            raise CountingEmailBackend.failure
+        return super().send_messages(messages)
+
+
+@override_settings(
+    EMAIL_BACKEND='notifications.tests.test_email_delivery.CountingEmailBackend',
+    NOTIFICATION_EMAIL_BATCH_SIZE=2,
+)
+class NotificationEmailDeliveryTests(APITestCase):
+    """
+    Tests for batched notification email delivery.
+    """
+    def setUp(self):
+        CountingEmailBackend.opened = 0
+        CountingEmailBackend.send_calls = 0
+        CountingEmailBackend.fail_on_call = None
+        CountingEmailBackend.failure = smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        self.opted_in = User.objects.create_user(
+            email='student@example.com',
+            password='password123',
+            full_name='Student One',
+            role='student'
+        )
+        self.opted_out = User.objects.create_user(
+            email='quiet@example.com',
+            password='password123',
+            full_name='Quiet User',
+            role='student',
+            email_notifications=False
+        )
+        for i in range(5):
+            Notification.objects.create(
+                recipient=self.opted_in,
+                title=f"Grade {i}",
+                message="A new grade has been posted.",
+                notification_type="grade_posted",
+                action_url="/student/results"
+            )
+        self.quiet_notification = Notification.objects.create(
+            recipient=self.opted_out,
+            title="Announcement",
+            message="School closed tomorrow.",
+            notification_type="announcement"
+        )
+
+    def test_delivers_in_batches_over_one_connection(self):
+        """Test pending notifications go out in batches, one message at a time, on a single connection."""
+        delivered = notification_email_deliver_pending()
+
+        self.assertEqual(delivered, 5)
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertEqual(CountingEmailBackend.opened, 1)
+        self.assertEqual(CountingEmailBackend.send_calls, 5)
+        self.assertEqual(mail.outbox[0].to, ['student@example.com'])
+        self.assertIn('/student/results', mail.outbox[0].alternatives[0][0])
+        self.assertFalse(
+            Notification.objects.filter(recipient=self.opted_in, email_sent=False).exists()
+        )
+
+    def test_skips_opted_out_and_already_sent(self):
+        """Test opted-out users are skipped and sent rows are not re-sent."""
+        notification_email_deliver_pending()
+        mail.outbox = []
+
+        delivered = notification_email_deliver_pending()
+
+        self.assertEqual(delivered, 0)
+        self.assertEqual(len(mail.outbox), 0)
+        self.quiet_notification.refresh_from_db()
+        self.assertFalse(self.quiet_notification.email_sent)
+
+    def test_failure_part_way_keeps_delivered_rows_sent(self):
+        """Test messages accepted before an SMTP failure are marked sent and not resent."""
+        CountingEmailBackend.fail_on_call = 4
+
+        with self.assertRaises(smtplib.SMTPServerDisconnected):
+            notification_email_deliver_pending()
+
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(Notification.objects.filter(recipient=self.opted_in, email_sent=True).count(), 3)
+
+        mail.outbox = []
+        delivered = notification_email_deliver_pending()
+
+        self.assertEqual(delivered, 2)
+        self.assertEqual(len(mail.outbox), 2)
+
+    def test_refused_recipient_fails_its_row_only(self):
+        """Test a permanently refused message is marked failed and the run goes on."""
+        CountingEmailBackend.fail_on_call = 2
+        CountingEmailBackend.failure = smtplib.SMTPRecipientsRefused({'student@example.com': (550, b'No such user')})
+
+        delivered = notification_email_deliver_pending()
+
+        self.assertEqual(delivered, 4)
+        failed = Notification.objects.get(recipient=self.opted_in, email_failed=True)
+        self.assertEqual((failed.title, failed.email_sent, failed.email_attempts), ("Grade 1", False, 1))
+
+        mail.outbox = []
+        self.assertEqual(notification_email_deliver_pending(), 0)
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_temporary_refusal_is_retried_after_the_claim_expires(self):
+        """Test a temporarily refused message waits out its claim, then is resent."""
+        CountingEmailBackend.fail_on_call = 1
+        CountingEmailBackend.failure = smtplib.SMTPDataError(451, b'Try again later')
+
+        self.assertEqual(notification_email_deliver_pending(), 4)
+        self.assertEqual(notification_email_deliver_pending(), 0)
+
+        Notification.objects.filter(email_sent=False, email_claimed_at__isnull=False).update(
+            email_claimed_at=timezone.now() - timedelta(hours=1)
+        )
+        self.assertEqual(notification_email_deliver_pending(), 1)
+        self.assertEqual(Notification.objects.get(title="Grade 0").email_attempts, 2)
+
+    @override_settings(NOTIFICATION_DIGEST_WINDOWS={'attendance_marked': 3600})
+    def test_digest_is_emailed_once_its_window_closes(self):
+        """Test a digest is not emailed while it can absorb events, then goes out with all of them."""
+        Notification.objects.update(email_sent=True)
+        for status_text in ("absent", "late"):
+            digest = notification_coalesce(
+                recipient=self.opted_in,
+                title="Attendance marked",
+                message=f"Marked {status_text}.",
+                notification_type="attendance_marked",
+            )
+
+        self.assertEqual(notification_email_deliver_pending(), 0)
+
+        Notification.objects.filter(id=digest.id).update(
+            digest_window_start=digest.digest_window_start - timedelta(hours=1)
+        )
+        self.assertEqual(notification_email_deliver_pending(), 1)
+        self.assertIn("2 updates. Latest: Marked late.", mail.outbox[0].body)
@@ -0,0 +1,64 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from notifications.models import Notification
+from notifications.services.notification_retention_services import notification_purge_expired
+
+User = get_user_model()
+
+
+class NotificationRetentionTests(APITestCase):
+    """
+    Tests for notification retention purging and reporting.
+    """
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='student@example.com',
+            password='password123',
+            full_name='Student One',
+            role='student'
+        )
+        old = timezone.now() - timedelta(days=200)
+
+        self.old_read = self._notification("Old read")
+        Notification.objects.filter(pk=self.old_read.pk).update(is_read=True, read_at=old, updated_at=old)
+
+        self.old_unread = self._notification("Old unread")
+        Notification.objects.filter(pk=self.old_unread.pk).update(updated_at=old)
+
+        self.old_inactive = self._notification("Old dismissed")
+        Notification.objects.filter(pk=self.old_inactive.pk).update(is_active=False, updated_at=old)
+
+        self.recent_read = self._notification("Recent read")
+        Notification.objects.filter(pk=self.recent_read.pk).update(is_read=True, read_at=timezone.now())
+
+    def _notification(self, title):
+        return Notification.objects.create(
+            recipient=self.user,
+            title=title,
+            message="Message",
+            notification_type="system"
+        )
+
+    def test_purge_removes_only_expired_rows(self):
+        """Test old read and old inactive rows are deleted in batches."""
+        deleted = notification_purge_expired(read_days=90, inactive_days=30, batch_size=1)
+
+        self.assertEqual(deleted, 2)
+        remaining = set(Notification.all_objects.values_list('pk', flat=True))
+        self.assertEqual(remaining, {self.old_unread.pk, self.recent_read.pk})
+
+    def test_report_command_lists_reclaimable_rows(self):
+        """Test the report command prints totals and per-recipient counts."""
+        out = StringIO()
+        call_command('notification_retention_report', '--read-days', '90', '--inactive-days', '30', stdout=out)
+
+        output = out.getvalue()
+        self.assertIn('Total rows:       4', output)
+        self.assertIn('Reclaimable rows: 2', output)
+        self.assertIn('student@example.com', output)
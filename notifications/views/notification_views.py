@@ -23,7 +23,7 @@ from notifications.services.notification_services import (
 # Notification Serializers
 # =============================================================================
 
-from accounts.pagination import PaginatedAPIMixin
+from accounts.pagination import PaginatedAPIMixin, SPARSE_FIELDSET_PARAMETERS
 
 class NotificationOutputSerializer(serializers.ModelSerializer):
     """Output serializer for notifications."""
@@ -37,6 +37,7 @@ class NotificationOutputSerializer(serializers.ModelSerializer):
             'recipient', 'recipient_email', 'sender', 'sender_name',
             'action_url', 'related_object_type', 'related_object_id',
             'is_read', 'read_at', 'email_sent', 'push_sent',
+            'digest_count', 'digest_payload',
             'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
@@ -66,6 +67,7 @@ class NotificationListApi(PaginatedAPIMixin, APIView):
             OpenApiParameter(name='is_read', type=bool),
             OpenApiParameter(name='notification_type', type=str),
             OpenApiParameter(name='page', type=int, description='Page number'),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={200: NotificationOutputSerializer(many=True)}
     )
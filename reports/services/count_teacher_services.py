@@ -1,8 +1,8 @@
-from django.db.models import Count, Q, Avg, Sum
+from django.db.models import Count, Q, Avg, Max, Min
 from django.core.exceptions import PermissionDenied
 from accounts.models import CustomUser, Role
 from school.models import School, ClassRoom, Course
-from teacher.models import Teacher, CourseAllocation, Assignment, Attendance, Mark
+from teacher.models import Teacher, CourseAllocation, Assignment, Attendance
 from student.models import Student, StudentEnrollment
 from typing import Dict
 
@@ -364,55 +364,30 @@ def get_attendance_summary(*, teacher_id: int, actor: CustomUser) -> Dict:
     
     _check_teacher_permission(actor, teacher_id)
     
-    # Get all courses taught by this teacher
-    allocations = CourseAllocation.objects.filter(
-        teacher=teacher
-    ).select_related('course', 'class_room')
-    
-    course_classroom_pairs = [
-        (alloc.course_id, alloc.class_room_id)
-        for alloc in allocations
-    ]
-    
-    # Build Q filter for attendance records
-    attendance_filter = Q()
-    for course_id, classroom_id in course_classroom_pairs:
-        attendance_filter |= Q(course_id=course_id, class_room_id=classroom_id)
-    
-    if not attendance_filter:
-        return {
-            'teacher_id': teacher_id,
-            'teacher_name': teacher.user.full_name,
-            'total_records': 0,
-            'by_status': {},
-            'by_course': []
-        }
-    
+    # Attendance is recorded per course allocation
+    attendance = Attendance.objects.filter(course_allocation__teacher=teacher)
+
     # Get attendance summary by status
-    status_summary = Attendance.objects.filter(
-        attendance_filter
-    ).values('status').annotate(count=Count('id'))
-    
+    status_summary = attendance.values('status').annotate(count=Count('id'))
+
     by_status = {item['status']: item['count'] for item in status_summary}
     total_records = sum(by_status.values())
-    
+
     # Get attendance by course
-    course_summary = Attendance.objects.filter(
-        attendance_filter
-    ).values(
-        'course__id', 'course__name'
+    course_summary = attendance.values(
+        'course_allocation__course__id', 'course_allocation__course__name'
     ).annotate(
         total_records=Count('id'),
         present_count=Count('id', filter=Q(status='present')),
         absent_count=Count('id', filter=Q(status='absent')),
         late_count=Count('id', filter=Q(status='late')),
         excused_count=Count('id', filter=Q(status='excused'))
-    )
-    
+    ).order_by('course_allocation__course__id')
+
     by_course = [
         {
-            'course_id': item['course__id'],
-            'course_name': item['course__name'],
+            'course_id': item['course_allocation__course__id'],
+            'course_name': item['course_allocation__course__name'],
             'total_records': item['total_records'],
             'present_count': item['present_count'],
             'absent_count': item['absent_count'],
@@ -467,56 +442,40 @@ def get_assignment_stats(*, teacher_id: int, actor: CustomUser) -> Dict:
     
     _check_teacher_permission(actor, teacher_id)
     
-    # Get all assignments created by this teacher
+    # Get all assignments created by this teacher, with their mark statistics
+    active_marks = Q(marks__is_active=True)
     assignments = Assignment.objects.filter(
         created_by=teacher
     ).annotate(
-        graded_count=Count('marks'),
-        average_score=Avg('marks__score'),
-        highest_score=Sum('marks__score') / Count('marks__score') if Count('marks__score') > 0 else None
+        graded_count=Count('marks', filter=active_marks),
+        average_score=Avg('marks__score', filter=active_marks),
+        highest_score=Max('marks__score', filter=active_marks),
+        lowest_score=Min('marks__score', filter=active_marks)
     ).order_by('-due_date')
-    
+
     # Count by type
     type_counts = Assignment.objects.filter(
         created_by=teacher
     ).values('exam_type').annotate(count=Count('id'))
-    
+
     by_type = {item['exam_type']: item['count'] for item in type_counts}
-    
-    # Build assignments list with stats
-    assignments_data = []
-    for assignment in assignments:
-        # Get score stats
-        marks = Mark.objects.filter(assignment=assignment)
-        mark_stats = marks.aggregate(
-            avg=Avg('score'),
-            highest=Sum('score'),  # Will calculate properly below
-            lowest=Sum('score')
-        )
-        
-        if marks.exists():
-            scores = list(marks.values_list('score', flat=True))
-            avg_score = sum(scores) / len(scores)
-            highest = max(scores)
-            lowest = min(scores)
-        else:
-            avg_score = None
-            highest = None
-            lowest = None
-        
-        assignments_data.append({
+
+    assignments_data = [
+        {
             'assignment_id': assignment.id,
             'assignment_code': assignment.assignment_code,
             'title': assignment.title,
             'exam_type': assignment.exam_type,
             'full_mark': float(assignment.full_mark),
             'due_date': str(assignment.due_date) if assignment.due_date else None,
-            'graded_count': marks.count(),
-            'average_score': round(float(avg_score), 2) if avg_score else None,
-            'highest_score': float(highest) if highest else None,
-            'lowest_score': float(lowest) if lowest else None
-        })
-    
+            'graded_count': assignment.graded_count,
+            'average_score': round(float(assignment.average_score), 2) if assignment.average_score else None,
+            'highest_score': float(assignment.highest_score) if assignment.highest_score else None,
+            'lowest_score': float(assignment.lowest_score) if assignment.lowest_score else None
+        }
+        for assignment in assignments
+    ]
+
     return {
         'teacher_id': teacher_id,
         'teacher_name': teacher.user.full_name,
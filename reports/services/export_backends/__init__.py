@@ -0,0 +1,6 @@
+"""
+Report export backends, one module per format. Each module exposes a
+function (data, headers, filename=..., user_name=..., workstream_name=...,
+school_name=...) -> HttpResponse and is imported by
+reports.services.export_service on its first export.
+"""
@@ -0,0 +1,52 @@
+"""CSV export backend."""
+import csv
+from datetime import datetime
+
+from django.http import HttpResponse
+
+
+def export_csv(data, headers, filename="report", user_name=None, workstream_name=None, school_name=None):
+    """
+    Generates a CSV file with UTF-8 BOM for Excel compatibility.
+    Includes user, workstream, and school information in the header.
+    """
+    response = HttpResponse(content_type='text/csv; charset=utf-8-sig')
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    response['Content-Disposition'] = f'attachment; filename="{filename}_{timestamp}.csv"'
+
+    # Add UTF-8 BOM for proper Excel opening
+    response.write('\ufeff')
+
+    writer = csv.writer(response)
+
+    # Add report title
+    report_title = filename.replace('_', ' ').title() + " Report"
+    writer.writerow([report_title])
+    writer.writerow([])  # Empty row for spacing
+
+    # Add organization info
+    if workstream_name:
+        writer.writerow([f"Workstream: {workstream_name}"])
+    if school_name:
+        writer.writerow([f"School: {school_name}"])
+    if user_name:
+        writer.writerow([f"Exported by: {user_name}"])
+    writer.writerow([f"Generated on: {datetime.now().strftime('%B %d, %Y at %H:%M')}"])
+    writer.writerow([])  # Empty row for spacing
+
+    # Write header with nice formatting
+    header_row = [h.replace('_', ' ').title() for h in headers]
+    writer.writerow(header_row)
+
+    for row in data:
+        row_data = []
+        for header in headers:
+            val = row.get(header, "")
+            if isinstance(val, (list, dict)):
+                val = str(val)
+            elif isinstance(val, datetime):
+                val = val.strftime("%Y-%m-%d %H:%M")
+            row_data.append(val)
+        writer.writerow(row_data)
+
+    return response
@@ -0,0 +1,117 @@
+"""Excel (.xlsx) export backend; imports openpyxl, so it is loaded on first use."""
+from datetime import datetime
+
+import openpyxl
+from django.http import HttpResponse
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+
+
+def export_excel(data, headers, filename="report", user_name=None, workstream_name=None, school_name=None):
+    """
+    Generates a professional Excel file with styling.
+    Includes user, workstream, and school information in the header.
+    """
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Report"
+
+    # Define styles
+    header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+    header_font = Font(bold=True, color="FFFFFF", size=12)
+    header_alignment = Alignment(horizontal="center", vertical="center")
+
+    cell_alignment = Alignment(horizontal="left", vertical="center", wrap_text=True)
+    border = Border(
+        left=Side(style='thin', color='D3D3D3'),
+        right=Side(style='thin', color='D3D3D3'),
+        top=Side(style='thin', color='D3D3D3'),
+        bottom=Side(style='thin', color='D3D3D3')
+    )
+
+    # Add report info at the top
+    info_font = Font(size=10, italic=True, color="666666")
+    title_font = Font(size=14, bold=True, color="4472C4")
+    current_row = 1
+
+    # Add report title
+    report_title = filename.replace('_', ' ').title() + " Report"
+    ws.cell(row=current_row, column=1, value=report_title)
+    ws.cell(row=current_row, column=1).font = title_font
+    current_row += 1
+
+    # Add organization info
+    if workstream_name:
+        ws.cell(row=current_row, column=1, value=f"Workstream: {workstream_name}")
+        ws.cell(row=current_row, column=1).font = info_font
+        current_row += 1
+
+    if school_name:
+        ws.cell(row=current_row, column=1, value=f"School: {school_name}")
+        ws.cell(row=current_row, column=1).font = info_font
+        current_row += 1
+
+    if user_name:
+        ws.cell(row=current_row, column=1, value=f"Exported by: {user_name}")
+        ws.cell(row=current_row, column=1).font = info_font
+        current_row += 1
+
+    ws.cell(row=current_row, column=1, value=f"Generated on: {datetime.now().strftime('%B %d, %Y at %H:%M')}")
+    ws.cell(row=current_row, column=1).font = info_font
+    current_row += 2  # Add space before table
+
+    # Write and style header
+    for col_num, header in enumerate(headers, 1):
+        cell = ws.cell(row=current_row, column=col_num, value=header.replace('_', ' ').title())
+        cell.fill = header_fill
+        cell.font = header_font
+        cell.alignment = header_alignment
+        cell.border = border
+
+    # Alternate row colors for better readability
+    light_fill = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
+
+    # Write data with styling
+    start_data_row = current_row + 1
+    for row_num, row_data in enumerate(data, start_data_row):
+        for col_num, header in enumerate(headers, 1):
+            value = row_data.get(header, "")
+
+            # Convert complex types to readable strings
+            if isinstance(value, (list, dict)):
+                value = str(value)
+            elif isinstance(value, datetime):
+                value = value.strftime("%Y-%m-%d %H:%M")
+
+            cell = ws.cell(row=row_num, column=col_num, value=value)
+            cell.alignment = cell_alignment
+            cell.border = border
+
+            # Alternate row colors
+            if row_num % 2 == 0:
+                cell.fill = light_fill
+
+    # Auto-adjust column widths
+    for col in ws.columns:
+        max_length = 0
+        column = col[0].column_letter
+        for cell in col:
+            try:
+                if len(str(cell.value)) > max_length:
+                    max_length = len(str(cell.value))
+            except:
+                pass
+        adjusted_width = min(max_length + 2, 50)  # Max width 50
+        ws.column_dimensions[column].width = adjusted_width
+
+    # Freeze the header row
+    ws.freeze_panes = f"A{current_row + 1}"
+
+    # Prepare response
+    response = HttpResponse(
+        content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    )
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    response["Content-Disposition"] = f'attachment; filename="{filename}_{timestamp}.xlsx"'
+
+    wb.save(response)
+    return response
@@ -0,0 +1,153 @@
+"""PDF export backend; imports reportlab, so it is loaded on first use."""
+from datetime import datetime
+
+from django.http import HttpResponse
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+
+
+def export_pdf(data, headers, filename="report", title=None, user_name=None, workstream_name=None, school_name=None):
+    """
+    Generates a professional PDF report with table styling.
+    Includes user, workstream, and school information in the header and footer.
+    """
+    response = HttpResponse(content_type='application/pdf')
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    response['Content-Disposition'] = f'attachment; filename="{filename}_{timestamp}.pdf"'
+
+    # Create the PDF document
+    doc = SimpleDocTemplate(response, pagesize=A4,
+                           rightMargin=30, leftMargin=30,
+                           topMargin=30, bottomMargin=30)
+
+    elements = []
+    styles = getSampleStyleSheet()
+
+    # Add custom title style
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#4472C4'),
+        spaceAfter=10,
+        alignment=1  # Center
+    )
+
+    # Add organization info style
+    org_style = ParagraphStyle(
+        'OrgStyle',
+        parent=styles['Normal'],
+        fontSize=12,
+        textColor=colors.HexColor('#333333'),
+        alignment=1,
+        spaceAfter=3
+    )
+
+    # Add title
+    report_title = title or filename.replace('_', ' ').title()
+    elements.append(Paragraph(report_title, title_style))
+
+    # Add organization info (workstream and school)
+    if workstream_name:
+        elements.append(Paragraph(f"<b>Workstream:</b> {workstream_name}", org_style))
+
+    if school_name:
+        elements.append(Paragraph(f"<b>School:</b> {school_name}", org_style))
+
+    elements.append(Spacer(1, 10))
+
+    # Add user and timestamp info
+    info_style = ParagraphStyle(
+        'InfoStyle',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=colors.grey,
+        alignment=1,
+        spaceAfter=5
+    )
+
+    if user_name:
+        elements.append(Paragraph(f"Exported by: {user_name}", info_style))
+
+    elements.append(Paragraph(f"Generated on: {datetime.now().strftime('%B %d, %Y at %H:%M')}", info_style))
+    elements.append(Spacer(1, 20))
+
+    # Prepare table data
+    table_data = []
+
+    # Add headers
+    header_row = [h.replace('_', ' ').title() for h in headers]
+    table_data.append(header_row)
+
+    # Add data rows
+    for row in data:
+        row_data = []
+        for header in headers:
+            value = row.get(header, "")
+            if isinstance(value, (list, dict)):
+                value = str(value)
+            elif isinstance(value, datetime):
+                value = value.strftime("%Y-%m-%d %H:%M")
+            row_data.append(str(value))
+        table_data.append(row_data)
+
+    # Create table
+    table = Table(table_data)
+
+    # Style the table
+    table_style = TableStyle([
+        # Header styling
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4472C4')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+
+        # Data rows styling
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+        ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 10),
+        ('TOPPADDING', (0, 1), (-1, -1), 6),
+        ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+
+        # Grid
+        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+
+        # Alternate row colors
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F2F2F2')]),
+    ])
+
+    table.setStyle(table_style)
+    elements.append(table)
+
+    # Add footer
+    elements.append(Spacer(1, 30))
+    footer_style = ParagraphStyle(
+        'Footer',
+        parent=styles['Normal'],
+        fontSize=8,
+        textColor=colors.grey,
+        alignment=1
+    )
+    elements.append(Paragraph(f"Total Records: {len(data)}", footer_style))
+
+    # Add organization footer
+    footer_parts = []
+    if workstream_name:
+        footer_parts.append(workstream_name)
+    if school_name:
+        footer_parts.append(school_name)
+    if footer_parts:
+        org_footer = " | ".join(footer_parts)
+        elements.append(Paragraph(org_footer, footer_style))
+
+    elements.append(Paragraph("EduTracker - Education Management System", footer_style))
+
+    # Build PDF
+    doc.build(elements)
+    return response
@@ -1,125 +1,86 @@
-import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from django.http import HttpResponse
-from datetime import datetime
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib import colors
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
+"""
+Report exports.
 
-class ExportService:
-    @staticmethod
-    def export_to_excel(data, headers, filename="report", user_name=None, workstream_name=None, school_name=None):
-        """
-        Generates a professional Excel file with styling.
-        Includes user, workstream, and school information in the header.
-        """
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Report"
+Each format is a backend function registered by dotted path in
+EXPORT_BACKENDS and imported on its first export, so processes that never
+export - most gunicorn and every Celery worker - do not load openpyxl or
+reportlab. Add a format with register_export_backend().
+"""
+import logging
 
-        # Define styles
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF", size=12)
-        header_alignment = Alignment(horizontal="center", vertical="center")
+from django.http import HttpResponse
+from django.utils.module_loading import import_string
 
-        cell_alignment = Alignment(horizontal="left", vertical="center", wrap_text=True)
-        border = Border(
-            left=Side(style='thin', color='D3D3D3'),
-            right=Side(style='thin', color='D3D3D3'),
-            top=Side(style='thin', color='D3D3D3'),
-            bottom=Side(style='thin', color='D3D3D3')
-        )
+from eduTrack.metrics import EXPORT_ROWS, EXPORT_SECONDS
 
-        # Add report info at the top
-        info_font = Font(size=10, italic=True, color="666666")
-        title_font = Font(size=14, bold=True, color="4472C4")
-        current_row = 1
+logger = logging.getLogger(__name__)
 
-        # Add report title
-        report_title = filename.replace('_', ' ').title() + " Report"
-        ws.cell(row=current_row, column=1, value=report_title)
-        ws.cell(row=current_row, column=1).font = title_font
-        current_row += 1
+EXPORT_BACKENDS = {
+    "csv": "reports.services.export_backends.csv_backend.export_csv",
+    "excel": "reports.services.export_backends.excel_backend.export_excel",
+    "pdf": "reports.services.export_backends.pdf_backend.export_pdf",
+}
 
-        # Add organization info
-        if workstream_name:
-            ws.cell(row=current_row, column=1, value=f"Workstream: {workstream_name}")
-            ws.cell(row=current_row, column=1).font = info_font
-            current_row += 1
+_loaded_backends = {}
 
-        if school_name:
-            ws.cell(row=current_row, column=1, value=f"School: {school_name}")
-            ws.cell(row=current_row, column=1).font = info_font
-            current_row += 1
 
-        if user_name:
-            ws.cell(row=current_row, column=1, value=f"Exported by: {user_name}")
-            ws.cell(row=current_row, column=1).font = info_font
-            current_row += 1
+def register_export_backend(export_format, backend):
+    """Register a backend for a format, as a callable or a dotted path imported on first use."""
+    EXPORT_BACKENDS[export_format] = backend
+    _loaded_backends.pop(export_format, None)
 
-        ws.cell(row=current_row, column=1, value=f"Generated on: {datetime.now().strftime('%B %d, %Y at %H:%M')}")
-        ws.cell(row=current_row, column=1).font = info_font
-        current_row += 2  # Add space before table
 
-        # Write and style header
-        for col_num, header in enumerate(headers, 1):
-            cell = ws.cell(row=current_row, column=col_num, value=header.replace('_', ' ').title())
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = header_alignment
-            cell.border = border
+def export_backend(export_format):
+    """
+    Return the backend function for a format, importing it on first use.
 
-        # Alternate row colors for better readability
-        light_fill = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
-        
-        # Write data with styling
-        start_data_row = current_row + 1
-        for row_num, row_data in enumerate(data, start_data_row):
-            for col_num, header in enumerate(headers, 1):
-                value = row_data.get(header, "")
-                
-                # Convert complex types to readable strings
-                if isinstance(value, (list, dict)):
-                    value = str(value)
-                elif isinstance(value, datetime):
-                    value = value.strftime("%Y-%m-%d %H:%M")
-                
-                cell = ws.cell(row=row_num, column=col_num, value=value)
-                cell.alignment = cell_alignment
-                cell.border = border
-                
-                # Alternate row colors
-                if row_num % 2 == 0:
-                    cell.fill = light_fill
+    Raises:
+        ValueError: If no backend is registered for the format
+        ImportError: If the backend or a library it needs is not installed
+    """
+    backend = _loaded_backends.get(export_format)
+    if backend is None:
+        if export_format not in EXPORT_BACKENDS:
+            raise ValueError(f"Unknown export format: {export_format}")
+        backend = EXPORT_BACKENDS[export_format]
+        if isinstance(backend, str):
+            backend = import_string(backend)
+        _loaded_backends[export_format] = backend
+    return backend
 
-        # Auto-adjust column widths
-        for col in ws.columns:
-            max_length = 0
-            column = col[0].column_letter
-            for cell in col:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)  # Max width 50
-            ws.column_dimensions[column].width = adjusted_width
 
-        # Freeze the header row
-        ws.freeze_panes = f"A{current_row + 1}"
+class ExportService:
+    @staticmethod
+    def export(export_format, data, headers, **options):
+        """
+        Render data (a list of dicts) with the format's backend, recording
+        generation time and row count in the metrics.
+        """
+        try:
+            backend = export_backend(export_format)
+        except ImportError as exc:
+            logger.error(f"{export_format} export backend could not be loaded: {exc}")
+            return HttpResponse(
+                f"{export_format.upper()} export is unavailable: {exc}",
+                content_type='text/plain',
+                status=501
+            )
+
+        with EXPORT_SECONDS.time(format=export_format):
+            response = backend(data, headers, **options)
+        EXPORT_ROWS.inc(len(data), format=export_format)
+        return response
 
-        # Prepare response
-        response = HttpResponse(
-            content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    @staticmethod
+    def export_to_excel(data, headers, filename="report", user_name=None, workstream_name=None, school_name=None):
+        """
+        Generates a professional Excel file with styling.
+        Includes user, workstream, and school information in the header.
+        """
+        return ExportService.export(
+            "excel", data, headers, filename=filename,
+            user_name=user_name, workstream_name=workstream_name, school_name=school_name
         )
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        response["Content-Disposition"] = f'attachment; filename="{filename}_{timestamp}.xlsx"'
-        
-        wb.save(response)
-        return response
 
     @staticmethod
     def export_to_csv(data, headers, filename="report", user_name=None, workstream_name=None, school_name=None):
@@ -127,47 +88,10 @@ class ExportService:
         Generates a CSV file with UTF-8 BOM for Excel compatibility.
         Includes user, workstream, and school information in the header.
         """
-        import csv
-        response = HttpResponse(content_type='text/csv; charset=utf-8-sig')
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        response['Content-Disposition'] = f'attachment; filename="{filename}_{timestamp}.csv"'
-
-        # Add UTF-8 BOM for proper Excel opening
-        response.write('\ufeff')
-
-        writer = csv.writer(response)
-
-        # Add report title
-        report_title = filename.replace('_', ' ').title() + " Report"
-        writer.writerow([report_title])
-        writer.writerow([])  # Empty row for spacing
-
-        # Add organization info
-        if workstream_name:
-            writer.writerow([f"Workstream: {workstream_name}"])
-        if school_name:
-            writer.writerow([f"School: {school_name}"])
-        if user_name:
-            writer.writerow([f"Exported by: {user_name}"])
-        writer.writerow([f"Generated on: {datetime.now().strftime('%B %d, %Y at %H:%M')}"])
-        writer.writerow([])  # Empty row for spacing
-        
-        # Write header with nice formatting
-        header_row = [h.replace('_', ' ').title() for h in headers]
-        writer.writerow(header_row)
-        
-        for row in data:
-            row_data = []
-            for header in headers:
-                val = row.get(header, "")
-                if isinstance(val, (list, dict)):
-                    val = str(val)
-                elif isinstance(val, datetime):
-                    val = val.strftime("%Y-%m-%d %H:%M")
-                row_data.append(val)
-            writer.writerow(row_data)
-            
-        return response
+        return ExportService.export(
+            "csv", data, headers, filename=filename,
+            user_name=user_name, workstream_name=workstream_name, school_name=school_name
+        )
 
     @staticmethod
     def export_to_pdf(data, headers, filename="report", title=None, user_name=None, workstream_name=None, school_name=None):
@@ -175,150 +99,7 @@ class ExportService:
         Generates a professional PDF report with table styling.
         Includes user, workstream, and school information in the header and footer.
         """
-        try:
-            response = HttpResponse(content_type='application/pdf')
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            response['Content-Disposition'] = f'attachment; filename="{filename}_{timestamp}.pdf"'
-
-            # Create the PDF document
-            doc = SimpleDocTemplate(response, pagesize=A4,
-                                   rightMargin=30, leftMargin=30,
-                                   topMargin=30, bottomMargin=30)
-
-            elements = []
-            styles = getSampleStyleSheet()
-
-            # Add custom title style
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=24,
-                textColor=colors.HexColor('#4472C4'),
-                spaceAfter=10,
-                alignment=1  # Center
-            )
-
-            # Add organization info style
-            org_style = ParagraphStyle(
-                'OrgStyle',
-                parent=styles['Normal'],
-                fontSize=12,
-                textColor=colors.HexColor('#333333'),
-                alignment=1,
-                spaceAfter=3
-            )
-
-            # Add title
-            report_title = title or filename.replace('_', ' ').title()
-            elements.append(Paragraph(report_title, title_style))
-
-            # Add organization info (workstream and school)
-            if workstream_name:
-                elements.append(Paragraph(f"<b>Workstream:</b> {workstream_name}", org_style))
-
-            if school_name:
-                elements.append(Paragraph(f"<b>School:</b> {school_name}", org_style))
-
-            elements.append(Spacer(1, 10))
-
-            # Add user and timestamp info
-            info_style = ParagraphStyle(
-                'InfoStyle',
-                parent=styles['Normal'],
-                fontSize=10,
-                textColor=colors.grey,
-                alignment=1,
-                spaceAfter=5
-            )
-
-            if user_name:
-                elements.append(Paragraph(f"Exported by: {user_name}", info_style))
-
-            elements.append(Paragraph(f"Generated on: {datetime.now().strftime('%B %d, %Y at %H:%M')}", info_style))
-            elements.append(Spacer(1, 20))
-            
-            # Prepare table data
-            table_data = []
-            
-            # Add headers
-            header_row = [h.replace('_', ' ').title() for h in headers]
-            table_data.append(header_row)
-            
-            # Add data rows
-            for row in data:
-                row_data = []
-                for header in headers:
-                    value = row.get(header, "")
-                    if isinstance(value, (list, dict)):
-                        value = str(value)
-                    elif isinstance(value, datetime):
-                        value = value.strftime("%Y-%m-%d %H:%M")
-                    row_data.append(str(value))
-                table_data.append(row_data)
-            
-            # Create table
-            table = Table(table_data)
-            
-            # Style the table
-            table_style = TableStyle([
-                # Header styling
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4472C4')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                
-                # Data rows styling
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-                ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 10),
-                ('TOPPADDING', (0, 1), (-1, -1), 6),
-                ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-                
-                # Grid
-                ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-                
-                # Alternate row colors
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F2F2F2')]),
-            ])
-            
-            table.setStyle(table_style)
-            elements.append(table)
-            
-            # Add footer
-            elements.append(Spacer(1, 30))
-            footer_style = ParagraphStyle(
-                'Footer',
-                parent=styles['Normal'],
-                fontSize=8,
-                textColor=colors.grey,
-                alignment=1
-            )
-            elements.append(Paragraph(f"Total Records: {len(data)}", footer_style))
-
-            # Add organization footer
-            footer_parts = []
-            if workstream_name:
-                footer_parts.append(workstream_name)
-            if school_name:
-                footer_parts.append(school_name)
-            if footer_parts:
-                org_footer = " | ".join(footer_parts)
-                elements.append(Paragraph(org_footer, footer_style))
-
-            elements.append(Paragraph("EduTracker - Education Management System", footer_style))
-            
-            # Build PDF
-            doc.build(elements)
-            return response
-            
-        except ImportError:
-            # Fallback if reportlab is not installed
-            response = HttpResponse(
-                "PDF generation requires 'reportlab' library. Please install it: pip install reportlab",
-                content_type='text/plain'
-            )
-            return response
\ No newline at end of file
+        return ExportService.export(
+            "pdf", data, headers, filename=filename, title=title,
+            user_name=user_name, workstream_name=workstream_name, school_name=school_name
+        )
@@ -1,7 +1,12 @@
+from django.http import HttpResponse
+from django.test import TestCase
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.urls import reverse
 from accounts.models import CustomUser, Role
+from eduTrack.startup_benchmark import startup_benchmark_run
+from reports.services.export_backends.csv_backend import export_csv
+from reports.services.export_service import EXPORT_BACKENDS, ExportService, export_backend, register_export_backend
 
 class ReportExportApiTests(APITestCase):
     def setUp(self):
@@ -92,3 +97,48 @@ class ReportExportApiTests(APITestCase):
         data = {'report_type': 'non_existent_report'}
         response = self.client.post(self.url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ExportBackendTests(TestCase):
+    """Tests for the lazily loaded export backends."""
+
+    def tearDown(self):
+        register_export_backend("csv", "reports.services.export_backends.csv_backend.export_csv")
+        EXPORT_BACKENDS.pop("json", None)
+
+    def test_registered_backend_is_imported_on_first_use(self):
+        """Test a dotted-path backend is resolved once and reused."""
+        register_export_backend("csv", "reports.services.export_backends.csv_backend.export_csv")
+
+        backend = export_backend("csv")
+
+        self.assertIs(backend, export_csv)
+        self.assertIs(export_backend("csv"), backend)
+
+    def test_custom_backend(self):
+        """Test ExportService.export renders with a registered callable."""
+        register_export_backend("json", lambda data, headers, **options: HttpResponse(str(len(data))))
+
+        response = ExportService.export("json", [{"a": 1}, {"a": 2}], ["a"])
+
+        self.assertEqual(response.content, b"2")
+
+    def test_unavailable_backend(self):
+        """Test a backend whose library is missing answers 501 instead of failing at import."""
+        register_export_backend("csv", "reports.services.export_backends.missing.export_csv")
+
+        response = ExportService.export_to_csv([{"a": 1}], ["a"])
+
+        self.assertEqual(response.status_code, status.HTTP_501_NOT_IMPLEMENTED)
+
+    def test_unknown_format(self):
+        """Test exporting an unregistered format raises ValueError."""
+        with self.assertRaises(ValueError):
+            export_backend("docx")
+
+    def test_web_startup_does_not_load_export_libraries(self):
+        """Test the web worker starts without openpyxl or reportlab."""
+        report = startup_benchmark_run(targets=["web"], runs=1)
+
+        self.assertEqual(report["targets"]["web"]["loaded"], [])
+        self.assertEqual(sorted(report["targets"]["web+exports"]["loaded"]), ["openpyxl", "reportlab"])
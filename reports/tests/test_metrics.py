@@ -0,0 +1,120 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import CustomUser, Role
+from eduTrack.metrics import EXPORT_ROWS, HTTP_REQUESTS, metrics_collect, metrics_flush, metrics_render, metrics_snapshot
+from reports.services.export_service import ExportService
+
+
+def _exited_pid() -> int:
+    process = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True, text=True)
+    return int(process.stdout)
+
+
+def _samples(metric) -> dict:
+    return {tuple(key): value for key, value in metric.snapshot()["samples"]}
+
+
+@override_settings(METRICS_CELERY_QUEUES=[])
+class MetricsTests(TestCase):
+    """Tests for eduTrack.metrics."""
+
+    def test_render_prometheus_text(self):
+        """Test counters and cumulative histogram buckets render in the exposition format."""
+        merged = {
+            "jobs_total": {"type": "counter", "help": "Jobs.", "labels": ["kind"], "samples": {("a\"b",): 3}},
+            "job_seconds": {
+                "type": "histogram", "help": "Job time.", "labels": [], "buckets": [0.1, 1.0],
+                "samples": {(): {"buckets": [1, 2], "sum": 1.5, "count": 3}},
+            },
+        }
+
+        lines = metrics_render(merged).splitlines()
+
+        self.assertIn('jobs_total{kind="a\\"b"} 3', lines)
+        self.assertIn("# TYPE job_seconds histogram", lines)
+        self.assertIn('job_seconds_bucket{le="1.0"} 2', lines)
+        self.assertIn('job_seconds_bucket{le="+Inf"} 3', lines)
+        self.assertIn("job_seconds_sum 1.5", lines)
+
+    def test_collect_merges_worker_snapshots(self):
+        """Test a scrape adds up the snapshots every process wrote to METRICS_DIR."""
+        HTTP_REQUESTS.inc(view="api/test/", method="GET", status=200)
+        own = _samples(HTTP_REQUESTS)[("api/test/", "GET", "200")]
+        other = metrics_snapshot()
+        other["edutrack_http_requests_total"]["samples"] = [[["api/test/", "GET", "200"], 5]]
+
+        with tempfile.TemporaryDirectory() as directory:
+            Path(directory, f"{os.getpid() + 1}.json").write_text(json.dumps(other))
+            with override_settings(METRICS_DIR=directory):
+                merged = metrics_collect()
+            self.assertTrue(list(Path(directory).glob(f"*-{os.getpid()}-*.json")))
+
+        self.assertEqual(merged["edutrack_http_requests_total"]["samples"][("api/test/", "GET", "200")], own + 5)
+
+    def test_flush_folds_exited_processes_into_host_totals(self):
+        """Test snapshots of exited processes are merged into one file and removed."""
+        exited = metrics_snapshot()
+        exited["edutrack_http_requests_total"]["samples"] = [[["api/gone/", "GET", "200"], 2]]
+        host, pid = socket.gethostname(), _exited_pid()
+
+        with tempfile.TemporaryDirectory() as directory, override_settings(METRICS_DIR=directory):
+            for started in (1, 2):
+                # The same PID twice: recycled, with different start times
+                Path(directory, f"{host}-{pid}-{started}.json").write_text(json.dumps(exited))
+            Path(directory, f"{host}-exited.json").write_text(json.dumps(exited))
+
+            metrics_flush(force=True)
+            files = sorted(path.name for path in Path(directory).glob("*.json"))
+            merged = metrics_collect()
+
+        self.assertEqual(len(files), 2)
+        self.assertIn(f"{host}-exited.json", files)
+        self.assertEqual(merged["edutrack_http_requests_total"]["samples"][("api/gone/", "GET", "200")], 6)
+
+    def test_export_records_rows(self):
+        """Test exports count the rows they write per format."""
+        before = _samples(EXPORT_ROWS).get(("csv",), 0)
+
+        ExportService.export_to_csv([{"name": "A"}, {"name": "B"}], ["name"])
+
+        self.assertEqual(_samples(EXPORT_ROWS)[("csv",)], before + 2)
+
+
+@override_settings(METRICS_CELERY_QUEUES=[])
+class MetricsApiTests(APITestCase):
+    """Tests for GET /api/metrics/."""
+
+    def setUp(self):
+        self.url = reverse("metrics")
+
+    def test_admin_scrapes_metrics(self):
+        """Test admins get the Prometheus text, including request counts."""
+        admin = CustomUser.objects.create_user(email="admin@test.com", password="password123", role=Role.ADMIN, full_name="Admin")
+        self.client.force_authenticate(user=admin)
+        self.client.get(self.url)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+        self.assertIn('edutrack_http_requests_total{view="api/metrics/",method="GET",status="200"}', response.content.decode())
+
+    def test_non_admin_forbidden(self):
+        """Test other roles cannot read the metrics."""
+        teacher = CustomUser.objects.create_user(email="teacher@test.com", password="password123", role=Role.TEACHER, full_name="Teacher")
+        self.client.force_authenticate(user=teacher)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,79 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.models import CustomUser, Role
+from eduTrack import db_router
+from eduTrack.db_router import ReplicaRouter, read_from_replica, replica_eligible
+from eduTrack.middleware import ReplicaRoutingMiddleware
+from reports.views.activity_log_views import ActivityLogListView
+from student.views.student_views import StudentListApi
+from teacher.views.attendance_views import AttendanceRecordApi
+
+
+@override_settings(DATABASE_REPLICAS=["replica"], REPLICA_MAX_LAG_SECONDS=5)
+class ReplicaRoutingTests(TestCase):
+    """Tests for eduTrack.db_router and ReplicaRoutingMiddleware."""
+
+    def setUp(self):
+        cache.clear()
+        self.router = ReplicaRouter()
+        lag = mock.patch("eduTrack.db_router.replica_lag", return_value=0.0)
+        self.replica_lag = lag.start()
+        self.addCleanup(lag.stop)
+        health = mock.patch.dict(db_router._health, clear=True)
+        health.start()
+        self.addCleanup(health.stop)
+
+    def _route(self, method, view_class, user=None, write=False):
+        """Run a request through the middleware; return where its reads went."""
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(user)}"} if user else {}
+        request = RequestFactory().generic(method, "/api/test/", **headers)
+        routed = {}
+
+        def view(request):
+            middleware.process_view(request, view_class.as_view(), (), {})
+            routed["read"] = self.router.db_for_read(CustomUser)
+            if write:
+                self.router.db_for_write(CustomUser)
+            return None
+
+        middleware = ReplicaRoutingMiddleware(view)
+        middleware(request)
+        return routed["read"]
+
+    def test_reads_go_to_replica_until_a_write(self):
+        """Test a replica-routed block reads from the primary once it writes."""
+        with read_from_replica() as alias:
+            self.assertEqual(alias, "replica")
+            self.assertEqual(self.router.db_for_read(CustomUser), "replica")
+            self.assertEqual(self.router.db_for_write(CustomUser), "default")
+            self.assertEqual(self.router.db_for_read(CustomUser), "default")
+        self.assertIsNone(self.router.db_for_read(CustomUser))
+
+    def test_lagging_replica_falls_back_to_primary(self):
+        """Test replicas over REPLICA_MAX_LAG_SECONDS, or not replicating, are skipped."""
+        for lag in (30.0, None):
+            self.replica_lag.return_value = lag
+            db_router._health.clear()
+            with read_from_replica() as alias:
+                self.assertIsNone(alias)
+                self.assertIsNone(self.router.db_for_read(CustomUser))
+
+    def test_eligible_views(self):
+        """Test reporting views and list GETs are eligible; writes are not."""
+        self.assertTrue(replica_eligible(ActivityLogListView, "GET"))
+        self.assertTrue(replica_eligible(StudentListApi, "GET"))
+        self.assertFalse(replica_eligible(StudentListApi, "POST"))
+        self.assertFalse(replica_eligible(AttendanceRecordApi, "POST"))
+
+    def test_middleware_routes_and_pins_writers(self):
+        """Test a user who writes reads from the primary for REPLICA_STICKY_SECONDS."""
+        user = CustomUser.objects.create_user(email="t@test.com", password="password123", role=Role.TEACHER, full_name="T")
+
+        self.assertEqual(self._route("GET", ActivityLogListView, user), "replica")
+        self.assertIsNone(self._route("POST", AttendanceRecordApi, user, write=True))
+        self.assertIsNone(self._route("GET", ActivityLogListView, user))
+        self.assertEqual(self._route("GET", ActivityLogListView), "replica")
@@ -13,6 +13,7 @@ from reports.views.stats_views import (
 )
 from reports.views.export_views import ReportExportView
 from reports.views.activity_log_views import ActivityLogListView
+from reports.views.metrics_views import MetricsView
 
 urlpatterns = [
     # Dashboard statistics (role-based)
@@ -49,4 +50,7 @@ urlpatterns = [
     # Performance
     path('school-performance/', SchoolPerformanceView.as_view(), name='school-performance'),
     path('school/<int:school_id>/performance/', SchoolPerformanceView.as_view(), name='school-performance-detail'),
+
+    # Prometheus metrics
+    path('metrics/', MetricsView.as_view(), name='metrics'),
 ]
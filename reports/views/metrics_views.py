@@ -0,0 +1,26 @@
+from django.http import HttpResponse
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework.views import APIView
+
+from accounts.permissions import IsSuperAdmin
+from eduTrack.metrics import metrics_render
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsView(APIView):
+    """
+    Application metrics in the Prometheus text format, merged across the
+    gunicorn and Celery worker processes. Admin only.
+    """
+    permission_classes = [IsSuperAdmin]
+
+    @extend_schema(
+        tags=['Reports & Statistics'],
+        summary='Prometheus metrics',
+        description='Request, SQL, cache, export and Celery counters and histograms in the Prometheus text format.',
+        responses={200: OpenApiTypes.STR},
+    )
+    def get(self, request):
+        return HttpResponse(metrics_render(), content_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,78 @@
+"""
+Django management command to onboard a school from a CSV/XLSX roster.
+Usage: python manage.py import_roster roster.xlsx --school 3 --actor admin@example.com
+           [--academic-year 7] [--dry-run] [--chunk-size N] [--workers N] [--report out.csv]
+"""
+
+import csv
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.models import CustomUser
+from school.models import AcademicYear, School
+from school.services.roster_import_services import roster_import
+
+
+class Command(BaseCommand):
+    help = 'Create students, teachers and guardians for a school from a roster file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV or XLSX roster')
+        parser.add_argument('--school', type=int, required=True, help='School ID')
+        parser.add_argument('--actor', required=True, help='Email of the user the import runs as')
+        parser.add_argument('--academic-year', type=int, help='Academic year ID for classroom enrollments')
+        parser.add_argument('--dry-run', action='store_true', help='Validate only; create nothing')
+        parser.add_argument('--chunk-size', type=int, help='Rows written per transaction')
+        parser.add_argument('--workers', type=int, help='Processes used to hash passwords')
+        parser.add_argument('--report', help='Write the per-row report to this CSV file')
+
+    def handle(self, *args, **options):
+        actor = CustomUser.objects.filter(email=options['actor']).first()
+        if actor is None:
+            raise CommandError(f"No active user with email {options['actor']}")
+        school = School.objects.filter(id=options['school']).first()
+        if school is None:
+            raise CommandError(f"School {options['school']} not found")
+        academic_year = None
+        if options['academic_year']:
+            academic_year = AcademicYear.objects.filter(id=options['academic_year'], school=school).first()
+            if academic_year is None:
+                raise CommandError(f"Academic year {options['academic_year']} not found in this school")
+
+        with open(options['path'], 'rb') as roster:
+            report = roster_import(
+                actor=actor,
+                school=school,
+                file=roster,
+                filename=options['path'],
+                academic_year=academic_year,
+                dry_run=options['dry_run'],
+                chunk_size=options['chunk_size'],
+                workers=options['workers'],
+            )
+
+        for entry in report['rows']:
+            if entry['errors']:
+                errors = '; '.join(f"{field}: {message}" for field, message in entry['errors'].items())
+                self.stdout.write(f"Row {entry['row']} ({entry['email'] or '-'}) {entry['status']}: {errors}")
+
+        if options['report']:
+            with open(options['report'], 'w', newline='') as out:
+                writer = csv.writer(out)
+                writer.writerow(['row', 'email', 'role', 'status', 'user_id', 'errors'])
+                for entry in report['rows']:
+                    writer.writerow([
+                        entry['row'], entry['email'], entry['role'], entry['status'], entry['user_id'] or '',
+                        '; '.join(f"{field}: {message}" for field, message in entry['errors'].items()),
+                    ])
+
+        if report['dry_run']:
+            valid = report['total'] - report['invalid']
+            self.stdout.write(self.style.SUCCESS(
+                f"Validated {report['total']} rows: {valid} valid, {report['invalid']} invalid"
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f"Imported {report['total']} rows: {report['created']} created, "
+                f"{report['invalid']} invalid, {report['failed']} failed"
+            ))
@@ -0,0 +1,66 @@
+"""
+Django management command to roll schools over into the next academic year.
+Usage: python manage.py rollover_academic_year 2027/2026 --actor admin@example.com
+           [--school 3 ...] [--workstream 2] [--start-date 2027-09-01] [--end-date 2028-06-30] [--dry-run]
+"""
+
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.models import CustomUser
+from school.models import School
+from school.services.academic_year_rollover_services import academic_year_rollover_schools
+
+
+class Command(BaseCommand):
+    help = 'Clone classrooms and allocations into the next academic year and promote students'
+
+    def add_arguments(self, parser):
+        parser.add_argument('source_code', help='Academic year code to roll over from, e.g. 2027/2026')
+        parser.add_argument('--actor', required=True, help='Email of the user the rollover runs as')
+        parser.add_argument('--school', type=int, action='append', help='School ID (repeatable); default all')
+        parser.add_argument('--workstream', type=int, help='Only schools in this workstream')
+        parser.add_argument('--start-date', type=date.fromisoformat, help='New year start (default: one year on)')
+        parser.add_argument('--end-date', type=date.fromisoformat, help='New year end (default: one year on)')
+        parser.add_argument('--dry-run', action='store_true', help='Report what would change; write nothing')
+
+    def handle(self, *args, **options):
+        actor = CustomUser.objects.filter(email=options['actor']).first()
+        if actor is None:
+            raise CommandError(f"No active user with email {options['actor']}")
+
+        schools = School.objects.all()
+        if options['school']:
+            schools = schools.filter(id__in=options['school'])
+        if options['workstream']:
+            schools = schools.filter(work_stream_id=options['workstream'])
+
+        reports = academic_year_rollover_schools(
+            actor=actor,
+            schools=schools,
+            source_code=options['source_code'],
+            start_date=options['start_date'],
+            end_date=options['end_date'],
+            dry_run=options['dry_run'],
+        )
+
+        failed = 0
+        for report in reports:
+            label = f"{report['school_name']} (#{report['school_id']})"
+            if 'error' in report:
+                failed += 1
+                self.stdout.write(self.style.ERROR(f"{label}: {report['error']}"))
+                continue
+            self.stdout.write(
+                f"{label} {report['source_year']} -> {report['target_year']}: "
+                f"{report['classrooms_cloned']} classrooms, {report['allocations_cloned']} allocations cloned; "
+                f"{report['enrollments_completed']} enrollments completed; "
+                f"{report['students_promoted']} promoted, {report['students_graduated']} graduated, "
+                f"{report['students_enrolled']} enrolled, {report['students_unplaced']} unplaced"
+            )
+
+        verb = 'Checked' if options['dry_run'] else 'Rolled over'
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {len(reports) - failed} of {len(reports)} schools, {failed} failed"
+        ))
@@ -0,0 +1,282 @@
+"""
+Academic-year rollover.
+
+Clones a school's classrooms and course allocations into the next
+academic year, completes the old year's active enrollments, promotes each
+student to the grade with the next numeric_level (graduating those in the
+top grade) and enrolls them in the matching classroom of the new year.
+Everything for one school is a handful of bulk queries in one
+transaction; a dry run executes the same queries and rolls them back.
+"""
+import logging
+from collections import defaultdict
+from datetime import date
+
+from django.core.exceptions import PermissionDenied
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from accounts.models import CustomUser
+from accounts.policies.academic_year_policies import can_manage_academic_year
+from reports.utils import log_activity
+from school.models import AcademicYear, ClassRoom, Grade, School
+from school.services.academic_year_services import _build_academic_year_code
+from student.models import Student, StudentEnrollment
+from teacher.models import CourseAllocation
+
+logger = logging.getLogger(__name__)
+
+# "enrolled" is what the enrollment API writes; "active" is the model default.
+OPEN_ENROLLMENT_STATUSES = ["active", "enrolled"]
+
+
+def _next_year(value: date) -> date:
+    try:
+        return value.replace(year=value.year + 1)
+    except ValueError:
+        # 29 February
+        return value.replace(year=value.year + 1, day=28)
+
+
+def _target_year(*, school: School, source_year: AcademicYear, start_date, end_date) -> tuple[AcademicYear, bool]:
+    start_date = start_date or _next_year(source_year.start_date)
+    end_date = end_date or _next_year(source_year.end_date)
+    if end_date < start_date:
+        raise ValidationError("end_date must be >= start_date.")
+    if start_date <= source_year.start_date:
+        raise ValidationError("The new academic year must start after the current one.")
+
+    code = _build_academic_year_code(start_date=start_date, end_date=end_date)
+    existing = AcademicYear.all_objects.filter(school=school, academic_year_code=code).first()
+    if existing is not None:
+        if not existing.is_active:
+            raise ValidationError(f"Academic year {code} exists but is inactive.")
+        return existing, False
+    return AcademicYear.objects.create(
+        school=school, start_date=start_date, end_date=end_date, academic_year_code=code, is_active=True
+    ), True
+
+
+def academic_year_rollover(
+    *,
+    actor: CustomUser,
+    source_year: AcademicYear,
+    start_date: date = None,
+    end_date: date = None,
+    dry_run: bool = False,
+) -> dict:
+    """
+    Roll one school over from source_year into the following year.
+
+    The target year is found or created from start_date/end_date (default:
+    the source dates one year later). Classrooms are matched by name, so a
+    re-run only fills in what is missing; enrollments already completed
+    are not touched again.
+
+    Students keep their section: the n-th classroom (by name) of a grade
+    feeds the n-th classroom of the next grade, wrapping around when the
+    next grade has fewer classrooms. Students whose next grade has no
+    classroom are promoted but left unplaced.
+
+    Returns:
+        Report dict with counts of everything created or changed
+
+    Raises:
+        PermissionDenied: If actor cannot manage the school's academic years
+        ValidationError: If the target dates are invalid
+    """
+    school = source_year.school
+    if not can_manage_academic_year(actor=actor, school=school):
+        raise PermissionDenied("Not allowed to roll over academic years for this school.")
+
+    with transaction.atomic():
+        target_year, target_created = _target_year(
+            school=school, source_year=source_year, start_date=start_date, end_date=end_date
+        )
+
+        grades = list(Grade.objects.order_by("numeric_level"))
+        next_grade = {grade.id: following for grade, following in zip(grades, grades[1:] + [None])}
+
+        # Classrooms
+        source_classrooms = list(
+            ClassRoom.objects.filter(school=school, academic_year=source_year).order_by("classroom_name")
+        )
+        existing_names = set(
+            ClassRoom.all_objects.filter(school=school, academic_year=target_year).values_list("classroom_name", flat=True)
+        )
+        ClassRoom.objects.bulk_create([
+            ClassRoom(
+                classroom_name=classroom.classroom_name,
+                school=school,
+                academic_year=target_year,
+                grade_id=classroom.grade_id,
+                homeroom_teacher_id=classroom.homeroom_teacher_id,
+                capacity=classroom.capacity,
+            )
+            for classroom in source_classrooms
+            if classroom.classroom_name not in existing_names
+        ])
+        # MySQL does not return primary keys from bulk inserts.
+        target_classrooms = list(
+            ClassRoom.objects.filter(school=school, academic_year=target_year).order_by("classroom_name")
+        )
+        target_by_name = {classroom.classroom_name: classroom for classroom in target_classrooms}
+        target_by_grade = defaultdict(list)
+        for classroom in target_classrooms:
+            target_by_grade[classroom.grade_id].append(classroom)
+
+        # Course allocations
+        existing_allocations = set(
+            CourseAllocation.all_objects.filter(academic_year=target_year).values_list("course_id", "class_room_id")
+        )
+        allocations = []
+        for allocation in CourseAllocation.objects.filter(
+            academic_year=source_year, class_room__in=source_classrooms
+        ).values("course_id", "teacher_id", "class_room__classroom_name"):
+            clone = target_by_name.get(allocation["class_room__classroom_name"])
+            if clone is None or (allocation["course_id"], clone.id) in existing_allocations:
+                continue
+            allocations.append(CourseAllocation(
+                course_id=allocation["course_id"],
+                class_room=clone,
+                teacher_id=allocation["teacher_id"],
+                academic_year=target_year,
+            ))
+        CourseAllocation.objects.bulk_create(allocations, batch_size=500)
+
+        # Promotions and enrollments
+        section = {}
+        grade_sections = defaultdict(int)
+        for classroom in source_classrooms:
+            section[classroom.id] = grade_sections[classroom.grade_id]
+            grade_sections[classroom.grade_id] += 1
+        classroom_grade = {classroom.id: classroom.grade_id for classroom in source_classrooms}
+
+        open_enrollments = StudentEnrollment.objects.filter(
+            academic_year=source_year, class_room__in=source_classrooms, status__in=OPEN_ENROLLMENT_STATUSES
+        )
+        already_enrolled = set(
+            StudentEnrollment.all_objects.filter(academic_year=target_year).values_list("student_id", flat=True)
+        )
+
+        promoted = defaultdict(list)
+        graduated = []
+        unplaced = 0
+        new_enrollments = []
+        seen = set()
+        for enrollment in open_enrollments.order_by("id").values("student_id", "class_room_id"):
+            student_id = enrollment["student_id"]
+            if student_id in seen:
+                continue
+            seen.add(student_id)
+
+            following = next_grade.get(classroom_grade[enrollment["class_room_id"]])
+            if following is None:
+                graduated.append(student_id)
+                continue
+            promoted[following].append(student_id)
+
+            choices = target_by_grade.get(following.id)
+            if not choices:
+                unplaced += 1
+            elif student_id not in already_enrolled:
+                new_enrollments.append(StudentEnrollment(
+                    student_id=student_id,
+                    class_room=choices[section[enrollment["class_room_id"]] % len(choices)],
+                    academic_year=target_year,
+                    status="active",
+                    enrollment_date=target_year.start_date,
+                ))
+
+        now = timezone.now()
+        completed = open_enrollments.update(status="completed", completion_date=source_year.end_date, updated_at=now)
+        for grade, student_ids in promoted.items():
+            Student.objects.filter(user_id__in=student_ids).update(
+                grade=grade, grade_level=grade.numeric_level, updated_at=now
+            )
+        if graduated:
+            Student.objects.filter(user_id__in=graduated).update(
+                enrollment_status="graduated", current_status="graduated", updated_at=now
+            )
+        StudentEnrollment.objects.bulk_create(new_enrollments, batch_size=500)
+
+        report = {
+            "school_id": school.id,
+            "school_name": school.school_name,
+            "source_year": source_year.academic_year_code,
+            "target_year": target_year.academic_year_code,
+            "target_year_created": target_created,
+            "classrooms_cloned": len(target_classrooms) - len(existing_names),
+            "allocations_cloned": len(allocations),
+            "enrollments_completed": completed,
+            "students_promoted": sum(len(student_ids) for student_ids in promoted.values()),
+            "students_graduated": len(graduated),
+            "students_enrolled": len(new_enrollments),
+            "students_unplaced": unplaced,
+            "dry_run": dry_run,
+        }
+
+        if dry_run:
+            transaction.set_rollback(True)
+        else:
+            log_activity(
+                actor=actor,
+                action_type='CREATE',
+                entity_type='AcademicYear',
+                entity_id=target_year.id,
+                description=(
+                    f"Rolled {school.school_name} over from {source_year.academic_year_code} to "
+                    f"{target_year.academic_year_code}: {report['students_promoted']} promoted, "
+                    f"{report['students_graduated']} graduated."
+                )
+            )
+
+    return report
+
+
+def academic_year_rollover_schools(
+    *,
+    actor: CustomUser,
+    schools,
+    source_code: str,
+    start_date: date = None,
+    end_date: date = None,
+    dry_run: bool = False,
+) -> list[dict]:
+    """
+    Roll every given school over from its academic year with source_code.
+    Each school commits (or fails, database errors included) on its own.
+
+    Returns:
+        One report per school; failed schools carry an "error" instead of counts
+    """
+    source_years = {
+        year.school_id: year
+        for year in AcademicYear.objects.select_related("school").filter(
+            school__in=schools, academic_year_code=source_code
+        )
+    }
+
+    reports = []
+    for school in schools.order_by("id"):
+        source_year = source_years.get(school.id)
+        if source_year is None:
+            reports.append({
+                "school_id": school.id,
+                "school_name": school.school_name,
+                "error": f"No active academic year {source_code}.",
+            })
+            continue
+        try:
+            reports.append(academic_year_rollover(
+                actor=actor, source_year=source_year, start_date=start_date, end_date=end_date, dry_run=dry_run
+            ))
+        except (PermissionDenied, ValidationError) as exc:
+            detail = exc.detail if isinstance(exc, ValidationError) else str(exc)
+            reports.append({"school_id": school.id, "school_name": school.school_name, "error": str(detail)})
+            logger.warning(f"Rollover of school {school.id} failed: {detail}")
+        except DatabaseError as exc:
+            reports.append({"school_id": school.id, "school_name": school.school_name, "error": f"Database error: {exc}"})
+            logger.exception(f"Rollover of school {school.id} failed")
+    return reports
@@ -1,9 +1,14 @@
+from django.db import transaction
 from django.utils import timezone
 from rest_framework.exceptions import PermissionDenied, ValidationError
 
 from accounts.models import CustomUser, Role
 from accounts.policies.academic_year_policies import can_manage_academic_year
 from school.models import AcademicYear, School
+from school.services.soft_delete_cascade_services import (
+    soft_delete_activate_descendants,
+    soft_delete_deactivate_descendants,
+)
 
 
 def _build_academic_year_code(*, start_date, end_date) -> str:
@@ -64,6 +69,7 @@ def update_academic_year(*, actor: CustomUser, academic_year: AcademicYear, star
     return academic_year
 
 
+@transaction.atomic
 def deactivate_academic_year(*, actor: CustomUser, academic_year: AcademicYear) -> AcademicYear:
     if not can_manage_academic_year(actor=actor, school=academic_year.school):
         raise PermissionDenied("Not allowed to deactivate academic years for this school.")
@@ -72,9 +78,13 @@ def deactivate_academic_year(*, actor: CustomUser, academic_year: AcademicYear)
         raise ValidationError("Academic year already deactivated.")
 
     academic_year.deactivate(user=actor)
+    soft_delete_deactivate_descendants(
+        model=AcademicYear, ids=[academic_year.id], actor=actor, stamp=academic_year.deactivated_at
+    )
     return academic_year
 
 
+@transaction.atomic
 def activate_academic_year(*, actor: CustomUser, academic_year: AcademicYear) -> AcademicYear:
     if not can_manage_academic_year(actor=actor, school=academic_year.school):
         raise PermissionDenied("Not allowed to activate academic years for this school.")
@@ -82,5 +92,6 @@ def activate_academic_year(*, actor: CustomUser, academic_year: AcademicYear) ->
     if academic_year.is_active:
         raise ValidationError("Academic year is already active.")
 
+    soft_delete_activate_descendants(model=AcademicYear, ids=[academic_year.id])
     academic_year.activate()
     return academic_year
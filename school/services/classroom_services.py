@@ -6,6 +6,10 @@ from accounts.models import CustomUser
 from school.models import School, AcademicYear, Grade, ClassRoom
 from teacher.models import Teacher
 from accounts.policies.user_policies import _has_school_access
+from school.services.soft_delete_cascade_services import (
+    soft_delete_activate_descendants,
+    soft_delete_deactivate_descendants,
+)
 
 
 @transaction.atomic
@@ -144,6 +148,9 @@ def classroom_deactivate(*, classroom: ClassRoom, actor: CustomUser) -> None:
         raise ValidationError("Classroom already deactivated.")
 
     classroom.deactivate(user=actor)
+    soft_delete_deactivate_descendants(
+        model=ClassRoom, ids=[classroom.id], actor=actor, stamp=classroom.deactivated_at
+    )
 
 
 @transaction.atomic
@@ -162,4 +169,5 @@ def classroom_activate(*, classroom: ClassRoom, actor: CustomUser) -> None:
     if not classroom.academic_year.is_active:
         raise ValidationError({"detail": "Cannot activate classroom because its academic year is inactive."})
 
+    soft_delete_activate_descendants(model=ClassRoom, ids=[classroom.id])
     classroom.activate()
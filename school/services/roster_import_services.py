@@ -0,0 +1,575 @@
+"""
+Roster import services for onboarding a school in one pass.
+
+A CSV or XLSX roster is parsed and validated entirely in memory against a
+handful of preloaded lookups (existing emails, grades, classrooms, linked
+students), passwords are hashed up front in a process pool, and the valid
+rows are written with chunked bulk_create() - one transaction per chunk -
+so a bad chunk never rolls back the chunks before it. Rows beyond the
+workstream's remaining capacity are refused up front, and each chunk
+re-checks the limit with the workstream row locked. Every input row gets
+an entry in the returned report.
+"""
+import csv
+import io
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from typing import Optional
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import PermissionDenied, ValidationError as DjangoValidationError
+from django.core.validators import validate_email
+from django.db import DatabaseError, transaction
+from django.db.models.functions import Lower
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from accounts.models import CustomUser, Role
+from accounts.policies.user_policies import ROLE_CREATION_MATRIX, _can_manage_school
+from accounts.services.user_search_services import user_search_keys_rebuild
+from eduTrack.process_pool import process_pool_worker_init
+from guardian.models import Guardian, GuardianStudentLink
+from reports.utils import log_activity
+from school.models import AcademicYear, ClassRoom, Grade, School
+from student.models import Student, StudentEnrollment
+from teacher.models import Teacher
+from workstream.models import WorkStream
+from workstream.services.workstream_capacity_services import workstream_counter_adjust, workstream_lock
+
+logger = logging.getLogger(__name__)
+
+ROSTER_ROLES = (Role.STUDENT, Role.TEACHER, Role.GUARDIAN)
+ROSTER_COLUMNS = (
+    "role", "email", "full_name", "password",
+    # student
+    "student_id", "date_of_birth", "admission_date", "grade_level", "classroom", "gender", "phone", "address",
+    # teacher
+    "hire_date", "employment_status", "specialization",
+    # guardian
+    "phone_number", "students", "relationship_type", "is_primary",
+)
+TEACHER_EMPLOYMENT_STATUSES = ("full_time", "part_time", "contract", "substitute")
+
+# Students are written before guardians so links can point at students
+# created earlier in the same import.
+_ROLE_WRITE_ORDER = {Role.STUDENT: 0, Role.TEACHER: 1, Role.GUARDIAN: 2}
+
+
+# =============================================================================
+# Parsing
+# =============================================================================
+
+def _cell_text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+def _cell_date(value) -> Optional[date]:
+    """Spreadsheet cells may already be dates; text must be ISO (YYYY-MM-DD)."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = _cell_text(value)
+    if not text:
+        return None
+    return date.fromisoformat(text)
+
+
+def roster_parse(*, file, filename: str) -> list[dict]:
+    """
+    Read a roster into a list of row dicts keyed by lower-cased header.
+
+    XLSX cells keep their native types (dates stay dates); CSV cells are
+    strings. Blank lines are skipped.
+    """
+    extension = os.path.splitext(filename or "")[1].lower()
+
+    if extension == ".xlsx":
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None) or ()
+            keys = [_cell_text(cell).lower() for cell in header]
+            parsed = [
+                dict(zip(keys, values))
+                for values in rows
+                if any(_cell_text(value) for value in values)
+            ]
+        finally:
+            workbook.close()
+        return parsed
+
+    if extension in ("", ".csv"):
+        data = file.read()
+        if isinstance(data, bytes):
+            data = data.decode("utf-8-sig")
+        reader = csv.DictReader(io.StringIO(data))
+        reader.fieldnames = [(name or "").strip().lower() for name in reader.fieldnames or []]
+        return [row for row in reader if any(_cell_text(value) for value in row.values())]
+
+    raise ValidationError({"file": "Unsupported roster format. Upload a .csv or .xlsx file."})
+
+
+# =============================================================================
+# Password hashing
+# =============================================================================
+
+def roster_hash_passwords(passwords: list, *, workers: int = None) -> list[str]:
+    """
+    Hash passwords with the configured hasher, in a process pool when the
+    batch is large enough to outweigh the pool start-up cost. Blank
+    passwords become unusable ones.
+
+    Args:
+        passwords: Raw passwords (None/'' for no password)
+        workers: Pool size (default: settings.ROSTER_IMPORT_HASH_WORKERS)
+    """
+    passwords = [password or None for password in passwords]
+    workers = workers or settings.ROSTER_IMPORT_HASH_WORKERS
+
+    if workers <= 1 or len(passwords) < settings.ROSTER_IMPORT_PARALLEL_MIN_ROWS:
+        return [make_password(password) for password in passwords]
+
+    chunksize = max(1, len(passwords) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=process_pool_worker_init) as pool:
+        return list(pool.map(make_password, passwords, chunksize=chunksize))
+
+
+# =============================================================================
+# Validation
+# =============================================================================
+
+class _RosterLookups:
+    """Everything row validation needs, loaded with one query per table."""
+
+    def __init__(self, *, school: School, academic_year: Optional[AcademicYear], rows: list[dict]):
+        emails = {_cell_text(row.get("email")) for row in rows} - {""}
+        student_ids = {_cell_text(row.get("student_id")) for row in rows} - {""}
+        linked_emails = {
+            email
+            for row in rows
+            for email in _split_emails(row.get("students"))
+        }
+
+        self.existing_emails = set()
+        email_list = list(emails)
+        for start in range(0, len(email_list), 1000):
+            self.existing_emails.update(
+                email.lower()
+                for email in CustomUser.all_objects.filter(
+                    email__in=email_list[start:start + 1000]
+                ).values_list("email", flat=True)
+            )
+        self.existing_student_ids = set(
+            Student.all_objects.filter(student_id__in=student_ids).values_list("student_id", flat=True)
+        ) if student_ids else set()
+        self.grades = {
+            grade.numeric_level: grade for grade in Grade.objects.all()
+        }
+        self.classrooms = {
+            classroom.classroom_name.lower(): classroom
+            for classroom in ClassRoom.objects.filter(school=school, academic_year=academic_year)
+        } if academic_year else {}
+        # Keyed by lower-cased email, like every other lookup.
+        self.school_students = dict(
+            Student.objects.annotate(email_lower=Lower("user__email")).filter(
+                email_lower__in={email.lower() for email in linked_emails},
+                user__school=school,
+                user__is_active=True,
+            ).values_list("email_lower", "user_id")
+        ) if linked_emails else {}
+
+
+def _split_emails(value) -> list[str]:
+    return list(dict.fromkeys(email.strip() for email in _cell_text(value).split(";") if email.strip()))
+
+
+def _parse_bool(value) -> bool:
+    return _cell_text(value).lower() in ("1", "true", "yes", "y")
+
+
+def _validate_row(*, actor: CustomUser, row: dict, lookups: _RosterLookups, academic_year, seen: dict) -> tuple[dict, dict]:
+    """Return (cleaned values, errors) for one roster row."""
+    errors = {}
+    cleaned = {}
+
+    role = _cell_text(row.get("role")).lower()
+    if role not in ROSTER_ROLES:
+        errors["role"] = f"Must be one of: {', '.join(ROSTER_ROLES)}."
+    elif role not in ROLE_CREATION_MATRIX.get(actor.role, []):
+        errors["role"] = f"You are not allowed to create users with role '{role}'."
+    cleaned["role"] = role
+
+    email = _cell_text(row.get("email"))
+    try:
+        validate_email(email)
+    except DjangoValidationError:
+        errors["email"] = "Enter a valid email address."
+    else:
+        if email.lower() in seen["emails"]:
+            errors["email"] = f"Duplicate email in roster (row {seen['emails'][email.lower()]})."
+        elif email.lower() in lookups.existing_emails:
+            errors["email"] = "A user with this email already exists."
+    cleaned["email"] = email
+
+    cleaned["full_name"] = _cell_text(row.get("full_name"))
+    if not cleaned["full_name"]:
+        errors["full_name"] = "This field is required."
+    cleaned["password"] = _cell_text(row.get("password"))
+
+    def required_date(field):
+        try:
+            value = _cell_date(row.get(field))
+        except ValueError:
+            errors[field] = "Enter a valid date (YYYY-MM-DD)."
+            return None
+        if value is None:
+            errors[field] = "This field is required."
+        return value
+
+    if role == Role.STUDENT:
+        cleaned["date_of_birth"] = required_date("date_of_birth")
+        cleaned["admission_date"] = required_date("admission_date")
+        if (
+            cleaned["date_of_birth"] and cleaned["admission_date"]
+            and cleaned["admission_date"] < cleaned["date_of_birth"]
+        ):
+            errors["admission_date"] = "Admission date must be after date of birth."
+
+        try:
+            cleaned["grade"] = lookups.grades.get(int(_cell_text(row.get("grade_level"))))
+        except ValueError:
+            cleaned["grade"] = None
+        if cleaned["grade"] is None:
+            errors["grade_level"] = "Grade not found."
+
+        student_id = _cell_text(row.get("student_id")) or None
+        if student_id and student_id in seen["student_ids"]:
+            errors["student_id"] = f"Duplicate student ID in roster (row {seen['student_ids'][student_id]})."
+        elif student_id and student_id in lookups.existing_student_ids:
+            errors["student_id"] = "A student with this ID already exists."
+        cleaned["student_id"] = student_id
+
+        gender = _cell_text(row.get("gender")).lower() or None
+        if gender and gender not in dict(Student.GENDER_CHOICES):
+            errors["gender"] = f"Must be one of: {', '.join(dict(Student.GENDER_CHOICES))}."
+        cleaned["gender"] = gender
+
+        classroom_name = _cell_text(row.get("classroom"))
+        cleaned["classroom"] = None
+        if classroom_name:
+            if academic_year is None:
+                errors["classroom"] = "An academic year is required to enroll students."
+            else:
+                classroom = lookups.classrooms.get(classroom_name.lower())
+                if classroom is None:
+                    errors["classroom"] = "Classroom not found in this school and academic year."
+                elif cleaned["grade"] and classroom.grade_id != cleaned["grade"].id:
+                    errors["classroom"] = "Classroom belongs to a different grade."
+                cleaned["classroom"] = classroom
+
+        cleaned["phone"] = _cell_text(row.get("phone")) or None
+        cleaned["address"] = _cell_text(row.get("address")) or None
+
+    elif role == Role.TEACHER:
+        cleaned["hire_date"] = required_date("hire_date")
+        cleaned["employment_status"] = _cell_text(row.get("employment_status")).lower()
+        if cleaned["employment_status"] not in TEACHER_EMPLOYMENT_STATUSES:
+            errors["employment_status"] = f"Must be one of: {', '.join(TEACHER_EMPLOYMENT_STATUSES)}."
+        cleaned["specialization"] = _cell_text(row.get("specialization")) or None
+
+    elif role == Role.GUARDIAN:
+        cleaned["phone_number"] = _cell_text(row.get("phone_number")) or None
+        cleaned["students"] = _split_emails(row.get("students"))
+        unknown = [
+            email for email in cleaned["students"]
+            if email.lower() not in seen["student_emails"] and email.lower() not in lookups.school_students
+        ]
+        if unknown:
+            errors["students"] = f"Students not found in this school or roster: {', '.join(unknown)}."
+        cleaned["relationship_type"] = _cell_text(row.get("relationship_type")).lower() or "parent"
+        if cleaned["relationship_type"] not in dict(GuardianStudentLink.RELATIONSHIP_CHOICES):
+            errors["relationship_type"] = (
+                f"Must be one of: {', '.join(dict(GuardianStudentLink.RELATIONSHIP_CHOICES))}."
+            )
+        cleaned["is_primary"] = _parse_bool(row.get("is_primary"))
+
+    return cleaned, errors
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+class _CapacityExceeded(Exception):
+    """A chunk would take the workstream over its capacity."""
+
+
+def _capacity_error(workstream: WorkStream) -> dict:
+    return {"detail": f"Workstream {workstream.workstream_name} has reached its capacity of {workstream.capacity} users."}
+
+
+def _write_chunk(*, chunk: list[dict], school: School, academic_year, created_ids: dict, lookups: _RosterLookups):
+    """Create users, profiles, links and enrollments for one chunk of valid rows."""
+    users = [
+        CustomUser(
+            email=entry["cleaned"]["email"],
+            full_name=entry["cleaned"]["full_name"],
+            role=entry["cleaned"]["role"],
+            password=entry["password_hash"],
+            work_stream_id=school.work_stream_id,
+            school=school,
+        )
+        for entry in chunk
+    ]
+    emails = [user.email for user in users]
+
+    with transaction.atomic():
+        # Registrations and other imports may have taken seats since the
+        # up-front check; the lock holds them off until this chunk commits.
+        workstream = workstream_lock(work_stream_id=school.work_stream_id, include_inactive=True)
+        if workstream.active_user_count + len(users) > workstream.capacity:
+            raise _CapacityExceeded(workstream)
+
+        CustomUser.objects.bulk_create(users)
+        # MySQL does not return primary keys from bulk inserts.
+        ids = dict(CustomUser.all_objects.filter(email__in=emails).values_list("email", "id"))
+        ids_lower = {email.lower(): user_id for email, user_id in ids.items()}
+
+        students, teachers, guardians, links, enrollments = [], [], [], [], []
+        today = timezone.localdate()
+        for entry in chunk:
+            cleaned = entry["cleaned"]
+            user_id = ids[cleaned["email"]]
+            if cleaned["role"] == Role.STUDENT:
+                students.append(Student(
+                    user_id=user_id,
+                    student_id=cleaned["student_id"],
+                    grade=cleaned["grade"],
+                    date_of_birth=cleaned["date_of_birth"],
+                    admission_date=cleaned["admission_date"],
+                    gender=cleaned["gender"],
+                    phone=cleaned["phone"],
+                    address=cleaned["address"],
+                ))
+                if cleaned["classroom"] is not None:
+                    enrollments.append(StudentEnrollment(
+                        student_id=user_id,
+                        class_room=cleaned["classroom"],
+                        academic_year=academic_year,
+                        status="active",
+                        enrollment_date=today,
+                    ))
+            elif cleaned["role"] == Role.TEACHER:
+                teachers.append(Teacher(
+                    user_id=user_id,
+                    hire_date=cleaned["hire_date"],
+                    employment_status=cleaned["employment_status"],
+                    specialization=cleaned["specialization"],
+                ))
+            else:
+                guardians.append(Guardian(user_id=user_id, phone_number=cleaned["phone_number"]))
+                for email in cleaned["students"]:
+                    student_user_id = (
+                        created_ids.get(email.lower())
+                        or ids_lower.get(email.lower())
+                        or lookups.school_students[email.lower()]
+                    )
+                    links.append(GuardianStudentLink(
+                        guardian_id=user_id,
+                        student_id=student_user_id,
+                        relationship_type=cleaned["relationship_type"],
+                        is_primary=cleaned["is_primary"],
+                    ))
+
+        Student.objects.bulk_create(students)
+        Teacher.objects.bulk_create(teachers)
+        Guardian.objects.bulk_create(guardians)
+        GuardianStudentLink.objects.bulk_create(links)
+        StudentEnrollment.objects.bulk_create(enrollments)
+
+        # bulk_create() sends no post_save, so search keys and the
+        # workstream user counter are maintained here.
+        user_search_keys_rebuild(user_ids=ids.values())
+        workstream_counter_adjust(work_stream_id=school.work_stream_id, field="active_user_count", delta=len(ids))
+
+    return ids
+
+
+def roster_import(
+    *,
+    actor: CustomUser,
+    school: School,
+    file,
+    filename: str,
+    academic_year: Optional[AcademicYear] = None,
+    dry_run: bool = False,
+    chunk_size: int = None,
+    workers: int = None,
+    max_rows: int = None,
+) -> dict:
+    """
+    Onboard students, teachers and guardians for a school from a roster.
+
+    Columns: role, email, full_name, password (blank: unusable until reset)
+        student: date_of_birth, admission_date, grade_level (numeric),
+            classroom (name, needs academic_year), student_id, gender, phone, address
+        teacher: hire_date, employment_status, specialization
+        guardian: phone_number, students (';'-separated student emails from
+            the roster or the school), relationship_type, is_primary
+
+    Args:
+        actor: User performing the import
+        school: School the users belong to
+        file: Roster file object
+        filename: Original name, used to pick the parser
+        academic_year: Year for classroom enrollments
+        dry_run: Validate only; nothing is written
+        chunk_size: Rows per transaction (default: settings.ROSTER_IMPORT_CHUNK_SIZE)
+        workers: Hashing processes (default: settings.ROSTER_IMPORT_HASH_WORKERS)
+        max_rows: Reject rosters with more data rows than this
+
+    Returns:
+        {"total", "created", "invalid", "failed", "dry_run", "rows": [
+            {"row", "email", "role", "status", "user_id", "errors"}]}
+        where status is created, valid (dry run), invalid or failed; rows
+        beyond the workstream's remaining capacity are invalid.
+
+    Raises:
+        PermissionDenied: If actor cannot manage the school
+        ValidationError: If the roster cannot be read or is too large
+    """
+    if not _can_manage_school(actor, school):
+        raise PermissionDenied("You don't have permission to import users into this school.")
+    if academic_year is not None and academic_year.school_id != school.id:
+        raise ValidationError({"academic_year_id": "Academic year does not belong to this school."})
+
+    chunk_size = chunk_size or settings.ROSTER_IMPORT_CHUNK_SIZE
+    rows = roster_parse(file=file, filename=filename)
+    if max_rows is not None and len(rows) > max_rows:
+        raise ValidationError({
+            "file": f"Roster has {len(rows)} rows; the limit is {max_rows}. "
+                    "Split the file or use the import_roster management command."
+        })
+    lookups = _RosterLookups(school=school, academic_year=academic_year, rows=rows)
+
+    # Header is row 1, so data rows are numbered from 2 as in a spreadsheet.
+    seen = {
+        "emails": {},
+        "student_ids": {},
+        "student_emails": {
+            _cell_text(row.get("email")).lower()
+            for row in rows
+            if _cell_text(row.get("role")).lower() == Role.STUDENT
+        },
+    }
+    report = []
+    valid = []
+    for row_number, row in enumerate(rows, start=2):
+        cleaned, errors = _validate_row(
+            actor=actor, row=row, lookups=lookups, academic_year=academic_year, seen=seen
+        )
+        if cleaned["email"]:
+            seen["emails"].setdefault(cleaned["email"].lower(), row_number)
+        if cleaned.get("student_id"):
+            seen["student_ids"].setdefault(cleaned["student_id"], row_number)
+
+        entry = {
+            "row": row_number,
+            "email": cleaned["email"],
+            "role": cleaned["role"],
+            "status": "invalid" if errors else "valid",
+            "user_id": None,
+            "errors": errors,
+        }
+        report.append(entry)
+        if not errors:
+            valid.append({"report": entry, "cleaned": cleaned})
+
+    # Valid rows beyond the workstream's free seats are refused, in write
+    # order, so guardians lose their seat before the students they link.
+    valid.sort(key=lambda item: _ROLE_WRITE_ORDER[item["cleaned"]["role"]])
+    workstream = WorkStream.all_objects.get(pk=school.work_stream_id)
+    remaining = max(0, workstream.capacity - workstream.active_user_count)
+    for item in valid[remaining:]:
+        item["report"].update(status="invalid", errors=_capacity_error(workstream))
+    valid = valid[:remaining]
+
+    if not dry_run and valid:
+        hashes = roster_hash_passwords([item["cleaned"]["password"] for item in valid], workers=workers)
+        for item, password_hash in zip(valid, hashes):
+            item["password_hash"] = password_hash
+
+        created_ids = {}
+        for start in range(0, len(valid), chunk_size):
+            chunk = valid[start:start + chunk_size]
+            # Guardians whose students failed in an earlier chunk cannot be linked.
+            chunk_students = {
+                item["cleaned"]["email"].lower() for item in chunk if item["cleaned"]["role"] == Role.STUDENT
+            }
+            writable = []
+            for item in chunk:
+                missing = [
+                    email for email in item["cleaned"].get("students", [])
+                    if email.lower() not in created_ids
+                    and email.lower() not in chunk_students
+                    and email.lower() not in lookups.school_students
+                ]
+                if missing:
+                    item["report"].update(
+                        status="failed",
+                        errors={"students": f"Linked students were not created: {', '.join(missing)}."},
+                    )
+                else:
+                    writable.append(item)
+            if not writable:
+                continue
+
+            try:
+                ids = _write_chunk(
+                    chunk=writable, school=school, academic_year=academic_year,
+                    created_ids=created_ids, lookups=lookups,
+                )
+            except _CapacityExceeded as exc:
+                for item in writable:
+                    item["report"].update(status="failed", errors=_capacity_error(exc.args[0]))
+                continue
+            except DatabaseError as exc:
+                logger.warning(f"Roster import chunk for school {school.id} failed: {exc}")
+                for item in writable:
+                    item["report"].update(status="failed", errors={"detail": "Could not save this row; the chunk was rolled back."})
+                continue
+
+            for item in writable:
+                email = item["cleaned"]["email"]
+                item["report"].update(status="created", user_id=ids[email])
+                created_ids[email.lower()] = ids[email]
+
+    summary = {
+        "total": len(report),
+        "created": sum(1 for entry in report if entry["status"] == "created"),
+        "invalid": sum(1 for entry in report if entry["status"] == "invalid"),
+        "failed": sum(1 for entry in report if entry["status"] == "failed"),
+        "dry_run": dry_run,
+        "rows": report,
+    }
+
+    if summary["created"]:
+        log_activity(
+            actor=actor,
+            action_type='CREATE',
+            entity_type='User',
+            entity_id=school.id,
+            description=f"Imported {summary['created']} users into school {school.school_name} from a roster."
+        )
+
+    return summary
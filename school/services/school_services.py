@@ -1,4 +1,5 @@
 from __future__ import annotations
+from django.db import transaction
 from django.core.exceptions import PermissionDenied, ValidationError
 from school.models import School
 from accounts.policies.school_policies import (
@@ -8,6 +9,12 @@ from accounts.policies.school_policies import (
 )
 from accounts.models import CustomUser, Role
 from workstream.models import WorkStream
+from workstream.services.workstream_capacity_services import workstream_lock
+from school.services.soft_delete_cascade_services import (
+    soft_delete_activate_descendants,
+    soft_delete_cascade_activate,
+    soft_delete_deactivate_descendants,
+)
 
 UNSET = object()
 
@@ -15,19 +22,19 @@ UNSET = object()
 def check_workstream_school_capacity(work_stream_id: int) -> None:
     """
     Check if a workstream has reached its maximum school capacity as per SRS 7.2.2.
+
+    Must run inside a transaction: the workstream row stays locked until
+    the caller's school save moves active_school_count.
     """
-    work_stream = WorkStream.objects.get(id=work_stream_id)
-    current_active_schools = School.objects.filter(
-        work_stream_id=work_stream_id, 
-        is_active=True
-    ).count()
-    
-    if current_active_schools >= work_stream.capacity:
+    work_stream = workstream_lock(work_stream_id=work_stream_id)
+
+    if work_stream.active_school_count >= work_stream.capacity:
         raise ValidationError(
             {"work_stream": f"Workstream '{work_stream.workstream_name}' has reached its maximum capacity of {work_stream.capacity} active schools."}
         )
 
 
+@transaction.atomic
 def create_school(
     *,
     actor: CustomUser,
@@ -84,6 +91,7 @@ def update_school(
     return school
 
 
+@transaction.atomic
 def deactivate_school(*, actor: CustomUser, school: School) -> School:
     if not can_deactivate_school(actor=actor, school=school):
         raise PermissionDenied("Not allowed to deactivate this school.")
@@ -92,9 +100,12 @@ def deactivate_school(*, actor: CustomUser, school: School) -> School:
         raise ValidationError("School already deactivated.")
 
     school.deactivate(user=actor)
+    # Academic years, classrooms, allocations and enrollments follow.
+    soft_delete_deactivate_descendants(model=School, ids=[school.id], actor=actor, stamp=school.deactivated_at)
     return school
 
 
+@transaction.atomic
 def activate_school(*, actor: CustomUser, school: School) -> School:
     # Admin/WorkstreamManager can activate
     if actor.role not in [Role.ADMIN, Role.MANAGER_WORKSTREAM]:
@@ -106,5 +117,56 @@ def activate_school(*, actor: CustomUser, school: School) -> School:
     # Check capacity
     check_workstream_school_capacity(school.work_stream_id)
 
+    # Bring back what deactivating the school switched off, then the school.
+    soft_delete_activate_descendants(model=School, ids=[school.id])
     school.activate()
     return school
+
+
+@transaction.atomic
+def school_bulk_activate(*, actor: CustomUser, schools) -> dict:
+    """
+    Activate every inactive school in a queryset, with their cascaded
+    children, in one transaction.
+
+    Workstream capacity is checked once up front against the locked
+    counters; schools beyond a workstream's remaining capacity (lowest ids
+    win) are reported as errors and left inactive.
+
+    Returns:
+        {"activated": int, "errors": [{"id", "error"}]}
+    """
+    if actor.role not in [Role.ADMIN, Role.MANAGER_WORKSTREAM]:
+        raise PermissionDenied("Only Admins or Workstream Managers can activate schools.")
+
+    candidates = list(schools.filter(is_active=False).order_by("id").values("id", "work_stream_id"))
+    work_streams = {
+        work_stream.id: work_stream
+        for work_stream in WorkStream.objects.select_for_update().filter(
+            id__in={candidate["work_stream_id"] for candidate in candidates}
+        ).order_by()
+    }
+    remaining = {
+        work_stream.id: work_stream.capacity - work_stream.active_school_count
+        for work_stream in work_streams.values()
+    }
+
+    accepted = []
+    errors = []
+    for candidate in candidates:
+        work_stream = work_streams.get(candidate["work_stream_id"])
+        if work_stream is None:
+            errors.append({"id": candidate["id"], "error": "Workstream not found."})
+        elif actor.role == Role.MANAGER_WORKSTREAM and work_stream.id != actor.work_stream_id:
+            errors.append({"id": candidate["id"], "error": "Not allowed to activate schools in this workstream."})
+        elif remaining[work_stream.id] <= 0:
+            errors.append({
+                "id": candidate["id"],
+                "error": f"Workstream '{work_stream.workstream_name}' has reached its maximum capacity of {work_stream.capacity} active schools.",
+            })
+        else:
+            remaining[work_stream.id] -= 1
+            accepted.append(candidate["id"])
+
+    soft_delete_cascade_activate(model=School, ids=accepted)
+    return {"activated": len(accepted), "errors": errors}
@@ -0,0 +1,150 @@
+"""
+Set-based soft-delete cascade for the educational hierarchy:
+
+    WorkStream -> School -> AcademicYear -> ClassRoom -> CourseAllocation
+                                                      -> StudentEnrollment
+
+Each level is one UPDATE whose WHERE clause selects its rows through
+subqueries on the level above, so a cascade costs a query per level, not
+per row, and runs inside one transaction.
+
+Deactivation stamps every descendant with the root's deactivated_at.
+Activation only revives descendants whose stamp still matches their
+parent's, so rows that were switched off on their own before the cascade
+stay off.
+
+Bulk UPDATEs send no post_save; WorkStream.active_school_count is moved
+here for School rows.
+"""
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from school.models import AcademicYear, ClassRoom, School
+from student.models import StudentEnrollment
+from teacher.models import CourseAllocation
+from workstream.models import WorkStream
+from workstream.services.workstream_capacity_services import workstream_counter_adjust
+
+SOFT_DELETE_CHILDREN = {
+    WorkStream: [(School, "work_stream")],
+    School: [(AcademicYear, "school")],
+    AcademicYear: [(ClassRoom, "academic_year")],
+    ClassRoom: [(CourseAllocation, "class_room"), (StudentEnrollment, "class_room")],
+}
+
+
+def _levels(*, model, roots, child_filter, filter_scope):
+    """
+    Walk the hierarchy below roots, top-down.
+
+    Returns [(model, queryset)] where each queryset selects the rows of that
+    model to update. child_filter(fk) gives the per-direction conditions;
+    with filter_scope they also limit which rows the next level descends
+    from, otherwise the next level descends from every row under roots.
+    """
+    levels = []
+    stack = [(model, roots)]
+    while stack:
+        parent, parent_scope = stack.pop(0)
+        for child, fk in SOFT_DELETE_CHILDREN.get(parent, []):
+            scope = child.all_objects.filter(**{f"{fk}__in": parent_scope.values("pk")})
+            rows = scope.filter(**child_filter(fk))
+            levels.append((child, rows))
+            stack.append((child, rows if filter_scope else scope))
+    return levels
+
+
+def _update(*, model, rows, values) -> int:
+    if model is School:
+        moved = list(rows.values("work_stream_id").annotate(total=Count("pk")).order_by())
+    updated = rows.update(updated_at=timezone.now(), **values)
+    if model is School and updated:
+        delta = 1 if values["is_active"] else -1
+        for entry in moved:
+            workstream_counter_adjust(
+                work_stream_id=entry["work_stream_id"], field="active_school_count", delta=delta * entry["total"]
+            )
+    return updated
+
+
+def _count(counts, model, updated):
+    if updated:
+        counts[model.__name__] = counts.get(model.__name__, 0) + updated
+
+
+@transaction.atomic
+def soft_delete_deactivate_descendants(*, model, ids, actor=None, stamp=None) -> dict:
+    """
+    Deactivate every active row below the given (already deactivated) rows.
+
+    Args:
+        model: Root model (WorkStream, School, AcademicYear or ClassRoom)
+        ids: Root primary keys
+        actor: Recorded as deactivated_by
+        stamp: deactivated_at for descendants; pass the root's own value so
+            a later activation can find what this cascade switched off
+
+    Returns:
+        {model name: rows deactivated}
+    """
+    stamp = stamp or timezone.now()
+    values = {"is_active": False, "deactivated_at": stamp, "deactivated_by": actor}
+    counts = {}
+    # Top-down: each level descends from all rows under the roots, not just
+    # the ones switched off above it, so parents can be updated first.
+    for child, rows in _levels(
+        model=model,
+        roots=model.all_objects.filter(pk__in=ids),
+        child_filter=lambda fk: {"is_active": True},
+        filter_scope=False,
+    ):
+        _count(counts, child, _update(model=child, rows=rows, values=values))
+    return counts
+
+
+@transaction.atomic
+def soft_delete_activate_descendants(*, model, ids) -> dict:
+    """
+    Reactivate the rows a cascade switched off below the given (still
+    inactive) rows. Call before activating the roots themselves: matching
+    relies on the roots' deactivated_at.
+
+    Returns:
+        {model name: rows activated}
+    """
+    values = {"is_active": True, "deactivated_at": None, "deactivated_by": None}
+    levels = _levels(
+        model=model,
+        roots=model.all_objects.filter(pk__in=ids, is_active=False),
+        child_filter=lambda fk: {"is_active": False, "deactivated_at": F(f"{fk}__deactivated_at")},
+        filter_scope=True,
+    )
+    counts = {}
+    # Bottom-up: each level is found through its parent's stamp, so
+    # parents must stay untouched until their children are done.
+    for child, rows in reversed(levels):
+        _count(counts, child, _update(model=child, rows=rows, values=values))
+    return counts
+
+
+@transaction.atomic
+def soft_delete_cascade_activate(*, model, ids) -> dict:
+    """
+    Activate inactive rows of model together with the descendants their
+    deactivation cascaded to, one UPDATE per level. Capacity limits are the
+    caller's to check beforehand.
+
+    Returns:
+        {model name: rows activated}
+    """
+    root_ids = list(
+        model.all_objects.filter(pk__in=list(ids), is_active=False).order_by().values_list("pk", flat=True)
+    )
+    counts = soft_delete_activate_descendants(model=model, ids=root_ids)
+    _count(counts, model, _update(
+        model=model,
+        rows=model.all_objects.filter(pk__in=root_ids),
+        values={"is_active": True, "deactivated_at": None, "deactivated_by": None},
+    ))
+    return counts
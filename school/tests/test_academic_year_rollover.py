@@ -0,0 +1,179 @@
+from datetime import date
+from io import StringIO
+from unittest import mock
+
+from django.core.exceptions import PermissionDenied
+from django.core.management import call_command
+from django.db import IntegrityError
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from accounts.models import CustomUser
+from school.models import AcademicYear, ClassRoom, Course, Grade, School
+from school.services.academic_year_rollover_services import academic_year_rollover, academic_year_rollover_schools
+from student.models import Student, StudentEnrollment
+from teacher.models import CourseAllocation, Teacher
+from workstream.models import WorkStream
+
+
+class AcademicYearRolloverTests(APITestCase):
+    """
+    Tests for rolling a school over into the next academic year.
+    """
+    def setUp(self):
+        self.workstream = WorkStream.objects.create(workstream_name="Rollover", capacity=5)
+        self.school = School.objects.create(school_name="Rollover High", work_stream=self.workstream)
+        self.manager = CustomUser.objects.create_user(
+            email="manager@school.com", password="password123", full_name="Manager",
+            role="manager_school", school=self.school
+        )
+        self.year = AcademicYear.objects.create(
+            academic_year_code="2027/2026", school=self.school,
+            start_date=date(2026, 9, 1), end_date=date(2027, 6, 30)
+        )
+        self.grade3 = Grade.objects.create(name="Grade 3", numeric_level=3, min_age=8, max_age=9)
+        self.grade4 = Grade.objects.create(name="Grade 4", numeric_level=4, min_age=9, max_age=10)
+        self.rooms = {
+            name: ClassRoom.objects.create(
+                classroom_name=name, school=self.school, academic_year=self.year, grade=grade, capacity=25
+            )
+            for name, grade in (("3A", self.grade3), ("3B", self.grade3), ("4A", self.grade4))
+        }
+        teacher_user = CustomUser.objects.create_user(
+            email="teacher@school.com", password="password123", full_name="Teacher", role="teacher", school=self.school
+        )
+        teacher = Teacher.objects.create(user=teacher_user, hire_date=date(2020, 1, 1), employment_status="full_time")
+        course = Course.objects.create(course_code="MATH3", school=self.school, grade=self.grade3, name="Math")
+        CourseAllocation.objects.create(course=course, class_room=self.rooms["3A"], teacher=teacher, academic_year=self.year)
+
+        self.students = {}
+        for email, room in (("a@school.com", "3A"), ("b@school.com", "3B"), ("c@school.com", "4A")):
+            user = CustomUser.objects.create_user(
+                email=email, password="password123", full_name=email, role="student", school=self.school
+            )
+            student = Student.objects.create(
+                user=user, grade=self.rooms[room].grade, date_of_birth=date(2017, 1, 1), admission_date=date(2026, 9, 1)
+            )
+            StudentEnrollment.objects.create(student=student, class_room=self.rooms[room], academic_year=self.year)
+            self.students[email] = student
+
+    def test_rollover_clones_structure_and_promotes(self):
+        """Test classrooms and allocations are cloned and students move up a grade."""
+        report = academic_year_rollover(actor=self.manager, source_year=self.year)
+
+        target = AcademicYear.objects.get(school=self.school, academic_year_code="2028/2027")
+        self.assertEqual(target.start_date, date(2027, 9, 1))
+        self.assertEqual(
+            (report["classrooms_cloned"], report["allocations_cloned"], report["enrollments_completed"]), (3, 1, 3)
+        )
+        self.assertEqual((report["students_promoted"], report["students_graduated"], report["students_enrolled"]), (2, 1, 2))
+        self.assertEqual(ClassRoom.objects.get(academic_year=target, classroom_name="3A").capacity, 25)
+        self.assertTrue(CourseAllocation.objects.filter(academic_year=target, class_room__classroom_name="3A").exists())
+
+        promoted = Student.objects.get(pk=self.students["b@school.com"].pk)
+        self.assertEqual((promoted.grade, promoted.grade_level), (self.grade4, 4))
+        enrollment = StudentEnrollment.objects.get(student=promoted, academic_year=target)
+        self.assertEqual(enrollment.class_room.classroom_name, "4A")
+        self.assertEqual(enrollment.enrollment_date, date(2027, 9, 1))
+        old = StudentEnrollment.objects.get(student=promoted, academic_year=self.year)
+        self.assertEqual((old.status, old.completion_date), ("completed", date(2027, 6, 30)))
+        self.assertEqual(Student.objects.get(pk=self.students["c@school.com"].pk).enrollment_status, "graduated")
+
+    def test_api_created_enrollment_is_rolled_over(self):
+        """Test enrollments created through the API ("enrolled") are completed and promoted."""
+        user = CustomUser.objects.create_user(
+            email="d@school.com", password="password123", full_name="D", role="student", school=self.school
+        )
+        student = Student.objects.create(
+            user=user, grade=self.grade3, date_of_birth=date(2017, 1, 1), admission_date=date(2026, 9, 1)
+        )
+        self.client.force_authenticate(user=self.manager)
+        response = self.client.post(reverse("student:enrollment-create"), {
+            "student_id": student.pk, "class_room_id": self.rooms["3A"].id, "academic_year_id": self.year.id,
+        }, format="json")
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertEqual(StudentEnrollment.objects.get(student=student).status, "enrolled")
+
+        report = academic_year_rollover(actor=self.manager, source_year=self.year)
+
+        self.assertEqual((report["enrollments_completed"], report["students_promoted"]), (4, 3))
+        self.assertEqual(Student.objects.get(pk=student.pk).grade, self.grade4)
+        self.assertEqual(StudentEnrollment.objects.get(student=student, academic_year=self.year).status, "completed")
+        self.assertTrue(StudentEnrollment.objects.filter(student=student, academic_year__academic_year_code="2028/2027").exists())
+
+    def test_database_error_fails_only_that_school(self):
+        """Test a database error in one school is reported and the next school still rolls over."""
+        other = School.objects.create(school_name="Second", work_stream=self.workstream)
+        AcademicYear.objects.create(
+            academic_year_code="2027/2026", school=other, start_date=date(2026, 9, 1), end_date=date(2027, 6, 30)
+        )
+        admin = CustomUser.objects.create_user(
+            email="admin@school.com", password="password123", full_name="Admin", role="admin"
+        )
+        rollover = academic_year_rollover
+        calls = []
+
+        def failing_first(**kwargs):
+            calls.append(kwargs["source_year"].school_id)
+            if len(calls) == 1:
+                raise IntegrityError("duplicate key")
+            return rollover(**kwargs)
+
+        with mock.patch(
+            "school.services.academic_year_rollover_services.academic_year_rollover", side_effect=failing_first
+        ), self.assertLogs("school.services.academic_year_rollover_services", level="ERROR"):
+            reports = academic_year_rollover_schools(
+                actor=admin, schools=School.objects.filter(id__in=[self.school.id, other.id]), source_code="2027/2026"
+            )
+
+        self.assertEqual(len(reports), 2)
+        self.assertIn("duplicate key", reports[0]["error"])
+        self.assertNotIn("error", reports[1])
+
+    def test_dry_run_reports_without_writing(self):
+        """Test a dry run returns the same counts and leaves the data untouched."""
+        report = academic_year_rollover(actor=self.manager, source_year=self.year, dry_run=True)
+
+        self.assertEqual(report["students_promoted"], 2)
+        self.assertTrue(report["target_year_created"])
+        self.assertFalse(AcademicYear.objects.filter(academic_year_code="2028/2027").exists())
+        self.assertEqual(StudentEnrollment.objects.filter(status="active").count(), 3)
+        self.assertEqual(Student.objects.get(pk=self.students["a@school.com"].pk).grade, self.grade3)
+
+    def test_rerun_is_a_no_op(self):
+        """Test a second rollover finds nothing left to clone or promote."""
+        academic_year_rollover(actor=self.manager, source_year=self.year)
+
+        report = academic_year_rollover(actor=self.manager, source_year=self.year)
+
+        self.assertFalse(report["target_year_created"])
+        self.assertEqual(
+            (report["classrooms_cloned"], report["allocations_cloned"], report["students_promoted"]), (0, 0, 0)
+        )
+        self.assertEqual(StudentEnrollment.objects.filter(academic_year__academic_year_code="2028/2027").count(), 2)
+
+    def test_other_school_manager_is_refused(self):
+        """Test managers cannot roll over a school that is not theirs."""
+        other = School.objects.create(school_name="Elsewhere", work_stream=self.workstream)
+        outsider = CustomUser.objects.create_user(
+            email="outsider@school.com", password="password123", full_name="Outsider",
+            role="manager_school", school=other
+        )
+
+        with self.assertRaises(PermissionDenied):
+            academic_year_rollover(actor=outsider, source_year=self.year)
+
+    def test_command_reports_per_school(self):
+        """Test the command rolls each school over and summarises failures."""
+        School.objects.create(school_name="No Year", work_stream=self.workstream)
+        admin = CustomUser.objects.create_user(
+            email="admin@school.com", password="password123", full_name="Admin", role="admin"
+        )
+        out = StringIO()
+
+        call_command("rollover_academic_year", "2027/2026", "--actor", admin.email, stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("2 promoted, 1 graduated", output)
+        self.assertIn("No active academic year 2027/2026", output)
+        self.assertIn("Rolled over 1 of 2 schools, 1 failed", output)
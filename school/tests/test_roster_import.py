@@ -0,0 +1,200 @@
+import io
+from datetime import date
+from io import StringIO
+
+from django.contrib.auth.hashers import check_password
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from openpyxl import Workbook
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import CustomUser, UserSearchKey
+from guardian.models import GuardianStudentLink
+from school.models import AcademicYear, ClassRoom, Grade, School
+from school.services.roster_import_services import roster_hash_passwords, roster_import
+from student.models import Student, StudentEnrollment
+from teacher.models import Teacher
+from workstream.models import WorkStream
+
+ROSTER_HEADER = (
+    "role,email,full_name,password,date_of_birth,admission_date,grade_level,classroom,"
+    "hire_date,employment_status,students,relationship_type,is_primary\n"
+)
+
+
+class RosterImportTests(APITestCase):
+    """
+    Tests for bulk roster onboarding.
+    """
+    def setUp(self):
+        self.workstream = WorkStream.objects.create(workstream_name="North", capacity=10)
+        self.school = School.objects.create(school_name="North High", work_stream=self.workstream, capacity=500)
+        self.year = AcademicYear.objects.create(
+            academic_year_code="2026-2027", school=self.school,
+            start_date=date(2026, 9, 1), end_date=date(2027, 6, 30)
+        )
+        self.grade = Grade.objects.create(name="Grade 3", numeric_level=3, min_age=8, max_age=9)
+        self.classroom = ClassRoom.objects.create(
+            classroom_name="3A", school=self.school, academic_year=self.year, grade=self.grade
+        )
+        self.manager = CustomUser.objects.create_user(
+            email="manager@school.com", password="password123", full_name="Manager",
+            role="manager_school", school=self.school
+        )
+        CustomUser.objects.create_user(email="taken@school.com", password="password123", full_name="Taken", role="guest")
+
+    def _roster(self, *lines):
+        return io.BytesIO((ROSTER_HEADER + "\n".join(lines) + "\n").encode())
+
+    def test_import_creates_users_profiles_links_and_enrollments(self):
+        """Test valid rows become users with profiles, links and enrollments."""
+        roster = self._roster(
+            "guardian,mom@school.com,Mona Ali,secret123,,,,,,,sara@school.com,parent,yes",
+            "student,sara@school.com,Sara Ali,secret123,2018-02-01,2026-09-01,3,3A,,,,,",
+            "teacher,tim@school.com,Tim Teach,,,,,,2020-01-15,full_time,,,",
+        )
+
+        report = roster_import(
+            actor=self.manager, school=self.school, file=roster, filename="roster.csv", academic_year=self.year
+        )
+
+        self.assertEqual((report["created"], report["invalid"], report["failed"]), (3, 0, 0))
+        self.assertEqual([entry["row"] for entry in report["rows"]], [2, 3, 4])
+        sara = CustomUser.objects.get(email="sara@school.com")
+        self.assertEqual(sara.school, self.school)
+        self.assertTrue(sara.check_password("secret123"))
+        self.assertEqual(Student.objects.get(user=sara).grade, self.grade)
+        self.assertTrue(StudentEnrollment.objects.filter(student_id=sara.id, class_room=self.classroom).exists())
+        link = GuardianStudentLink.objects.get(student_id=sara.id)
+        self.assertEqual(link.guardian.user.email, "mom@school.com")
+        self.assertTrue(link.is_primary)
+        tim = Teacher.objects.get(user__email="tim@school.com")
+        self.assertFalse(tim.user.has_usable_password())
+        self.assertTrue(UserSearchKey.objects.filter(user=sara, key__startswith="sara").exists())
+        self.workstream.refresh_from_db()
+        self.assertEqual(self.workstream.active_user_count, 3)
+
+    def test_invalid_rows_are_reported_and_valid_rows_still_created(self):
+        """Test each bad row gets field errors without blocking the others."""
+        roster = self._roster(
+            "student,ok@school.com,Ok Kid,pw,2018-02-01,2026-09-01,3,,,,,,",
+            "student,ok@school.com,Dup Kid,pw,2018-02-01,2026-09-01,3,,,,,,",
+            "student,taken@school.com,Taken Kid,pw,2018-02-01,2026-09-01,9,,,,,,",
+            "guardian,dad@school.com,Dad,pw,,,,,,,ghost@school.com,uncle,",
+            "secretary,sec@school.com,Sec,pw,,,,,,,,,",
+        )
+
+        report = roster_import(actor=self.manager, school=self.school, file=roster, filename="roster.csv")
+
+        self.assertEqual((report["created"], report["invalid"]), (1, 4))
+        errors = {entry["row"]: entry["errors"] for entry in report["rows"]}
+        self.assertIn("row 2", errors[3]["email"])
+        self.assertIn("already exists", errors[4]["email"])
+        self.assertIn("grade_level", errors[4])
+        self.assertIn("students", errors[5])
+        self.assertIn("relationship_type", errors[5])
+        self.assertIn("role", errors[6])
+        self.assertFalse(CustomUser.objects.filter(email="dad@school.com").exists())
+
+    def test_dry_run_creates_nothing(self):
+        """Test dry runs validate every row but write no users."""
+        roster = self._roster("student,ok@school.com,Ok Kid,pw,2018-02-01,2026-09-01,3,,,,,,")
+
+        report = roster_import(actor=self.manager, school=self.school, file=roster, filename="roster.csv", dry_run=True)
+
+        self.assertEqual(report["rows"][0]["status"], "valid")
+        self.assertFalse(CustomUser.objects.filter(email="ok@school.com").exists())
+
+    def test_rows_beyond_workstream_capacity_are_reported(self):
+        """Test only the workstream's free seats are filled and the rest get errors."""
+        self.workstream.active_user_count = 8
+        self.workstream.save(update_fields=["active_user_count"])
+        roster = self._roster(
+            "guardian,mom@school.com,Mona Ali,pw,,,,,,,sara@school.com,parent,yes",
+            "student,sara@school.com,Sara Ali,pw,2018-02-01,2026-09-01,3,,,,,,",
+            "teacher,tim@school.com,Tim Teach,,,,,,2020-01-15,full_time,,,",
+        )
+
+        report = roster_import(actor=self.manager, school=self.school, file=roster, filename="roster.csv")
+
+        self.assertEqual((report["created"], report["invalid"]), (2, 1))
+        self.assertIn("capacity", report["rows"][0]["errors"]["detail"])
+        self.assertFalse(CustomUser.objects.filter(email="mom@school.com").exists())
+        self.workstream.refresh_from_db()
+        self.assertEqual(self.workstream.active_user_count, 10)
+
+    def test_guardian_links_school_student_regardless_of_email_case(self):
+        """Test a guardian row links an existing student whose email differs only in case."""
+        roster_import(
+            actor=self.manager, school=self.school, filename="roster.csv",
+            file=self._roster("student,Sara@School.com,Sara Ali,pw,2018-02-01,2026-09-01,3,,,,,,"),
+        )
+
+        report = roster_import(
+            actor=self.manager, school=self.school, filename="roster.csv",
+            file=self._roster("guardian,mom@school.com,Mona Ali,pw,,,,,,,sara@school.com,parent,yes"),
+        )
+
+        self.assertEqual(report["created"], 1, report["rows"])
+        link = GuardianStudentLink.objects.get(guardian__user__email="mom@school.com")
+        self.assertEqual(link.student.user.email, "Sara@School.com")
+
+    def test_xlsx_roster_with_native_dates(self):
+        """Test spreadsheet cells typed as dates and numbers are accepted."""
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["Role", "Email", "Full_Name", "Date_Of_Birth", "Admission_Date", "Grade_Level"])
+        sheet.append(["student", "xl@school.com", "Excel Kid", date(2018, 2, 1), date(2026, 9, 1), 3])
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        buffer.seek(0)
+
+        report = roster_import(actor=self.manager, school=self.school, file=buffer, filename="roster.xlsx")
+
+        self.assertEqual(report["created"], 1)
+        self.assertEqual(Student.objects.get(user__email="xl@school.com").date_of_birth, date(2018, 2, 1))
+
+    @override_settings(ROSTER_IMPORT_PARALLEL_MIN_ROWS=2)
+    def test_parallel_hashing_matches_passwords(self):
+        """Test passwords hashed in worker processes verify in this one."""
+        hashes = roster_hash_passwords(["alpha", "beta", "", "gamma"], workers=2)
+
+        self.assertTrue(check_password("alpha", hashes[0]))
+        self.assertTrue(check_password("gamma", hashes[3]))
+        self.assertTrue(hashes[2].startswith("!"))
+
+    def test_import_endpoint_returns_report(self):
+        """Test the upload endpoint runs the import and returns per-row results."""
+        self.client.force_authenticate(user=self.manager)
+        upload = SimpleUploadedFile(
+            "roster.csv", self._roster("student,api@school.com,Api Kid,pw,2018-02-01,2026-09-01,3,3A,,,,,").read()
+        )
+
+        response = self.client.post(
+            reverse("school:school-roster-import", kwargs={"school_id": self.school.id}),
+            {"file": upload, "academic_year_id": self.year.id},
+            format="multipart",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["created"], 1)
+        self.assertEqual(response.data["rows"][0]["status"], "created")
+
+    def test_command_writes_summary(self):
+        """Test the management command prints row errors and a summary."""
+        path = "/tmp/roster_import_test.csv"
+        with open(path, "wb") as roster:
+            roster.write(self._roster(
+                "student,cmd@school.com,Cmd Kid,pw,2018-02-01,2026-09-01,3,,,,,,",
+                "student,bad@school.com,Bad Kid,pw,not-a-date,2026-09-01,3,,,,,,",
+            ).read())
+        out = StringIO()
+
+        call_command("import_roster", path, "--school", str(self.school.id), "--actor", self.manager.email, stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("Row 3 (bad@school.com) invalid: date_of_birth", output)
+        self.assertIn("Imported 2 rows: 1 created, 1 invalid, 0 failed", output)
@@ -0,0 +1,106 @@
+from datetime import date
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import CustomUser
+from school.models import AcademicYear, ClassRoom, Course, Grade, School
+from school.services.school_services import activate_school, deactivate_school
+from student.models import Student, StudentEnrollment
+from teacher.models import CourseAllocation, Teacher
+from workstream.models import WorkStream
+from workstream.services.workstream_services import workstream_deactivate
+
+
+class SoftDeleteCascadeTests(APITestCase):
+    """
+    Tests for set-based cascading activation/deactivation.
+    """
+    def setUp(self):
+        self.admin = CustomUser.objects.create_user(
+            email="admin@school.com", password="password123", full_name="Admin", role="admin"
+        )
+        self.workstream = WorkStream.objects.create(workstream_name="Central", capacity=2)
+        self.school = School.objects.create(school_name="Central High", work_stream=self.workstream)
+        self.year = AcademicYear.objects.create(
+            academic_year_code="2026-2027", school=self.school,
+            start_date=date(2026, 9, 1), end_date=date(2027, 6, 30)
+        )
+        grade = Grade.objects.create(name="Grade 5", numeric_level=5, min_age=10, max_age=11)
+        self.classroom = ClassRoom.objects.create(
+            classroom_name="5A", school=self.school, academic_year=self.year, grade=grade
+        )
+        teacher_user = CustomUser.objects.create_user(
+            email="teacher@school.com", password="password123", full_name="Teacher", role="teacher", school=self.school
+        )
+        teacher = Teacher.objects.create(user=teacher_user, hire_date=date(2020, 1, 1), employment_status="full_time")
+        course = Course.objects.create(course_code="MATH5", school=self.school, grade=grade, name="Math")
+        self.allocation = CourseAllocation.objects.create(
+            course=course, class_room=self.classroom, teacher=teacher, academic_year=self.year
+        )
+        self.enrollments = []
+        for i in range(2):
+            student_user = CustomUser.objects.create_user(
+                email=f"student{i}@school.com", password="password123", full_name=f"Student {i}",
+                role="student", school=self.school
+            )
+            student = Student.objects.create(
+                user=student_user, grade=grade, date_of_birth=date(2016, 1, 1), admission_date=date(2026, 9, 1)
+            )
+            self.enrollments.append(StudentEnrollment.objects.create(
+                student=student, class_room=self.classroom, academic_year=self.year
+            ))
+
+    def _active(self, obj):
+        return type(obj).all_objects.get(pk=obj.pk).is_active
+
+    def test_school_deactivation_cascades_and_activation_restores(self):
+        """Test children follow the school, except rows switched off on their own."""
+        withdrawn = self.enrollments[1]
+        withdrawn.deactivate(user=self.admin)
+
+        deactivate_school(actor=self.admin, school=self.school)
+
+        for obj in (self.year, self.classroom, self.allocation, self.enrollments[0]):
+            self.assertFalse(self._active(obj))
+        self.workstream.refresh_from_db()
+        self.assertEqual(self.workstream.active_school_count, 0)
+
+        activate_school(actor=self.admin, school=self.school)
+
+        for obj in (self.school, self.year, self.classroom, self.allocation, self.enrollments[0]):
+            self.assertTrue(self._active(obj))
+        self.assertFalse(self._active(withdrawn))
+        self.workstream.refresh_from_db()
+        self.assertEqual(self.workstream.active_school_count, 1)
+
+    def test_workstream_deactivation_reaches_enrollments(self):
+        """Test deactivating a workstream switches off the whole tree below it."""
+        workstream_deactivate(actor=self.admin, workstream=self.workstream)
+
+        for obj in (self.school, self.year, self.classroom, self.allocation, *self.enrollments):
+            self.assertFalse(self._active(obj))
+        self.workstream.refresh_from_db()
+        self.assertEqual(self.workstream.active_school_count, 0)
+
+    def test_bulk_activation_checks_capacity_once(self):
+        """Test bulk activation fills remaining capacity and reports the rest."""
+        deactivate_school(actor=self.admin, school=self.school)
+        others = [
+            School.objects.create(school_name=name, work_stream=self.workstream, is_active=False)
+            for name in ("East", "West")
+        ]
+        self.client.force_authenticate(user=self.admin)
+
+        with self.assertNumQueries(16):
+            response = self.client.post(reverse("school:school-activate-all"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["activated"], 2)
+        self.assertEqual([error["id"] for error in response.data["errors"]], [others[1].id])
+        self.assertTrue(self._active(self.school))
+        self.assertTrue(self._active(self.enrollments[0]))
+        self.assertFalse(self._active(others[1]))
+        self.workstream.refresh_from_db()
+        self.assertEqual(self.workstream.active_school_count, 2)
@@ -44,6 +44,7 @@ from school.views.class_room_views import (
     ClassRoomActivateApi,
     ClassRoomToggleStatusApi,
 )
+from school.views.roster_import_views import SchoolRosterImportApi
 
 urlpatterns = [
     # School endpoints
@@ -53,6 +54,7 @@ urlpatterns = [
     path("school/<int:school_id>/deactivate/", SchoolDeactivateAPIView.as_view(), name="school-deactivate"),
     path("school/<int:school_id>/activate/", SchoolActivateAPIView.as_view(), name="school-activate"),
     path("school/activate-all/", SchoolBulkActivateAPIView.as_view(), name="school-activate-all"),
+    path("school/<int:school_id>/roster-import/", SchoolRosterImportApi.as_view(), name="school-roster-import"),
     
     # Academic Year endpoints
     path("academic-years/", AcademicYearListAPIView.as_view(), name="academic-year-list"),
@@ -4,7 +4,7 @@ from rest_framework import status
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample, OpenApiResponse
 
 from accounts.permissions import IsAdminOrManager, IsAdminOrManagerOrSecretary
-from accounts.pagination import PaginatedAPIMixin
+from accounts.pagination import PaginatedAPIMixin, SPARSE_FIELDSET_PARAMETERS
 from school.selectors.academic_year_selectors import get_academic_year, list_academic_years
 from school.services.academic_year_services import (
     create_academic_year,
@@ -45,6 +45,7 @@ class AcademicYearListAPIView(PaginatedAPIMixin, APIView):
                 type=int,
                 description='Page number'
             ),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={
             200: OpenApiResponse(
@@ -4,7 +4,7 @@ from rest_framework import serializers, status
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample, OpenApiResponse, extend_schema_field
 
 from accounts.permissions import IsAdminOrManager, IsAdminOrManagerOrSecretary
-from accounts.pagination import PaginatedAPIMixin
+from accounts.pagination import PaginatedAPIMixin, SPARSE_FIELDSET_PARAMETERS
 from school.models import ClassRoom
 from school.selectors.school_selectors import school_get
 from school.selectors.classroom_selectors import classroom_list, classroom_get
@@ -71,6 +71,7 @@ class ClassRoomListApi(PaginatedAPIMixin, APIView):
             OpenApiParameter(name='grade_id', type=int, description='Filter by grade'),
             OpenApiParameter(name='include_inactive', type=bool, description='Include deactivated records'),
             OpenApiParameter(name='page', type=int, description='Page number'),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={200: ClassRoomOutputSerializer(many=True)},
         examples=[
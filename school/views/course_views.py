@@ -4,7 +4,7 @@ from rest_framework import serializers, status
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample, OpenApiResponse
 
 from accounts.permissions import IsAdminOrManager
-from accounts.pagination import PaginatedAPIMixin
+from accounts.pagination import PaginatedAPIMixin, SPARSE_FIELDSET_PARAMETERS
 from school.models import Course
 from school.selectors.school_selectors import school_get
 from school.selectors.course_selectors import course_list, course_get
@@ -108,6 +108,7 @@ class CourseListApi(PaginatedAPIMixin, APIView):
             OpenApiParameter(name='course_code', type=str, description='Filter by code'),
             OpenApiParameter(name='include_inactive', type=bool, description='Include deactivated records'),
             OpenApiParameter(name='page', type=int, description='Page number'),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={200: CourseOutputSerializer(many=True)},
         examples=[
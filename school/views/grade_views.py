@@ -4,7 +4,7 @@ from rest_framework import serializers, status
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample, OpenApiResponse
 
 from accounts.permissions import IsAdminOrManager, IsAdminOrManagerOrSecretary
-from accounts.pagination import PaginatedAPIMixin
+from accounts.pagination import PaginatedAPIMixin, SPARSE_FIELDSET_PARAMETERS
 from school.models import Grade
 from school.selectors.grade_selectors import grade_list, grade_get
 from school.services.grade_services import grade_create, grade_update, grade_deactivate, grade_activate
@@ -60,6 +60,7 @@ class GradeListApi(PaginatedAPIMixin, APIView):
             OpenApiParameter(name='numeric_level', type=int, description='Filter by level'),
             OpenApiParameter(name='include_inactive', type=bool, description='Include deactivated records'),
             OpenApiParameter(name='page', type=int, description='Page number'),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={200: GradeOutputSerializer(many=True)},
         examples=[
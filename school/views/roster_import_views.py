@@ -0,0 +1,100 @@
+from django.conf import settings
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import serializers, status
+from rest_framework.exceptions import ValidationError
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample, OpenApiResponse
+
+from accounts.permissions import IsAdminOrManagerOrSecretary
+from school.models import AcademicYear
+from school.selectors.school_selectors import school_get
+from school.services.roster_import_services import roster_import
+
+
+class RosterImportInputSerializer(serializers.Serializer):
+    """Input serializer for roster uploads."""
+    file = serializers.FileField(help_text="CSV or XLSX roster")
+    academic_year_id = serializers.IntegerField(required=False, help_text="Academic year for classroom enrollments")
+    dry_run = serializers.BooleanField(default=False, help_text="Validate only; create nothing")
+
+
+class SchoolRosterImportApi(APIView):
+    """Onboard students, teachers and guardians for a school from a roster file."""
+    permission_classes = [IsAdminOrManagerOrSecretary]
+
+    @extend_schema(
+        tags=['School Management'],
+        summary='Import school roster',
+        description=(
+            'Upload a CSV or XLSX roster to create students (with classroom enrollments), '
+            'teachers and guardians (with student links) in one request. Columns: role, email, '
+            'full_name, password; students: date_of_birth, admission_date, grade_level, classroom, '
+            'student_id, gender, phone, address; teachers: hire_date, employment_status, '
+            'specialization; guardians: phone_number, students (";"-separated emails), '
+            'relationship_type, is_primary. Returns a per-row report. Rosters are limited to '
+            'ROSTER_IMPORT_MAX_ROWS rows (default 200); import larger files with the '
+            'import_roster management command.'
+        ),
+        parameters=[
+            OpenApiParameter(name='school_id', type=int, location=OpenApiParameter.PATH, description='School ID'),
+        ],
+        request={
+            'multipart/form-data': {
+                'type': 'object',
+                'properties': {
+                    'file': {'type': 'string', 'format': 'binary'},
+                    'academic_year_id': {'type': 'integer'},
+                    'dry_run': {'type': 'boolean'},
+                },
+                'required': ['file']
+            }
+        },
+        responses={
+            200: OpenApiResponse(
+                description='Import report',
+                examples=[
+                    OpenApiExample(
+                        'Import Report',
+                        value={
+                            'total': 2,
+                            'created': 1,
+                            'invalid': 1,
+                            'failed': 0,
+                            'dry_run': False,
+                            'rows': [
+                                {'row': 2, 'email': 'sara@school.com', 'role': 'student', 'status': 'created', 'user_id': 41, 'errors': {}},
+                                {'row': 3, 'email': 'omar@school.com', 'role': 'student', 'status': 'invalid', 'user_id': None,
+                                 'errors': {'grade_level': 'Grade not found.'}},
+                            ]
+                        }
+                    )
+                ]
+            ),
+            400: OpenApiResponse(description='Unreadable or oversized roster'),
+            403: OpenApiResponse(description='Permission denied'),
+        }
+    )
+    def post(self, request, school_id):
+        school = school_get(school_id=school_id, actor=request.user)
+
+        serializer = RosterImportInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        academic_year = None
+        if data.get('academic_year_id'):
+            academic_year = AcademicYear.objects.filter(id=data['academic_year_id'], school=school).first()
+            if academic_year is None:
+                raise ValidationError({"academic_year_id": "Academic year not found in this school."})
+
+        report = roster_import(
+            actor=request.user,
+            school=school,
+            file=data['file'],
+            filename=data['file'].name,
+            academic_year=academic_year,
+            dry_run=data['dry_run'],
+            workers=settings.ROSTER_IMPORT_API_HASH_WORKERS,
+            max_rows=settings.ROSTER_IMPORT_MAX_ROWS,
+        )
+        return Response(report, status=status.HTTP_200_OK)
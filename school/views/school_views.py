@@ -6,7 +6,7 @@ from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample, OpenApiResponse
 
 from accounts.permissions import IsAdminOrManagerWorkstream
-from accounts.pagination import PaginatedAPIMixin
+from accounts.pagination import PaginatedAPIMixin, SPARSE_FIELDSET_PARAMETERS
 from school.selectors.school_selectors import school_list, school_get
 from school.services.school_services import (
     UNSET,
@@ -14,6 +14,7 @@ from school.services.school_services import (
     update_school,
     deactivate_school,
     activate_school,
+    school_bulk_activate,
 )
 from workstream.models import WorkStream
 from accounts.models import Role
@@ -45,6 +46,7 @@ class SchoolListAPIView(PaginatedAPIMixin, APIView):
                 type=int,
                 description='Page number'
             ),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={
             200: OpenApiResponse(
@@ -307,8 +309,6 @@ class SchoolBulkActivateAPIView(APIView):
         from school.models import School
 
         actor = request.user
-        activated_count = 0
-        errors = []
 
         # Start with all inactive schools visible to this actor
         qs = School.all_objects.filter(is_active=False)
@@ -321,14 +321,6 @@ class SchoolBulkActivateAPIView(APIView):
         if work_stream_id:
             qs = qs.filter(work_stream_id=work_stream_id)
 
-        for school in qs:
-            try:
-                activate_school(actor=actor, school=school)
-                activated_count += 1
-            except Exception as e:
-                errors.append({'id': school.id, 'error': str(e)})
+        result = school_bulk_activate(actor=actor, schools=qs)
 
-        return Response(
-            {'activated': activated_count, 'errors': errors},
-            status=status.HTTP_200_OK
-        )
+        return Response(result, status=status.HTTP_200_OK)
@@ -0,0 +1,26 @@
+"""
+Django management command to rebuild the full-text search index.
+Usage: python manage.py rebuild_search_index [--scope message|lesson_plan|learning_material] [--batch-size N]
+"""
+
+from django.core.management.base import BaseCommand
+
+from search.models import SearchIndexEntry
+from search.services.search_index_services import search_rebuild
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index from messages, lesson plans and learning materials'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scope',
+            action='append',
+            choices=[choice for choice, _ in SearchIndexEntry.SCOPE_CHOICES],
+            help='Only rebuild this document type (repeatable; default: all)',
+        )
+        parser.add_argument('--batch-size', type=int, default=500, help='Documents read per query')
+
+    def handle(self, *args, **options):
+        indexed = search_rebuild(scopes=options['scope'], batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Indexed {indexed} documents'))
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-18 21:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchIndexEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(choices=[('message', 'Message'), ('lesson_plan', 'Lesson Plan'), ('learning_material', 'Learning Material')], help_text='Kind of document indexed', max_length=30)),
+                ('token', models.CharField(help_text='Normalised search term', max_length=64)),
+                ('document_id', models.PositiveBigIntegerField(help_text='Primary key of the indexed document')),
+                ('weight', models.PositiveIntegerField(default=1, help_text='Field-weighted term frequency')),
+            ],
+            options={
+                'verbose_name': 'Search Index Entry',
+                'verbose_name_plural': 'Search Index Entries',
+                'db_table': 'search_index',
+                'indexes': [models.Index(fields=['scope', 'document_id'], name='idx_search_document')],
+                'constraints': [models.UniqueConstraint(fields=('scope', 'token', 'document_id'), name='unique_search_posting')],
+            },
+        ),
+    ]
@@ -0,0 +1,41 @@
+from django.db import models
+
+
+class SearchIndexEntry(models.Model):
+    """
+    Inverted index posting: one row per (scope, token, document).
+    Schema: Search_index table
+
+    Documents are referenced by scope + primary key rather than a foreign
+    key so one table serves messages, lesson plans and learning materials.
+    """
+    SCOPE_MESSAGE = "message"
+    SCOPE_LESSON_PLAN = "lesson_plan"
+    SCOPE_LEARNING_MATERIAL = "learning_material"
+    SCOPE_CHOICES = [
+        (SCOPE_MESSAGE, "Message"),
+        (SCOPE_LESSON_PLAN, "Lesson Plan"),
+        (SCOPE_LEARNING_MATERIAL, "Learning Material"),
+    ]
+
+    scope = models.CharField(max_length=30, choices=SCOPE_CHOICES, help_text="Kind of document indexed")
+    token = models.CharField(max_length=64, help_text="Normalised search term")
+    document_id = models.PositiveBigIntegerField(help_text="Primary key of the indexed document")
+    weight = models.PositiveIntegerField(default=1, help_text="Field-weighted term frequency")
+
+    class Meta:
+        db_table = "search_index"
+        verbose_name = "Search Index Entry"
+        verbose_name_plural = "Search Index Entries"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["scope", "token", "document_id"],
+                name="unique_search_posting"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["scope", "document_id"], name="idx_search_document"),
+        ]
+
+    def __str__(self):
+        return f"{self.scope}:{self.token} -> {self.document_id}"
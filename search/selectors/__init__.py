@@ -0,0 +1,4 @@
+from .search_selectors import (
+    search_query,
+    search_hydrate,
+)
@@ -0,0 +1,133 @@
+"""
+Ranked queries over the search inverted index.
+
+A query is tokenised the same way documents are, postings for those
+tokens are restricted to documents the actor may read (the same role
+scoping the list endpoints use), then grouped per document and ranked by
+how many query terms matched and a field-weighted score in which rarer
+terms count for more.
+"""
+import math
+from typing import Dict, Iterable, List, Tuple
+
+from django.db.models import Case, Count, ExpressionWrapper, F, FloatField, Q, QuerySet, Sum, Value, When
+
+from accounts.models import CustomUser
+from search.models import SearchIndexEntry
+from search.services.search_index_services import SEARCH_DOCUMENTS, search_tokenize
+from teacher.selectors.learning_material_selectors import learning_material_visible_to
+from teacher.selectors.lesson_plan_selectors import lesson_plan_visible_to
+from user_messages.models import MailboxEntry
+
+MAX_QUERY_TERMS = 10
+SNIPPET_LENGTH = 160
+
+
+def _visible_document_ids(*, scope: str, actor: CustomUser) -> QuerySet:
+    """Subquery of document ids in a scope that the actor may read."""
+    if scope == SearchIndexEntry.SCOPE_MESSAGE:
+        return MailboxEntry.objects.filter(user=actor).values("message_id")
+    if scope == SearchIndexEntry.SCOPE_LESSON_PLAN:
+        return lesson_plan_visible_to(actor=actor).values("id")
+    return learning_material_visible_to(actor=actor).values("id")
+
+
+def search_query(*, actor: CustomUser, query: str, scopes: Iterable[str] = None) -> Tuple[QuerySet, List[str]]:
+    """
+    Return ranked matches for a free-text query.
+
+    Returns:
+        (rows, tokens) where rows is a QuerySet of dicts with scope,
+        document_id, matched and score, best match first, and tokens are
+        the normalised query terms.
+    """
+    tokens = list(dict.fromkeys(search_tokenize(query)))[:MAX_QUERY_TERMS]
+    scopes = [scope for scope in (scopes or SEARCH_DOCUMENTS.keys()) if scope in SEARCH_DOCUMENTS]
+    if not tokens or not scopes:
+        return SearchIndexEntry.objects.none().values("scope", "document_id"), tokens
+
+    postings = SearchIndexEntry.objects.filter(token__in=tokens).filter(
+        Q(*[
+            Q(scope=scope, document_id__in=_visible_document_ids(scope=scope, actor=actor))
+            for scope in scopes
+        ], _connector=Q.OR)
+    )
+
+    # Rarer terms weigh more: scale each term by 1 + log(max_df / df),
+    # using document frequencies read from the (scope, token) index prefix.
+    frequencies = {
+        (row["scope"], row["token"]): row["df"]
+        for row in SearchIndexEntry.objects.filter(scope__in=scopes, token__in=tokens)
+        .values("scope", "token")
+        .annotate(df=Count("id"))
+    }
+    if not frequencies:
+        return postings.none().values("scope", "document_id"), tokens
+    max_df = max(frequencies.values())
+    weighted = Case(
+        *[
+            When(
+                scope=scope,
+                token=token,
+                then=ExpressionWrapper(F("weight") * Value(1 + math.log(max_df / df)), output_field=FloatField()),
+            )
+            for (scope, token), df in frequencies.items()
+        ],
+        default=Value(0.0),
+        output_field=FloatField(),
+    )
+
+    rows = (
+        postings.values("scope", "document_id")
+        .annotate(matched=Count("id"), score=Sum(weighted))
+        .order_by("-matched", "-score", "-document_id")
+    )
+    return rows, tokens
+
+
+def _snippet(text: str, tokens: List[str]) -> str:
+    """A window of the text around the first query term, for result previews."""
+    if not text:
+        return ""
+    lowered = text.lower()
+    positions = [pos for pos in (lowered.find(token) for token in tokens) if pos >= 0]
+    start = max(min(positions) - SNIPPET_LENGTH // 4, 0) if positions else 0
+    snippet = text[start:start + SNIPPET_LENGTH].strip()
+    if start > 0:
+        snippet = f"...{snippet}"
+    if start + SNIPPET_LENGTH < len(text):
+        snippet = f"{snippet}..."
+    return snippet
+
+
+def search_hydrate(*, rows: Iterable[Dict], tokens: List[str]) -> List[Dict]:
+    """
+    Resolve a page of ranked rows to result dicts, one in_bulk query per scope.
+
+    Rows whose document has disappeared since the ranking query are skipped.
+    """
+    rows = list(rows)
+    ids_by_scope = {}
+    for row in rows:
+        ids_by_scope.setdefault(row["scope"], []).append(row["document_id"])
+
+    documents = {
+        scope: SEARCH_DOCUMENTS[scope].model.objects.in_bulk(ids)
+        for scope, ids in ids_by_scope.items()
+    }
+
+    results = []
+    for row in rows:
+        instance = documents[row["scope"]].get(row["document_id"])
+        if instance is None:
+            continue
+        document = SEARCH_DOCUMENTS[row["scope"]]
+        results.append({
+            "scope": row["scope"],
+            "id": instance.pk,
+            "title": getattr(instance, document.title_field) or "",
+            "snippet": _snippet(getattr(instance, document.body_field), tokens),
+            "matched": row["matched"],
+            "score": round(row["score"] or 0, 4),
+        })
+    return results
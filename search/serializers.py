@@ -0,0 +1,17 @@
+from rest_framework import serializers
+
+from search.models import SearchIndexEntry
+
+
+class SearchFilterSerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=200)
+    scope = serializers.MultipleChoiceField(choices=SearchIndexEntry.SCOPE_CHOICES, required=False)
+
+
+class SearchResultSerializer(serializers.Serializer):
+    scope = serializers.CharField()
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    snippet = serializers.CharField()
+    matched = serializers.IntegerField(help_text="Number of query terms found in the document")
+    score = serializers.FloatField()
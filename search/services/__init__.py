@@ -0,0 +1,6 @@
+from .search_index_services import (
+    search_index_document,
+    search_remove_document,
+    search_rebuild,
+    search_tokenize,
+)
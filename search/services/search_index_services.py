@@ -0,0 +1,159 @@
+"""
+Inverted index maintenance for full-text search.
+
+Each indexed document is tokenised into lower-cased word terms, weighted
+by the field they appear in, and stored as SearchIndexEntry postings.
+Saves update a document's postings in place (delete dropped terms, insert
+new ones, update changed weights) so the index stays current without an
+external search service and works on both MySQL and SQLite.
+"""
+import logging
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from django.db import transaction
+
+from search.models import SearchIndexEntry
+from teacher.models import LearningMaterial, LessonPlan
+from user_messages.models import Message
+
+logger = logging.getLogger(__name__)
+
+TOKEN_MAX_LENGTH = 64
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+STOP_WORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is",
+    "it", "of", "on", "or", "that", "the", "this", "to", "was", "with",
+})
+
+
+@dataclass(frozen=True)
+class SearchDocument:
+    """How a model is indexed: field weights plus the fields shown in results."""
+    model: type
+    fields: Dict[str, int]
+    title_field: str
+    body_field: str
+
+
+SEARCH_DOCUMENTS: Dict[str, SearchDocument] = {
+    SearchIndexEntry.SCOPE_MESSAGE: SearchDocument(
+        model=Message,
+        fields={"subject": 3, "body": 1},
+        title_field="subject",
+        body_field="body",
+    ),
+    SearchIndexEntry.SCOPE_LESSON_PLAN: SearchDocument(
+        model=LessonPlan,
+        fields={"title": 3, "objectives": 2, "content": 1, "resources_needed": 1},
+        title_field="title",
+        body_field="content",
+    ),
+    SearchIndexEntry.SCOPE_LEARNING_MATERIAL: SearchDocument(
+        model=LearningMaterial,
+        fields={"title": 3, "material_code": 2, "description": 1},
+        title_field="title",
+        body_field="description",
+    ),
+}
+
+
+def search_tokenize(text: Optional[str]) -> List[str]:
+    """Split text into normalised search terms, dropping stop words and single characters."""
+    if not text:
+        return []
+    return [
+        token[:TOKEN_MAX_LENGTH]
+        for token in TOKEN_RE.findall(text.lower())
+        if len(token) > 1 and token not in STOP_WORDS
+    ]
+
+
+def search_document_terms(*, scope: str, instance) -> Counter:
+    """Return token -> weight for a document, summing field weights per occurrence."""
+    terms = Counter()
+    for field, field_weight in SEARCH_DOCUMENTS[scope].fields.items():
+        for token in search_tokenize(getattr(instance, field, None)):
+            terms[token] += field_weight
+    return terms
+
+
+def search_remove_document(*, scope: str, document_id: int) -> None:
+    """Drop every posting for a document."""
+    SearchIndexEntry.objects.filter(scope=scope, document_id=document_id).delete()
+
+
+@transaction.atomic
+def search_index_document(*, scope: str, instance) -> None:
+    """
+    Bring a document's postings in line with its current content.
+
+    Inactive documents are removed from the index.
+    """
+    if not getattr(instance, "is_active", True):
+        search_remove_document(scope=scope, document_id=instance.pk)
+        return
+
+    terms = search_document_terms(scope=scope, instance=instance)
+    existing = {
+        entry.token: entry
+        for entry in SearchIndexEntry.objects.filter(scope=scope, document_id=instance.pk)
+    }
+
+    stale = [entry.id for token, entry in existing.items() if token not in terms]
+    if stale:
+        SearchIndexEntry.objects.filter(id__in=stale).delete()
+
+    changed = []
+    for token, weight in terms.items():
+        entry = existing.get(token)
+        if entry is not None and entry.weight != weight:
+            entry.weight = weight
+            changed.append(entry)
+    if changed:
+        SearchIndexEntry.objects.bulk_update(changed, ["weight"])
+
+    SearchIndexEntry.objects.bulk_create(
+        [
+            SearchIndexEntry(scope=scope, token=token, document_id=instance.pk, weight=weight)
+            for token, weight in terms.items()
+            if token not in existing
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def search_rebuild(*, scopes: Iterable[str] = None, batch_size: int = 500) -> int:
+    """
+    Rebuild postings from scratch for the given scopes (default: all).
+
+    Documents are read in primary-key order in chunks of batch_size; each
+    chunk's postings are written with one bulk INSERT.
+
+    Returns:
+        Number of documents indexed
+    """
+    indexed = 0
+    for scope in scopes or SEARCH_DOCUMENTS.keys():
+        document = SEARCH_DOCUMENTS[scope]
+        SearchIndexEntry.objects.filter(scope=scope).delete()
+
+        queryset = document.model.objects.only("pk", *document.fields.keys()).order_by("pk")
+        last_pk = 0
+        while True:
+            batch = list(queryset.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                break
+            entries = [
+                SearchIndexEntry(scope=scope, token=token, document_id=instance.pk, weight=weight)
+                for instance in batch
+                for token, weight in search_document_terms(scope=scope, instance=instance).items()
+            ]
+            SearchIndexEntry.objects.bulk_create(entries, batch_size=1000)
+            indexed += len(batch)
+            last_pk = batch[-1].pk
+
+        logger.info(f"Rebuilt search index for scope '{scope}'")
+    return indexed
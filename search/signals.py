@@ -0,0 +1,35 @@
+"""
+Keep the search inverted index in sync with indexed documents.
+
+Queryset .update()/bulk_create() bypass these receivers; run
+`manage.py rebuild_search_index` after such bulk changes.
+"""
+from django.db.models.signals import post_delete, post_save
+
+from search.services.search_index_services import (
+    SEARCH_DOCUMENTS,
+    search_index_document,
+    search_remove_document,
+)
+
+
+def _indexed_fields_changed(scope, update_fields):
+    if not update_fields:
+        return True
+    return bool(set(update_fields) & ({"is_active"} | set(SEARCH_DOCUMENTS[scope].fields)))
+
+
+def _connect(scope, model):
+    def index_document(sender, instance, update_fields=None, **kwargs):
+        if _indexed_fields_changed(scope, update_fields):
+            search_index_document(scope=scope, instance=instance)
+
+    def remove_document(sender, instance, **kwargs):
+        search_remove_document(scope=scope, document_id=instance.pk)
+
+    post_save.connect(index_document, sender=model, weak=False, dispatch_uid=f"search_index_{scope}")
+    post_delete.connect(remove_document, sender=model, weak=False, dispatch_uid=f"search_remove_{scope}")
+
+
+for _scope, _document in SEARCH_DOCUMENTS.items():
+    _connect(_scope, _document.model)
@@ -0,0 +1,120 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import Role
+from school.models import School, Course, ClassRoom, AcademicYear, Grade
+from search.models import SearchIndexEntry
+from teacher.models import Teacher, LessonPlan, LearningMaterial
+from user_messages.services.message_services import message_send
+from workstream.models import WorkStream
+
+User = get_user_model()
+
+
+class SearchTests(APITestCase):
+    """
+    Tests for the inverted search index and the ranked search API.
+    """
+    def setUp(self):
+        self.workstream = WorkStream.objects.create(workstream_name="WS1", capacity=10)
+        self.school = School.objects.create(school_name="School 1", work_stream=self.workstream)
+        self.academic_year = AcademicYear.objects.create(
+            academic_year_code="2025/2026", school=self.school, start_date="2025-09-01", end_date="2026-06-30"
+        )
+        self.grade = Grade.objects.create(name="Grade 10", numeric_level=10, min_age=15, max_age=16)
+        self.course = Course.objects.create(name="Math", course_code="MATH101", school=self.school, grade=self.grade)
+        self.classroom = ClassRoom.objects.create(
+            classroom_name="10A", school=self.school, academic_year=self.academic_year, grade=self.grade
+        )
+
+        self.teacher_user = User.objects.create_user(
+            email='teacher@example.com', full_name='Teacher One', role=Role.TEACHER, school=self.school
+        )
+        self.teacher = Teacher.objects.create(user=self.teacher_user, hire_date="2025-01-01", employment_status="full_time")
+        self.student_user = User.objects.create_user(
+            email='student@example.com', full_name='Student One', role=Role.STUDENT, school=self.school
+        )
+        self.outsider = User.objects.create_user(
+            email='outsider@example.com', full_name='Outsider', role=Role.TEACHER, school=self.school
+        )
+        self.url = reverse('search:search')
+
+    def _lesson_plan(self, title, content, is_published=True):
+        return LessonPlan.objects.create(
+            course=self.course, classroom=self.classroom, academic_year=self.academic_year,
+            teacher=self.teacher, title=title, content=content, date_planned="2026-02-01",
+            is_published=is_published
+        )
+
+    def _search(self, user, **params):
+        self.client.force_authenticate(user=user)
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data['results']
+
+    def test_save_indexes_and_reindexes_document(self):
+        """Test postings follow the document content on create, update and soft delete."""
+        plan = self._lesson_plan("Quadratic equations", "Factoring practice")
+        tokens = set(
+            SearchIndexEntry.objects.filter(scope='lesson_plan', document_id=plan.id).values_list('token', flat=True)
+        )
+        self.assertEqual(tokens, {'quadratic', 'equations', 'factoring', 'practice'})
+
+        plan.content = "Graphing parabolas"
+        plan.save()
+        tokens = set(
+            SearchIndexEntry.objects.filter(scope='lesson_plan', document_id=plan.id).values_list('token', flat=True)
+        )
+        self.assertEqual(tokens, {'quadratic', 'equations', 'graphing', 'parabolas'})
+
+        plan.deactivate()
+        self.assertFalse(SearchIndexEntry.objects.filter(scope='lesson_plan', document_id=plan.id).exists())
+
+    def test_results_are_ranked(self):
+        """Test documents matching more terms, and in heavier fields, rank first."""
+        body_only = self._lesson_plan("Weekly review", "We review fractions today")
+        title_match = self._lesson_plan("Fractions", "Introduction")
+        both_terms = self._lesson_plan("Fractions and decimals", "Converting")
+
+        results = self._search(self.teacher_user, q="fractions decimals")
+
+        self.assertEqual([r['id'] for r in results], [both_terms.id, title_match.id, body_only.id])
+        self.assertEqual(results[0]['matched'], 2)
+        self.assertIn('fractions', results[2]['snippet'])
+
+    def test_results_respect_role_scoping(self):
+        """Test unpublished plans and other users' messages are not returned."""
+        self._lesson_plan("Draft photosynthesis plan", "Notes", is_published=False)
+        published = self._lesson_plan("Photosynthesis", "Light reactions")
+        message = message_send(
+            sender=self.teacher_user, recipients=[self.student_user],
+            subject="Photosynthesis homework", body="Read chapter four"
+        )
+        LearningMaterial.objects.create(
+            material_code="BIO-1", course=self.course, classroom=self.classroom,
+            academic_year=self.academic_year, uploaded_by=self.teacher_user,
+            title="Photosynthesis slides", file_url="/files/bio.pdf"
+        )
+
+        student_hits = {(r['scope'], r['id']) for r in self._search(self.student_user, q="photosynthesis")}
+        self.assertEqual(student_hits, {('lesson_plan', published.id), ('message', message.id)})
+
+        outsider_hits = self._search(self.outsider, q="photosynthesis", scope="message")
+        self.assertEqual(outsider_hits, [])
+
+    def test_rebuild_command(self):
+        """Test the rebuild command restores postings written around the signals."""
+        plan = self._lesson_plan("Cell biology", "Mitosis")
+        SearchIndexEntry.objects.all().delete()
+
+        out = StringIO()
+        call_command('rebuild_search_index', '--scope', 'lesson_plan', stdout=out)
+
+        self.assertIn('Indexed 1 documents', out.getvalue())
+        results = self._search(self.teacher_user, q="mitosis")
+        self.assertEqual([r['id'] for r in results], [plan.id])
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from search.views import SearchApi
+
+app_name = 'search'
+
+urlpatterns = [
+    path('', SearchApi.as_view(), name='search'),
+]
@@ -0,0 +1 @@
+from .search_views import SearchApi
@@ -0,0 +1,48 @@
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from rest_framework import permissions
+from rest_framework.views import APIView
+
+from accounts.pagination import PaginatedAPIMixin, SPARSE_FIELDSET_PARAMETERS
+from search.models import SearchIndexEntry
+from search.selectors.search_selectors import search_hydrate, search_query
+from search.serializers import SearchFilterSerializer, SearchResultSerializer
+
+
+class SearchApi(PaginatedAPIMixin, APIView):
+    """
+    GET: Ranked full-text search over messages, lesson plans and learning
+    materials the current user can see.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    @extend_schema(
+        tags=['Search'],
+        summary='Search content',
+        description=(
+            'Full-text search over messages, lesson plans and learning materials, '
+            'restricted to what the current user can see and ranked by relevance.'
+        ),
+        parameters=[
+            OpenApiParameter(name='q', type=str, required=True, description='Search terms'),
+            OpenApiParameter(
+                name='scope', type=str, many=True,
+                enum=[choice for choice, _ in SearchIndexEntry.SCOPE_CHOICES],
+                description='Limit to one or more document types (repeatable)'
+            ),
+            OpenApiParameter(name='page', type=int, description='Page number'),
+            *SPARSE_FIELDSET_PARAMETERS,
+        ],
+        responses={200: SearchResultSerializer(many=True)},
+    )
+    def get(self, request):
+        filter_serializer = SearchFilterSerializer(data=request.query_params)
+        filter_serializer.is_valid(raise_exception=True)
+
+        rows, tokens = search_query(
+            actor=request.user,
+            query=filter_serializer.validated_data['q'],
+            scopes=filter_serializer.validated_data.get('scope'),
+        )
+        page = self.paginate_queryset(rows)
+        results = search_hydrate(rows=page, tokens=tokens)
+        return self.get_paginated_response(SearchResultSerializer(results, many=True).data)
@@ -6,7 +6,7 @@ from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExampl
 from accounts.serializers import MessageSerializer
 
 from accounts.permissions import IsAdminOrManager
-from accounts.pagination import PaginatedAPIMixin
+from accounts.pagination import PaginatedAPIMixin, SPARSE_FIELDSET_PARAMETERS
 from secretary.models import Secretary
 from secretary.selectors import secretary_list, secretary_get
 from secretary.services import (
@@ -73,6 +73,7 @@ class SecretaryListApi(PaginatedAPIMixin, APIView):
             OpenApiParameter(name='include_inactive', type=bool, description='Include inactive secretaries'),
             OpenApiParameter(name='is_active', type=bool, description='Filter by active status'),
             OpenApiParameter(name='page', type=int, description='Page number'),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={200: SecretaryOutputSerializer(many=True)},
         examples=[
@@ -2,11 +2,19 @@
 # Start Celery worker for background task processing
 
 echo "Starting Celery worker..."
-echo "Worker will run in this terminal and process background tasks."
+echo "Worker (with embedded beat scheduler) will run in this terminal and process background tasks."
 echo ""
 
 # Load environment variables from .env file
 export $(grep -v '^#' /home/mahmoud/Desktop/front/.env | xargs)
 
 cd /home/mahmoud/Desktop/front/EduTraker
-celery -A eduTrack worker --loglevel=info
+
+# Snapshots from the previous run would be merged into the new one
+if [ -n "$METRICS_DIR" ]; then
+  echo "Clearing metrics snapshots in $METRICS_DIR..."
+  mkdir -p "$METRICS_DIR"
+  rm -f "$METRICS_DIR"/*.json
+fi
+
+celery -A eduTrack worker -B --loglevel=info
@@ -9,9 +9,16 @@ from django.shortcuts import get_object_or_404
 from django.core.exceptions import PermissionDenied
 
 from accounts.models import CustomUser, Role
+from accounts.selectors.relation_filters import RelationFilter, apply_relation_filters, relation_exists
 from student.models import Student, StudentEnrollment
 from guardian.models import GuardianStudentLink
 
+STUDENT_RELATION_FILTERS = {
+    "academic_year_id": RelationFilter(StudentEnrollment.all_objects.all(), "student_id", "academic_year_id"),
+    "grade_id": RelationFilter(StudentEnrollment.all_objects.all(), "student_id", "class_room__grade_id"),
+    "classroom_id": RelationFilter(StudentEnrollment.all_objects.all(), "student_id", "class_room_id"),
+}
+
 
 def can_access_student(*, actor: CustomUser, student: Student) -> bool:
     """Check if actor has permission to access the given student. Returns True/False only."""
@@ -56,10 +63,7 @@ def student_list(*, filters: dict, user: CustomUser, include_inactive: bool = Fa
     elif user.role in [Role.MANAGER_SCHOOL, Role.TEACHER, Role.SECRETARY]:
         qs = qs.filter(user__school_id=user.school_id)
     elif user.role == Role.GUARDIAN:
-        linked_student_ids = GuardianStudentLink.objects.filter(
-            guardian__user=user
-        ).values_list('student_id', flat=True)
-        qs = qs.filter(user_id__in=linked_student_ids)
+        qs = qs.filter(relation_exists(GuardianStudentLink.objects.filter(guardian__user=user), link="student_id"))
     elif user.role == Role.STUDENT:
         qs = qs.filter(user_id=user.id)
     else:
@@ -69,14 +73,8 @@ def student_list(*, filters: dict, user: CustomUser, include_inactive: bool = Fa
     if school_id := filters.get("school_id"):
         qs = qs.filter(user__school_id=school_id)
 
-    if academic_year_id := filters.get("academic_year_id"):
-        qs = qs.filter(enrollments__academic_year_id=academic_year_id).distinct()
-
-    if grade_id := filters.get("grade_id"):
-        qs = qs.filter(enrollments__class_room__grade_id=grade_id).distinct()
-
-    if classroom_id := filters.get("classroom_id"):
-        qs = qs.filter(enrollments__class_room_id=classroom_id).distinct()
+    # Enrollment filters as EXISTS: a JOIN would need DISTINCT over the wide rows
+    qs = apply_relation_filters(qs, filters=filters, spec=STUDENT_RELATION_FILTERS)
 
     if current_status := filters.get("current_status"):
         qs = qs.filter(current_status=current_status)
@@ -1,6 +1,8 @@
 """
 Tests for Student API endpoints.
 """
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -81,6 +83,25 @@ class StudentApiTests(APITestCase):
         # Should return at least one student (the one created in setUp)
         self.assertGreaterEqual(len(response.data.get('results', response.data)), 1)
 
+    def test_list_students_enrollment_filters_use_exists(self):
+        """Test enrollment filters match once per student without DISTINCT."""
+        StudentEnrollment.objects.create(
+            student=self.student, class_room=self.classroom2, academic_year=self.academic_year
+        )
+        self.client.force_authenticate(user=self.manager_user)
+        url = reverse('student:student-list')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {'academic_year_id': self.academic_year.id, 'grade_id': self.grade_level.id})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 1)
+        listing = [q['sql'] for q in queries.captured_queries if 'EXISTS' in q['sql']]
+        self.assertTrue(listing)
+        self.assertFalse(any('DISTINCT' in sql for sql in listing))
+
+        response = self.client.get(url, {'classroom_id': self.classroom2.id + 100})
+        self.assertEqual(response.data['count'], 0)
+
     def test_student_enrollment_list(self):
         """Test listing student enrollments."""
         self.client.force_authenticate(user=self.manager_user)
@@ -4,7 +4,7 @@ from rest_framework import serializers, status
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample, OpenApiResponse
 
 from accounts.permissions import IsStaffUser, IsAdminOrManagerOrSecretary
-from accounts.pagination import PaginatedAPIMixin
+from accounts.pagination import PaginatedAPIMixin, SPARSE_FIELDSET_PARAMETERS
 from student.models import StudentEnrollment
 from student.selectors.enrollment_selectors import (
     student_enrollment_list,
@@ -75,6 +75,7 @@ class StudentEnrollmentListApi(PaginatedAPIMixin, APIView):
             OpenApiParameter(name='status', type=str, description='Filter by status'),
             OpenApiParameter(name='include_inactive', type=bool, description='Include deactivated records'),
             OpenApiParameter(name='page', type=int, description='Page number'),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={200: EnrollmentOutputSerializer(many=True)},
         examples=[
@@ -125,6 +126,7 @@ class EnrollmentListApi(PaginatedAPIMixin, APIView):
             OpenApiParameter(name='status', type=str, description='Filter by status'),
             OpenApiParameter(name='include_inactive', type=bool, description='Include deactivated records'),
             OpenApiParameter(name='page', type=int, description='Page number'),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={200: EnrollmentOutputSerializer(many=True)}
     )
@@ -4,14 +4,16 @@ Student management API views.
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import serializers, status
+from django.db.models import OuterRef, Subquery
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample, OpenApiResponse, extend_schema_field
 
 from accounts.serializers import MessageSerializer
 
 from accounts.models import CustomUser, Role
 from accounts.permissions import IsStaffUser, IsAdminOrManagerOrSecretary, IsStudent
-from accounts.pagination import PaginatedAPIMixin
-from student.models import Student
+from accounts.pagination import PaginatedAPIMixin, SPARSE_FIELDSET_PARAMETERS
+from accounts.projections import ProjectionSerializer
+from student.models import Student, StudentEnrollment
 from student.selectors.student_selectors import (
     student_list,
     student_get,
@@ -109,6 +111,47 @@ class StudentOutputSerializer(serializers.ModelSerializer):
         return None
 
 
+def _active_enrollment_column(column):
+    # Same row StudentOutputSerializer.get_current_grade picks with .first()
+    return Subquery(
+        StudentEnrollment.objects.filter(student_id=OuterRef('pk'), status='active').values(column)[:1]
+    )
+
+
+class StudentListSerializer(ProjectionSerializer):
+    """StudentOutputSerializer's shape, read from .values() rows for list pages."""
+    user_id = serializers.IntegerField()
+    email = serializers.EmailField(source='user.email')
+    full_name = serializers.CharField(source='user.full_name')
+    phone = serializers.CharField()
+    is_active = serializers.BooleanField(source='user.is_active')
+    school_id = serializers.IntegerField(source='user.school_id')
+    school_name = serializers.CharField(source='user.school.school_name')
+    work_stream_id = serializers.IntegerField(source='user.school.work_stream_id')
+    current_grade = serializers.SerializerMethodField()
+    date_of_birth = serializers.DateField()
+    admission_date = serializers.DateField()
+    current_status = serializers.CharField()
+    address = serializers.CharField()
+    medical_notes = serializers.CharField()
+    deactivated_at = serializers.DateTimeField(source='user.deactivated_at')
+    deactivated_by_name = serializers.CharField(source='user.deactivated_by.full_name')
+    created_at = serializers.DateTimeField()
+    updated_at = serializers.DateTimeField()
+
+    annotations = {
+        'current_grade': {
+            'current_grade_id': _active_enrollment_column('class_room__grade_id'),
+            'current_grade_name': _active_enrollment_column('class_room__grade__name'),
+        },
+    }
+
+    def get_current_grade(self, row):
+        if row['current_grade_id'] is None:
+            return None
+        return {'id': row['current_grade_id'], 'name': row['current_grade_name']}
+
+
 # =============================================================================
 # Student Views
 # =============================================================================
@@ -130,6 +173,7 @@ class StudentListApi(PaginatedAPIMixin, APIView):
             OpenApiParameter(name='search', type=str, description='Search by name or email'),
             OpenApiParameter(name='include_inactive', type=bool, description='Include deactivated records'),
             OpenApiParameter(name='page', type=int, description='Page number'),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={200: StudentOutputSerializer(many=True)},
         examples=[
@@ -162,10 +206,12 @@ class StudentListApi(PaginatedAPIMixin, APIView):
             user=request.user,
             include_inactive=filter_serializer.validated_data.get('include_inactive', False)
         )
-        page = self.paginate_queryset(students)
+        fields = self.get_sparse_fields(StudentListSerializer.field_paths())
+        rows = StudentListSerializer.project(students, fields=fields)
+        page = self.paginate_queryset(rows)
         if page is not None:
-            return self.get_paginated_response(StudentOutputSerializer(page, many=True).data)
-        return Response(StudentOutputSerializer(students, many=True).data)
+            return self.get_paginated_response(StudentListSerializer(page, many=True, fields=fields).data)
+        return Response(StudentListSerializer(rows, many=True, fields=fields).data)
 
 
 class StudentCreateApi(APIView):
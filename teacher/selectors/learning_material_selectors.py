@@ -0,0 +1,40 @@
+from django.db.models import QuerySet
+
+from teacher.models import LearningMaterial
+from accounts.models import CustomUser, Role
+
+
+def learning_material_visible_to(*, actor: CustomUser) -> QuerySet[LearningMaterial]:
+    """Return the LearningMaterials the actor may read, scoped by role."""
+    qs = LearningMaterial.objects.all()
+
+    if actor.role == Role.ADMIN:
+        pass  # Admin sees all
+    elif actor.role == Role.MANAGER_WORKSTREAM:
+        qs = qs.filter(academic_year__school__work_stream_id=actor.work_stream_id)
+    elif actor.role in [Role.MANAGER_SCHOOL, Role.TEACHER]:
+        qs = qs.filter(academic_year__school_id=actor.school_id)
+    elif actor.role == Role.STUDENT:
+        # Students see materials for classrooms they are enrolled in
+        from student.models import StudentEnrollment
+        enrolled_classroom_ids = StudentEnrollment.objects.filter(
+            student__user_id=actor.id,
+            status__in=['active', 'enrolled']
+        ).values_list('class_room_id', flat=True)
+        qs = qs.filter(classroom_id__in=enrolled_classroom_ids)
+    elif actor.role == Role.GUARDIAN:
+        # Guardians see materials for their children's classrooms
+        from guardian.models import GuardianStudentLink
+        from student.models import StudentEnrollment
+        child_ids = GuardianStudentLink.objects.filter(
+            guardian__user_id=actor.id
+        ).values_list('student_id', flat=True)
+        enrolled_classroom_ids = StudentEnrollment.objects.filter(
+            student_id__in=child_ids,
+            status__in=['active', 'enrolled']
+        ).values_list('class_room_id', flat=True)
+        qs = qs.filter(classroom_id__in=enrolled_classroom_ids)
+    else:
+        qs = qs.none()
+
+    return qs
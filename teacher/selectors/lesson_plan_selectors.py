@@ -0,0 +1,14 @@
+from django.db.models import QuerySet
+
+from teacher.models import LessonPlan
+from accounts.models import CustomUser, Role
+
+
+def lesson_plan_visible_to(*, actor: CustomUser) -> QuerySet[LessonPlan]:
+    """Return the LessonPlans the actor may read; drafts are limited to teachers and admins."""
+    qs = LessonPlan.objects.all()
+
+    if actor.role not in [Role.TEACHER, Role.ADMIN]:
+        qs = qs.filter(is_published=True)
+
+    return qs
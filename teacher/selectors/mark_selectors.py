@@ -4,6 +4,7 @@ from rest_framework.exceptions import PermissionDenied
 
 from teacher.models import Mark
 from accounts.models import CustomUser, Role
+from accounts.selectors.relation_filters import relation_exists
 from guardian.models import GuardianStudentLink
 
 
@@ -26,10 +27,9 @@ def mark_list(*, actor: CustomUser, filters: dict, include_inactive: bool = Fals
     elif actor.role == Role.STUDENT:
         qs = qs.filter(student__user_id=actor.id)
     elif actor.role == Role.GUARDIAN:
-        linked_student_ids = GuardianStudentLink.objects.filter(
-            guardian_id=actor.id
-        ).values_list('student_id', flat=True)
-        qs = qs.filter(student_id__in=linked_student_ids)
+        qs = qs.filter(relation_exists(
+            GuardianStudentLink.objects.filter(guardian_id=actor.id), link="student_id", outer="student_id"
+        ))
     else:
         qs = qs.none()
 
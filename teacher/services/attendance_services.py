@@ -6,7 +6,7 @@ from typing import Optional
 from teacher.models import Attendance, Teacher, CourseAllocation
 from student.models import Student
 from accounts.models import CustomUser, Role
-from notifications.services.notification_services import notification_create
+from notifications.services.notification_services import notification_coalesce
 from accounts.policies.user_policies import _has_school_access
 from reports.utils import log_activity
 
@@ -44,13 +44,15 @@ def attendance_record(
         attendance.save()
         
     # Create notification for the student
-    notification_create(
+    notification_coalesce(
         recipient=student.user,
         sender=teacher.user,
         title="Attendance Marked",
-        message=f"Attendance for {course_allocation.student_group} on {date} has been marked as {status}.",
+        message=f"Attendance for {course_allocation.course.name} on {date} has been marked as {status}.",
         notification_type="attendance_marked",
-        action_url=f"/student/attendance"
+        action_url=f"/student/attendance",
+        related_object_type="Attendance",
+        related_object_id=attendance.id,
     )
 
     log_activity(
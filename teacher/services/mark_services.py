@@ -7,7 +7,7 @@ from decimal import Decimal
 from teacher.models import Mark, Teacher, Assignment
 from student.models import Student
 from accounts.models import CustomUser, Role
-from notifications.services.notification_services import notification_create
+from notifications.services.notification_services import notification_coalesce
 from reports.utils import log_activity
 
 
@@ -45,13 +45,15 @@ def mark_record(
         mark.save()
         
     # Create notification for the student
-    notification_create(
+    notification_coalesce(
         recipient=student.user,
         sender=teacher.user,
         title="Grade Posted",
         message=f"A new grade has been posted for {assignment.title}. Score: {score}/{assignment.full_mark}",
         notification_type="grade_posted",
-        action_url=f"/student/results"
+        action_url=f"/student/results",
+        related_object_type="Mark",
+        related_object_id=mark.id,
     )
 
     log_activity(
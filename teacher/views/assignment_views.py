@@ -4,7 +4,7 @@ from rest_framework import status
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample, OpenApiResponse
 
 from accounts.permissions import IsTeacher, IsAdminOrManagerOrSecretary, IsStudent
-from accounts.pagination import PaginatedAPIMixin
+from accounts.pagination import PaginatedAPIMixin, SPARSE_FIELDSET_PARAMETERS
 from teacher.serializers.assignment_serializers import (
     AssignmentInputSerializer,
     AssignmentUpdateSerializer,
@@ -40,6 +40,7 @@ class AssignmentListCreateApi(PaginatedAPIMixin, APIView):
             OpenApiParameter(name='title', type=str, description='Filter by title'),
             OpenApiParameter(name='include_inactive', type=bool, description='Include deactivated records'),
             OpenApiParameter(name='page', type=int, description='Page number'),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={200: AssignmentOutputSerializer(many=True)},
         examples=[
@@ -4,7 +4,8 @@ from rest_framework import serializers, status
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample, OpenApiResponse
 
 from accounts.permissions import IsTeacher, IsAdminOrManagerOrSecretary, IsStaffUser, IsStudent, IsGuardian
-from accounts.pagination import PaginatedAPIMixin
+from accounts.pagination import PaginatedAPIMixin, SPARSE_FIELDSET_PARAMETERS
+from accounts.projections import ProjectionSerializer
 from teacher.models import Attendance
 from teacher.selectors.attendance_selectors import attendance_list, attendance_get
 from teacher.services.attendance_services import (
@@ -58,6 +59,26 @@ class AttendanceOutputSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'recorded_by_name', 'deactivated_by_name', 'created_at', 'updated_at']
 
 
+class AttendanceListSerializer(ProjectionSerializer):
+    """AttendanceOutputSerializer's shape, read from .values() rows for list pages."""
+    id = serializers.IntegerField()
+    student_id = serializers.IntegerField()
+    student_name = serializers.CharField(source='student.user.full_name')
+    course_allocation = serializers.IntegerField(source='course_allocation_id')
+    course_name = serializers.CharField(source='course_allocation.course.name')
+    date = serializers.DateField()
+    status = serializers.CharField()
+    note = serializers.CharField()
+    recorded_by = serializers.IntegerField(source='recorded_by_id')
+    recorded_by_name = serializers.CharField(source='recorded_by.user.full_name')
+    is_active = serializers.BooleanField()
+    deactivated_at = serializers.DateTimeField()
+    deactivated_by = serializers.IntegerField(source='deactivated_by_id')
+    deactivated_by_name = serializers.CharField(source='deactivated_by.full_name')
+    created_at = serializers.DateTimeField()
+    updated_at = serializers.DateTimeField()
+
+
 # =============================================================================
 # Attendance Views
 # =============================================================================
@@ -77,6 +98,7 @@ class AttendanceListApi(PaginatedAPIMixin, APIView):
             OpenApiParameter(name='status', type=str),
             OpenApiParameter(name='include_inactive', type=bool),
             OpenApiParameter(name='page', type=int, description='Page number'),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={200: AttendanceOutputSerializer(many=True)}
     )
@@ -88,10 +110,12 @@ class AttendanceListApi(PaginatedAPIMixin, APIView):
             filters=filter_serializer.validated_data,
             include_inactive=filter_serializer.validated_data.get('include_inactive', False)
         )
-        page = self.paginate_queryset(records)
+        fields = self.get_sparse_fields(AttendanceListSerializer.field_paths())
+        rows = AttendanceListSerializer.project(records, fields=fields)
+        page = self.paginate_queryset(rows)
         if page is not None:
-            return self.get_paginated_response(AttendanceOutputSerializer(page, many=True).data)
-        return Response(AttendanceOutputSerializer(records, many=True).data)
+            return self.get_paginated_response(AttendanceListSerializer(page, many=True, fields=fields).data)
+        return Response(AttendanceListSerializer(rows, many=True, fields=fields).data)
 
 
 class AttendanceRecordApi(APIView):
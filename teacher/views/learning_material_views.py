@@ -5,6 +5,7 @@ from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExampl
 
 from teacher.models import LearningMaterial
 from teacher.serializers import LearningMaterialSerializer
+from teacher.selectors.learning_material_selectors import learning_material_visible_to
 from accounts.models import Role
 from reports.utils import log_activity
 
@@ -54,40 +55,7 @@ class LearningMaterialListCreateView(generics.ListCreateAPIView):
     search_fields = ['title', 'description']
 
     def get_queryset(self):
-        user = self.request.user
-        queryset = LearningMaterial.objects.all()
-        
-        # Role-based filtering
-        if user.role == Role.ADMIN:
-            pass # Admin sees all
-        elif user.role == Role.MANAGER_WORKSTREAM:
-            queryset = queryset.filter(academic_year__school__work_stream_id=user.work_stream_id)
-        elif user.role == Role.MANAGER_SCHOOL:
-            queryset = queryset.filter(academic_year__school_id=user.school_id)
-        elif user.role == Role.TEACHER:
-            # Teachers see materials in their school, or maybe only their own?
-            # SRS says "Teachers can upload... List filtered...". Let's assume they see all in school.
-            queryset = queryset.filter(academic_year__school_id=user.school_id)
-        elif user.role == Role.STUDENT:
-            # Students see materials for classrooms they are enrolled in
-            from student.models import StudentEnrollment
-            enrolled_classroom_ids = StudentEnrollment.objects.filter(
-                student__user_id=user.id,
-                status__in=['active', 'enrolled']
-            ).values_list('class_room_id', flat=True)
-            queryset = queryset.filter(classroom_id__in=enrolled_classroom_ids)
-        elif user.role == Role.GUARDIAN:
-            # Guardians see materials for their children's classrooms
-            from guardian.models import GuardianStudent
-            child_ids = GuardianStudent.objects.filter(guardian__user_id=user.id).values_list('student_id', flat=True)
-            from student.models import StudentEnrollment
-            enrolled_classroom_ids = StudentEnrollment.objects.filter(
-                student_id__in=child_ids,
-                status__in=['active', 'enrolled']
-            ).values_list('class_room_id', flat=True)
-            queryset = queryset.filter(classroom_id__in=enrolled_classroom_ids)
-        else:
-            queryset = queryset.none()
+        queryset = learning_material_visible_to(actor=self.request.user)
 
         # Manual filtering since django_filters is not available
         course_id = self.request.query_params.get('course')
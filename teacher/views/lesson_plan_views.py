@@ -2,6 +2,7 @@ from rest_framework import generics, permissions, filters
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from ..models import LessonPlan, Teacher
 from ..serializers.lesson_plan_serializers import LessonPlanSerializer
+from ..selectors.lesson_plan_selectors import lesson_plan_visible_to
 from accounts.models import Role
 from reports.utils import log_activity
 
@@ -34,7 +35,8 @@ class LessonPlanListCreateAPIView(generics.ListCreateAPIView):
     search_fields = ['title', 'content', 'objectives']
 
     def get_queryset(self):
-        queryset = LessonPlan.objects.all()
+        # Non-teachers/admins can only see published lesson plans
+        queryset = lesson_plan_visible_to(actor=self.request.user)
         course_id = self.request.query_params.get('course')
         classroom_id = self.request.query_params.get('classroom')
         academic_year_id = self.request.query_params.get('academic_year')
@@ -46,10 +48,6 @@ class LessonPlanListCreateAPIView(generics.ListCreateAPIView):
         if academic_year_id:
             queryset = queryset.filter(academic_year_id=academic_year_id)
 
-        # Non-teachers/admins can only see published lesson plans
-        if self.request.user.role not in [Role.TEACHER, Role.ADMIN]:
-            queryset = queryset.filter(is_published=True)
-        
         return queryset
 
     def perform_create(self, serializer):
@@ -5,7 +5,8 @@ from decimal import Decimal
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample, OpenApiResponse
 
 from accounts.permissions import IsTeacher, IsAdminOrManagerOrSecretary, IsStaffUser, IsStudent, IsGuardian
-from accounts.pagination import PaginatedAPIMixin
+from accounts.pagination import PaginatedAPIMixin, SPARSE_FIELDSET_PARAMETERS
+from accounts.projections import ProjectionSerializer
 from teacher.models import Mark, Assignment
 from teacher.selectors.mark_selectors import mark_list, mark_get
 from teacher.services.mark_services import (
@@ -54,6 +55,26 @@ class MarkOutputSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'graded_by_name', 'graded_at', 'deactivated_by_name', 'created_at', 'updated_at']
 
 
+class MarkListSerializer(ProjectionSerializer):
+    """MarkOutputSerializer's shape, read from .values() rows for list pages."""
+    id = serializers.IntegerField()
+    student_id = serializers.IntegerField()
+    student_name = serializers.CharField(source='student.user.full_name')
+    assignment = serializers.IntegerField(source='assignment_id')
+    assignment_title = serializers.CharField(source='assignment.title')
+    score = serializers.DecimalField(max_digits=5, decimal_places=2)
+    feedback = serializers.CharField()
+    graded_by = serializers.IntegerField(source='graded_by_id')
+    graded_by_name = serializers.CharField(source='graded_by.user.full_name')
+    graded_at = serializers.DateTimeField()
+    is_active = serializers.BooleanField()
+    deactivated_at = serializers.DateTimeField()
+    deactivated_by = serializers.IntegerField(source='deactivated_by_id')
+    deactivated_by_name = serializers.CharField(source='deactivated_by.full_name')
+    created_at = serializers.DateTimeField()
+    updated_at = serializers.DateTimeField()
+
+
 # =============================================================================
 # Mark Views
 # =============================================================================
@@ -70,6 +91,7 @@ class MarkListApi(PaginatedAPIMixin, APIView):
             OpenApiParameter(name='assignment_id', type=int),
             OpenApiParameter(name='include_inactive', type=bool),
             OpenApiParameter(name='page', type=int, description='Page number'),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={200: MarkOutputSerializer(many=True)}
     )
@@ -81,10 +103,12 @@ class MarkListApi(PaginatedAPIMixin, APIView):
             filters=filter_serializer.validated_data,
             include_inactive=filter_serializer.validated_data.get('include_inactive', False)
         )
-        page = self.paginate_queryset(records)
+        fields = self.get_sparse_fields(MarkListSerializer.field_paths())
+        rows = MarkListSerializer.project(records, fields=fields)
+        page = self.paginate_queryset(rows)
         if page is not None:
-            return self.get_paginated_response(MarkOutputSerializer(page, many=True).data)
-        return Response(MarkOutputSerializer(records, many=True).data)
+            return self.get_paginated_response(MarkListSerializer(page, many=True, fields=fields).data)
+        return Response(MarkListSerializer(rows, many=True, fields=fields).data)
 
 
 class MarkRecordApi(APIView):
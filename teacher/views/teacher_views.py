@@ -5,7 +5,8 @@ from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExampl
 from django.db.models import Q
 
 from accounts.permissions import IsAdminOrManagerOrSecretary
-from accounts.pagination import PaginatedAPIMixin
+from accounts.pagination import PaginatedAPIMixin, SPARSE_FIELDSET_PARAMETERS
+from accounts.projections import ProjectionSerializer
 from accounts.models import Role, CustomUser
 from school.models import School
 from teacher.models import Teacher
@@ -70,6 +71,28 @@ class TeacherOutputSerializer(serializers.ModelSerializer):
         read_only_fields = ['user_id', 'created_at', 'updated_at', 'deactivated_by_name']
 
 
+class TeacherListSerializer(ProjectionSerializer):
+    """TeacherOutputSerializer's shape, read from .values() rows for list pages."""
+    user_id = serializers.IntegerField()
+    email = serializers.EmailField(source='user.email')
+    full_name = serializers.CharField(source='user.full_name')
+    is_active = serializers.BooleanField(source='user.is_active')
+    school_id = serializers.IntegerField(source='user.school_id')
+    school_name = serializers.CharField(source='user.school.school_name')
+    specialization = serializers.CharField()
+    hire_date = serializers.DateField()
+    employment_status = serializers.CharField()
+    highest_degree = serializers.CharField()
+    years_of_experience = serializers.IntegerField()
+    office_location = serializers.CharField()
+    deactivated_at = serializers.DateTimeField(source='user.deactivated_at')
+    deactivated_by_name = serializers.CharField(source='user.deactivated_by.full_name')
+    created_at = serializers.DateTimeField()
+    updated_at = serializers.DateTimeField()
+    date_joined = serializers.DateTimeField(source='user.date_joined')
+    last_login = serializers.DateTimeField(source='user.last_login')
+
+
 class TeacherActivityLogFilterSerializer(serializers.Serializer):
     """Filter serializer for teacher activity logs."""
     school_id = serializers.IntegerField(required=False, help_text="Filter by school")
@@ -123,6 +146,7 @@ class TeacherListApi(PaginatedAPIMixin, APIView):
             OpenApiParameter(name='search', type=str, description='Search by name or email'),
             OpenApiParameter(name='include_inactive', type=bool, description='Include deactivated records'),
             OpenApiParameter(name='page', type=int, description='Page number'),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={200: TeacherOutputSerializer(many=True)},
         examples=[
@@ -151,10 +175,12 @@ class TeacherListApi(PaginatedAPIMixin, APIView):
             user=request.user,
             include_inactive=filter_serializer.validated_data.get('include_inactive', False)
         )
-        page = self.paginate_queryset(teachers)
+        fields = self.get_sparse_fields(TeacherListSerializer.field_paths())
+        rows = TeacherListSerializer.project(teachers, fields=fields)
+        page = self.paginate_queryset(rows)
         if page is not None:
-            return self.get_paginated_response(TeacherOutputSerializer(page, many=True).data)
-        return Response(TeacherOutputSerializer(teachers, many=True).data)
+            return self.get_paginated_response(TeacherListSerializer(page, many=True, fields=fields).data)
+        return Response(TeacherListSerializer(rows, many=True, fields=fields).data)
 
 
 class TeacherCreateApi(APIView):
@@ -390,6 +416,7 @@ class TeacherActivityLogListApi(PaginatedAPIMixin, APIView):
             OpenApiParameter(name='action_type', type=str, description='Filter by action type'),
             OpenApiParameter(name='entity_type', type=str, description='Filter by entity type'),
             OpenApiParameter(name='page', type=int, description='Page number'),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={200: TeacherActivityLogOutputSerializer(many=True)}
     )
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.8 on 2026-10-18 21:29
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+BATCH_SIZE = 1000
+
+
+def backfill_mailbox(apps, schema_editor):
+    Message = apps.get_model("user_messages", "Message")
+    MessageReceipt = apps.get_model("user_messages", "MessageReceipt")
+    MailboxEntry = apps.get_model("user_messages", "MailboxEntry")
+
+    entries = []
+    for message_id, sender_id, sent_at in (
+        Message.objects.filter(is_active=True)
+        .values_list("id", "sender_id", "sent_at")
+        .iterator(chunk_size=BATCH_SIZE)
+    ):
+        entries.append(MailboxEntry(user_id=sender_id, message_id=message_id, folder="sent", sent_at=sent_at))
+        if len(entries) >= BATCH_SIZE:
+            MailboxEntry.objects.bulk_create(entries, ignore_conflicts=True)
+            entries = []
+
+    for message_id, recipient_id, sent_at in (
+        MessageReceipt.objects.filter(is_active=True, is_deleted=False, message__is_active=True)
+        .values_list("message_id", "recipient_id", "message__sent_at")
+        .iterator(chunk_size=BATCH_SIZE)
+    ):
+        entries.append(MailboxEntry(user_id=recipient_id, message_id=message_id, folder="inbox", sent_at=sent_at))
+        if len(entries) >= BATCH_SIZE:
+            MailboxEntry.objects.bulk_create(entries, ignore_conflicts=True)
+            entries = []
+
+    MailboxEntry.objects.bulk_create(entries, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_messages', '0002_alter_message_recipients'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MailboxEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('folder', models.CharField(choices=[('inbox', 'Inbox'), ('sent', 'Sent')], help_text='Mailbox folder', max_length=10)),
+                ('sent_at', models.DateTimeField(help_text='Copy of Message.sent_at for index ordering')),
+                ('message', models.ForeignKey(help_text='The message', on_delete=django.db.models.deletion.CASCADE, related_name='mailbox_entries', to='user_messages.message')),
+                ('user', models.ForeignKey(help_text='Mailbox owner', on_delete=django.db.models.deletion.CASCADE, related_name='mailbox_entries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Mailbox Entry',
+                'verbose_name_plural': 'Mailbox Entries',
+                'db_table': 'message_mailbox',
+                'indexes': [models.Index(fields=['user', 'folder', '-sent_at'], name='idx_mailbox_user_folder'), models.Index(fields=['user', '-sent_at'], name='idx_mailbox_user_sent')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'message'), name='unique_mailbox_user_message')],
+            },
+        ),
+        migrations.RunPython(backfill_mailbox, reverse_code=migrations.RunPython.noop),
+    ]
@@ -0,0 +1,95 @@
+# Generated by Django 5.2.8 on 2026-10-18 21:31
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+BATCH_SIZE = 1000
+
+
+def backfill_conversations(apps, schema_editor):
+    Message = apps.get_model("user_messages", "Message")
+    MessageReceipt = apps.get_model("user_messages", "MessageReceipt")
+    ConversationSummary = apps.get_model("user_messages", "ConversationSummary")
+
+    def flush(thread_id, summaries):
+        ConversationSummary.objects.bulk_create(
+            [
+                ConversationSummary(
+                    user_id=user_id,
+                    thread_id=thread_id,
+                    latest_message_id=state["latest_message_id"],
+                    last_message_at=state["last_message_at"],
+                    participant_ids=sorted(state["participants"]),
+                    unread_count=state["unread"],
+                )
+                for user_id, state in summaries.items()
+            ],
+            batch_size=BATCH_SIZE,
+        )
+
+    messages = (
+        Message.objects.filter(is_active=True)
+        .order_by("thread_id", "sent_at", "id")
+        .values_list("id", "thread_id", "sender_id", "sent_at")
+    )
+    current_thread, summaries = None, {}
+    for offset in range(0, messages.count(), BATCH_SIZE):
+        chunk = list(messages[offset:offset + BATCH_SIZE])
+        receipts = {}
+        for message_id, recipient_id, is_read in MessageReceipt.objects.filter(
+            message_id__in=[row[0] for row in chunk], is_active=True, is_deleted=False
+        ).values_list("message_id", "recipient_id", "is_read"):
+            receipts.setdefault(message_id, []).append((recipient_id, is_read))
+
+        for message_id, thread_id, sender_id, sent_at in chunk:
+            if thread_id != current_thread:
+                if current_thread is not None:
+                    flush(current_thread, summaries)
+                current_thread, summaries = thread_id, {}
+
+            message_receipts = receipts.get(message_id, [])
+            members = {sender_id} | {recipient_id for recipient_id, _ in message_receipts}
+            for user_id in members:
+                state = summaries.setdefault(user_id, {"participants": set(), "unread": 0})
+                state["latest_message_id"] = message_id
+                state["last_message_at"] = sent_at
+                state["participants"] |= members
+            for recipient_id, is_read in message_receipts:
+                if recipient_id != sender_id and not is_read:
+                    summaries[recipient_id]["unread"] += 1
+
+    if current_thread is not None:
+        flush(current_thread, summaries)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_messages', '0003_message_mailbox'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ConversationSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('thread_id', models.UUIDField(help_text='Thread identifier')),
+                ('last_message_at', models.DateTimeField(help_text='sent_at of the latest message')),
+                ('participant_ids', models.JSONField(default=list, help_text='IDs of all senders and recipients the user has seen in the thread')),
+                ('unread_count', models.PositiveIntegerField(default=0, help_text='Unread messages for the user')),
+                ('latest_message', models.ForeignKey(help_text='Most recent message in the thread visible to the user', on_delete=django.db.models.deletion.CASCADE, related_name='+', to='user_messages.message')),
+                ('user', models.ForeignKey(help_text='Conversation owner', on_delete=django.db.models.deletion.CASCADE, related_name='conversation_summaries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Conversation Summary',
+                'verbose_name_plural': 'Conversation Summaries',
+                'db_table': 'message_conversations',
+                'indexes': [models.Index(fields=['user', '-last_message_at'], name='idx_conversation_user_last')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'thread_id'), name='unique_conversation_user_thread')],
+            },
+        ),
+        migrations.RunPython(backfill_conversations, reverse_code=migrations.RunPython.noop),
+    ]
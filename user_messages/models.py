@@ -102,3 +102,101 @@ class MessageReceipt(SoftDeleteModel):
     def __str__(self):
         status = "Read" if self.is_read else "Unread"
         return f"{self.message.subject} -> {self.recipient.email} ({status})"
+
+
+class MailboxEntry(models.Model):
+    """
+    Denormalised per-user mailbox index: one row per (user, message).
+    The folder is "sent" for the sender and "inbox" for each recipient, and
+    sent_at is copied from the message so folder listings are a single
+    range scan on (user, folder, sent_at). Rows are maintained by
+    user_messages.signals and the message services, not edited directly.
+    """
+    FOLDER_INBOX = "inbox"
+    FOLDER_SENT = "sent"
+    FOLDER_CHOICES = [
+        (FOLDER_INBOX, "Inbox"),
+        (FOLDER_SENT, "Sent"),
+    ]
+
+    user = models.ForeignKey(
+        'accounts.CustomUser',
+        on_delete=models.CASCADE,
+        related_name="mailbox_entries",
+        help_text="Mailbox owner"
+    )
+    message = models.ForeignKey(
+        Message,
+        on_delete=models.CASCADE,
+        related_name="mailbox_entries",
+        help_text="The message"
+    )
+    folder = models.CharField(
+        max_length=10,
+        choices=FOLDER_CHOICES,
+        help_text="Mailbox folder"
+    )
+    sent_at = models.DateTimeField(help_text="Copy of Message.sent_at for index ordering")
+
+    class Meta:
+        db_table = "message_mailbox"
+        verbose_name = "Mailbox Entry"
+        verbose_name_plural = "Mailbox Entries"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "message"],
+                name="unique_mailbox_user_message"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["user", "folder", "-sent_at"], name="idx_mailbox_user_folder"),
+            models.Index(fields=["user", "-sent_at"], name="idx_mailbox_user_sent"),
+        ]
+
+    def __str__(self):
+        return f"{self.user.email} [{self.folder}] message #{self.message_id}"
+
+
+class ConversationSummary(models.Model):
+    """
+    Per-user summary of a message thread for the conversation sidebar:
+    latest visible message, participants and the user's unread count.
+    Maintained incrementally on send, read and delete by the message
+    services, so the sidebar is one range scan on (user, last_message_at).
+    """
+    user = models.ForeignKey(
+        'accounts.CustomUser',
+        on_delete=models.CASCADE,
+        related_name="conversation_summaries",
+        help_text="Conversation owner"
+    )
+    thread_id = models.UUIDField(help_text="Thread identifier")
+    latest_message = models.ForeignKey(
+        Message,
+        on_delete=models.CASCADE,
+        related_name="+",
+        help_text="Most recent message in the thread visible to the user"
+    )
+    last_message_at = models.DateTimeField(help_text="sent_at of the latest message")
+    participant_ids = models.JSONField(
+        default=list,
+        help_text="IDs of all senders and recipients the user has seen in the thread"
+    )
+    unread_count = models.PositiveIntegerField(default=0, help_text="Unread messages for the user")
+
+    class Meta:
+        db_table = "message_conversations"
+        verbose_name = "Conversation Summary"
+        verbose_name_plural = "Conversation Summaries"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "thread_id"],
+                name="unique_conversation_user_thread"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["user", "-last_message_at"], name="idx_conversation_user_last"),
+        ]
+
+    def __str__(self):
+        return f"{self.user.email} thread {self.thread_id} ({self.unread_count} unread)"
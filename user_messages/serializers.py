@@ -1,25 +1,13 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
-from .models import Message, MessageReceipt
-from notifications.services.notification_services import notification_create
-from accounts.models import Role
+from django.db.models import prefetch_related_objects
+from drf_spectacular.utils import extend_schema_field
+from .models import ConversationSummary, Message, MessageReceipt
+from accounts.selectors.user_selectors import user_resolve_emails
+from user_messages.services.message_services import message_send
 
 User = get_user_model()
 
-
-def _notification_action_url_for_role(role: str) -> str:
-    """Return the communication route matching recipient role."""
-    role_routes = {
-        Role.ADMIN: "/super-admin/communication",
-        Role.MANAGER_WORKSTREAM: "/workstream/communication",
-        Role.MANAGER_SCHOOL: "/school-manager/communication",
-        Role.SECRETARY: "/secretary/communication",
-        Role.TEACHER: "/teacher/communication",
-        Role.STUDENT: "/student/communication",
-        Role.GUARDIAN: "/guardian/communication",
-    }
-    return role_routes.get(role, "/login/portal")
-
 class UserMinimalSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
@@ -35,10 +23,9 @@ class MessageReceiptSerializer(serializers.ModelSerializer):
 
 class MessageSerializer(serializers.ModelSerializer):
     sender = UserMinimalSerializer(read_only=True)
-    # Input: IDs of recipients
-    recipient_ids = serializers.PrimaryKeyRelatedField(
-        many=True,
-        queryset=User.objects.all(),
+    # Input: IDs of recipients (resolved in one query in validate())
+    recipient_ids = serializers.ListField(
+        child=serializers.IntegerField(),
         write_only=True,
         source='recipients',
         required=False,
@@ -71,64 +58,46 @@ class MessageSerializer(serializers.ModelSerializer):
         ref_name = 'UserMessageSerializer'
 
     def validate(self, data):
-        recipients_by_id = data.get('recipients', [])
+        recipient_ids = data.get('recipients', [])
         recipient_emails = data.get('recipient_emails', [])
         
-        if not recipients_by_id and not recipient_emails:
+        if not recipient_ids and not recipient_emails:
             raise serializers.ValidationError(
                 "You must provide at least one recipient via 'recipient_ids' or 'recipient_emails'."
             )
-        return data
 
-    def create(self, validated_data):
-        from notifications.models import Notification
+        users_by_id = User.objects.in_bulk(set(recipient_ids))
+        missing_ids = [pk for pk in recipient_ids if pk not in users_by_id]
+        if missing_ids:
+            raise serializers.ValidationError(
+                {"recipient_ids": [f'Invalid pk "{pk}" - object does not exist.' for pk in missing_ids]}
+            )
+        recipients = list({pk: users_by_id[pk] for pk in recipient_ids}.values())
 
-        recipients = list(validated_data.pop('recipients', []))
-        recipient_emails = validated_data.pop('recipient_emails', [])
-        
-        # Resolve emails to users
+        # Resolve emails to users, merging and avoiding duplicates
         if recipient_emails:
-            email_users = User.objects.filter(email__in=recipient_emails, is_active=True)
-            found_emails = set(email_users.values_list('email', flat=True))
-            not_found = [e for e in recipient_emails if e.lower() not in {f.lower() for f in found_emails}]
+            email_users, not_found = user_resolve_emails(emails=recipient_emails)
             if not_found:
                 raise serializers.ValidationError(
                     {"recipient_emails": [f"No active user found with email: {e}" for e in not_found]}
                 )
-            # Merge, avoiding duplicates
             existing_ids = {u.id for u in recipients}
-            for u in email_users:
-                if u.id not in existing_ids:
-                    recipients.append(u)
-                    existing_ids.add(u.id)
+            recipients.extend(u for u in email_users if u.id not in existing_ids)
+
+        data['recipients'] = recipients
+        return data
+
+    def create(self, validated_data):
+        validated_data.pop('recipient_emails', None)
+        recipients = validated_data.pop('recipients', [])
 
         # Assign sender from context if not present
         request = self.context.get('request')
         if request and hasattr(request, 'user'):
             validated_data['sender'] = request.user
-            
-        # IMPORTANT: Threading Logic
-        # If this is a reply (has parent_message), it MUST share the same thread_id
-        parent = validated_data.get('parent_message')
-        if parent:
-            validated_data['thread_id'] = parent.thread_id
-            
-        message = Message.objects.create(**validated_data)
-        
-        # Create receipts and notifications
-        for user in recipients:
-            MessageReceipt.objects.create(message=message, recipient=user)
-            
-            # Create a system notification for the recipient
-            notification_create(
-                recipient=user,
-                sender=message.sender,
-                title="New Message",
-                message=f"You have received a new message from {message.sender.full_name}: {message.subject}",
-                notification_type="message_received",
-                action_url=_notification_action_url_for_role(user.role)
-            )
-            
+
+        message = message_send(recipients=recipients, **validated_data)
+        prefetch_related_objects([message], 'receipts__recipient')
         return message
 
 class MessageDetailSerializer(MessageSerializer):
@@ -138,5 +107,32 @@ class MessageDetailSerializer(MessageSerializer):
     class Meta(MessageSerializer.Meta):
         ref_name = 'UserMessageDetailSerializer'
 
+class ConversationMessageSerializer(serializers.ModelSerializer):
+    sender = UserMinimalSerializer(read_only=True)
+
+    class Meta:
+        model = Message
+        fields = ['id', 'sender', 'subject', 'body', 'sent_at']
+        ref_name = 'UserMessageConversationMessage'
+
+class ConversationSummarySerializer(serializers.ModelSerializer):
+    """
+    Conversation sidebar entry. Participants are resolved from the
+    'participants' context dict (id -> user) filled once per page.
+    """
+    latest_message = ConversationMessageSerializer(read_only=True)
+    participants = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ConversationSummary
+        fields = ['thread_id', 'latest_message', 'last_message_at', 'participants', 'unread_count']
+
+    @extend_schema_field(UserMinimalSerializer(many=True))
+    def get_participants(self, obj):
+        users = self.context.get('participants', {})
+        return UserMinimalSerializer(
+            [users[pk] for pk in obj.participant_ids if pk in users], many=True
+        ).data
+
 class MarkReadSerializer(serializers.Serializer):
     is_read = serializers.BooleanField(default=True)
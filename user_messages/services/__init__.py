@@ -0,0 +1,11 @@
+from .message_services import (
+    message_send,
+    message_deliver,
+    mailbox_add_sent,
+    mailbox_add_inbox,
+    mailbox_remove,
+    mailbox_rebuild,
+    conversation_record_message,
+    conversation_rebuild,
+    message_mark_read,
+)
@@ -0,0 +1,291 @@
+"""
+Message services for sending messages and fanning out receipts.
+
+Receipts and recipient notifications are written set-based with chunked
+bulk inserts. Sends with more recipients than
+settings.MESSAGE_ASYNC_RECIPIENT_THRESHOLD are fanned out by a Celery task
+after the message row commits.
+"""
+import logging
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Prefetch
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+
+from accounts.models import CustomUser, Role
+from notifications.services.notification_services import notification_bulk_create
+from user_messages.models import ConversationSummary, MailboxEntry, Message, MessageReceipt
+
+logger = logging.getLogger(__name__)
+
+
+def _notification_action_url_for_role(role: str) -> str:
+    """Return the communication route matching recipient role."""
+    role_routes = {
+        Role.ADMIN: "/super-admin/communication",
+        Role.MANAGER_WORKSTREAM: "/workstream/communication",
+        Role.MANAGER_SCHOOL: "/school-manager/communication",
+        Role.SECRETARY: "/secretary/communication",
+        Role.TEACHER: "/teacher/communication",
+        Role.STUDENT: "/student/communication",
+        Role.GUARDIAN: "/guardian/communication",
+    }
+    return role_routes.get(role, "/login/portal")
+
+
+def mailbox_add_sent(*, message: Message) -> None:
+    """Index a message in its sender's "sent" folder."""
+    MailboxEntry.objects.bulk_create(
+        [MailboxEntry(user_id=message.sender_id, message=message,
+                      folder=MailboxEntry.FOLDER_SENT, sent_at=message.sent_at)],
+        ignore_conflicts=True,
+    )
+
+
+def mailbox_add_inbox(*, message: Message, recipient_ids: List[int]) -> None:
+    """
+    Index a message in the recipients' "inbox" folders. A sender messaging
+    themselves keeps only the "sent" entry.
+    """
+    MailboxEntry.objects.bulk_create(
+        [
+            MailboxEntry(user_id=recipient_id, message=message,
+                         folder=MailboxEntry.FOLDER_INBOX, sent_at=message.sent_at)
+            for recipient_id in recipient_ids
+            if recipient_id != message.sender_id
+        ],
+        batch_size=settings.MESSAGE_BULK_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+
+
+def mailbox_remove(*, message: Message, user_id: Optional[int] = None) -> None:
+    """Drop a message from one user's mailbox, or from every mailbox."""
+    entries = MailboxEntry.objects.filter(message=message)
+    if user_id is not None:
+        entries = entries.filter(user_id=user_id)
+    entries.delete()
+
+
+def mailbox_rebuild(*, message: Message) -> None:
+    """Re-index a message for its sender and every recipient that kept it."""
+    mailbox_add_sent(message=message)
+    mailbox_add_inbox(
+        message=message,
+        recipient_ids=list(
+            MessageReceipt.objects.filter(message=message, is_deleted=False)
+            .values_list('recipient_id', flat=True)
+        ),
+    )
+
+
+@transaction.atomic
+def conversation_record_message(*, message: Message, recipient_ids: List[int]) -> None:
+    """
+    Fold a sent message into the thread summaries of its sender and the
+    given recipients; each recipient's unread count goes up by one.
+    Re-recording the sender alone is harmless, so this can run once per
+    message and again per receipt.
+    """
+    recipient_ids = [pk for pk in dict.fromkeys(recipient_ids) if pk != message.sender_id]
+    member_ids = [message.sender_id, *recipient_ids]
+    participants = set(member_ids)
+
+    existing = {
+        summary.user_id: summary
+        for summary in ConversationSummary.objects.select_for_update().filter(
+            thread_id=message.thread_id, user_id__in=member_ids
+        )
+    }
+    to_create, to_update = [], []
+    for user_id in member_ids:
+        unread = 1 if user_id in recipient_ids else 0
+        summary = existing.get(user_id)
+        if summary is None:
+            to_create.append(ConversationSummary(
+                user_id=user_id,
+                thread_id=message.thread_id,
+                latest_message=message,
+                last_message_at=message.sent_at,
+                participant_ids=sorted(participants),
+                unread_count=unread,
+            ))
+            continue
+
+        if message.sent_at >= summary.last_message_at:
+            summary.latest_message = message
+            summary.last_message_at = message.sent_at
+        summary.participant_ids = sorted(set(summary.participant_ids) | participants)
+        summary.unread_count += unread
+        to_update.append(summary)
+
+    ConversationSummary.objects.bulk_create(
+        to_create, batch_size=settings.MESSAGE_BULK_BATCH_SIZE, ignore_conflicts=True
+    )
+    ConversationSummary.objects.bulk_update(
+        to_update,
+        ['latest_message', 'last_message_at', 'participant_ids', 'unread_count'],
+        batch_size=settings.MESSAGE_BULK_BATCH_SIZE,
+    )
+
+
+@transaction.atomic
+def conversation_rebuild(*, thread_id, user_ids: Optional[List[int]] = None) -> None:
+    """
+    Recompute thread summaries from the messages still visible, for every
+    member of the thread or only `user_ids`. Used after deletes, where the
+    latest message or unread count cannot be adjusted incrementally.
+    """
+    messages = Message.objects.filter(thread_id=thread_id).order_by('sent_at', 'id').prefetch_related(
+        Prefetch('receipts', queryset=MessageReceipt.objects.filter(is_deleted=False))
+    )
+
+    summaries = {}
+    for message in messages:
+        receipts = list(message.receipts.all())
+        members = {message.sender_id} | {receipt.recipient_id for receipt in receipts}
+        for user_id in members:
+            if user_ids is not None and user_id not in user_ids:
+                continue
+            summary = summaries.setdefault(user_id, ConversationSummary(
+                user_id=user_id, thread_id=thread_id, participant_ids=[], unread_count=0
+            ))
+            summary.latest_message = message
+            summary.last_message_at = message.sent_at
+            summary.participant_ids = sorted(set(summary.participant_ids) | members)
+        for receipt in receipts:
+            if receipt.recipient_id in summaries and receipt.recipient_id != message.sender_id and not receipt.is_read:
+                summaries[receipt.recipient_id].unread_count += 1
+
+    stale = ConversationSummary.objects.filter(thread_id=thread_id)
+    if user_ids is not None:
+        stale = stale.filter(user_id__in=user_ids)
+    stale.delete()
+    ConversationSummary.objects.bulk_create(summaries.values(), batch_size=settings.MESSAGE_BULK_BATCH_SIZE)
+
+
+@transaction.atomic
+def message_mark_read(*, message_id: int, user: CustomUser) -> MessageReceipt:
+    """
+    Mark a received message as read and update the thread's unread count.
+    
+    Raises:
+        Http404: If the user has no receipt for this message
+    """
+    receipt = get_object_or_404(
+        MessageReceipt.objects.select_related('message'),
+        message_id=message_id,
+        recipient=user,
+    )
+    if not receipt.is_read:
+        receipt.is_read = True
+        receipt.read_at = timezone.now()
+        receipt.save()
+        ConversationSummary.objects.filter(
+            user=user, thread_id=receipt.message.thread_id, unread_count__gt=0
+        ).update(unread_count=F('unread_count') - 1)
+    return receipt
+
+
+@transaction.atomic
+def message_deliver(*, message: Message, recipients: List[CustomUser]) -> int:
+    """
+    Create receipts and "New Message" notifications for the recipients.
+    
+    Safe to re-run for the same message: recipients that already have a
+    receipt are skipped, so a retried task does not notify twice.
+    
+    Returns:
+        Number of recipients delivered to
+    """
+    already_delivered = set(
+        MessageReceipt.all_objects.filter(
+            message=message,
+            recipient_id__in=[user.id for user in recipients],
+        ).values_list('recipient_id', flat=True)
+    )
+    pending = [user for user in recipients if user.id not in already_delivered]
+    if not pending:
+        return 0
+
+    MessageReceipt.objects.bulk_create(
+        [MessageReceipt(message=message, recipient=user) for user in pending],
+        batch_size=settings.MESSAGE_BULK_BATCH_SIZE,
+    )
+    # bulk_create bypasses the post_save handler that indexes single receipts
+    mailbox_add_inbox(message=message, recipient_ids=[user.id for user in pending])
+    conversation_record_message(message=message, recipient_ids=[user.id for user in pending])
+    notification_bulk_create(
+        recipients=pending,
+        sender=message.sender,
+        title="New Message",
+        message=f"You have received a new message from {message.sender.full_name}: {message.subject}",
+        notification_type="message_received",
+        action_url=lambda user: _notification_action_url_for_role(user.role),
+    )
+    return len(pending)
+
+
+def message_deliver_async(*, message: Message, recipient_ids: List[int]) -> None:
+    """
+    Queue delivery of a message once the current transaction commits,
+    falling back to delivering inline when the broker is unavailable.
+    """
+    from user_messages.tasks import deliver_message
+
+    def _queue():
+        try:
+            deliver_message.delay(message_id=message.id, recipient_ids=recipient_ids)
+        except Exception:
+            logger.exception("Could not queue message delivery; delivering inline")
+            recipients = list(CustomUser.objects.filter(id__in=recipient_ids).only('id', 'role'))
+            message_deliver(message=message, recipients=recipients)
+
+    transaction.on_commit(_queue)
+
+
+@transaction.atomic
+def message_send(
+    *,
+    sender: CustomUser,
+    recipients: List[CustomUser],
+    body: str,
+    subject: str = "",
+    attachments: Optional[list] = None,
+    parent_message: Optional[Message] = None,
+    is_draft: bool = False,
+    thread_id=None
+) -> Message:
+    """
+    Send a message to the given recipients.
+    
+    A reply always joins its parent's thread. Large sends are delivered in
+    the background; the returned message may not have receipts yet.
+    
+    Returns:
+        Created Message object
+    """
+    if parent_message is not None:
+        thread_id = parent_message.thread_id
+
+    message_fields = {
+        'sender': sender,
+        'subject': subject,
+        'body': body,
+        'attachments': attachments or [],
+        'parent_message': parent_message,
+        'is_draft': is_draft,
+    }
+    if thread_id is not None:
+        message_fields['thread_id'] = thread_id
+    message = Message.objects.create(**message_fields)
+
+    if len(recipients) > settings.MESSAGE_ASYNC_RECIPIENT_THRESHOLD:
+        message_deliver_async(message=message, recipient_ids=[user.id for user in recipients])
+    else:
+        message_deliver(message=message, recipients=recipients)
+
+    return message
@@ -0,0 +1,49 @@
+"""
+Keep the denormalised MailboxEntry index and ConversationSummary rows in
+sync with messages and receipts.
+
+Bulk writes in user_messages.services.message_services index their rows
+explicitly because bulk_create() does not send post_save.
+"""
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from user_messages.models import Message, MessageReceipt
+from user_messages.services.message_services import (
+    conversation_rebuild,
+    conversation_record_message,
+    mailbox_add_inbox,
+    mailbox_add_sent,
+    mailbox_rebuild,
+    mailbox_remove,
+)
+
+
+@receiver(post_save, sender=Message)
+def index_message(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        if instance.is_active:
+            mailbox_add_sent(message=instance)
+            conversation_record_message(message=instance, recipient_ids=[])
+        return
+
+    # Soft delete / restore via SoftDeleteModel.deactivate()/activate()
+    if update_fields and 'is_active' in update_fields:
+        if instance.is_active:
+            mailbox_rebuild(message=instance)
+        else:
+            mailbox_remove(message=instance)
+        conversation_rebuild(thread_id=instance.thread_id)
+
+
+@receiver(post_save, sender=MessageReceipt)
+def index_receipt(sender, instance, created, **kwargs):
+    if instance.is_deleted or not instance.is_active:
+        if not created:
+            mailbox_remove(message=instance.message, user_id=instance.recipient_id)
+            conversation_rebuild(thread_id=instance.message.thread_id, user_ids=[instance.recipient_id])
+        return
+
+    if created:
+        mailbox_add_inbox(message=instance.message, recipient_ids=[instance.recipient_id])
+        conversation_record_message(message=instance.message, recipient_ids=[instance.recipient_id])
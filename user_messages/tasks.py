@@ -0,0 +1,33 @@
+from celery import shared_task
+import logging
+
+from accounts.models import CustomUser
+from user_messages.models import Message
+from user_messages.services.message_services import message_deliver
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def deliver_message(self, message_id, recipient_ids):
+    """
+    Fan out receipts and notifications for a large multi-recipient message.
+
+    Args:
+        message_id: ID of the message being delivered
+        recipient_ids: IDs of the recipient users
+    """
+    try:
+        message = Message.all_objects.select_related('sender').get(id=message_id)
+    except Message.DoesNotExist:
+        logger.error(f"Message with ID {message_id} not found for delivery")
+        return
+
+    try:
+        recipients = list(CustomUser.objects.filter(id__in=recipient_ids).only('id', 'role'))
+        delivered = message_deliver(message=message, recipients=recipients)
+        logger.info(f"Delivered message {message_id} to {delivered} recipients")
+        return delivered
+    except Exception as e:
+        logger.error(f"Error delivering message {message_id}: {str(e)}")
+        raise self.retry(exc=e)
@@ -0,0 +1,127 @@
+import math
+from unittest.mock import patch
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import AutoField
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from notifications.models import Notification
+from user_messages.models import ConversationSummary, MailboxEntry, Message, MessageReceipt
+from user_messages.tasks import deliver_message
+
+User = get_user_model()
+
+
+class MessageBulkSendTests(APITestCase):
+    """
+    Tests for set-based multi-recipient message sending.
+    """
+    def setUp(self):
+        self.sender = User.objects.create_user(
+            email='teacher@example.com',
+            password='password123',
+            full_name='Teacher One',
+            role='teacher'
+        )
+        self.students = [
+            User.objects.create_user(
+                email=f'student{i}@example.com',
+                full_name=f'Student {i}',
+                role='student'
+            )
+            for i in range(40)
+        ]
+        self.url = reverse('user_messages:message-list-create')
+        self.client.force_authenticate(user=self.sender)
+
+    def _send(self, recipients):
+        return self.client.post(self.url, {
+            'subject': 'Class update',
+            'body': 'Homework is due Friday.',
+            'recipient_ids': [user.id for user in recipients],
+        }, format='json')
+
+    def _insert_batches(self, recipients):
+        """
+        INSERT statements the per-recipient bulk_create calls split into,
+        given the backend's own cap on rows per statement (SQLite limits
+        query parameters, so wide tables take fewer rows per INSERT).
+        """
+        batches = 0
+        for model, rows, batch_size in [
+            (MessageReceipt, recipients, settings.MESSAGE_BULK_BATCH_SIZE),
+            (MailboxEntry, recipients, settings.MESSAGE_BULK_BATCH_SIZE),
+            (ConversationSummary, recipients, settings.MESSAGE_BULK_BATCH_SIZE),
+            (Notification, recipients, settings.NOTIFICATION_BULK_BATCH_SIZE),
+        ]:
+            fields = [field for field in model._meta.concrete_fields if not isinstance(field, AutoField)]
+            max_rows = max(connection.ops.bulk_batch_size(fields, [None] * rows), 1)
+            batches += math.ceil(rows / min(batch_size, max_rows))
+        return batches
+
+    def test_query_count_does_not_grow_with_recipients(self):
+        """Test sending to 40 recipients costs the same queries as sending to 2, INSERT batches aside."""
+        with CaptureQueriesContext(connection) as small:
+            self.assertEqual(self._send(self.students[:2]).status_code, status.HTTP_201_CREATED)
+        with CaptureQueriesContext(connection) as large:
+            response = self._send(self.students)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            len(large.captured_queries) - len(small.captured_queries),
+            self._insert_batches(40) - self._insert_batches(2),
+        )
+        self.assertEqual(len(response.data['receipts']), 40)
+        self.assertEqual(
+            Notification.objects.filter(notification_type='message_received').count(), 42
+        )
+        self.assertTrue(
+            Notification.objects.filter(
+                recipient=self.students[0], action_url='/student/communication'
+            ).exists()
+        )
+
+    def test_recipient_emails_resolved_case_insensitively(self):
+        """Test recipient emails match regardless of case."""
+        response = self.client.post(self.url, {
+            'subject': 'Hi',
+            'body': 'Hello',
+            'recipient_emails': ['STUDENT1@example.com', 'student2@EXAMPLE.com'],
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        recipient_ids = set(MessageReceipt.objects.values_list('recipient_id', flat=True))
+        self.assertEqual(recipient_ids, {self.students[1].id, self.students[2].id})
+
+    def test_unknown_recipient_email_rejected(self):
+        """Test an unknown email is reported and nothing is sent."""
+        response = self.client.post(self.url, {
+            'body': 'Hello',
+            'recipient_emails': ['nobody@example.com'],
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('recipient_emails', response.data)
+        self.assertEqual(Message.objects.count(), 0)
+
+    @override_settings(MESSAGE_ASYNC_RECIPIENT_THRESHOLD=10)
+    def test_large_send_is_delivered_by_task(self):
+        """Test sends above the threshold fan out after commit via Celery."""
+        with patch.object(deliver_message, 'delay', side_effect=lambda **kw: deliver_message.apply(kwargs=kw)) as delay:
+            with self.captureOnCommitCallbacks(execute=False) as callbacks:
+                response = self._send(self.students)
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            self.assertEqual(MessageReceipt.objects.count(), 0)
+
+            for callback in callbacks:
+                callback()
+
+        delay.assert_called_once()
+        self.assertEqual(MessageReceipt.objects.count(), 40)
+        self.assertEqual(Notification.objects.count(), 40)
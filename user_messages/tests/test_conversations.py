@@ -0,0 +1,69 @@
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from user_messages.models import ConversationSummary
+
+User = get_user_model()
+
+
+class ConversationListTests(APITestCase):
+    """
+    Tests for the conversation summary endpoint.
+    """
+    def setUp(self):
+        self.teacher = User.objects.create_user(email='teacher@example.com', full_name='Teacher', role='teacher')
+        self.student = User.objects.create_user(email='student@example.com', full_name='Student', role='student')
+        self.guardian = User.objects.create_user(email='guardian@example.com', full_name='Guardian', role='guardian')
+        self.messages_url = reverse('user_messages:message-list-create')
+        self.url = reverse('user_messages:conversation-list')
+
+    def _send(self, sender, recipients, body, parent=None):
+        self.client.force_authenticate(user=sender)
+        payload = {'body': body, 'recipient_ids': [user.id for user in recipients]}
+        if parent:
+            payload['parent_message'] = parent
+        response = self.client.post(self.messages_url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data
+
+    def test_summary_tracks_latest_message_and_unread(self):
+        """Test a thread shows its latest message, participants and unread count."""
+        first = self._send(self.teacher, [self.student], 'Hello')
+        self._send(self.teacher, [self.student], 'Are you there?', parent=first['id'])
+        self._send(self.guardian, [self.student], 'Separate thread')
+
+        self.client.force_authenticate(user=self.student)
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data['results']
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0]['latest_message']['body'], 'Separate thread')
+        teacher_thread = results[1]
+        self.assertEqual(str(teacher_thread['thread_id']), str(first['thread_id']))
+        self.assertEqual(teacher_thread['latest_message']['body'], 'Are you there?')
+        self.assertEqual(teacher_thread['unread_count'], 2)
+        self.assertEqual(
+            {p['email'] for p in teacher_thread['participants']},
+            {'teacher@example.com', 'student@example.com'}
+        )
+
+    def test_read_and_delete_update_summary(self):
+        """Test marking read decrements and deleting recomputes the summary."""
+        first = self._send(self.teacher, [self.student], 'Hello')
+        second = self._send(self.teacher, [self.student], 'Follow up', parent=first['id'])
+
+        self.client.force_authenticate(user=self.student)
+        self.client.post(reverse('user_messages:message-mark-read', kwargs={'pk': first['id']}))
+        summary = ConversationSummary.objects.get(user=self.student)
+        self.assertEqual(summary.unread_count, 1)
+
+        self.client.delete(reverse('user_messages:message-detail', kwargs={'pk': second['id']}))
+        summary = ConversationSummary.objects.get(user=self.student)
+        self.assertEqual(summary.unread_count, 0)
+        self.assertEqual(summary.latest_message_id, first['id'])
+
+        # The sender still sees their own latest message
+        self.assertEqual(ConversationSummary.objects.get(user=self.teacher).latest_message_id, second['id'])
@@ -0,0 +1,90 @@
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from user_messages.models import MailboxEntry, Message, MessageReceipt
+
+User = get_user_model()
+
+
+class MailboxIndexTests(APITestCase):
+    """
+    Tests for the per-user mailbox index behind the message list.
+    """
+    def setUp(self):
+        self.teacher = User.objects.create_user(email='teacher@example.com', full_name='Teacher', role='teacher')
+        self.student = User.objects.create_user(email='student@example.com', full_name='Student', role='student')
+        self.guardian = User.objects.create_user(email='guardian@example.com', full_name='Guardian', role='guardian')
+        self.list_url = reverse('user_messages:message-list-create')
+
+    def _message(self, sender, recipients, subject):
+        message = Message.objects.create(sender=sender, subject=subject, body='Body')
+        for recipient in recipients:
+            MessageReceipt.objects.create(message=message, recipient=recipient)
+        return message
+
+    def test_send_indexes_sender_and_recipients(self):
+        """Test sending via the API creates sent and inbox entries."""
+        self.client.force_authenticate(user=self.teacher)
+        response = self.client.post(self.list_url, {
+            'body': 'Hello',
+            'recipient_ids': [self.student.id, self.guardian.id],
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        folders = dict(MailboxEntry.objects.values_list('user_id', 'folder'))
+        self.assertEqual(folders, {
+            self.teacher.id: MailboxEntry.FOLDER_SENT,
+            self.student.id: MailboxEntry.FOLDER_INBOX,
+            self.guardian.id: MailboxEntry.FOLDER_INBOX,
+        })
+
+    def test_delete_removes_entries(self):
+        """Test recipient delete drops their entry and sender delete drops all."""
+        message = self._message(self.teacher, [self.student, self.guardian], 'Hi')
+        url = reverse('user_messages:message-detail', kwargs={'pk': message.id})
+
+        self.client.force_authenticate(user=self.student)
+        self.client.delete(url)
+        self.assertFalse(MailboxEntry.objects.filter(user=self.student).exists())
+        self.assertTrue(MailboxEntry.objects.filter(user=self.guardian).exists())
+
+        self.client.force_authenticate(user=self.teacher)
+        self.client.delete(url)
+        self.assertFalse(MailboxEntry.objects.filter(message=message).exists())
+
+    def test_peer_filter(self):
+        """Test peer_id limits the list to messages exchanged with that user."""
+        self._message(self.teacher, [self.student], 'To student')
+        self._message(self.guardian, [self.teacher], 'From guardian')
+
+        self.client.force_authenticate(user=self.teacher)
+        response = self.client.get(self.list_url, {'peer_id': self.guardian.id})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([m['subject'] for m in response.data['results']], ['From guardian'])
+
+    def test_peer_filter_keeps_messages_the_peer_deleted(self):
+        """Test peer_id still lists a message after the peer deleted their copy."""
+        message = self._message(self.teacher, [self.student], 'To student')
+        self.client.force_authenticate(user=self.student)
+        self.client.delete(reverse('user_messages:message-detail', kwargs={'pk': message.id}))
+
+        self.client.force_authenticate(user=self.teacher)
+        response = self.client.get(self.list_url, {'peer_id': self.student.id})
+
+        self.assertEqual([m['subject'] for m in response.data['results']], ['To student'])
+
+    def test_keyset_pagination(self):
+        """Test the list pages with a cursor, newest first, without overlap."""
+        for i in range(3):
+            self._message(self.teacher, [self.student], f'Message {i}')
+
+        self.client.force_authenticate(user=self.student)
+        first = self.client.get(self.list_url, {'page_size': 2})
+        second = self.client.get(first.data['next'])
+
+        subjects = [m['subject'] for m in first.data['results'] + second.data['results']]
+        self.assertEqual(subjects, ['Message 2', 'Message 1', 'Message 0'])
+        self.assertIsNone(second.data['next'])
@@ -4,6 +4,7 @@ from user_messages.views import (
     MessageDetailView,
     MessageThreadView,
     MessageReadView,
+    ConversationListView,
     CommunicationUserSearchApi
 )
 
@@ -12,6 +13,7 @@ app_name = 'user_messages'
 urlpatterns = [
     path('', MessageListCreateView.as_view(), name='message-list-create'),
     path('search/', CommunicationUserSearchApi.as_view(), name='user-search'),
+    path('conversations/', ConversationListView.as_view(), name='conversation-list'),
     path('<int:pk>/', MessageDetailView.as_view(), name='message-detail'),
     path('<int:pk>/read/', MessageReadView.as_view(), name='message-mark-read'),
     path('threads/<uuid:thread_id>/', MessageThreadView.as_view(), name='message-thread'),
@@ -3,5 +3,6 @@ from .message_views import (
     MessageDetailView,
     MessageThreadView,
     MessageReadView,
+    ConversationListView,
     CommunicationUserSearchApi
 )
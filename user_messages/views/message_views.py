@@ -1,22 +1,35 @@
 from rest_framework import generics, permissions, status
+from rest_framework.pagination import CursorPagination
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample, OpenApiResponse
 from django.db import models
-from django.utils import timezone
 from django.shortcuts import get_object_or_404
-from ..models import Message, MessageReceipt
+from ..models import ConversationSummary, MailboxEntry, Message, MessageReceipt
 from ..serializers import MessageSerializer, MessageDetailSerializer
-from ..serializers import UserMinimalSerializer
-from accounts.selectors.user_selectors import user_list
+from ..serializers import UserMinimalSerializer, ConversationSummarySerializer
+from ..services.message_services import message_mark_read
+from accounts.selectors.user_selectors import user_list, user_search_cached_ids
 from accounts.models import CustomUser, Role
 
+class MailboxCursorPagination(CursorPagination):
+    """Keyset pagination over the mailbox index, newest first."""
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-sent_at', '-id')
+
+
 @extend_schema(
     tags=['User Messages'],
     summary='List and create messages',
-    description='List all messages for the current user (sent and received) or send a new one.',
+    description=(
+        'List all messages for the current user (sent and received) or send a new one. '
+        'Results use keyset pagination: follow the `next` link (`cursor` parameter).'
+    ),
     parameters=[
         OpenApiParameter(name='box', type=str, enum=['inbox', 'sent'], description='Filter by inbox or sent messages'),
+        OpenApiParameter(name='peer_id', type=int, description='Only messages exchanged with this user'),
     ],
     responses={200: MessageSerializer(many=True), 201: MessageSerializer}
 )
@@ -24,25 +37,42 @@ class MessageListCreateView(generics.ListCreateAPIView):
     """
     GET: List all messages for the current user (sent and received).
     POST: Send a new message.
+    
+    Listing reads the per-user MailboxEntry index, so inbox and sent views
+    are range scans on (user, folder, sent_at) without DISTINCT. peer_id
+    walks the user's mailbox in that order and probes each message's sender
+    and receipts; the index stores no counterpart, so it is not a range scan.
     """
     serializer_class = MessageSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = MailboxCursorPagination
 
     def get_queryset(self):
         user = self.request.user
-        queryset = Message.objects.filter(
-            models.Q(sender=user) | models.Q(receipts__recipient=user)
-        ).distinct().select_related('sender').prefetch_related('receipts__recipient')
-        
-        # Optional: Filter by 'type' (inbox/sent) via query params if needed
-        # Filter by peer_id (conversation with specific user)
+        entries = MailboxEntry.objects.filter(user=user)
+
+        box = self.request.query_params.get('box')
+        if box in (MailboxEntry.FOLDER_INBOX, MailboxEntry.FOLDER_SENT):
+            entries = entries.filter(folder=box)
+
+        # Filter by peer_id (conversation with specific user): my entries whose
+        # message the peer sent or received, whether or not the peer has
+        # since deleted their own copy.
         peer_id = self.request.query_params.get('peer_id')
         if peer_id:
-            queryset = queryset.filter(
-                models.Q(sender_id=peer_id) | models.Q(receipts__recipient_id=peer_id)
+            entries = entries.filter(
+                models.Q(message__sender_id=peer_id)
+                | models.Exists(
+                    MessageReceipt.objects.filter(recipient_id=peer_id, message_id=models.OuterRef('message_id'))
+                )
             )
-            
-        return queryset.order_by('-sent_at')
+
+        return entries.select_related('message__sender').prefetch_related('message__receipts__recipient')
+
+    def list(self, request, *args, **kwargs):
+        page = self.paginate_queryset(self.get_queryset())
+        serializer = self.get_serializer([entry.message for entry in page], many=True)
+        return self.get_paginated_response(serializer.data)
 
     def perform_create(self, serializer):
         serializer.save(sender=self.request.user)
@@ -143,12 +173,52 @@ class MessageReadView(APIView):
         return self.mark_read(request, pk)
         
     def mark_read(self, request, pk):
-        receipt = get_object_or_404(MessageReceipt, message_id=pk, recipient=request.user)
-        if not receipt.is_read:
-            receipt.is_read = True
-            receipt.read_at = timezone.now()
-            receipt.save()
+        message_mark_read(message_id=pk, user=request.user)
         return Response({'status': 'marked as read'}, status=status.HTTP_200_OK)
+
+
+class ConversationCursorPagination(CursorPagination):
+    """Keyset pagination over conversation summaries, most recent first."""
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-last_message_at', '-id')
+
+
+@extend_schema(
+    tags=['User Messages'],
+    summary='List conversations',
+    description=(
+        'List the threads the current user takes part in, with the latest message, '
+        'participants and the unread count, most recent first.'
+    ),
+    responses={200: ConversationSummarySerializer(many=True)}
+)
+class ConversationListView(generics.ListAPIView):
+    """
+    GET: Conversation sidebar backed by the ConversationSummary table.
+    """
+    serializer_class = ConversationSummarySerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = ConversationCursorPagination
+
+    def get_queryset(self):
+        return ConversationSummary.objects.filter(
+            user=self.request.user
+        ).select_related('latest_message__sender')
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['participants'] = getattr(self, '_participants', {})
+        return context
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        # Resolve participants for the whole page in one query
+        participant_ids = {pk for summary in page for pk in summary.participant_ids}
+        self._participants = CustomUser.all_objects.in_bulk(participant_ids)
+        return page
+
 @extend_schema(
     tags=['User Messages'],
     summary='Search users for messaging',
@@ -276,15 +346,18 @@ class CommunicationUserSearchApi(generics.ListAPIView):
         else:
             return CustomUser.objects.none()
 
-        # Exclude self from results
-        qs = qs.exclude(id=user.id)
-
-        # Apply search filter
-        from django.db.models import Q
-        qs = qs.filter(
-            Q(full_name__istartswith=search_term) |
-            Q(email__istartswith=search_term) |
-            Q(role__istartswith=search_term)
-        )
+        # The visibility scope above is fully determined by role, school and
+        # workstream (plus the guardian's own links), so users sharing those
+        # share cached prefix results while typing.
+        scope_key = ':'.join(str(part) for part in (
+            'communication',
+            user.role,
+            user_school.pk if user_school else '',
+            user_workstream.pk if user_workstream else '',
+            user.id if user.role == Role.GUARDIAN else '',
+        ))
+        # Fetch one extra so excluding self still leaves a full page
+        ids = user_search_cached_ids(scope_key=scope_key, term=search_term, queryset=qs, limit=21)
 
-        return qs[:20]  # Limit results
+        # Exclude self from results; a list lets the paginator skip COUNT(*)
+        return list(CustomUser.objects.filter(id__in=ids).exclude(id=user.id)[:20])  # Limit results
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class WorkstreamConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'workstream'
+
+    def ready(self):
+        import workstream.signals
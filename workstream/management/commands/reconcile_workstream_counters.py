@@ -0,0 +1,27 @@
+"""
+Django management command to repair drifted workstream capacity counters.
+Usage: python manage.py reconcile_workstream_counters [--dry-run]
+"""
+
+from django.core.management.base import BaseCommand
+
+from workstream.services.workstream_capacity_services import workstream_counters_reconcile
+
+
+class Command(BaseCommand):
+    help = 'Recount active users and schools per workstream and correct stored counters'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Report drift without correcting it')
+
+    def handle(self, *args, **options):
+        drift = workstream_counters_reconcile(dry_run=options['dry_run'])
+
+        for entry in drift:
+            self.stdout.write(
+                f"{entry['workstream_name']} (#{entry['id']}) {entry['field']}: "
+                f"stored {entry['stored']}, actual {entry['actual']}"
+            )
+
+        verb = 'Found' if options['dry_run'] else 'Corrected'
+        self.stdout.write(self.style.SUCCESS(f'{verb} {len(drift)} drifted counters'))
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.8 on 2026-10-18 22:11
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_counters(apps, schema_editor):
+    WorkStream = apps.get_model("workstream", "WorkStream")
+    CustomUser = apps.get_model("accounts", "CustomUser")
+    School = apps.get_model("school", "School")
+
+    users = dict(
+        CustomUser.objects.filter(is_active=True, work_stream__isnull=False)
+        .values("work_stream").annotate(total=Count("pk")).values_list("work_stream", "total")
+    )
+    schools = dict(
+        School.objects.filter(is_active=True)
+        .values("work_stream").annotate(total=Count("pk")).values_list("work_stream", "total")
+    )
+    for work_stream_id in set(users) | set(schools):
+        WorkStream.objects.filter(pk=work_stream_id).update(
+            active_user_count=users.get(work_stream_id, 0),
+            active_school_count=schools.get(work_stream_id, 0),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workstream', '0001_initial'),
+        ('accounts', '0005_user_search_keys'),
+        ('school', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workstream',
+            name='active_school_count',
+            field=models.PositiveIntegerField(default=0, help_text='Active schools in this workstream'),
+        ),
+        migrations.AddField(
+            model_name='workstream',
+            name='active_user_count',
+            field=models.PositiveIntegerField(default=0, help_text='Active users in this workstream'),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -25,7 +25,13 @@ class WorkStream(SoftDeleteModel):
     )
     location = models.CharField(max_length=255, null=True, blank=True, help_text="Workstream regional location")
     slug = models.SlugField(max_length=255, unique=True, null=True, blank=True, help_text="Workstream URL slug")
-    
+    # Maintained with F() updates by workstream.signals; repaired by
+    # `manage.py reconcile_workstream_counters`.
+    active_user_count = models.PositiveIntegerField(default=0, help_text="Active users in this workstream")
+    active_school_count = models.PositiveIntegerField(default=0, help_text="Active schools in this workstream")
+
+    COUNTER_FIELDS = ("active_user_count", "active_school_count")
+
     def save(self, *args, **kwargs):
         if not self.slug or self.slug.strip() == "":
             # Create a unique slug
@@ -36,6 +42,12 @@ class WorkStream(SoftDeleteModel):
                 slug = f"{base_slug}-{counter}"
                 counter += 1
             self.slug = slug
+        if not self._state.adding and not kwargs.get("force_insert") and kwargs.get("update_fields") is None:
+            # Never write back counters read before a concurrent F() update.
+            kwargs["update_fields"] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
         super().save(*args, **kwargs)
     
     class Meta:
@@ -0,0 +1,107 @@
+"""
+Workstream capacity counters.
+
+WorkStream.active_user_count and active_school_count replace COUNT(*)
+queries on the registration and school activation paths. They move by
+single-row F() updates from workstream.signals, and capacity checks read
+them under select_for_update() so concurrent registrations serialize on
+the workstream row instead of racing past the limit.
+"""
+import logging
+
+from django.db import transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from accounts.models import CustomUser
+from school.models import School
+from workstream.models import WorkStream
+
+logger = logging.getLogger(__name__)
+
+
+def workstream_counter_adjust(*, work_stream_id: int, field: str, delta: int) -> None:
+    """
+    Add delta to one counter column. Decrements never go below zero; any
+    drift that causes is left for the reconciliation command.
+    """
+    if not work_stream_id or not delta:
+        return
+    queryset = WorkStream.all_objects.filter(pk=work_stream_id)
+    if delta < 0:
+        queryset = queryset.filter(**{f"{field}__gte": -delta})
+    queryset.update(**{field: F(field) + delta})
+
+
+def workstream_lock(*, work_stream_id: int, include_inactive: bool = False) -> WorkStream:
+    """
+    Load a workstream with its row locked until the surrounding transaction
+    ends, so a capacity check and the write it guards cannot interleave
+    with another request's.
+
+    Raises:
+        WorkStream.DoesNotExist
+    """
+    manager = WorkStream.all_objects if include_inactive else WorkStream.objects
+    return manager.select_for_update().get(pk=work_stream_id)
+
+
+def _count_subquery(model, **filters):
+    return Coalesce(
+        Subquery(
+            model.all_objects.filter(work_stream=OuterRef("pk"), is_active=True, **filters)
+            .order_by()
+            .values("work_stream")
+            .annotate(total=Count("pk"))
+            .values("total"),
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def workstream_counters_reconcile(*, dry_run: bool = False) -> list[dict]:
+    """
+    Compare every workstream's counters with real counts and repair drift.
+
+    Drifted rows are recounted under a row lock before being corrected, so
+    a registration committed between the scan and the fix is not lost.
+
+    Returns:
+        [{"id", "workstream_name", "field", "stored", "actual"}] for each
+        counter that was (or, with dry_run, would be) corrected
+    """
+    drift = []
+    workstreams = WorkStream.all_objects.annotate(
+        actual_users=_count_subquery(CustomUser),
+        actual_schools=_count_subquery(School),
+    ).values("id", "workstream_name", "active_user_count", "active_school_count", "actual_users", "actual_schools")
+
+    for row in workstreams.iterator():
+        if (row["active_user_count"], row["active_school_count"]) == (row["actual_users"], row["actual_schools"]):
+            continue
+
+        if not dry_run:
+            with transaction.atomic():
+                workstream_lock(work_stream_id=row["id"], include_inactive=True)
+                actual_users = CustomUser.all_objects.filter(work_stream_id=row["id"], is_active=True).count()
+                actual_schools = School.all_objects.filter(work_stream_id=row["id"], is_active=True).count()
+                WorkStream.all_objects.filter(pk=row["id"]).update(
+                    active_user_count=actual_users,
+                    active_school_count=actual_schools,
+                )
+            row["actual_users"], row["actual_schools"] = actual_users, actual_schools
+
+        for field, actual in (("active_user_count", row["actual_users"]), ("active_school_count", row["actual_schools"])):
+            if row[field] != actual:
+                drift.append({
+                    "id": row["id"],
+                    "workstream_name": row["workstream_name"],
+                    "field": field,
+                    "stored": row[field],
+                    "actual": actual,
+                })
+
+    if drift and not dry_run:
+        logger.warning(f"Corrected {len(drift)} drifted workstream counters")
+    return drift
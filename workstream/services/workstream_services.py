@@ -3,6 +3,10 @@ from django.db import transaction
 from django.core.exceptions import ValidationError, PermissionDenied
 from accounts.models import CustomUser, Role
 from workstream.models import WorkStream
+from school.services.soft_delete_cascade_services import (
+    soft_delete_activate_descendants,
+    soft_delete_deactivate_descendants,
+)
 from accounts.policies.workstream_policies import (
     can_create_workstream,
     allowed_update_fields_for_workstream,
@@ -101,9 +105,13 @@ def workstream_update(
     if "is_active" in data and "is_active" in allowed_fields:
         new_status = data["is_active"]
         if new_status and not workstream.is_active:
+            soft_delete_activate_descendants(model=WorkStream, ids=[workstream.id])
             workstream.activate()
         elif not new_status and workstream.is_active:
             workstream.deactivate(user=actor)
+            soft_delete_deactivate_descendants(
+                model=WorkStream, ids=[workstream.id], actor=actor, stamp=workstream.deactivated_at
+            )
 
     # Update manager's work_stream field if manager was changed
     if new_manager and new_manager != old_manager:
@@ -128,5 +136,8 @@ def workstream_deactivate(
     if not can_deactivate_workstream(actor=actor, workstream=workstream):
         raise PermissionDenied("Only admins can deactivate workstreams.")
 
-    workstream.is_active = False
-    workstream.save()
+    # Schools and everything below them are switched off with it.
+    workstream.deactivate(user=actor)
+    soft_delete_deactivate_descendants(
+        model=WorkStream, ids=[workstream.id], actor=actor, stamp=workstream.deactivated_at
+    )
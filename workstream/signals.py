@@ -0,0 +1,72 @@
+"""
+Keep WorkStream.active_user_count / active_school_count in step with user
+and school saves.
+
+Each loaded instance remembers the workstream it counted toward (None
+when inactive or unassigned). A save or delete that changes that moves
+one unit between counters with F() updates in the same transaction.
+
+bulk_create()/queryset.update() send no signals; adjust counters with
+workstream.services.workstream_capacity_services.workstream_counter_adjust()
+or run `manage.py reconcile_workstream_counters` afterwards.
+"""
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+from django.dispatch import receiver
+
+from accounts.models import CustomUser
+from school.models import School
+from workstream.services.workstream_capacity_services import workstream_counter_adjust
+
+COUNTER_FIELD_BY_MODEL = {
+    CustomUser: "active_user_count",
+    School: "active_school_count",
+}
+COUNTED_FIELDS = {"is_active", "work_stream", "work_stream_id"}
+
+
+def _counted_work_stream_id(instance):
+    return instance.work_stream_id if instance.is_active else None
+
+
+@receiver(post_init, sender=CustomUser)
+@receiver(post_init, sender=School)
+def remember_counted_work_stream(sender, instance, **kwargs):
+    # Reads __dict__ so deferred fields are not fetched one query at a time.
+    if instance.pk is not None and "is_active" in instance.__dict__ and "work_stream_id" in instance.__dict__:
+        instance._counted_work_stream_id = _counted_work_stream_id(instance)
+
+
+@receiver(pre_save, sender=CustomUser)
+@receiver(pre_save, sender=School)
+def load_counted_work_stream(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or instance._state.adding or hasattr(instance, "_counted_work_stream_id"):
+        return
+    if update_fields is not None and not COUNTED_FIELDS & set(update_fields):
+        return
+    stored = sender.all_objects.filter(pk=instance.pk).values("is_active", "work_stream_id").first()
+    if stored is not None:
+        instance._counted_work_stream_id = stored["work_stream_id"] if stored["is_active"] else None
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_save, sender=School)
+def move_workstream_counter(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if not created and update_fields is not None and not COUNTED_FIELDS & set(update_fields):
+        return
+
+    previous = None if created else getattr(instance, "_counted_work_stream_id", None)
+    current = _counted_work_stream_id(instance)
+    if previous != current:
+        field = COUNTER_FIELD_BY_MODEL[sender]
+        workstream_counter_adjust(work_stream_id=previous, field=field, delta=-1)
+        workstream_counter_adjust(work_stream_id=current, field=field, delta=1)
+    instance._counted_work_stream_id = current
+
+
+@receiver(post_delete, sender=CustomUser)
+@receiver(post_delete, sender=School)
+def release_workstream_counter(sender, instance, **kwargs):
+    previous = getattr(instance, "_counted_work_stream_id", None)
+    workstream_counter_adjust(work_stream_id=previous, field=COUNTER_FIELD_BY_MODEL[sender], delta=-1)
@@ -0,0 +1,109 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+
+from accounts.services.auth_services import workstream_register_user
+from school.models import School
+from school.services.school_services import activate_school
+from workstream.models import WorkStream
+
+User = get_user_model()
+
+
+class WorkstreamCapacityCounterTests(APITestCase):
+    """
+    Tests for maintained workstream user/school counters.
+    """
+    def setUp(self):
+        self.workstream = WorkStream.objects.create(workstream_name="Counted", capacity=2)
+        self.other = WorkStream.objects.create(workstream_name="Other", capacity=5)
+        self.admin = User.objects.create_user(
+            email='admin@example.com', password='password123', full_name='Admin', role='admin'
+        )
+
+    def _counters(self, workstream):
+        workstream.refresh_from_db()
+        return workstream.active_user_count, workstream.active_school_count
+
+    def test_user_saves_move_the_counter(self):
+        """Test create, deactivate, reassign and delete keep the user count exact."""
+        user = User.objects.create_user(
+            email='one@example.com', password='password123', full_name='One', role='student',
+            work_stream=self.workstream
+        )
+        User.objects.create_user(
+            email='off@example.com', password='password123', full_name='Off', role='student',
+            work_stream=self.workstream, is_active=False
+        )
+        self.assertEqual(self._counters(self.workstream), (1, 0))
+
+        user.deactivate()
+        self.assertEqual(self._counters(self.workstream), (0, 0))
+
+        user.activate()
+        user = User.all_objects.only('id', 'email').get(pk=user.pk)
+        user.work_stream = self.other
+        user.save(update_fields=['work_stream'])
+        self.assertEqual(self._counters(self.workstream), (0, 0))
+        self.assertEqual(self._counters(self.other), (1, 0))
+
+        user.delete()
+        self.assertEqual(self._counters(self.other), (0, 0))
+
+    def test_registration_checks_the_counter(self):
+        """Test registration stops at capacity without counting users."""
+        for i in range(2):
+            User.objects.create_user(
+                email=f'user{i}@example.com', password='password123', full_name=f'User {i}',
+                role='student', work_stream=self.workstream
+            )
+
+        with self.assertRaises(ValidationError):
+            workstream_register_user(
+                workstream_id=self.workstream.id, email='late@example.com',
+                full_name='Late', password='password123'
+            )
+
+    def test_school_activation_checks_the_counter(self):
+        """Test activating a school past the workstream limit is refused."""
+        School.objects.create(school_name="A", work_stream=self.workstream)
+        School.objects.create(school_name="B", work_stream=self.workstream)
+        closed = School.objects.create(school_name="C", work_stream=self.workstream, is_active=False)
+        self.assertEqual(self._counters(self.workstream)[1], 2)
+
+        with self.assertRaises(ValidationError):
+            activate_school(actor=self.admin, school=closed)
+
+    def test_full_save_does_not_overwrite_counters(self):
+        """Test a stale WorkStream instance saved in full keeps the live counters."""
+        stale = WorkStream.objects.get(pk=self.workstream.pk)
+        User.objects.create_user(
+            email='one@example.com', password='password123', full_name='One', role='student',
+            work_stream=self.workstream
+        )
+
+        stale.description = "Updated"
+        stale.save()
+
+        self.assertEqual(self._counters(self.workstream), (1, 0))
+
+    def test_reconcile_command_repairs_drift(self):
+        """Test the command reports and corrects counters changed behind its back."""
+        User.objects.create_user(
+            email='one@example.com', password='password123', full_name='One', role='student',
+            work_stream=self.workstream
+        )
+        WorkStream.objects.filter(pk=self.workstream.pk).update(active_user_count=7, active_school_count=3)
+        out = StringIO()
+
+        call_command('reconcile_workstream_counters', '--dry-run', stdout=out)
+        self.assertEqual(self._counters(self.workstream), (7, 3))
+
+        call_command('reconcile_workstream_counters', stdout=out)
+
+        self.assertEqual(self._counters(self.workstream), (1, 0))
+        self.assertIn('Counted (#%d) active_user_count: stored 7, actual 1' % self.workstream.pk, out.getvalue())
+        self.assertIn('Corrected 2 drifted counters', out.getvalue())
@@ -9,7 +9,7 @@ from rest_framework import serializers
 
 from accounts.permissions import IsSuperAdmin
 from accounts.models import CustomUser
-from accounts.pagination import PaginatedAPIMixin
+from accounts.pagination import PaginatedAPIMixin, SPARSE_FIELDSET_PARAMETERS
 
 from workstream.models import WorkStream
 from workstream.selectors.workstream_selectors import (
@@ -113,6 +113,7 @@ class WorkstreamListCreateAPIView(PaginatedAPIMixin, APIView):
                 description="Page number.",
                 required=False,
             ),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={200: WorkstreamOutputSerializer(many=True)},
         examples=[